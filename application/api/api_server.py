@@ -84,6 +84,9 @@ class APIServer:
         notifications_router.add_api_route(
             "/dialog/html", self.notification_handler.send_html_dialog, methods=["POST"]
         )
+        notifications_router.add_api_route(
+            "/batch", self.notification_handler.send_notification_batch, methods=["POST"]
+        )
         self.api_app.include_router(notifications_router)
 
         # ------------------------------------------------------------------
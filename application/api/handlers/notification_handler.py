@@ -5,6 +5,10 @@ from typing import Any, Dict
 
 from application.api.handlers.base_handler import BaseHandler
 from application.api.models.dialog_notification_request import DialogNotificationRequest
+from application.api.models.notification_batch_request import (
+    NotificationBatchItem,
+    NotificationBatchRequest,
+)
 from application.api.models.notification_message import NotificationMessage
 from application.api.models.notification_request import NotificationRequest
 from application.api.models.system_notification_request import SystemNotificationRequest
@@ -157,6 +161,44 @@ class NotificationHandler(BaseHandler):
         except Exception as exception:
             return self._create_error_response(f"{notification_type} 알림 전송 실패", exception)
 
+    async def send_notification_batch(self, request: NotificationBatchRequest) -> Dict[str, Any]:
+        """여러 알림을 한 번에 전송 (요청 순서대로 처리)"""
+        results = [await self._send_batch_item(item) for item in request.notifications]
+        failed = [index for index, result in enumerate(results) if result["status"] != "success"]
+
+        data = {"total": len(results), "sent": len(results) - len(failed), "failed": failed}
+        if failed:
+            return self._create_error_response(
+                f"{len(failed)}개의 알림 전송 실패", error_code="BATCH_PARTIAL", details=data
+            )
+        return self._create_success_response(f"{len(results)}개의 알림이 전송되었습니다", data)
+
+    async def _send_batch_item(self, item: NotificationBatchItem) -> Dict[str, Any]:
+        if item.type == "dialog_html":
+            return await self.send_html_dialog(
+                DialogNotificationRequest(
+                    title=item.title,
+                    message=item.message,
+                    html_message=item.html_message,
+                    notification_type=item.notification_type,
+                    width=item.width,
+                    height=item.height,
+                    duration=item.duration,
+                )
+            )
+        return await self._send_notification_by_type(
+            item.type,
+            NotificationRequest(
+                title=item.title,
+                message=item.message,
+                html_message=item.html_message,
+                duration=item.duration,
+                width=item.width,
+                height=item.height,
+                show_bubble=item.show_bubble,
+            ),
+        )
+
     # 레거시 호환성을 위한 메서드
     async def send_notification_legacy(self, notification: NotificationMessage) -> Dict[str, Any]:
         """
@@ -5,6 +5,10 @@ from application.api.models.chat_message_request import ChatMessageRequest
 from application.api.models.conversation_file_request import ConversationFileRequest
 from application.api.models.dialog_notification_request import DialogNotificationRequest
 from application.api.models.llm_request import LLMRequest
+from application.api.models.notification_batch_request import (
+    NotificationBatchItem,
+    NotificationBatchRequest,
+)
 from application.api.models.notification_message import NotificationMessage
 from application.api.models.notification_request import NotificationRequest
 from application.api.models.system_notification_request import SystemNotificationRequest
@@ -17,6 +21,8 @@ __all__ = [
     "ConversationFileRequest",
     "DialogNotificationRequest",
     "LLMRequest",
+    "NotificationBatchItem",
+    "NotificationBatchRequest",
     "NotificationMessage",
     "NotificationRequest",
     "SystemNotificationRequest",
@@ -0,0 +1,26 @@
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+# info~auto 는 채팅창 알림, dialog_html 은 HTML 다이얼로그
+BatchNotificationType = Literal["info", "warning", "error", "confirm", "auto", "dialog_html"]
+
+
+class NotificationBatchItem(BaseModel):
+    """일괄 알림 요청의 개별 알림"""
+
+    type: BatchNotificationType = "info"
+    title: str
+    message: str = ""
+    html_message: Optional[str] = None
+    notification_type: str = "info"  # dialog_html 의 다이얼로그 종류
+    duration: Optional[int] = 5000
+    width: Optional[int] = 350
+    height: Optional[int] = 150
+    show_bubble: Optional[bool] = True
+
+
+class NotificationBatchRequest(BaseModel):
+    """여러 알림을 한 번의 요청으로 전송하는 모델"""
+
+    notifications: List[NotificationBatchItem] = Field(..., max_length=1000)
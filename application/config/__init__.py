@@ -52,6 +52,7 @@ from application.config.libs import (  # 핵심 인터페이스; 기본 구현
     TOMLConfigSerializer,
     ValidationResult,
     YAMLConfigSerializer,
+    atomic_write_text,
     backup_config_file,
     create_config_manager,
     create_minimal_manager,
@@ -122,6 +123,7 @@ __all__ = [
     "detect_config_type",
     "ensure_config_dir",
     "backup_config_file",
+    "atomic_write_text",
     # 레지스트리 및 팩토리
     "ConfigRegistry",
     "ConfigFactory",
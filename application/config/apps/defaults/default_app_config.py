@@ -53,3 +53,6 @@ SUPPORTED_THEMES = ["light", "dark"]
 # 설정 파일 관련 상수
 DEFAULT_APP_CONFIG_FILE_NAME = "app.config"
 DEFAULT_APP_CONFIG_TEMPLATE_SUFFIX = ".template"
+
+# set_config_value 변경을 모아서 저장하기까지의 지연 시간 (초)
+DEFAULT_APP_CONFIG_SAVE_DELAY = 0.5
@@ -1,16 +1,22 @@
 import configparser
+import io
 import logging
 import os
 import shutil
-from typing import Any, Dict, List, Optional
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
 
 from application.config.apps.defaults.default_app_config import (
     DEFAULT_APP_CONFIG_FILE_NAME,
+    DEFAULT_APP_CONFIG_SAVE_DELAY,
     DEFAULT_APP_CONFIG_SECTIONS,
     DEFAULT_APP_CONFIG_TEMPLATE_SUFFIX,
     DEFAULT_UI_VALUES,
     SUPPORTED_THEMES,
 )
+from application.config.libs.config_change_notifier import get_config_change_notifier
+from application.config.libs.utils import atomic_write_text
 from application.util.logger import setup_logger
 
 logger: logging.Logger = setup_logger("config") or logging.getLogger("config")
@@ -23,12 +29,22 @@ class AppConfigManager:
     단일 책임 원칙에 따라 app.config 파일 관리만을 담당합니다.
     """
 
-    def __init__(self, config_file: Optional[str] = None) -> None:
+    def __init__(
+        self, config_file: Optional[str] = None, save_delay: float = DEFAULT_APP_CONFIG_SAVE_DELAY
+    ) -> None:
         """AppConfigManager 생성자
 
         Args:
             config_file: 설정 파일 경로. None인 경우 기본값 사용
+            save_delay: set_config_value 변경을 모아 저장하기까지의 지연 시간(초).
+                0 이하이면 매번 즉시 저장
         """
+        self.save_delay = save_delay
+        self._save_lock = threading.RLock()
+        self._batch_depth = 0
+        self._dirty = False  # 파일에 아직 기록되지 않은 변경이 있는지
+        self._flush_timer: Optional[threading.Timer] = None
+
         if config_file:
             self.config_file = config_file
         else:
@@ -55,6 +71,15 @@ class AppConfigManager:
             self.create_default_config()
             return
 
+        with self._save_lock:
+            if self._dirty:
+                if self._batch_depth:
+                    # batch 중에는 메모리의 변경이 파일 내용으로 덮이지 않도록 다시 읽지 않는다
+                    logger.debug("batch 진행 중이라 설정 파일 리로드를 건너뜀")
+                    return
+                # 아직 기록되지 않은 변경을 먼저 저장한다
+                self.flush()
+
         if os.path.exists(self.config_file):
             try:
                 self.config.read(self.config_file, encoding="utf-8")
@@ -93,25 +118,103 @@ class AppConfigManager:
             raise
 
     def save_config(self) -> None:
-        """설정 파일 저장"""
+        """설정 파일 저장
+
+        임시 파일에 기록한 뒤 교체하므로 저장 중 실패해도 기존 파일이 손상되지 않는다.
+        batch() 안에서 호출되면 batch 가 끝날 때 한 번만 저장한다.
+        """
         if not self.config_file:
             logger.error("설정 파일 경로가 비어있습니다")
             return
 
+        # 알림기 잠금을 _save_lock 안에서 잡지 않도록 자체 저장 표시를 먼저 시작한다
+        with get_config_change_notifier().self_write(self.config_file), self._save_lock:
+            if self._batch_depth:
+                self._dirty = True
+                return
+            self._cancel_flush_timer()
+
+            try:
+                config_dir = os.path.dirname(self.config_file)
+                if config_dir and not os.path.exists(config_dir):
+                    os.makedirs(config_dir, exist_ok=True)
+
+                atomic_write_text(self.config_file, self._serialize_config())
+                self._dirty = False
+                logger.debug("설정 파일 저장 완료: %s", self.config_file)
+            except PermissionError as exception:
+                logger.error("설정 파일 저장 권한 없음: %s", exception)
+            except OSError as exception:
+                logger.error("설정 파일 저장 실패: %s", exception)
+            except Exception as exception:
+                logger.error("설정 파일 저장 중 예상치 못한 오류: %s", exception)
+
+    def flush(self) -> None:
+        """지연 저장 대기 중인 변경을 즉시 파일에 기록"""
+        with self._save_lock:
+            if self._dirty and not self._batch_depth:
+                self.save_config()
+
+    @contextmanager
+    def batch(self) -> Iterator["AppConfigManager"]:
+        """여러 설정 변경을 한 번의 저장으로 묶는 트랜잭션
+
+        블록 안의 저장 요청은 블록이 끝날 때 한 번에 기록된다. 블록에서 예외가 발생하면
+        메모리의 설정을 블록 진입 전 상태로 되돌리고 파일에는 기록하지 않는다.
+        중첩된 batch 는 가장 바깥 batch 에 합쳐진다.
+
+        Example:
+            with app_config_manager.batch():
+                app_config_manager.set_config_value("UI", "font_size", "16")
+                app_config_manager.set_config_value("UI", "window_theme", "dark")
+        """
+        with self._save_lock:
+            outermost = self._batch_depth == 0
+            if outermost:
+                saved_content = self._serialize_config()
+                was_dirty = self._dirty
+            self._batch_depth += 1
+
         try:
-            config_dir = os.path.dirname(self.config_file)
-            if config_dir and not os.path.exists(config_dir):
-                os.makedirs(config_dir, exist_ok=True)
-
-            with open(self.config_file, "w", encoding="utf-8") as config_file:
-                self.config.write(config_file)
-            logger.debug("설정 파일 저장 완료: %s", self.config_file)
-        except PermissionError as exception:
-            logger.error("설정 파일 저장 권한 없음: %s", exception)
-        except OSError as exception:
-            logger.error("설정 파일 저장 실패: %s", exception)
-        except Exception as exception:
-            logger.error("설정 파일 저장 중 예상치 못한 오류: %s", exception)
+            yield self
+        except BaseException:
+            with self._save_lock:
+                self._batch_depth -= 1
+                if outermost:
+                    self.config.clear()
+                    self.config.read_string(saved_content)
+                    self._dirty = was_dirty
+                    logger.warning("설정 batch 중 오류로 변경 사항을 되돌림")
+            raise
+        else:
+            with self._save_lock:
+                self._batch_depth -= 1
+                if outermost:
+                    self.flush()
+
+    def _schedule_save(self) -> None:
+        """변경을 표시하고 save_delay 뒤에 한 번 저장되도록 예약"""
+        with self._save_lock:
+            self._dirty = True
+            if self._batch_depth:
+                return
+            if self.save_delay <= 0:
+                self.save_config()
+                return
+            if self._flush_timer is None:
+                # 데몬 스레드가 아니므로 종료 직전에 예약된 저장도 마저 기록된다
+                self._flush_timer = threading.Timer(self.save_delay, self.flush)
+                self._flush_timer.start()
+
+    def _cancel_flush_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _serialize_config(self) -> str:
+        buffer = io.StringIO()
+        self.config.write(buffer)
+        return buffer.getvalue()
 
     def get_ui_config(self) -> Dict[str, Any]:
         """UI 설정 반환"""
@@ -266,7 +369,7 @@ class AppConfigManager:
                 self.config.add_section(section)
 
             self.config[section][key] = str(value)
-            self.save_config()
+            self._schedule_save()
             logger.debug("설정 값 저장 완료 [%s.%s]: %s", section, key, value)
         except ValueError as exception:
             logger.error("설정 값 오류 [%s.%s]: %s", section, key, exception)
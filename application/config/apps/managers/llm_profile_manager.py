@@ -10,6 +10,7 @@ from application.config.apps.defaults.default_llm_profiles import (
     PROTECTED_PROFILES,
     REQUIRED_LLM_PROFILE_FIELDS,
 )
+from application.config.libs.config_change_notifier import get_config_change_notifier
 from application.util.logger import setup_logger
 
 logger: logging.Logger = setup_logger("config") or logging.getLogger("config")
@@ -76,8 +77,9 @@ class LLMProfileManager:
                 "profiles": self._llm_profiles,
                 "current_profile": self._current_profile_name,
             }
-            with open(self.llm_profiles_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with get_config_change_notifier().self_write(self.llm_profiles_file):
+                with open(self.llm_profiles_file, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
             logger.debug("LLM 프로필 저장 완료")
         except Exception as exception:
             logger.error(f"LLM 프로필 저장 실패: {exception}")
@@ -2,7 +2,10 @@ import logging
 import os
 import threading
 import time
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
 
 from application.config.apps.managers.app_config_manager import AppConfigManager
 from application.config.apps.managers.llm_profile_manager import LLMProfileManager
@@ -15,6 +18,22 @@ from application.util.logger import setup_logger
 
 logger: logging.Logger = setup_logger("config") or logging.getLogger("config")
 
+# 설정 파일의 (mtime_ns, size), 파일이 없으면 None
+FileStamp = Optional[Tuple[int, int]]
+
+
+@dataclass(frozen=True)
+class LLMConfigSnapshot:
+    """병합된 LLM 설정의 불변 스냅샷
+
+    version 은 만들 당시의 config_version, stamps 는 app.config / llm_profiles.json
+    파일의 (mtime_ns, size) 로 파일 감시를 쓸 수 없을 때 변경 여부를 판단하는 데 쓴다.
+    """
+
+    version: int
+    stamps: Tuple[FileStamp, FileStamp]
+    values: Mapping[str, Any]
+
 
 class ConfigManager:
     """통합 설정 관리 클래스"""
@@ -23,6 +42,10 @@ class ConfigManager:
         """ConfigManager 생성자"""
         self._lock = threading.RLock()
         self._change_callbacks: List[ConfigChangeCallback] = []
+        # 설정이 바뀔 때마다 증가 (설정에서 파생된 캐시의 무효화 기준)
+        self._config_version = 0
+        # get_llm_config 결과 캐시 (버전/파일 스탬프가 바뀌면 다시 만든다)
+        self._llm_snapshot: Optional[LLMConfigSnapshot] = None
         self._file_change_notifier = get_config_change_notifier()
 
         # 컴포지션을 통한 책임 분리
@@ -128,8 +151,18 @@ class ConfigManager:
         except Exception as e:
             logger.error(f"LLM 프로필 리로드 중 오류: {e}")
 
+    @property
+    def config_version(self) -> int:
+        """설정 변경 횟수 (파일 변경 감지/설정 저장 시 증가)"""
+        return self._config_version
+
+    def _bump_config_version(self) -> None:
+        with self._lock:
+            self._config_version += 1
+
     def _notify_config_changed(self, file_path: str, change_type: str) -> None:
         """등록된 콜백들에게 설정 변경 알림"""
+        self._bump_config_version()
         for callback in self._change_callbacks.copy():
             try:
                 callback(file_path, change_type)
@@ -184,15 +217,23 @@ class ConfigManager:
         with self._lock:
             self.app_config_manager.load_config()
             self.config = self.app_config_manager.config  # 참조 동기화
+            self._llm_snapshot = None
 
     def create_default_config(self) -> None:
         """기본 설정 생성 - AppConfigManager에 위임"""
         self.app_config_manager.create_default_config()
+        self._bump_config_version()
 
     def save_config(self) -> None:
         """설정 파일 저장 - AppConfigManager에 위임"""
         self.app_config_manager.save_config()
 
+    @contextmanager
+    def batch(self) -> Iterator["ConfigManager"]:
+        """여러 app.config 변경을 한 번의 저장으로 묶기 - AppConfigManager에 위임"""
+        with self.app_config_manager.batch():
+            yield self
+
     def load_llm_profiles(self) -> None:
         """LLM 프로필 로드 - LLMProfileManager에 위임"""
         with self._lock:
@@ -204,6 +245,7 @@ class ConfigManager:
             self._current_profile_name = (
                 self.llm_profile_manager._current_profile_name
             )  # pylint: disable=protected-access
+            self._llm_snapshot = None
 
     def create_default_llm_profiles(self) -> None:
         """기본 LLM 프로필 생성 - LLMProfileManager에 위임"""
@@ -241,6 +283,7 @@ class ConfigManager:
                 self.config.add_section("LLM")
             self.config["LLM"]["current_profile"] = profile_name
             self.save_config()
+            self._bump_config_version()
 
             # 참조 동기화
             self._current_profile_name = (
@@ -248,12 +291,63 @@ class ConfigManager:
             )  # pylint: disable=protected-access
 
     def get_llm_config(self) -> Dict[str, Any]:
-        """LLM 설정 반환 - 프로필 우선, 하위 호환성 유지"""
+        """LLM 설정 반환 - 프로필 우선, 하위 호환성 유지
+
+        매 호출마다 파일을 읽지 않고 캐시된 스냅샷의 복사본을 돌려준다.
+        """
+        return dict(self.get_llm_config_snapshot().values)
+
+    def get_llm_config_snapshot(self) -> LLMConfigSnapshot:
+        """병합된 LLM 설정의 불변 스냅샷 반환
+
+        파일 감시가 동작 중이면 config_version 만으로 최신 여부를 판단하고 (감시 콜백과
+        설정 저장 메서드가 버전을 올린다), 감시를 쓸 수 없으면 두 설정 파일의
+        mtime/size 를 비교해 외부 수정을 감지한다.
+        """
+        snapshot = self._llm_snapshot
+        if (
+            snapshot is not None
+            and snapshot.version == self._config_version
+            and (self._is_watching_llm_files() or snapshot.stamps == self._llm_file_stamps())
+        ):
+            return snapshot
+
         with self._lock:
-            try:
-                self.load_config()
-                self.load_llm_profiles()
+            snapshot = self._llm_snapshot
+            stamps = self._llm_file_stamps()
+            if snapshot is None or snapshot.stamps != stamps:
+                # 처음이거나 디스크의 파일이 바뀌었으면 다시 읽는다
+                try:
+                    self.load_config()
+                    self.load_llm_profiles()
+                except Exception as exception:
+                    logger.error("LLM 설정 파일 로드 실패 (기존 설정 유지): %s", exception)
+                stamps = self._llm_file_stamps()
+            elif snapshot.version == self._config_version:
+                return snapshot
+
+            snapshot = LLMConfigSnapshot(
+                version=self._config_version,
+                stamps=stamps,
+                values=MappingProxyType(self._build_llm_config()),
+            )
+            self._llm_snapshot = snapshot
+            return snapshot
+
+    def _is_watching_llm_files(self) -> bool:
+        return all(
+            self._file_change_notifier.is_watching(path)
+            for path in (self.config_file, self.llm_profiles_file)
+            if path
+        )
 
+    def _llm_file_stamps(self) -> Tuple[FileStamp, FileStamp]:
+        return _file_stamp(self.config_file), _file_stamp(self.llm_profiles_file)
+
+    def _build_llm_config(self) -> Dict[str, Any]:
+        """메모리에 로드된 app.config / 프로필로 LLM 설정을 만든다"""
+        with self._lock:
+            try:
                 # 현재 프로필 가져오기
                 current_profile = self.llm_profile_manager.get_current_profile()
                 if current_profile:
@@ -328,6 +422,7 @@ class ConfigManager:
             self._llm_profiles = (
                 self.llm_profile_manager._llm_profiles
             )  # pylint: disable=protected-access
+            self._bump_config_version()
 
     def update_llm_profile(self, profile_name: str, config: Dict[str, Any]) -> None:
         """LLM 프로필 업데이트 - LLMProfileManager에 위임"""
@@ -337,6 +432,7 @@ class ConfigManager:
             self._llm_profiles = (
                 self.llm_profile_manager._llm_profiles
             )  # pylint: disable=protected-access
+            self._bump_config_version()
 
     def delete_llm_profile(self, profile_name: str) -> None:
         """LLM 프로필 삭제 - LLMProfileManager에 위임"""
@@ -349,6 +445,7 @@ class ConfigManager:
             self._current_profile_name = (
                 self.llm_profile_manager._current_profile_name
             )  # pylint: disable=protected-access
+            self._bump_config_version()
 
     def set_llm_config(self, api_key: str, base_url: str, model: str) -> None:
         """LLM 설정 저장 - AppConfigManager에 위임"""
@@ -363,6 +460,7 @@ class ConfigManager:
             self.config["LLM"]["base_url"] = base_url
             self.config["LLM"]["model"] = model
             self.save_config()
+            self._bump_config_version()
             logger.info("LLM 설정 저장 완료")
         except ValueError as exception:
             logger.error("LLM 설정 값 오류: %s", exception)
@@ -387,6 +485,7 @@ class ConfigManager:
         self.app_config_manager.set_ui_config(
             font_family, font_size, chat_bubble_max_width, window_theme
         )
+        self._bump_config_version()
 
     def get_config_value(
         self, section: str, key: str, fallback: Optional[str] = None
@@ -398,6 +497,7 @@ class ConfigManager:
     def set_config_value(self, section: str, key: str, value: str) -> None:
         """설정값 저장 - AppConfigManager에 위임"""
         self.app_config_manager.set_config_value(section, key, value)
+        self._bump_config_version()
 
     def get_github_repositories(self) -> List[str]:
         """GitHub 저장소 목록 반환 - AppConfigManager에 위임"""
@@ -407,6 +507,7 @@ class ConfigManager:
     def set_github_repositories(self, repositories: List[str]) -> None:
         """GitHub 저장소 목록 설정 - AppConfigManager에 위임"""
         self.app_config_manager.set_github_repositories(repositories)
+        self._bump_config_version()
 
     def get_instruction_path(self) -> str:
         """지시 사항 파일 경로 반환"""
@@ -456,11 +557,13 @@ GitHub 관련 키워드("이슈", "issue", "PR", "pull request", "커밋", "comm
             self.config["llm"] = {}
         self.config["llm"]["current_profile"] = profile_name
         self.save_config()
+        self._bump_config_version()
         logger.info(f"LLM 프로필이 '{profile_name}'(으)로 변경되었습니다.")
 
     def save_ui_config(self, ui_config: Dict[str, Any]) -> None:
         """UI 설정 저장 - AppConfigManager에 위임"""
         self.app_config_manager.save_ui_config(ui_config)
+        self._bump_config_version()
         self.load_ui_config()
 
     def load_ui_config(self) -> None:
@@ -469,6 +572,9 @@ GitHub 관련 키워드("이슈", "issue", "PR", "pull request", "커밋", "comm
     def cleanup(self) -> None:
         """리소스 정리"""
         try:
+            # 지연 저장 대기 중인 변경 기록
+            self.app_config_manager.flush()
+
             # 파일 감시 해제
             if self.config_file:
                 self._file_change_notifier.unregister_all_callbacks(self.config_file)
@@ -511,3 +617,13 @@ GitHub 관련 키워드("이슈", "issue", "PR", "pull request", "커밋", "comm
         except Exception as exc:  # pragma: no cover – 예상치 못한 오류 로그
             logger.error("MCP 설정 가져오기 실패: %s", exc)
             return {}
+
+
+def _file_stamp(path: Optional[str]) -> FileStamp:
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
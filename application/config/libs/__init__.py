@@ -55,6 +55,7 @@ from application.config.libs.serializers import (
 
 # 유틸리티
 from application.config.libs.utils import (
+    atomic_write_text,
     backup_config_file,
     detect_config_type,
     ensure_config_dir,
@@ -113,6 +114,7 @@ __all__ = [
     "detect_config_type",
     "ensure_config_dir",
     "backup_config_file",
+    "atomic_write_text",
     # 레지스트리 및 팩토리
     "ConfigRegistry",
     "ConfigFactory",
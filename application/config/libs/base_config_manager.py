@@ -178,7 +178,7 @@ class BaseConfigManager(IConfigManager, ABC):
 
             # 백업 생성 (기존 파일이 있는 경우)
             if os.path.exists(self._config_file):
-                backup_config_file(self._config_file)
+                backup_config_file(self._config_file, deduplicate=True)
 
             # 직렬화 및 저장
             if self._serializer:
@@ -187,8 +187,9 @@ class BaseConfigManager(IConfigManager, ABC):
                 serializer = SerializerFactory.create_serializer(self._config_type)
                 content = serializer.serialize(self._config_data)
 
-            with open(self._config_file, "w", encoding="utf-8") as f:
-                f.write(content)
+            with self._change_notifier.self_write(self._config_file):
+                with open(self._config_file, "w", encoding="utf-8") as f:
+                    f.write(content)
 
             logger.debug("설정 파일 저장 완료: %s", self._config_file)
         except Exception as exception:
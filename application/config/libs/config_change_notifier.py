@@ -1,11 +1,13 @@
 import atexit  # 추가: 전역 종료 시 정리용
+import hashlib
 import logging
 import os
 import threading
 import time
-from typing import Callable, Dict, List, Optional, Set, cast
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Set, cast
 
-from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.events import FileSystemEvent, FileSystemEventHandler, FileSystemMovedEvent
 from watchdog.observers import Observer
 
 from application.util.logger import setup_logger
@@ -15,6 +17,18 @@ logger: logging.Logger = setup_logger("config") or logging.getLogger("config")
 # 콜백 함수 타입 정의
 ConfigChangeCallback = Callable[[str, str], None]  # (file_path, change_type)
 
+# 파일 이벤트가 잠잠해진 뒤 내용을 확인하기까지 기다리는 시간 (초)
+DEFAULT_DEBOUNCE_SECONDS = 0.2
+
+
+def _content_hash(file_path: str) -> Optional[str]:
+    """파일 내용 해시 (파일이 없거나 읽을 수 없으면 None)"""
+    try:
+        with open(file_path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
 
 class ConfigFileWatcher(FileSystemEventHandler):
     """설정 파일 변경 감지 핸들러"""
@@ -49,7 +63,7 @@ class ConfigFileWatcher(FileSystemEventHandler):
             if current_time - last_time > 0.1:  # 100ms 쿨다운
                 self.last_modified_times[file_path] = current_time
                 logger.debug(f"파일 변경 감지: {file_path}")
-                self.notifier._notify_change(  # pylint: disable=protected-access
+                self.notifier._handle_file_event(  # pylint: disable=protected-access
                     file_path, "modified"
                 )
 
@@ -62,7 +76,9 @@ class ConfigFileWatcher(FileSystemEventHandler):
 
         if file_path in self.watched_files:
             logger.debug(f"파일 생성 감지: {file_path}")
-            self.notifier._notify_change(file_path, "created")  # pylint: disable=protected-access
+            self.notifier._handle_file_event(  # pylint: disable=protected-access
+                file_path, "created"
+            )
 
     def on_deleted(self, event: FileSystemEvent) -> None:
         """파일 삭제 이벤트 처리"""
@@ -73,13 +89,39 @@ class ConfigFileWatcher(FileSystemEventHandler):
 
         if file_path in self.watched_files:
             logger.debug(f"파일 삭제 감지: {file_path}")
-            self.notifier._notify_change(file_path, "deleted")  # pylint: disable=protected-access
+            self.notifier._handle_file_event(  # pylint: disable=protected-access
+                file_path, "deleted"
+            )
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """파일 이동 이벤트 처리 (임시 파일 → 설정 파일로 교체하는 원자적 저장)"""
+        if event.is_directory or not isinstance(event, FileSystemMovedEvent):
+            return
+
+        src_path = cast(str, os.path.abspath(event.src_path))
+        dest_path = cast(str, os.path.abspath(event.dest_path))
+
+        if dest_path in self.watched_files:
+            logger.debug(f"파일 교체 감지: {dest_path}")
+            self.notifier._handle_file_event(  # pylint: disable=protected-access
+                dest_path, "modified"
+            )
+        if src_path in self.watched_files:
+            self.notifier._handle_file_event(  # pylint: disable=protected-access
+                src_path, "deleted"
+            )
 
 
 class ConfigChangeNotifier:
-    """설정 변경 알림 관리자"""
+    """설정 변경 알림 관리자
+
+    파일 이벤트는 경로별로 debounce 초 동안 모은 뒤 내용 해시를 비교해, 실제로 내용이
+    바뀐 경우에만 콜백을 한 번 호출한다. self_write() 로 감싼 이 프로세스의 저장은
+    콜백을 호출하지 않는다. 콜백은 알림기 잠금을 놓은 뒤 호출하므로 콜백 안에서 다른
+    설정 관리자의 잠금을 잡아도 저장 경로와 잠금 순서가 엇갈리지 않는다.
+    """
 
-    def __init__(self):
+    def __init__(self, debounce: float = DEFAULT_DEBOUNCE_SECONDS):
         self._callbacks: Dict[str, List[ConfigChangeCallback]] = {}
         self._observer: Optional[Observer] = None  # type: ignore
         self._watched_files: Set[str] = set()
@@ -87,6 +129,16 @@ class ConfigChangeNotifier:
         self._lock = threading.RLock()
         self._running = False
 
+        self.debounce = debounce
+        # 마지막으로 알린(또는 감시 시작 시점의) 파일 내용 해시
+        self._content_hashes: Dict[str, Optional[str]] = {}
+        # 이 프로세스가 직접 기록한 내용의 해시 (해당 이벤트를 한 번 무시)
+        self._self_write_tokens: Dict[str, Optional[str]] = {}
+        # 저장 중인 경로별 self_write 중첩 수와, 저장 중에 도착해 미뤄 둔 이벤트
+        self._writing: Dict[str, int] = {}
+        self._deferred_events: Dict[str, str] = {}
+        self._pending_timers: Dict[str, threading.Timer] = {}
+
         # 프로세스 종료 시 남은 Observer 스레드를 안전하게 정리한다
         atexit.register(self._atexit_cleanup)
 
@@ -153,6 +205,100 @@ class ConfigChangeNotifier:
                 self._stop_watching_file(abs_path)
                 logger.debug(f"모든 콜백 해제: {abs_path}")
 
+    def is_watching(self, file_path: str) -> bool:
+        """파일이 실제로 동작 중인 Observer 에 의해 감시되고 있는지 여부"""
+        abs_path = os.path.abspath(file_path)
+        with self._lock:
+            observer = self._observer
+            return (
+                self._running
+                and observer is not None
+                and observer.is_alive()
+                and abs_path in self._watched_files
+            )
+
+    @contextmanager
+    def self_write(self, file_path: str) -> Iterator[None]:
+        """이 프로세스가 파일을 저장하는 구간을 표시
+
+        블록이 끝난 뒤의 파일 내용을 토큰으로 남겨, 그 저장으로 발생한 파일 이벤트가
+        콜백을 호출하지 않도록 한다. 블록 안에서 도착한 이벤트는 토큰을 남긴 뒤에
+        다시 확인한다 (debounce 가 0 이어도 저장 중인 파일을 외부 변경으로 보지 않음).
+        """
+        abs_path = cast(str, os.path.abspath(file_path))
+        with self._lock:
+            self._writing[abs_path] = self._writing.get(abs_path, 0) + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                if self._writing[abs_path] > 1:
+                    self._writing[abs_path] -= 1
+                    deferred = None
+                else:
+                    del self._writing[abs_path]
+                    deferred = self._deferred_events.pop(abs_path, None)
+                if abs_path in self._watched_files:
+                    self._self_write_tokens[abs_path] = _content_hash(abs_path)
+                if deferred is not None:
+                    # 저장하는 스레드가 잡고 있을 잠금 아래에서 콜백이 돌지 않도록 타이머로 넘긴다
+                    self._schedule_flush(abs_path, deferred)
+
+    def _handle_file_event(self, file_path: str, change_type: str) -> None:
+        """watchdog 이벤트 수신 - 경로별로 debounce 후 내용 변경 여부를 확인"""
+        if self.debounce <= 0:
+            self._flush_file_event(file_path, change_type)
+            return
+
+        with self._lock:
+            self._schedule_flush(file_path, change_type)
+
+    def _schedule_flush(self, file_path: str, change_type: str) -> None:
+        """debounce 뒤 _flush_file_event 예약 (이미 예약돼 있으면 다시 시작) - _lock 안에서 호출"""
+        timer = self._pending_timers.get(file_path)
+        if timer is not None:
+            timer.cancel()
+        timer = threading.Timer(
+            max(self.debounce, 0.0), self._flush_file_event, args=(file_path, change_type)
+        )
+        timer.daemon = True
+        self._pending_timers[file_path] = timer
+        timer.start()
+
+    def _flush_file_event(self, file_path: str, change_type: str) -> None:
+        """이벤트가 잠잠해진 뒤 실제 내용 변경이 있을 때만 콜백 호출
+
+        변경 여부는 잠금 안에서 정하고, 콜백은 잠금을 놓은 뒤 호출한다.
+        """
+        with self._lock:
+            self._pending_timers.pop(file_path, None)
+            if file_path not in self._watched_files:
+                return
+            if file_path in self._writing:
+                self._deferred_events[file_path] = change_type  # self_write 가 끝나면 다시 확인
+                return
+
+            current = _content_hash(file_path)
+            previous = self._content_hashes.get(file_path)
+            self._content_hashes[file_path] = current
+
+            if file_path in self._self_write_tokens:
+                token = self._self_write_tokens.pop(file_path)
+                if token == current:
+                    logger.debug(f"자체 저장 이벤트 무시: {file_path}")
+                    return
+            if current == previous:
+                logger.debug(f"내용 변경 없는 이벤트 무시 [{change_type}]: {file_path}")
+                return
+
+            if current is None:
+                change_type = "deleted"
+            elif previous is None:
+                change_type = "created"
+            else:
+                change_type = "modified"
+        self._notify_change(file_path, change_type)
+
     def _start_watching_file(self, file_path: str) -> None:
         """파일 감시 시작"""
         if file_path in self._watched_files:
@@ -160,6 +306,7 @@ class ConfigChangeNotifier:
 
         directory = os.path.dirname(file_path)
         self._watched_files.add(file_path)
+        self._content_hashes[file_path] = _content_hash(file_path)
 
         if directory not in self._watched_directories:
             self._watched_directories.add(directory)
@@ -177,6 +324,12 @@ class ConfigChangeNotifier:
     def _stop_watching_file(self, file_path: str) -> None:
         """파일 감시 중지"""
         self._watched_files.discard(file_path)
+        self._content_hashes.pop(file_path, None)
+        self._self_write_tokens.pop(file_path, None)
+        self._deferred_events.pop(file_path, None)
+        timer = self._pending_timers.pop(file_path, None)
+        if timer is not None:
+            timer.cancel()
 
         # 해당 디렉토리의 다른 파일들도 확인
         directory = os.path.dirname(file_path)
@@ -224,24 +377,31 @@ class ConfigChangeNotifier:
             self._running = False
 
     def _notify_change(self, file_path: str, change_type: str) -> None:
-        """변경 사항을 등록된 콜백들에게 알림
+        """변경 사항을 등록된 콜백들에게 알림 (알림기 잠금 밖에서 호출)
 
         Args:
             file_path: 변경된 파일 경로
             change_type: 변경 타입 (modified, created, deleted)
         """
         with self._lock:
-            callbacks = self._callbacks.get(file_path, [])
+            # 복사본으로 순회 (콜백 중 해제될 수 있음)
+            callbacks = list(self._callbacks.get(file_path, []))
 
-            for callback in callbacks.copy():  # 복사본으로 순회 (콜백 중 해제될 수 있음)
-                try:
-                    callback(file_path, change_type)
-                except Exception as e:
-                    logger.error(f"콜백 실행 중 오류 [{file_path}]: {e}")
+        for callback in callbacks:
+            try:
+                callback(file_path, change_type)
+            except Exception as e:
+                logger.error(f"콜백 실행 중 오류 [{file_path}]: {e}")
 
     def stop_all(self) -> None:
         """모든 감시 중지"""
         with self._lock:
+            for timer in self._pending_timers.values():
+                timer.cancel()
+            self._pending_timers.clear()
+            self._content_hashes.clear()
+            self._self_write_tokens.clear()
+            self._deferred_events.clear()
             self._callbacks.clear()
             self._watched_files.clear()
             self._watched_directories.clear()
@@ -4,12 +4,24 @@
 독립성을 위해 최소한의 의존성으로 구현되었습니다.
 """
 
+import contextlib
+import hashlib
+import json
 import os
+import re
+import shutil
+import tempfile
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 from application.config.libs.interfaces import ConfigDict, ConfigType, ConfigValue
 
+# 설정 파일별로 유지하는 백업 개수
+DEFAULT_MAX_BACKUPS = 5
+
+_backup_lock = threading.Lock()
+
 
 def get_nested_value(
     data: ConfigDict, key: str, fallback: Optional[ConfigValue] = None
@@ -254,35 +266,178 @@ def ensure_config_dir(file_path: Union[str, Path]) -> None:
         directory.mkdir(parents=True, exist_ok=True)
 
 
-def backup_config_file(file_path: Union[str, Path], backup_suffix: str = ".bak") -> Optional[str]:
+def atomic_write_text(
+    file_path: Union[str, Path], content: str, encoding: str = "utf-8", fsync: bool = True
+) -> None:
+    """파일 내용을 원자적으로 교체
+
+    같은 디렉토리의 임시 파일에 기록하고 fsync 한 뒤 os.replace 로 바꿔치기한다.
+    쓰는 도중 실패하거나 프로세스가 중단되어도 기존 파일은 온전히 남는다.
+
+    Args:
+        file_path: 대상 파일 경로
+        content: 기록할 내용
+        encoding: 인코딩
+        fsync: 디스크 반영(fsync)까지 기다릴지 여부. 교체 자체는 항상 원자적이다
+
+    Raises:
+        OSError: 기록 또는 교체에 실패한 경우 (임시 파일은 삭제됨)
+    """
+    path = Path(file_path)
+    directory = path.parent
+    fd, temp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as temp_file:
+            temp_file.write(content)
+            if fsync:
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+        if path.exists():
+            # mkstemp 는 0600 으로 만들므로 기존 파일의 권한을 유지한다
+            os.chmod(temp_path, path.stat().st_mode & 0o7777)
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_path)
+        raise
+
+    if not fsync:
+        return
+    # 이름 교체까지 디스크에 반영 (디렉토리 fsync 를 지원하지 않는 플랫폼은 무시)
+    with contextlib.suppress(OSError, AttributeError):
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def backup_config_file(
+    file_path: Union[str, Path],
+    backup_suffix: str = ".bak",
+    max_backups: int = DEFAULT_MAX_BACKUPS,
+    deduplicate: bool = False,
+) -> Optional[str]:
     """설정 파일 백업
 
+    `<파일><접미사>.1` ~ `.<max_backups>` 슬롯을 순환하며 가장 오래된 백업을 덮어쓴다.
+    다음 슬롯과 마지막 백업의 해시는 `<파일><접미사>.manifest` 에 기록하므로 백업 수와
+    관계없이 한 번의 백업은 일정한 수의 파일만 다룬다. manifest 가 없으면 이전 방식으로
+    쌓인 `.bak`, `.bak.N` 백업을 정리해 최근 max_backups 개만 슬롯으로 옮긴다.
+
     Args:
         file_path: 원본 파일 경로
         backup_suffix: 백업 파일 접미사
+        max_backups: 유지할 백업 개수
+        deduplicate: True 이면 직전 백업과 내용이 같을 때 새로 백업하지 않는다
 
     Returns:
-        백업 파일 경로 (실패 시 None)
+        백업 파일 경로 (중복으로 건너뛴 경우 직전 백업 경로, 실패 시 None)
     """
     try:
         path = Path(file_path)
         if not path.exists():
             return None
+        max_backups = max(1, max_backups)
+        manifest_path = path.with_name(f"{path.name}{backup_suffix}.manifest")
+
+        with _backup_lock:
+            manifest = _read_backup_manifest(manifest_path)
+            if manifest is None:
+                manifest = _migrate_legacy_backups(path, backup_suffix, max_backups)
+            elif manifest.get("max_backups") != max_backups:
+                _resize_backup_ring(path, backup_suffix, manifest, max_backups)
+
+            content_hash = None
+            if deduplicate:
+                content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
+                last_backup = manifest.get("last_backup")
+                if (
+                    content_hash == manifest.get("last_hash")
+                    and last_backup
+                    and path.with_name(last_backup).exists()
+                ):
+                    return str(path.with_name(last_backup))
+
+            slot = int(manifest.get("next_slot", 1))
+            if not 1 <= slot <= max_backups:
+                slot = 1
+            backup_path = _backup_slot_path(path, backup_suffix, slot)
+            shutil.copy2(path, backup_path)
+
+            manifest.update(
+                max_backups=max_backups,
+                next_slot=slot % max_backups + 1,
+                last_backup=backup_path.name,
+                last_hash=content_hash,
+            )
+            atomic_write_text(manifest_path, json.dumps(manifest), fsync=False)
+            return str(backup_path)
+    except Exception:
+        return None
 
-        backup_path = path.with_suffix(path.suffix + backup_suffix)
 
-        # 기존 백업이 있으면 번호 추가
-        counter = 1
-        while backup_path.exists():
-            backup_path = path.with_suffix(f"{path.suffix}{backup_suffix}.{counter}")
-            counter += 1
+def _backup_slot_path(path: Path, backup_suffix: str, slot: int) -> Path:
+    return path.with_name(f"{path.name}{backup_suffix}.{slot}")
 
-        import shutil
 
-        shutil.copy2(path, backup_path)
-        return str(backup_path)
-    except Exception:
+def _read_backup_manifest(manifest_path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
         return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def _migrate_legacy_backups(path: Path, backup_suffix: str, max_backups: int) -> Dict[str, Any]:
+    """이전 방식(`.bak`, `.bak.1`, `.bak.2`, ...)으로 쌓인 백업을 한 번 정리
+
+    최근 max_backups 개를 수정 시각 순서대로 슬롯 1..N 으로 옮기고 나머지는 삭제한다.
+    """
+    pattern = re.compile(re.escape(path.name + backup_suffix) + r"(\.\d+)?")
+    legacy = sorted(
+        (
+            entry
+            for entry in path.parent.iterdir()
+            if pattern.fullmatch(entry.name) and entry.is_file()
+        ),
+        key=lambda entry: entry.stat().st_mtime_ns,
+    )
+    keep = legacy[-max_backups:]
+    for entry in legacy[: len(legacy) - len(keep)]:
+        entry.unlink()
+
+    # 슬롯 이름이 기존 백업 이름과 겹칠 수 있어 임시 이름을 거쳐 옮긴다
+    staged = []
+    for index, entry in enumerate(keep):
+        temp = path.with_name(f".{path.name}{backup_suffix}.migrate.{index}")
+        entry.replace(temp)
+        staged.append(temp)
+    for slot, temp in enumerate(staged, start=1):
+        temp.replace(_backup_slot_path(path, backup_suffix, slot))
+
+    return {
+        "max_backups": max_backups,
+        "next_slot": len(keep) % max_backups + 1,
+        "last_backup": _backup_slot_path(path, backup_suffix, len(keep)).name if keep else None,
+        "last_hash": None,
+    }
+
+
+def _resize_backup_ring(
+    path: Path, backup_suffix: str, manifest: Dict[str, Any], max_backups: int
+) -> None:
+    """백업 개수 설정이 줄어든 경우 범위를 벗어난 슬롯을 삭제"""
+    previous = int(manifest.get("max_backups") or 0)
+    for slot in range(max_backups + 1, previous + 1):
+        with contextlib.suppress(OSError):
+            _backup_slot_path(path, backup_suffix, slot).unlink()
+    last_backup = manifest.get("last_backup")
+    if last_backup and not path.with_name(last_backup).exists():
+        manifest["last_backup"] = manifest["last_hash"] = None
+    if int(manifest.get("next_slot", 1)) > max_backups:
+        manifest["next_slot"] = 1
+    manifest["max_backups"] = max_backups
 
 
 def validate_config_structure(
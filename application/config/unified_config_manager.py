@@ -1,7 +1,8 @@
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
 
 from application.config.apps.managers.app_config_manager import AppConfigManager
 from application.config.apps.managers.llm_profile_manager import LLMProfileManager
@@ -96,6 +97,12 @@ class UnifiedConfigManager:
         """앱 설정값 저장"""
         self.app_config_manager.set_config_value(section, key, value)
 
+    @contextmanager
+    def batch(self) -> Iterator["UnifiedConfigManager"]:
+        """여러 앱 설정 변경을 한 번의 저장으로 묶기"""
+        with self.app_config_manager.batch():
+            yield self
+
     def get_ui_config(self) -> Dict[str, Any]:
         """UI 설정 반환"""
         return self.app_config_manager.get_ui_config()
@@ -281,6 +288,8 @@ class UnifiedConfigManager:
     def cleanup(self) -> None:
         """리소스 정리"""
         try:
+            # 지연 저장 대기 중인 앱 설정 기록
+            self.app_config_manager.flush()
             # 각 관리자가 BaseConfigManager를 상속하면 cleanup 메서드가 있을 것임
             # 현재는 직접 호출하지 않음 (각 관리자의 __del__에서 처리)
             logger.info("통합 설정 관리자 정리 완료")
@@ -2,7 +2,26 @@
 MCP (Model Context Protocol) 패키지
 """
 
+from application.llm.mcp.call_guard import (
+    CallLimits,
+    CircuitBreaker,
+    CircuitOpenError,
+    MCPToolTimeoutError,
+)
 from application.llm.mcp.mcp_manager import MCPManager
-from application.llm.mcp.mcp_tool_manager import MCPToolManager
+from application.llm.mcp.mcp_tool_manager import MCPToolManager, MCPToolRegistry
+from application.llm.mcp.session_pool import MCPSessionPool
+from application.llm.mcp.tool_result_cache import ToolCachePolicy, ToolResultCache
 
-__all__ = ["MCPManager", "MCPToolManager"] 
+__all__ = [
+    "CallLimits",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "MCPToolTimeoutError",
+    "MCPManager",
+    "MCPToolManager",
+    "MCPToolRegistry",
+    "MCPSessionPool",
+    "ToolCachePolicy",
+    "ToolResultCache",
+] 
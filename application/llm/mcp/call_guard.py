@@ -0,0 +1,114 @@
+"""
+MCP 도구 호출 보호 - 호출 제한 시간, 동시 호출 한도, 회로 차단기
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Mapping, Optional
+
+DEFAULT_CALL_TIMEOUT = 120.0
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_COOLDOWN = 30.0
+
+# 회로 차단기 상태
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"  # 호출을 바로 실패시킨다
+CIRCUIT_HALF_OPEN = "half_open"  # 쿨다운 후 시험 호출 하나만 허용
+
+
+class MCPToolTimeoutError(TimeoutError):
+    """도구 호출 제한 시간 초과"""
+
+
+class CircuitOpenError(RuntimeError):
+    """회로 차단기가 열려 있어 호출하지 않음"""
+
+
+@dataclass(frozen=True)
+class CallLimits:
+    """서버 하나의 도구 호출 제한 (mcp.json 서버 항목에서 설정)"""
+
+    timeout: float = DEFAULT_CALL_TIMEOUT
+    tool_timeouts: Mapping[str, float] = field(default_factory=dict)
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD
+    cooldown: float = DEFAULT_COOLDOWN
+
+    def timeout_for(self, tool_name: str) -> float:
+        return self.tool_timeouts.get(tool_name, self.timeout)
+
+
+class CircuitBreaker:
+    """연속 실패가 failure_threshold 에 이르면 열리고, cooldown 뒤 시험 호출로 복구를 확인
+
+    풀 이벤트 루프에서만 상태를 바꾸므로 잠금을 쓰지 않는다.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self.state = CIRCUIT_CLOSED
+        self.consecutive_failures = 0
+        self.last_error: Optional[str] = None
+        self._clock = clock
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def retry_in(self) -> float:
+        """열린 상태에서 시험 호출까지 남은 시간(초)"""
+        if self.state != CIRCUIT_OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.cooldown - self._clock())
+
+    def allow(self) -> bool:
+        """호출 허용 여부 (열린 상태에서 쿨다운이 지나면 시험 호출 하나를 허용)"""
+        if self.state == CIRCUIT_OPEN and self.retry_in() <= 0:
+            self.state = CIRCUIT_HALF_OPEN
+        if self.state == CIRCUIT_HALF_OPEN:
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+        return self.state == CIRCUIT_CLOSED
+
+    def record_success(self) -> bool:
+        """성공 기록, 상태가 바뀌었으면 True"""
+        self._trial_in_flight = False
+        self.consecutive_failures = 0
+        self.last_error = None
+        if self.state == CIRCUIT_CLOSED:
+            return False
+        self.state = CIRCUIT_CLOSED
+        return True
+
+    def record_failure(self, error: BaseException) -> bool:
+        """실패 기록, 상태가 바뀌었으면(열렸으면) True"""
+        self._trial_in_flight = False
+        self.consecutive_failures += 1
+        self.last_error = str(error) or type(error).__name__
+        if self.state == CIRCUIT_OPEN:
+            return False
+        if self.state == CIRCUIT_HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.state = CIRCUIT_OPEN
+            self._opened_at = self._clock()
+            return True
+        return False
+
+    def release_trial(self) -> None:
+        """결과 없이 끝난(취소된) 시험 호출 정리"""
+        self._trial_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "retry_in": round(self.retry_in(), 3),
+            "last_error": self.last_error,
+        }
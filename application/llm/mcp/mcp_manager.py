@@ -141,6 +141,10 @@ class MCPManager:
         """서버 상태 반환"""
         return self._server_statuses.get(server_name)
 
+    def set_server_status(self, status: MCPServerStatus) -> None:
+        """서버 상태 기록 (MCPToolManager 가 실제 시작 결과를 알린다)"""
+        self._server_statuses[status.server_name] = status
+
     def get_all_server_statuses(self) -> Dict[str, MCPServerStatus]:
         """모든 서버 상태 반환"""
         return self._server_statuses.copy()
@@ -3,28 +3,152 @@ MCP 도구 관리자 - langchain-mcp-adapters 0.1.0+ 사용
 """
 
 import asyncio
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List, Optional
-
-from langchain_mcp_adapters.client import MultiServerMCPClient
-
+import os
+from concurrent.futures import Future
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from langchain_mcp_adapters.tools import convert_mcp_tool_to_langchain_tool
+from mcp.types import Tool
+
+from application.config.libs.utils import atomic_write_text
+from application.llm.mcp.call_guard import (
+    CIRCUIT_CLOSED,
+    DEFAULT_CALL_TIMEOUT,
+    DEFAULT_COOLDOWN,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_MAX_CONCURRENCY,
+    CallLimits,
+)
 from application.llm.mcp.mcp_manager import MCPManager
+from application.llm.mcp.session_pool import DEFAULT_CONNECT_TIMEOUT, MCPSessionPool
+from application.llm.mcp.tool_result_cache import ToolResultCache, is_write_tool
+from application.llm.models.mcp_server_status import MCPServerStatus
 from application.util.logger import setup_logger
 
 logger = setup_logger("mcp_tool_manager") or logging.getLogger("mcp_tool_manager")
 
+DEFAULT_DISCOVERY_TIMEOUT = 30.0
+DEFAULT_RETRY_INTERVAL = 30.0
+DEFAULT_MCP_TOOL_CACHE_FILE = "mcp_tools_cache.json"
+
+# 서버 상태
+SERVER_READY = "ready"
+SERVER_LAZY = "lazy"  # 도구 정의만 알고 있고 첫 사용 시 프로세스를 띄운다
+SERVER_DEGRADED = "degraded"  # 시작 실패, 백그라운드에서 재시도
+
+
+def _freeze(value: Any) -> Any:
+    """dict/list 를 읽기 전용 Mapping/tuple 로 재귀 변환"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _positive(value: Any, cast: Callable[[Any], Any]) -> Any:
+    """0보다 큰 값으로 변환 (bool 이거나 변환할 수 없으면 ValueError)"""
+    if isinstance(value, bool):
+        raise ValueError(value)
+    result = cast(value)
+    if result <= 0:
+        raise ValueError(value)
+    return result
+
+
+@dataclass
+class _ServerSettings:
+    """mcp.json 서버 항목의 시작 및 도구 호출 관련 설정"""
+
+    lazy: bool = False
+    pool_size: int = 1
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT
+    discovery_timeout: float = DEFAULT_DISCOVERY_TIMEOUT
+    cache: Mapping[str, Any] = field(default_factory=dict)  # 도구별 결과 캐시 정책
+    call_timeout: float = DEFAULT_CALL_TIMEOUT
+    tool_timeouts: Dict[str, float] = field(default_factory=dict)
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD  # circuit_breaker.failure_threshold
+    cooldown: float = DEFAULT_COOLDOWN  # circuit_breaker.cooldown
+
+    @property
+    def call_limits(self) -> CallLimits:
+        return CallLimits(
+            timeout=self.call_timeout,
+            tool_timeouts=dict(self.tool_timeouts),
+            max_concurrency=self.max_concurrency,
+            failure_threshold=self.failure_threshold,
+            cooldown=self.cooldown,
+        )
+
+
+@dataclass(frozen=True)
+class MCPToolRegistry:
+    """도구 목록의 불변 스냅샷
+
+    도구 목록이 바뀔 때(initialize, refresh_tools, degraded 서버 복구)만 새로 만들고
+    generation 을 올린다. 에이전트는 generation 이 같은 동안 도구 바인딩을 재사용할 수 있다.
+    """
+
+    generation: int
+    tools: Tuple[Any, ...]
+    by_name: Mapping[str, Any]
+    servers: Mapping[str, str]  # 도구 이름 → 서버 이름
+    openai_tools: Tuple[Mapping[str, Any], ...]
+    openai_tools_json: str  # get_openai_tools 가 매번 일반 dict 사본을 만들 때 쓰는 직렬화 결과
+
+
+_EMPTY_REGISTRY = MCPToolRegistry(
+    generation=0,
+    tools=(),
+    by_name=MappingProxyType({}),
+    servers=MappingProxyType({}),
+    openai_tools=(),
+    openai_tools_json="[]",
+)
+
 
 class MCPToolManager:
     """
     진정한 MCP 통합을 위한 도구 관리자
     langchain-mcp-adapters 0.1.0+ 사용
+
+    서버는 동시에 시작하며, 시작에 실패하거나 제한 시간을 넘긴 서버는 degraded 로 표시하고
+    다른 서버를 막지 않는다. degraded 서버는 retry_interval 마다 백그라운드에서 재시도한다.
+    lazy 서버는 캐시된 도구 정의로 도구를 만들고 첫 호출 때 프로세스를 띄운다.
+
+    도구 호출 제한 시간(call_timeout, tool_timeouts), 동시 호출 수(max_concurrency),
+    회로 차단기(circuit_breaker)는 서버 항목에서 설정하며 세션 풀이 적용한다.
+
+        "chrome": {"command": "...", "call_timeout": 60, "tool_timeouts": {"navigate": 90},
+                   "max_concurrency": 1, "circuit_breaker": {"failure_threshold": 3}}
     """
 
-    def __init__(self, mcp_manager: MCPManager, config_manager: Any):
+    def __init__(
+        self,
+        mcp_manager: MCPManager,
+        config_manager: Any,
+        retry_interval: float = DEFAULT_RETRY_INTERVAL,
+        tool_cache_file: Optional[str] = DEFAULT_MCP_TOOL_CACHE_FILE,
+    ):
         self.mcp_manager = mcp_manager
         self.config_manager = config_manager
-        self.mcp_client: Optional[MultiServerMCPClient] = None
-        self.langchain_tools: List[Any] = []
+        self.retry_interval = retry_interval
+        self.tool_cache_file = tool_cache_file
+        self.session_pool: Optional[MCPSessionPool] = None
+        self._registry = _EMPTY_REGISTRY
+        self.result_cache = ToolResultCache()
+        self.server_states: Dict[str, str] = {}
+        self._server_settings: Dict[str, _ServerSettings] = {}
+        self._server_tools: Dict[str, List[Any]] = {}
+        self._retry_future: Optional[Future] = None
         self._initialized = False
         self._lock = asyncio.Lock()
 
@@ -53,11 +177,25 @@ class MCPToolManager:
 
                 logger.info(f"MCP 서버 설정: {list(server_configs.keys())}")
 
-                # MultiServerMCPClient 초기화 (컨텍스트 매니저 사용 안 함)
-                self.mcp_client = MultiServerMCPClient(server_configs)
-
-                # 직접 도구 로드 (langchain-mcp-adapters 0.1.0+ 방식)
-                await self._load_tools()
+                # 서버별 세션을 열어 두고 도구 호출마다 재사용
+                self._server_settings = self._build_server_settings(mcp_config, server_configs)
+                self.result_cache = ToolResultCache.from_config(
+                    getattr(mcp_config, "tool_cache", None)
+                )
+                for name, settings in self._server_settings.items():
+                    self.result_cache.configure(name, settings.cache)
+                self.session_pool = MCPSessionPool(
+                    server_configs,
+                    sizes={name: s.pool_size for name, s in self._server_settings.items()},
+                    connect_timeouts={
+                        name: s.connect_timeout for name, s in self._server_settings.items()
+                    },
+                    call_limits={
+                        name: s.call_limits for name, s in self._server_settings.items()
+                    },
+                    on_circuit_change=self._on_circuit_change,
+                )
+                await self._load_tools(use_cache=True)
 
                 self._initialized = True
                 logger.info(f"MCP 도구 관리자 초기화 완료: {len(self.langchain_tools)}개 도구")
@@ -100,40 +238,321 @@ class MCPToolManager:
 
         return server_configs
 
-    async def _load_tools(self) -> None:
-        """Langchain 도구 로드 (새로운 API 사용)"""
-        try:
-            if not self.mcp_client:
-                logger.warning("MCP 클라이언트가 초기화되지 않았습니다")
-                return
+    def _build_server_settings(
+        self, mcp_config: Any, server_configs: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, _ServerSettings]:
+        """서버별 설정 (시작 설정, 결과 캐시 정책, 도구 호출 제한)"""
+        enabled_servers = mcp_config.get_enabled_servers()
+        settings = {}
+        for server_name in server_configs:
+            server_data = enabled_servers.get(server_name, {})
+            server_settings = _ServerSettings(lazy=bool(server_data.get("lazy", False)))
+            if isinstance(server_data.get("cache"), Mapping):
+                server_settings.cache = server_data["cache"]
+            elif "cache" in server_data:
+                logger.warning(f"서버 {server_name}: cache 는 도구 이름 → 정책 객체여야 합니다")
+            breaker = server_data.get("circuit_breaker", {})
+            if not isinstance(breaker, Mapping):
+                logger.warning(f"서버 {server_name}: circuit_breaker 는 객체여야 합니다")
+                breaker = {}
+            for source, key, cast in (
+                (server_data, "pool_size", int),
+                (server_data, "connect_timeout", float),
+                (server_data, "discovery_timeout", float),
+                (server_data, "call_timeout", float),
+                (server_data, "max_concurrency", int),
+                (breaker, "failure_threshold", int),
+                (breaker, "cooldown", float),
+            ):
+                if key not in source:
+                    continue
+                try:
+                    setattr(server_settings, key, _positive(source[key], cast))
+                except (TypeError, ValueError):
+                    logger.warning(f"서버 {server_name}: 잘못된 {key} 값 {source[key]!r}")
+            tool_timeouts = server_data.get("tool_timeouts", {})
+            if not isinstance(tool_timeouts, Mapping):
+                logger.warning(f"서버 {server_name}: tool_timeouts 는 도구 이름 → 초 객체여야 합니다")
+                tool_timeouts = {}
+            for tool_name, value in tool_timeouts.items():
+                try:
+                    server_settings.tool_timeouts[str(tool_name)] = _positive(value, float)
+                except (TypeError, ValueError):
+                    logger.warning(f"서버 {server_name}: 도구 {tool_name} 제한 시간 무시 {value!r}")
+            settings[server_name] = server_settings
+        return settings
+
+    async def _load_tools(self, use_cache: bool = False) -> None:
+        """모든 서버를 동시에 시작하고 Langchain 도구 로드 (도구는 세션 풀을 통해 호출된다)"""
+        pool = self.session_pool
+        if not pool:
+            logger.warning("MCP 세션 풀이 초기화되지 않았습니다")
+            return
+
+        await asyncio.gather(
+            *(self._start_server(pool, name, use_cache) for name in pool.connections)
+        )
+        self._rebuild_tools(pool)
 
-            # langchain-mcp-adapters 0.1.0+ 방식: 직접 get_tools() 호출
-            self.langchain_tools = await self.mcp_client.get_tools()
+        logger.info(f"Langchain 도구 {len(self.langchain_tools)}개 로드 완료")
+        for tool in self.langchain_tools:
+            logger.debug(f"  - {tool.name}: {tool.description}")
+
+        if SERVER_DEGRADED in self.server_states.values():
+            self._schedule_retry(pool)
 
-            logger.info(f"Langchain 도구 {len(self.langchain_tools)}개 로드 완료")
-            for tool in self.langchain_tools:
-                logger.debug(f"  - {tool.name}: {tool.description}")
+    async def _start_server(self, pool: MCPSessionPool, server_name: str, use_cache: bool) -> None:
+        """서버 하나를 시작하고 도구를 찾는다 (실패는 degraded 상태로 남기고 전파하지 않음)"""
+        settings = self._server_settings.get(server_name, _ServerSettings())
+        try:
+            definitions = self._load_cached_tools(pool, server_name) if settings.lazy else None
+            if definitions is None or not use_cache:
+                was_running = pool.is_server_running(server_name)
+                await pool.warm_up(server_name)  # 연결 제한 시간은 풀이 적용
+                definitions = await asyncio.wait_for(
+                    self._discover_tools(pool, server_name), settings.discovery_timeout
+                )
+                if settings.lazy:
+                    self._save_cached_tools(pool, server_name, definitions)
+                    if not was_running:
+                        await pool.stop_server(server_name)
+
+            session = pool.session(server_name)
+            self._server_tools[server_name] = [
+                convert_mcp_tool_to_langchain_tool(session, tool, server_name=server_name)
+                for tool in definitions
+            ]
+            self.result_cache.invalidate(server_name)  # 새로 시작한 서버의 결과만 믿는다
+            state = SERVER_READY if pool.is_server_running(server_name) else SERVER_LAZY
+            self._set_server_state(server_name, state, definitions)
+            logger.info(f"MCP 서버 {server_name} 시작 ({state}): {len(definitions)}개 도구")
 
         except Exception as e:
-            logger.error(f"도구 로드 실패: {e}")
-            # 에러 로그에 더 자세한 정보 추가
-            import traceback
+            error = str(e) or type(e).__name__
+            logger.warning(f"MCP 서버 {server_name} 시작 실패, degraded 로 표시: {error}")
+            with suppress(Exception):
+                await pool.stop_server(server_name)
+            self._server_tools.pop(server_name, None)
+            self._set_server_state(server_name, SERVER_DEGRADED, error=error)
+
+    async def _discover_tools(self, pool: MCPSessionPool, server_name: str) -> List[Tool]:
+        """서버의 도구 정의 조회 (페이지 단위)"""
+        tools: List[Tool] = []
+        cursor = None
+        while True:
+            page = await pool.list_tools(server_name, cursor)
+            tools.extend(page.tools)
+            cursor = page.nextCursor
+            if not cursor:
+                return tools
+
+    def _rebuild_tools(self, pool: MCPSessionPool) -> None:
+        """서버 설정 순서대로 도구 목록 재구성"""
+        tools = []
+        servers: Dict[str, str] = {}
+        for name in pool.connections:
+            for tool in self._server_tools.get(name, []):
+                tools.append(tool)
+                servers.setdefault(tool.name, name)
+        self._publish_tools(tools, servers)
+
+    def _publish_tools(
+        self, tools: Sequence[Any], servers: Optional[Mapping[str, str]] = None
+    ) -> None:
+        """이름 색인과 OpenAI 스키마를 미리 만들어 새 레지스트리로 교체"""
+        by_name: Dict[str, Any] = {}
+        schemas = []
+        for tool in tools:
+            by_name.setdefault(tool.name, tool)  # 이름이 겹치면 먼저 나온 도구 사용
+            schema = self._build_openai_schema(tool)
+            if schema is not None:
+                schemas.append(schema)
+
+        # 읽는 쪽이 잠금 없이 일관된 목록을 보도록 한 번에 교체한다
+        self._registry = MCPToolRegistry(
+            generation=self._registry.generation + 1,
+            tools=tuple(tools),
+            by_name=MappingProxyType(by_name),
+            servers=MappingProxyType(dict(servers or {})),
+            openai_tools=tuple(_freeze(schema) for schema in schemas),
+            openai_tools_json=json.dumps(schemas, ensure_ascii=False, default=str),
+        )
 
-            logger.error(f"도구 로드 실패 상세: {traceback.format_exc()}")
-            self.langchain_tools = []
+    def _build_openai_schema(self, langchain_tool: Any) -> Optional[Dict[str, Any]]:
+        """Langchain 도구를 OpenAI 함수 스키마로 변환"""
+        empty_schema = {"type": "object", "properties": {}, "required": []}
+        try:
+            args_schema = getattr(langchain_tool, "args_schema", None)
+            if isinstance(args_schema, dict):  # MCP 도구는 inputSchema 를 그대로 쓴다
+                parameters = args_schema
+            elif args_schema is not None:
+                try:
+                    parameters = args_schema.model_json_schema()
+                except Exception as schema_e:
+                    logger.warning(f"도구 {langchain_tool.name} 스키마 변환 실패: {schema_e}")
+                    parameters = empty_schema
+            else:
+                parameters = empty_schema
+
+            return {
+                "type": "function",
+                "function": {
+                    "name": langchain_tool.name,
+                    "description": langchain_tool.description,
+                    "parameters": parameters or empty_schema,
+                },
+            }
+        except Exception as e:
+            logger.warning(f"도구 {getattr(langchain_tool, 'name', '?')} 스키마 변환 실패: {e}")
+            return None
+
+    @property
+    def langchain_tools(self) -> List[Any]:
+        """현재 Langchain 도구 목록"""
+        return list(self._registry.tools)
+
+    @property
+    def tools_generation(self) -> int:
+        """도구 목록 세대 번호 (도구 목록이 바뀔 때마다 증가)"""
+        return self._registry.generation
+
+    def get_tool_registry(self) -> MCPToolRegistry:
+        """현재 도구 레지스트리 스냅샷"""
+        return self._registry
+
+    def _set_server_state(
+        self,
+        server_name: str,
+        state: str,
+        definitions: Optional[List[Tool]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """서버 상태 기록 및 MCPManager 상태 갱신"""
+        self.server_states[server_name] = state
+        if not hasattr(self.mcp_manager, "set_server_status"):
+            return
+        self.mcp_manager.set_server_status(
+            MCPServerStatus(
+                server_name=server_name,
+                connected=state == SERVER_READY,
+                tools=[
+                    {
+                        "name": tool.name,
+                        "description": tool.description or "",
+                        "inputSchema": tool.inputSchema,
+                    }
+                    for tool in definitions or []
+                ],
+                error_message=error,
+                metadata={"state": state, "circuit": self._circuit_state(server_name)},
+            )
+        )
+
+    def _circuit_state(self, server_name: str) -> Dict[str, Any]:
+        pool = self.session_pool
+        if pool is None or server_name not in pool.connections:
+            return {"state": CIRCUIT_CLOSED}
+        return pool.get_circuit_state(server_name)
+
+    def _on_circuit_change(self, server_name: str, circuit: Dict[str, Any]) -> None:
+        """회로 차단기 상태를 MCPManager 서버 상태에 반영 (세션 풀 루프에서 호출)"""
+        get_status = getattr(self.mcp_manager, "get_server_status", None)
+        status = get_status(server_name) if get_status else None
+        if status is None or not hasattr(self.mcp_manager, "set_server_status"):
+            return
+        closed = circuit["state"] == CIRCUIT_CLOSED
+        error = None if closed else f"회로 차단기 열림: {circuit.get('last_error')}"
+        self.mcp_manager.set_server_status(
+            status.model_copy(
+                update={
+                    "connected": closed and self.server_states.get(server_name) == SERVER_READY,
+                    "error_message": error,
+                    "last_check": datetime.now(),
+                    "metadata": {**status.metadata, "circuit": circuit},
+                }
+            )
+        )
+
+    def get_server_states(self) -> Dict[str, str]:
+        """서버 이름 → 상태 (ready / lazy / degraded)"""
+        return dict(self.server_states)
+
+    def _schedule_retry(self, pool: MCPSessionPool) -> None:
+        """degraded 서버 재시도 작업 예약 (풀 루프에서 실행되어 호출자 루프와 무관)"""
+        if self._retry_future is not None and not self._retry_future.done():
+            return
+        self._retry_future = pool.spawn(self._retry_degraded_servers(pool))
+
+    async def _retry_degraded_servers(self, pool: MCPSessionPool) -> None:
+        while True:
+            await asyncio.sleep(self.retry_interval)
+            if pool is not self.session_pool:
+                return
+            degraded = [
+                name for name, state in self.server_states.items() if state == SERVER_DEGRADED
+            ]
+            if not degraded:
+                return
+            logger.info(f"degraded MCP 서버 재시도: {degraded}")
+            await asyncio.gather(*(self._start_server(pool, name, True) for name in degraded))
+            self._rebuild_tools(pool)
+
+    def _tool_cache_key(self, pool: MCPSessionPool, server_name: str) -> str:
+        """연결 설정이 바뀌면 캐시를 무시하도록 연결 설정의 해시를 키로 사용"""
+        connection = json.dumps(pool.connections[server_name], sort_keys=True, default=str)
+        return hashlib.sha256(connection.encode("utf-8")).hexdigest()
+
+    def _read_tool_cache(self) -> Dict[str, Any]:
+        if not self.tool_cache_file or not os.path.exists(self.tool_cache_file):
+            return {}
+        try:
+            with open(self.tool_cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception as e:
+            logger.warning(f"MCP 도구 캐시 읽기 실패: {e}")
+            return {}
+
+    def _load_cached_tools(self, pool: MCPSessionPool, server_name: str) -> Optional[List[Tool]]:
+        """lazy 서버의 캐시된 도구 정의 (없거나 연결 설정이 바뀌었으면 None)"""
+        entry = self._read_tool_cache().get(server_name)
+        if not isinstance(entry, dict) or entry.get("key") != self._tool_cache_key(
+            pool, server_name
+        ):
+            return None
+        try:
+            return [Tool.model_validate(tool) for tool in entry.get("tools", [])]
+        except Exception as e:
+            logger.warning(f"서버 {server_name} 도구 캐시 손상: {e}")
+            return None
+
+    def _save_cached_tools(
+        self, pool: MCPSessionPool, server_name: str, definitions: List[Tool]
+    ) -> None:
+        if not self.tool_cache_file:
+            return
+        cache = self._read_tool_cache()
+        cache[server_name] = {
+            "key": self._tool_cache_key(pool, server_name),
+            "tools": [tool.model_dump(mode="json", exclude_none=True) for tool in definitions],
+        }
+        try:
+            atomic_write_text(self.tool_cache_file, json.dumps(cache, ensure_ascii=False, indent=2))
+        except Exception as e:
+            logger.warning(f"MCP 도구 캐시 저장 실패: {e}")
 
     async def get_langchain_tools(self) -> List[Any]:
         """Langchain 도구 목록 반환"""
         if not self._initialized:
             await self.initialize()
-        return self.langchain_tools.copy()
+        return list(self._registry.tools)
 
     async def refresh_tools(self) -> None:
-        """도구 목록 새로고침"""
+        """도구 목록 새로고침 (lazy 서버도 도구 정의를 다시 조회)"""
         async with self._lock:
             try:
-                if self.mcp_client and self._initialized:
-                    await self._load_tools()
+                if self.session_pool and self._initialized:
+                    await self._load_tools(use_cache=False)
                     logger.info("MCP 도구 목록 새로고침 완료")
                 else:
                     logger.warning("MCP 클라이언트가 초기화되지 않아 새로고침을 건너뜁니다")
@@ -142,77 +561,81 @@ class MCPToolManager:
 
     def get_tool_descriptions(self) -> str:
         """도구 설명 텍스트 반환"""
-        if not self.langchain_tools:
+        if not self._registry.tools:
             return "사용 가능한 MCP 도구가 없습니다."
 
         descriptions = []
-        for tool in self.langchain_tools:
+        for tool in self._registry.tools:
             descriptions.append(f"- {tool.name}: {tool.description}")
 
         return "\n".join(descriptions)
 
     def get_tool_count(self) -> int:
         """도구 개수 반환"""
-        return len(self.langchain_tools)
+        return len(self._registry.tools)
 
     async def get_openai_tools(self) -> List[Dict[str, Any]]:
-        """OpenAI 형식의 도구 스키마 반환 (하위 호환성)"""
-        tools = []
-        for langchain_tool in self.langchain_tools:
-            try:
-                # Langchain 도구를 OpenAI 형식으로 변환
-                args_schema = {}
-                if hasattr(langchain_tool, "args_schema") and langchain_tool.args_schema:
-                    try:
-                        args_schema = langchain_tool.args_schema.model_json_schema()
-                    except Exception as schema_e:
-                        logger.warning(f"도구 {langchain_tool.name} 스키마 변환 실패: {schema_e}")
-                        args_schema = {"type": "object", "properties": {}, "required": []}
-
-                tool_schema = {
-                    "type": "function",
-                    "function": {
-                        "name": langchain_tool.name,
-                        "description": langchain_tool.description,
-                        "parameters": args_schema
-                        or {"type": "object", "properties": {}, "required": []},
-                    },
-                }
-                tools.append(tool_schema)
-            except Exception as e:
-                logger.warning(f"도구 {langchain_tool.name} 스키마 변환 실패: {e}")
+        """OpenAI 형식의 도구 스키마 반환 (하위 호환성)
 
+        스키마는 도구 목록이 바뀔 때 한 번만 만들어 두고, 호출자가 JSON 으로 직렬화하거나
+        고칠 수 있도록 직렬화해 둔 결과에서 일반 dict 사본을 만들어 반환한다.
+        레지스트리의 읽기 전용 스키마는 get_tool_registry().openai_tools 로 읽는다.
+        """
+        tools: List[Dict[str, Any]] = json.loads(self._registry.openai_tools_json)
         return tools
 
-    async def call_mcp_tool(self, tool_name: str, arguments: Dict[str, Any]) -> str:
-        """MCP 도구 호출 (하위 호환성 - 직접 호출하지 말고 Langchain을 통해 사용)"""
-        try:
-            # Langchain 도구 찾기
-            target_tool = None
-            for tool in self.langchain_tools:
-                if tool.name == tool_name:
-                    target_tool = tool
-                    break
+    async def call_mcp_tool(
+        self, tool_name: str, arguments: Dict[str, Any], use_cache: bool = True
+    ) -> str:
+        """MCP 도구 호출 (하위 호환성 - 직접 호출하지 말고 Langchain을 통해 사용)
 
+        캐시 정책이 있는 도구는 결과를 재사용한다. use_cache=False 이면 캐시를 읽지 않고
+        새로 호출한 결과로 캐시를 갱신한다. 제한 시간 초과나 열린 회로 차단기는 세션 풀이
+        오류로 알리며 실패 메시지로 반환한다.
+        """
+        try:
+            registry = self._registry
+            target_tool = registry.by_name.get(tool_name)
             if not target_tool:
                 return f"도구 '{tool_name}'을 찾을 수 없습니다."
 
+            cache = self.result_cache
+            server_name = registry.servers.get(tool_name, "")
+            hints = getattr(target_tool, "metadata", None)
+            policy = cache.policy_for(server_name, tool_name, hints)
+            if policy.cacheable:
+                if use_cache:
+                    cached = cache.get(server_name, tool_name, arguments)
+                    if cached is not None:
+                        return cached
+                else:
+                    cache.record_bypass(server_name, tool_name)
+
             # 도구 실행
-            result = await target_tool.ainvoke(arguments)
-            return str(result)
+            try:
+                result = str(await target_tool.ainvoke(arguments))
+            finally:
+                if not policy.cacheable and is_write_tool(tool_name, hints):
+                    # 부작용이 있는 도구를 호출했으면 같은 서버의 캐시 결과는 더 이상 믿을 수 없다
+                    cache.invalidate(server_name)
+
+            cache.put(server_name, tool_name, arguments, result, policy)
+            return result
 
         except Exception as e:
             logger.error(f"MCP 도구 {tool_name} 호출 실패: {e}")
             return f"도구 호출 실패: {e}"
 
     async def _cleanup_client(self) -> None:
-        """MCP 클라이언트 정리 (컨텍스트 매니저 사용 안 함)"""
-        if self.mcp_client:
+        """MCP 세션 풀 정리 (열어 둔 세션과 서버 프로세스 종료)"""
+        if self._retry_future is not None:
+            self._retry_future.cancel()
+            self._retry_future = None
+        if self.session_pool:
             try:
-                # langchain-mcp-adapters 0.1.0+에서는 명시적 정리가 필요하지 않음
-                # 단순히 None으로 설정
-                self.mcp_client = None
-                logger.debug("MCP 클라이언트 정리 완료")
+                pool, self.session_pool = self.session_pool, None
+                await pool.aclose()
+                logger.debug("MCP 세션 풀 정리 완료")
             except Exception as e:
                 logger.warning(f"MCP 클라이언트 정리 중 오류: {e}")
 
@@ -221,7 +644,10 @@ class MCPToolManager:
         async with self._lock:
             try:
                 await self._cleanup_client()
-                self.langchain_tools = []
+                self._publish_tools([])
+                self.result_cache.clear()
+                self.server_states = {}
+                self._server_tools = {}
                 self._initialized = False
                 logger.info("MCP 도구 관리자 정리 완료")
 
@@ -0,0 +1,511 @@
+"""
+MCP 세션 풀 - 서버별로 오래 유지되는 ClientSession 을 재사용
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+from concurrent.futures import Future
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Set, TypeVar
+
+import anyio
+from langchain_mcp_adapters.sessions import Connection, create_session
+from mcp import ClientSession
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, CallToolResult, ListToolsResult
+
+from application.llm.mcp.call_guard import (
+    CallLimits,
+    CircuitBreaker,
+    CircuitOpenError,
+    MCPToolTimeoutError,
+)
+from application.util.logger import setup_logger
+
+logger = setup_logger("mcp_session_pool") or logging.getLogger("mcp_session_pool")
+
+T = TypeVar("T")
+
+DEFAULT_CONNECT_TIMEOUT = 30.0
+
+# 요청이 서버에 전달되지 않았음이 확실한 오류 (닫힌 stdio 스트림에 쓰기 시도)
+_UNDELIVERED_ERRORS = (anyio.ClosedResourceError, anyio.BrokenResourceError)
+
+
+@dataclass
+class _Slot:
+    """풀에 속한 세션 하나 (소유 태스크가 세션 컨텍스트를 열고 닫는다)"""
+
+    server_name: str
+    ready: "asyncio.Future[ClientSession]"
+    stop: asyncio.Event = field(default_factory=asyncio.Event)
+    task: Optional["asyncio.Task[None]"] = None
+    session: Optional[ClientSession] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.session is not None and self.task is not None and not self.task.done()
+
+
+class MCPSessionPool:
+    """서버별 MCP 세션 풀
+
+    stdio 서버는 세션마다 프로세스를 하나 띄우므로 호출마다 세션을 새로 열면 인터프리터
+    기동 비용을 매번 치른다. 풀은 서버당 size 개의 세션을 열어 둔 채 돌아가며 사용하고,
+    응답하지 않는 세션은 다시 띄운다.
+
+    도구 호출에는 서버별 CallLimits 를 적용한다. 제한 시간을 넘긴 호출은
+    MCPToolTimeoutError 로 끝나고, 동시 호출 수는 서버별 세마포어로 제한한다. 연속 실패가
+    쌓이면 회로 차단기가 열려 cooldown 동안 CircuitOpenError 로 바로 실패시키고, 멈춘
+    프로세스를 내려 시험 호출 때 새로 띄운다.
+
+    세션(과 stdio 프로세스)은 풀 전용 이벤트 루프 스레드에서 관리하므로, 메시지마다 새
+    이벤트 루프를 만드는 호출자도 같은 세션을 공유할 수 있다.
+    """
+
+    def __init__(
+        self,
+        connections: Dict[str, Connection],
+        size: int = 1,
+        sizes: Optional[Dict[str, int]] = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        connect_timeouts: Optional[Dict[str, float]] = None,
+        ping_timeout: float = 5.0,
+        health_check_interval: float = 30.0,
+        call_limits: Optional[Dict[str, CallLimits]] = None,
+        on_circuit_change: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    ) -> None:
+        """
+        Args:
+            connections: 서버 이름 → langchain-mcp-adapters 연결 설정
+            size: 서버당 기본 세션 수
+            sizes: 서버별 세션 수 (없으면 size)
+            connect_timeout: 세션 연결(프로세스 기동 + initialize) 제한 시간(초)
+            connect_timeouts: 서버별 연결 제한 시간 (없으면 connect_timeout)
+            ping_timeout: 상태 확인 ping 제한 시간(초)
+            health_check_interval: 주기적 상태 확인 간격(초), 0 이하이면 사용 안 함
+            call_limits: 서버별 도구 호출 제한 (없으면 기본값)
+            on_circuit_change: 회로 차단기 상태가 바뀔 때 (서버 이름, 스냅샷)으로 호출
+        """
+        self.connections = dict(connections)
+        self.size = max(1, size)
+        self.sizes = dict(sizes or {})
+        self.connect_timeout = connect_timeout
+        self.connect_timeouts = dict(connect_timeouts or {})
+        self.ping_timeout = ping_timeout
+        self.health_check_interval = health_check_interval
+        call_limits = call_limits or {}
+        self.call_limits = {name: call_limits.get(name, CallLimits()) for name in connections}
+        self.on_circuit_change = on_circuit_change
+        self.sessions_started = 0  # 새로 연 세션 수 (재시작 포함)
+
+        self._slots: Dict[str, List[_Slot]] = {}
+        self._round_robin: Dict[str, "itertools.count[int]"] = {}
+        self._server_locks: Dict[str, asyncio.Lock] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._health_task: Optional["asyncio.Task[None]"] = None
+        self._semaphores = {
+            name: asyncio.Semaphore(max(1, limits.max_concurrency))
+            for name, limits in self.call_limits.items()
+        }
+        self._breakers = {
+            name: CircuitBreaker(limits.failure_threshold, limits.cooldown)
+            for name, limits in self.call_limits.items()
+        }
+        self._background: Set["asyncio.Task[None]"] = set()
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API (어느 이벤트 루프에서든 호출 가능)
+    # ------------------------------------------------------------------
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """풀 전용 이벤트 루프 스레드 시작"""
+        with self._lock:
+            if self.is_running:
+                return
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            self._loop = loop
+            self._thread = threading.Thread(target=run, name="mcp-session-pool", daemon=True)
+            self._thread.start()
+            ready.wait()
+            if self.health_check_interval > 0:
+                asyncio.run_coroutine_threadsafe(self._start_health_loop(), loop).result()
+            logger.info("MCP 세션 풀 시작: %s", list(self.connections))
+
+    async def call_tool(
+        self, server_name: str, name: str, arguments: Optional[Dict[str, Any]] = None, **kwargs: Any
+    ) -> CallToolResult:
+        """서버의 풀 세션으로 도구 호출"""
+        return await self._submit(self._call_tool(server_name, name, arguments, kwargs))
+
+    async def list_tools(self, server_name: str, cursor: Optional[str] = None) -> ListToolsResult:
+        """서버의 풀 세션으로 도구 목록 조회"""
+        return await self._submit(self._list_tools(server_name, cursor))
+
+    async def warm_up(self, server_name: str) -> None:
+        """서버의 세션을 미리 모두 연다"""
+        await self._submit(self._fill(server_name))
+
+    async def health_check(self) -> Dict[str, bool]:
+        """모든 세션에 ping 을 보내고 응답하지 않는 세션을 다시 띄운다
+
+        Returns:
+            서버 이름 → 모든 세션이 정상이었는지 여부
+        """
+        return await self._submit(self._health_check())
+
+    async def stop_server(self, server_name: str) -> None:
+        """서버의 세션을 모두 닫는다 (다음 사용 시 다시 띄움)"""
+        await self._submit(self._stop_server(server_name))
+
+    def is_server_running(self, server_name: str) -> bool:
+        """서버에 살아있는 세션이 있는지 여부"""
+        return any(slot.alive for slot in self._slots.get(server_name, []))
+
+    def get_circuit_state(self, server_name: str) -> Dict[str, Any]:
+        """서버 회로 차단기 스냅샷 (state, consecutive_failures, retry_in, last_error)"""
+        return self._breakers[server_name].snapshot()
+
+    def spawn(self, coro: Coroutine[Any, Any, T]) -> "Future[T]":
+        """풀 루프에서 백그라운드 작업 실행 (호출자 루프가 끝나도 계속 실행된다)"""
+        if not self.is_running:
+            self.start()
+        assert self._loop is not None
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def session(self, server_name: str) -> "PooledSession":
+        """langchain-mcp-adapters 도구에 넘길 세션 대리 객체"""
+        return PooledSession(self, server_name)
+
+    async def aclose(self) -> None:
+        await asyncio.to_thread(self.close)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """모든 세션과 서버 프로세스를 정리하고 루프 스레드를 종료"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None or not thread.is_alive():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_all(), loop).result(timeout)
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning("MCP 세션 정리 중 오류: %s", e)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+        logger.info("MCP 세션 풀 종료")
+
+    # ------------------------------------------------------------------
+    # Internals (풀 루프에서 실행)
+    # ------------------------------------------------------------------
+    def _submit(self, coro: Coroutine[Any, Any, T]) -> "asyncio.Future[T]":
+        if not self.is_running:
+            self.start()
+        assert self._loop is not None
+        future: "Future[T]" = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        return asyncio.wrap_future(future)
+
+    async def _call_tool(
+        self,
+        server_name: str,
+        name: str,
+        arguments: Optional[Dict[str, Any]],
+        kwargs: Dict[str, Any],
+    ) -> CallToolResult:
+        """회로 차단기, 동시 호출 한도, 제한 시간을 적용한 도구 호출"""
+        if server_name not in self.connections:
+            raise KeyError(f"알 수 없는 MCP 서버: {server_name}")
+        breaker = self._breakers[server_name]
+        if not breaker.allow():
+            raise CircuitOpenError(
+                f"MCP 서버 {server_name} 회로 차단기 열림 "
+                f"({breaker.retry_in():.0f}초 뒤 재시도, 최근 오류: {breaker.last_error})"
+            )
+
+        loop = asyncio.get_running_loop()
+        timeout = self.call_limits[server_name].timeout_for(name)
+        deadline = loop.time() + timeout
+        semaphore = self._semaphores[server_name]
+        recorded = False
+        try:
+            try:
+                # 차례를 기다리다 넘긴 시간은 서버 잘못이 아니므로 실패로 세지 않는다
+                await asyncio.wait_for(semaphore.acquire(), timeout)
+            except asyncio.TimeoutError:
+                raise MCPToolTimeoutError(f"MCP 도구 {name} 동시 호출 대기 시간 초과 ({timeout}s)") from None
+            try:
+                result = await asyncio.wait_for(
+                    self._call_tool_once(server_name, name, arguments, kwargs),
+                    max(0.0, deadline - loop.time()),
+                )
+            except asyncio.TimeoutError:
+                error = MCPToolTimeoutError(f"MCP 도구 {name} 호출 시간 초과 ({timeout}s)")
+                recorded = True
+                self._record_failure(server_name, error)
+                raise error from None
+            except McpError as e:
+                # 오류 응답을 보낸 서버는 살아 있다 (연결이 끊긴 경우만 실패로 센다)
+                recorded = True
+                if e.error.code == CONNECTION_CLOSED:
+                    self._record_failure(server_name, e)
+                elif breaker.record_success():
+                    self._notify_circuit(server_name)
+                raise
+            except Exception as e:
+                recorded = True
+                self._record_failure(server_name, e)
+                raise
+            finally:
+                semaphore.release()
+        finally:
+            if not recorded:
+                breaker.release_trial()
+
+        if breaker.record_success():
+            logger.info("MCP 서버 회로 차단기 닫힘: %s", server_name)
+            self._notify_circuit(server_name)
+        return result
+
+    def _record_failure(self, server_name: str, error: BaseException) -> None:
+        if not self._breakers[server_name].record_failure(error):
+            return
+        logger.warning("MCP 서버 회로 차단기 열림: %s (%s)", server_name, error)
+        # 멈춘 프로세스는 이후 호출도 막으므로 내려 두고 시험 호출 때 새로 띄운다
+        task = asyncio.get_running_loop().create_task(self._stop_server(server_name))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        self._notify_circuit(server_name)
+
+    def _notify_circuit(self, server_name: str) -> None:
+        if self.on_circuit_change is None:
+            return
+        try:
+            self.on_circuit_change(server_name, self.get_circuit_state(server_name))
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning("회로 차단기 상태 전달 실패 [%s]: %s", server_name, e)
+
+    async def _call_tool_once(
+        self,
+        server_name: str,
+        name: str,
+        arguments: Optional[Dict[str, Any]],
+        kwargs: Dict[str, Any],
+    ) -> CallToolResult:
+        slot = await self._acquire(server_name)
+        assert slot.session is not None
+        try:
+            return await slot.session.call_tool(name, arguments, **kwargs)
+        except _UNDELIVERED_ERRORS:
+            # 요청을 보내기 전에 세션이 이미 끊겨 있었으므로 새 세션으로 한 번 다시 시도한다
+            logger.warning("MCP 세션 연결 끊김, 재시작 후 재시도: %s", server_name)
+            await self._restart(slot)
+            slot = await self._acquire(server_name)
+            assert slot.session is not None
+            return await slot.session.call_tool(name, arguments, **kwargs)
+        except McpError as e:
+            # 처리 도중 끊긴 호출은 이미 실행됐을 수 있으므로 세션만 교체하고 재시도하지 않는다
+            if e.error.code == CONNECTION_CLOSED:
+                slot.session = None
+            raise
+
+    async def _list_tools(self, server_name: str, cursor: Optional[str]) -> ListToolsResult:
+        slot = await self._acquire(server_name)
+        assert slot.session is not None
+        try:
+            return await slot.session.list_tools(cursor=cursor)
+        except _UNDELIVERED_ERRORS:
+            await self._restart(slot)
+            slot = await self._acquire(server_name)
+            assert slot.session is not None
+            return await slot.session.list_tools(cursor=cursor)
+
+    async def _acquire(self, server_name: str) -> _Slot:
+        """살아있는 세션을 돌아가며 고른다 (부족하거나 죽은 세션은 새로 띄움)"""
+        slots = await self._fill(server_name)
+        index = next(self._round_robin.setdefault(server_name, itertools.count()))
+        return slots[index % len(slots)]
+
+    async def _fill(self, server_name: str) -> List[_Slot]:
+        if server_name not in self.connections:
+            raise KeyError(f"알 수 없는 MCP 서버: {server_name}")
+
+        slots = self._slots.setdefault(server_name, [])
+        if len(slots) == self._size_of(server_name) and all(slot.alive for slot in slots):
+            return slots
+
+        async with self._server_locks.setdefault(server_name, asyncio.Lock()):
+            for index, slot in enumerate(slots):
+                if not slot.alive:
+                    await self._stop_slot(slot)
+                    slots[index] = await self._open_slot(server_name)
+            while len(slots) < self._size_of(server_name):
+                slots.append(await self._open_slot(server_name))
+        return slots
+
+    def _size_of(self, server_name: str) -> int:
+        return max(1, int(self.sizes.get(server_name, self.size)))
+
+    async def _open_slot(self, server_name: str) -> _Slot:
+        loop = asyncio.get_running_loop()
+        slot = _Slot(server_name=server_name, ready=loop.create_future())
+        slot.task = loop.create_task(
+            self._run_slot(slot, self.connections[server_name]),
+            name=f"mcp-session-{server_name}",
+        )
+        timeout = self.connect_timeouts.get(server_name, self.connect_timeout)
+        try:
+            await asyncio.wait_for(asyncio.shield(slot.ready), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            # 연결 중인 세션은 아직 풀에 없으므로 여기서 프로세스까지 정리한다
+            slot.ready.cancel()
+            await self._stop_slot(slot, timeout=0)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            raise TimeoutError(f"MCP 서버 연결 시간 초과: {server_name} ({timeout}s)") from None
+        self.sessions_started += 1
+        logger.debug("MCP 세션 시작: %s", server_name)
+        return slot
+
+    async def _run_slot(self, slot: _Slot, connection: Connection) -> None:
+        """세션 컨텍스트는 연 태스크에서 닫아야 하므로 stop 신호까지 여기서 유지한다"""
+        try:
+            async with create_session(connection) as session:
+                await session.initialize()
+                slot.session = session
+                slot.ready.set_result(session)
+                await slot.stop.wait()
+        except BaseException as e:  # pylint: disable=broad-except
+            if not slot.ready.done():
+                error = _unwrap_exception_group(e)
+                slot.ready.set_exception(
+                    error if isinstance(error, Exception) else RuntimeError(str(error))
+                )
+            elif not isinstance(e, asyncio.CancelledError):
+                logger.warning("MCP 세션 종료됨 [%s]: %s", slot.server_name, e)
+            if isinstance(e, (asyncio.CancelledError, KeyboardInterrupt, SystemExit)):
+                raise
+        finally:
+            slot.session = None
+
+    async def _stop_slot(self, slot: _Slot, timeout: float = 5.0) -> None:
+        slot.stop.set()
+        if slot.task is None:
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(slot.task), timeout)
+        except asyncio.TimeoutError:
+            slot.task.cancel()
+            with suppress(BaseException):
+                await slot.task
+        except BaseException:  # pylint: disable=broad-except
+            pass
+
+    async def _stop_server(self, server_name: str) -> None:
+        async with self._server_locks.setdefault(server_name, asyncio.Lock()):
+            slots = self._slots.pop(server_name, [])
+            await asyncio.gather(*(self._stop_slot(slot) for slot in slots))
+
+    async def _restart(self, slot: _Slot) -> None:
+        slot.session = None  # alive 가 False 가 되어 다음 _fill 에서 교체된다
+        await self._fill(slot.server_name)
+
+    async def _ping(self, slot: _Slot) -> bool:
+        if not slot.alive:
+            return False
+        assert slot.session is not None
+        try:
+            await asyncio.wait_for(slot.session.send_ping(), self.ping_timeout)
+            return True
+        except Exception:  # pylint: disable=broad-except
+            return False
+
+    async def _health_check(self) -> Dict[str, bool]:
+        result: Dict[str, bool] = {}
+        for server_name, slots in list(self._slots.items()):
+            healthy = await asyncio.gather(*(self._ping(slot) for slot in slots))
+            result[server_name] = all(healthy)
+            for slot, ok in zip(slots, healthy):
+                if not ok:
+                    logger.warning("MCP 세션 응답 없음, 재시작: %s", server_name)
+                    slot.session = None
+            if not all(healthy):
+                with suppress(Exception):
+                    await self._fill(server_name)
+        return result
+
+    async def _start_health_loop(self) -> None:
+        self._health_task = asyncio.get_running_loop().create_task(self._health_loop())
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            try:
+                await self._health_check()
+            except Exception as e:  # pylint: disable=broad-except
+                logger.warning("MCP 세션 상태 확인 실패: %s", e)
+
+    async def _close_all(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+            with suppress(BaseException):
+                await self._health_task
+        for task in list(self._background):
+            with suppress(BaseException):
+                await task
+        slots = [slot for server_slots in self._slots.values() for slot in server_slots]
+        await asyncio.gather(*(self._stop_slot(slot) for slot in slots))
+        self._slots.clear()
+
+
+def _unwrap_exception_group(error: BaseException) -> BaseException:
+    """anyio TaskGroup 이 감싼 예외에서 실제 원인을 꺼낸다"""
+    while isinstance(error, BaseExceptionGroup) and len(error.exceptions) == 1:
+        error = error.exceptions[0]
+    return error
+
+
+class PooledSession:
+    """풀을 통해 호출하는 ClientSession 대리 객체
+
+    langchain-mcp-adapters 도구는 세션의 call_tool/list_tools 만 사용하므로, 세션이
+    재시작되어도 도구를 다시 만들 필요가 없다.
+    """
+
+    def __init__(self, pool: MCPSessionPool, server_name: str) -> None:
+        self.pool = pool
+        self.server_name = server_name
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        read_timeout_seconds: Optional[timedelta] = None,
+        progress_callback: Any = None,
+        **kwargs: Any,
+    ) -> CallToolResult:
+        if read_timeout_seconds is not None:
+            kwargs["read_timeout_seconds"] = read_timeout_seconds
+        if progress_callback is not None:
+            kwargs["progress_callback"] = progress_callback
+        return await self.pool.call_tool(self.server_name, name, arguments, **kwargs)
+
+    async def list_tools(self, cursor: Optional[str] = None, **_: Any) -> ListToolsResult:
+        return await self.pool.list_tools(self.server_name, cursor)
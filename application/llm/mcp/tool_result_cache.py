@@ -0,0 +1,320 @@
+"""
+MCP 도구 결과 캐시 - (서버, 도구, 정규화된 인자) 단위로 읽기 전용 도구 결과를 재사용
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from application.util.logger import setup_logger
+
+logger = setup_logger("mcp_tool_result_cache") or logging.getLogger("mcp_tool_result_cache")
+
+# 캐시 정책
+CACHE_NEVER = "never"
+CACHE_TTL = "ttl"  # ttl 초 동안 재사용
+CACHE_SESSION = "session"  # 서버 재시작, 도구 새로고침, 정리 전까지 재사용
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+
+# 서버 기본 정책("*")을 적용하지 않는 부작용 도구 판별용 단어 (MCP 도구 힌트가 없을 때)
+# fmt: off
+WRITE_TOOL_WORDS = frozenset(
+    {
+        "append", "apply", "click", "commit", "create", "delete", "drop", "edit", "exec",
+        "execute", "insert", "install", "kill", "mkdir", "modify", "move", "patch", "post",
+        "press", "push", "put", "remove", "rename", "replace", "reset", "restart", "rm", "run",
+        "save", "send", "set", "start", "stop", "terminate", "type", "update", "upload",
+        "write",
+    }
+)
+# fmt: on
+
+CacheKey = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class ToolCachePolicy:
+    """도구 하나의 결과 캐시 정책"""
+
+    mode: str = CACHE_NEVER
+    ttl: Optional[float] = None
+
+    @property
+    def cacheable(self) -> bool:
+        return self.mode != CACHE_NEVER
+
+    @classmethod
+    def parse(cls, value: Any) -> "ToolCachePolicy":
+        """mcp.json 설정 값을 정책으로 변환
+
+        "never" / "session" / 초 단위 숫자(TTL) / {"policy": "ttl", "ttl": 60}
+        """
+        ttl: Any = None
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            mode, ttl = CACHE_TTL, value
+        elif isinstance(value, str):
+            mode = value.strip().lower()
+        elif isinstance(value, Mapping):
+            ttl = value.get("ttl")
+            mode = str(value.get("policy", CACHE_TTL if ttl is not None else CACHE_NEVER)).lower()
+        else:
+            raise ValueError(f"알 수 없는 캐시 정책: {value!r}")
+
+        if mode == CACHE_TTL:
+            ttl = float(ttl)
+            if ttl <= 0:
+                raise ValueError(f"TTL 은 0보다 커야 합니다: {ttl}")
+            return cls(CACHE_TTL, ttl)
+        if mode in (CACHE_NEVER, CACHE_SESSION):
+            return cls(mode)
+        raise ValueError(f"알 수 없는 캐시 정책: {value!r}")
+
+
+NO_CACHE = ToolCachePolicy()
+
+
+def is_write_tool(tool_name: str, hints: Optional[Mapping[str, Any]] = None) -> bool:
+    """부작용이 있는 도구인지 판별 (MCP 도구 힌트 우선, 없으면 이름으로 추정)"""
+    if hints:
+        if hints.get("readOnlyHint") is True:
+            return False
+        if hints.get("readOnlyHint") is False or hints.get("destructiveHint") is True:
+            return True
+    snake = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", tool_name).lower()
+    return any(word in WRITE_TOOL_WORDS for word in re.split(r"[^a-z0-9]+", snake))
+
+
+def canonicalize_arguments(arguments: Optional[Mapping[str, Any]]) -> str:
+    """같은 의미의 인자가 같은 키가 되도록 정규화한 JSON 문자열
+
+    키 순서, 정수로 표현 가능한 실수(1.0 → 1), 유니코드 정규화(NFC), 집합 순서,
+    값이 None 인 키(생략과 동일하게 취급)의 차이를 없앤다.
+    """
+    return json.dumps(
+        _canonical(arguments or {}), sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {str(key): _canonical(item) for key, item in value.items() if item is not None}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        items = [_canonical(item) for item in value]
+        return sorted(items, key=lambda item: json.dumps(item, sort_keys=True))
+    if isinstance(value, str):
+        return unicodedata.normalize("NFC", value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    return str(value)
+
+
+@dataclass
+class _Entry:
+    value: str
+    size: int
+    expires_at: Optional[float]
+
+
+@dataclass
+class ToolCacheStats:
+    """캐시 지표 (전체 및 도구별 hit/miss)"""
+
+    hits: int = 0
+    misses: int = 0
+    bypasses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    per_tool: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def record(self, server_name: str, tool_name: str, kind: str) -> None:
+        setattr(self, kind, getattr(self, kind) + 1)
+        counters = self.per_tool.setdefault(
+            f"{server_name}/{tool_name}", {"hits": 0, "misses": 0, "bypasses": 0}
+        )
+        counters[kind] += 1
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ToolResultCache:
+    """크기(개수·바이트) 제한이 있는 LRU 도구 결과 캐시
+
+    정책은 mcp.json 서버 항목의 "cache" 에 도구 이름별로 선언한다. "*" 는 서버 기본
+    정책으로, 부작용이 있는 도구(is_write_tool)에는 적용하지 않는다. 선언되지 않은 도구는
+    캐시하지 않는다.
+
+        "weather": {"command": "...", "cache": {"get_weather": 600, "*": "session"}}
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = ToolCacheStats()
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._policies: Dict[str, Dict[str, ToolCachePolicy]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Optional[Mapping[str, Any]]) -> "ToolResultCache":
+        """mcp.json 최상위 "tool_cache" ({"max_entries": .., "max_bytes": ..}) 로 생성"""
+        limits = {"max_entries": DEFAULT_MAX_ENTRIES, "max_bytes": DEFAULT_MAX_BYTES}
+        for key in limits:
+            if config and key in config:
+                try:
+                    limits[key] = max(0, int(config[key]))
+                except (TypeError, ValueError):
+                    logger.warning(f"잘못된 tool_cache.{key} 값: {config[key]!r}")
+        return cls(max_entries=limits["max_entries"], max_bytes=limits["max_bytes"])
+
+    # ------------------------------------------------------------------
+    # 정책
+    # ------------------------------------------------------------------
+    def configure(self, server_name: str, policies: Optional[Mapping[str, Any]]) -> None:
+        """서버의 도구별 캐시 정책 설정 (잘못된 항목은 경고 후 무시)"""
+        parsed: Dict[str, ToolCachePolicy] = {}
+        for tool_name, value in (policies or {}).items():
+            try:
+                parsed[str(tool_name)] = ToolCachePolicy.parse(value)
+            except (TypeError, ValueError) as e:
+                logger.warning(f"서버 {server_name} 도구 {tool_name} 캐시 정책 무시: {e}")
+        self._policies[server_name] = parsed
+
+    def policy_for(
+        self, server_name: str, tool_name: str, hints: Optional[Mapping[str, Any]] = None
+    ) -> ToolCachePolicy:
+        policies = self._policies.get(server_name, {})
+        if tool_name in policies:
+            return policies[tool_name]
+        if "*" in policies and not is_write_tool(tool_name, hints):
+            return policies["*"]
+        return NO_CACHE
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+    def get(
+        self, server_name: str, tool_name: str, arguments: Optional[Mapping[str, Any]]
+    ) -> Optional[str]:
+        key = (server_name, tool_name, canonicalize_arguments(arguments))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at is not None:
+                if entry.expires_at <= self._clock():
+                    self._remove(key)
+                    self.stats.expirations += 1
+                    entry = None
+            if entry is None:
+                self.stats.record(server_name, tool_name, "misses")
+                return None
+            self._entries.move_to_end(key)
+            self.stats.record(server_name, tool_name, "hits")
+            return entry.value
+
+    def record_bypass(self, server_name: str, tool_name: str) -> None:
+        """캐시를 읽지 않고 호출한 경우 기록"""
+        with self._lock:
+            self.stats.record(server_name, tool_name, "bypasses")
+
+    def put(
+        self,
+        server_name: str,
+        tool_name: str,
+        arguments: Optional[Mapping[str, Any]],
+        value: str,
+        policy: ToolCachePolicy,
+    ) -> bool:
+        """결과 저장 (정책상 캐시하지 않거나 한도보다 크면 False)"""
+        if not policy.cacheable:
+            return False
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes or self.max_entries <= 0:
+            return False
+
+        key = (server_name, tool_name, canonicalize_arguments(arguments))
+        expires_at = self._clock() + policy.ttl if policy.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(value, size, expires_at)
+            self._bytes += size
+            self.stats.stores += 1
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+        return True
+
+    def invalidate(self, server_name: Optional[str] = None, tool_name: Optional[str] = None) -> int:
+        """서버(와 도구) 단위로 캐시 무효화, 인자가 없으면 전체 삭제
+
+        Returns:
+            삭제한 항목 수
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if (server_name is None or key[0] == server_name)
+                and (tool_name is None or key[1] == tool_name)
+            ]
+            for key in keys:
+                self._remove(key)
+            self.stats.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    # ------------------------------------------------------------------
+    # 상태
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._bytes
+
+    def get_stats(self) -> Dict[str, Any]:
+        """지표 스냅샷"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.stats.hits,
+                "misses": self.stats.misses,
+                "bypasses": self.stats.bypasses,
+                "stores": self.stats.stores,
+                "evictions": self.stats.evictions,
+                "expirations": self.stats.expirations,
+                "invalidations": self.stats.invalidations,
+                "hit_rate": self.stats.hit_rate,
+                "per_tool": {name: dict(counts) for name, counts in self.stats.per_tool.items()},
+            }
@@ -2,7 +2,7 @@
 MCP 서버 모델
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -18,6 +18,17 @@ class MCPServer(BaseModel):
     env: Dict[str, str] = Field(default_factory=dict, description="환경 변수")
     description: str = Field("", description="서버 설명")
     enabled: bool = Field(True, description="활성화 여부")
+    lazy: bool = Field(False, description="첫 도구 사용 시 프로세스 시작 여부")
+    pool_size: Optional[int] = Field(None, description="유지할 세션 수")
+    connect_timeout: Optional[float] = Field(None, description="연결 제한 시간(초)")
+    discovery_timeout: Optional[float] = Field(None, description="도구 조회 제한 시간(초)")
+    cache: Dict[str, Any] = Field(default_factory=dict, description="도구별 결과 캐시 정책")
+    call_timeout: Optional[float] = Field(None, description="도구 호출 제한 시간(초)")
+    tool_timeouts: Dict[str, float] = Field(default_factory=dict, description="도구별 제한 시간(초)")
+    max_concurrency: Optional[int] = Field(None, description="동시 도구 호출 수")
+    circuit_breaker: Dict[str, Any] = Field(
+        default_factory=dict, description="회로 차단기 설정 (failure_threshold, cooldown)"
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
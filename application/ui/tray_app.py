@@ -530,11 +530,10 @@ class TrayApp(QObject):
         print(f"[DEBUG] ⚙️ UI 설정 업데이트: {settings_dict}")
 
         try:
-            # 설정 업데이트
-            for key, value in settings_dict.items():
-                self.config_manager.set_config_value("UI", key, value)
-
-            self.config_manager.save_config()
+            # 설정 업데이트 (한 번에 저장)
+            with self.config_manager.batch():
+                for key, value in settings_dict.items():
+                    self.config_manager.set_config_value("UI", key, value)
 
             # 메인 윈도우에 설정 변경 알림
             if hasattr(self, "main_window"):
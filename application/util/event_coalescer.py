@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, cast
+
+from application.util.logger import setup_logger
+
+logger = cast(logging.Logger, setup_logger("util") or logging.getLogger("util"))
+
+# 묶음 대상 이벤트 → payload 에서 실행 정보를 담은 객체의 키 (status 는 payload 자체)
+COALESCED_EVENT_TYPES: Dict[str, Optional[str]] = {
+    "workflow_run": "workflow_run",
+    "workflow_job": "workflow_job",
+    "check_run": "check_run",
+    "check_suite": "check_suite",
+    "status": None,
+}
+
+# 그룹을 나눌 커밋(또는 실행/PR)을 가리키는 payload 경로 - GitHub payload 구조 기준, 앞에서부터 사용
+# 서버의 slim 프로필(webhook/projection.py)도 이 경로를 남겨야 한다
+REF_PATHS: Dict[str, Tuple[str, ...]] = {
+    "workflow_run": ("workflow_run.head_sha", "workflow_run.pull_requests.0.number"),
+    "workflow_job": ("workflow_job.head_sha", "workflow_job.run_id"),
+    "check_run": (
+        "check_run.head_sha",
+        "check_run.check_suite.head_sha",
+        "check_run.pull_requests.0.number",
+    ),
+    "check_suite": ("check_suite.head_sha", "check_suite.pull_requests.0.number"),
+    "status": ("sha",),
+}
+
+GroupKey = Tuple[str, str, Hashable]
+
+
+def _lookup(value: Any, path: str) -> Any:
+    """점으로 구분된 경로의 값 (숫자 토큰은 목록 인덱스, 없으면 None)"""
+    for token in path.split("."):
+        if isinstance(value, dict):
+            value = value.get(token)
+        elif isinstance(value, list) and token.isdigit() and int(token) < len(value):
+            value = value[int(token)]
+        else:
+            return None
+    return value
+
+
+def coalesce_key(message: Dict[str, Any]) -> Optional[GroupKey]:
+    """(저장소, 이벤트 타입, head SHA 또는 PR 번호) - 묶을 수 없는 이벤트는 None"""
+    event_type = message.get("event_type", "")
+    if event_type not in REF_PATHS:
+        return None
+    payload: Dict[str, Any] = message.get("payload") or {}
+    for path in REF_PATHS[event_type]:
+        ref = _lookup(payload, path)
+        if ref:
+            return (str(message.get("repo_name", "")), event_type, ref)
+    return None
+
+
+def run_state(message: Dict[str, Any]) -> Tuple[str, str]:
+    """이벤트의 (실행 이름, 최신 상태)"""
+    event_type = message.get("event_type", "")
+    payload: Dict[str, Any] = message.get("payload") or {}
+    if event_type == "status":
+        return str(payload.get("context", "status")), str(payload.get("state", ""))
+    run: Dict[str, Any] = payload.get(COALESCED_EVENT_TYPES.get(event_type) or "") or {}
+    name = run.get("name") or (run.get("app") or {}).get("name") or event_type
+    return str(name), str(run.get("conclusion") or run.get("status") or "")
+
+
+@dataclass
+class _Group:
+    first_seen: float
+    last_seen: float
+    latest: Dict[str, Any]
+    count: int = 0
+    runs: Dict[str, str] = field(default_factory=dict)  # 실행 이름 → 최신 상태
+    sequence_ids: List[int] = field(default_factory=list)  # 묶인 메시지 (전달 후 ack 용)
+
+
+class EventCoalescer:  # pylint: disable=too-many-instance-attributes
+    """Holds CI status events briefly and emits one aggregated message per group.
+
+    같은 그룹의 이벤트가 ``window`` 초 동안 더 오지 않거나, 그룹의 첫 이벤트 이후
+    ``max_hold`` 초가 지나면 최신 상태의 메시지 하나에 ``coalesced`` 정보를 붙여
+    ``emit`` 한다. ``coalesced`` 의 ``sequence_ids`` 는 묶인 메시지의 시퀀스로, 호출자는
+    emit 된 묶음을 전달한 뒤에 이 메시지들을 ack 한다. 대기 그룹이 ``max_groups`` 개를
+    넘으면 가장 오래된 그룹부터 바로 내보낸다. 묶음 대상이 아닌 이벤트는 :meth:`add` 가
+    그대로 돌려준다.
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[Dict[str, Any]], None],
+        window: float = 3.0,
+        max_hold: float = 15.0,
+        max_groups: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._emit = emit
+        self.window = window
+        self.max_hold = max(max_hold, window)
+        self.max_groups = max_groups
+        self._clock = clock
+        self._groups: "OrderedDict[GroupKey, _Group]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._changes = 0  # add() 호출 횟수 (타이머 스레드가 새 그룹을 놓치지 않도록)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    @property
+    def pending_groups(self) -> int:
+        return len(self._groups)
+
+    def add(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """메시지를 그룹에 보관하고, 묶지 않는 메시지 목록을 반환"""
+        passthrough: List[Dict[str, Any]] = []
+        evicted: List[_Group] = []
+        with self._cond:
+            now = self._clock()
+            for message in messages:
+                key = coalesce_key(message)
+                if key is None:
+                    passthrough.append(message)
+                    continue
+                group = self._groups.get(key)
+                if group is None:
+                    if len(self._groups) >= self.max_groups:
+                        evicted.append(self._groups.popitem(last=False)[1])
+                    group = self._groups[key] = _Group(now, now, message)
+                self._merge(group, message, now)
+            self._changes += 1
+            self._cond.notify()
+        self._emit_groups(evicted)
+        return passthrough
+
+    def flush_due(self) -> float:
+        """기한이 지난 그룹을 내보내고, 다음 기한까지 남은 시간(초)을 반환"""
+        with self._cond:
+            now = self._clock()
+            due = [key for key, group in self._groups.items() if self._deadline(group) <= now]
+            ready = [self._groups.pop(key) for key in due]
+            next_deadline = min((self._deadline(g) for g in self._groups.values()), default=None)
+        self._emit_groups(ready)
+        return float("inf") if next_deadline is None else max(0.0, next_deadline - now)
+
+    def flush_all(self) -> None:
+        with self._cond:
+            groups = list(self._groups.values())
+            self._groups.clear()
+        self._emit_groups(groups)
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run_loop, name="event-coalescer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """타이머 스레드를 멈추고 대기 중인 그룹을 모두 내보낸다."""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        self._thread = None
+        self.flush_all()
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+    def _deadline(self, group: _Group) -> float:
+        return min(group.last_seen + self.window, group.first_seen + self.max_hold)
+
+    @staticmethod
+    def _merge(group: _Group, message: Dict[str, Any], now: float) -> None:
+        sequence_id = message.get("sequence_id")
+        if sequence_id is not None:
+            if sequence_id in group.sequence_ids:
+                return  # ack 전에 재전달된 메시지
+            group.sequence_ids.append(sequence_id)
+        group.count += 1
+        group.last_seen = now
+        if (message.get("sequence_id") or 0) >= (group.latest.get("sequence_id") or 0):
+            group.latest = message
+        name, state = run_state(message)
+        group.runs[name] = state
+
+    def _emit_groups(self, groups: List[_Group]) -> None:
+        for group in groups:
+            message = group.latest
+            if group.count > 1:
+                coalesced = {
+                    "count": group.count,
+                    "runs": group.runs,
+                    "sequence_ids": group.sequence_ids,
+                }
+                message = {**message, "coalesced": coalesced}
+            try:
+                self._emit(message)
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error("묶음 알림 전송 오류: %s", exc)
+
+    def _run_loop(self) -> None:
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                seen = self._changes
+            delay = self.flush_due()
+            with self._cond:
+                if not self._running:
+                    return
+                if self._changes == seen:
+                    self._cond.wait(None if delay == float("inf") else delay)
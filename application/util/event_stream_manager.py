@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, cast
+
+import requests
+
+from application.util.logger import setup_logger
+
+logger = cast(logging.Logger, setup_logger("util") or logging.getLogger("util"))
+
+# 스트리밍을 지원하지 않는 서버로 판단하는 HTTP 상태 코드
+_UNSUPPORTED_STATUS_CODES = (404, 405, 501)
+
+
+class EventStreamManager:  # pylint: disable=too-many-instance-attributes
+    """Consumes the webhook server's Server-Sent Events stream in a daemon thread.
+
+    밀린 메시지는 서버의 ``ready`` 이벤트까지 모아 한 번에 전달하고, 이후에는
+    도착하는 즉시 한 건씩 전달한다. 서버가 스트림을 지원하지 않거나 연결이
+    반복해서 실패하면 ``on_unavailable`` 을 호출하고 종료한다 (polling 으로 전환).
+    스트림은 lease 없이 커서 이후만 보내므로, 전달하지 못한 메시지는 :meth:`rewind` 로
+    스트림을 되감아 다시 받는다.
+    """
+
+    def __init__(
+        self,
+        open_stream: Callable[[Optional[str]], requests.Response],
+        handle_messages: Callable[[List[Dict[str, Any]], bool], None],
+        on_unavailable: Callable[[], None],
+        reconnect_delay: float = 5.0,
+        max_failures: int = 3,
+    ) -> None:
+        self._open_stream = open_stream
+        self._handle_messages = handle_messages
+        self._on_unavailable = on_unavailable
+        self._reconnect_delay = reconnect_delay
+        self._max_failures = max_failures
+
+        self._thread: Optional[threading.Thread] = None
+        self._running: bool = False
+        self._response: Optional[requests.Response] = None
+        self._first_batch = True
+        self._rewind_to: Optional[str] = None
+        self.last_event_id: Optional[str] = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        if self._running:
+            logger.warning("EventStreamManager already running.")
+            return
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._thread.start()
+        logger.info("EventStreamManager started.")
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+
+        self._running = False
+        response = self._response
+        if response is not None:
+            response.close()  # 블로킹 중인 iter_lines 해제
+        thread = self._thread
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        logger.info("EventStreamManager stopped.")
+
+    def rewind(self, event_id: str) -> None:
+        """event_id 이후의 이벤트부터 다시 받도록 재연결을 요청 (재연결 지연 후 적용)"""
+        self._rewind_to = event_id
+        response = self._response
+        if response is not None and threading.current_thread() is not self._thread:
+            response.close()  # 다른 스레드에서 요청하면 블로킹 중인 iter_lines 를 깨운다
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+    def _run_loop(self) -> None:
+        failures = 0
+        while self._running:
+            rewind_to, self._rewind_to = self._rewind_to, None
+            if rewind_to is not None:
+                logger.info("Reopening event stream after event %s.", rewind_to)
+                self.last_event_id = rewind_to
+            try:
+                response = self._open_stream(self.last_event_id)
+                self._response = response
+                failures = 0
+                self._consume(response.iter_lines(decode_unicode=True))
+            except requests.HTTPError as exc:
+                status = exc.response.status_code if exc.response is not None else None
+                if status in _UNSUPPORTED_STATUS_CODES:
+                    logger.info("Event stream not supported (HTTP %s); falling back.", status)
+                    self._fall_back()
+                    return
+                failures += 1
+                logger.warning("Event stream HTTP error: %s", exc)
+            except Exception as exc:  # pylint: disable=broad-except
+                if not self._running:
+                    break
+                if self._rewind_to is None:
+                    failures += 1
+                    logger.warning("Event stream disconnected: %s", exc)
+            finally:
+                if self._response is not None:
+                    self._response.close()
+                    self._response = None
+
+            if failures >= self._max_failures:
+                logger.info("Event stream failed %d times; falling back.", failures)
+                self._fall_back()
+                return
+            if self._running:
+                time.sleep(self._reconnect_delay)
+
+    def _fall_back(self) -> None:
+        self._running = False
+        self._on_unavailable()
+
+    def _consume(self, lines: Iterable[str]) -> None:
+        """SSE 라인을 파싱하여 이벤트 단위로 처리"""
+        backlog: List[Dict[str, Any]] = []
+        ready = False
+        event_name, event_id, data_lines = "message", None, []
+
+        for line in lines:
+            if not self._running:
+                return
+            if line:
+                if line.startswith(":"):
+                    continue  # heartbeat 등 주석
+                field, _, value = line.partition(":")
+                value = value[1:] if value.startswith(" ") else value
+                if field == "event":
+                    event_name = value
+                elif field == "id":
+                    event_id = value
+                elif field == "data":
+                    data_lines.append(value)
+                continue
+
+            # 빈 줄: 이벤트 하나 완성
+            if event_name == "ready":
+                ready = True
+                self._dispatch(backlog)
+                backlog = []
+            elif event_name == "webhook" and data_lines:
+                message = json.loads("\n".join(data_lines))
+                if ready:
+                    self._dispatch([message])
+                else:
+                    backlog.append(message)
+                if event_id:
+                    self.last_event_id = event_id
+            event_name, event_id, data_lines = "message", None, []
+            if self._rewind_to is not None:
+                return  # 처리 중 되감기 요청: 다음 이벤트를 기다리지 않고 재연결
+
+        # 정상 종료된 스트림도 재연결 대상 (남은 backlog 는 먼저 전달)
+        if self._rewind_to is None:
+            self._dispatch(backlog)
+
+    def _dispatch(self, messages: List[Dict[str, Any]]) -> None:
+        if not messages:
+            return
+        first_batch = self._first_batch
+        self._first_batch = False
+        try:
+            self._handle_messages(messages, first_batch)
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("Event stream handler error: %s", exc)
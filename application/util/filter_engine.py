@@ -1,157 +1,235 @@
 from __future__ import annotations
 
+import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Collection, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from application.config.config_manager import ConfigManager
 from application.util.logger import setup_logger
 
 logger: logging.Logger = setup_logger("ui") or logging.getLogger("ui")
 
+Decision = Tuple[bool, bool]  # (show_system_notification, show_chat_bubble)
+Predicate = Callable[[Dict[str, Any]], bool]
+
+SHOW_ALL: Decision = (True, True)
+HIDE_ALL: Decision = (False, False)
+
+# GitHub 이벤트 타입 → 설정 파일의 이벤트 키
+EVENT_KEYS: Mapping[str, str] = MappingProxyType(
+    {
+        "push": "push",
+        "pull_request": "pull_request",
+        "issues": "issues",
+        "release": "release",
+        **dict.fromkeys(("workflow_run", "workflow_job", "check_run", "check_suite"), "workflow"),
+        **dict.fromkeys(("star", "fork", "watch", "create", "delete"), "repository"),
+    }
+)
+
+
+@dataclass(frozen=True)
+class EventRule:
+    """한 이벤트 키에 대해 미리 컴파일된 필터 규칙"""
+
+    enabled: bool
+    allowed_actions: Optional[frozenset]  # None 이면 액션 필터 없음
+    predicate: Optional[Predicate]  # 이벤트별 커스텀 필터
+    decision: Decision
+
+
+@dataclass(frozen=True)
+class CompiledRules:
+    """notification_settings 를 컴파일한 불변 규칙 테이블"""
+
+    enabled: bool
+    events: Mapping[str, EventRule]
+
+    def evaluate(self, message: Dict[str, Any]) -> Decision:
+        if not self.enabled:
+            return HIDE_ALL
+
+        payload: Dict[str, Any] = message.get("payload", {})
+        action: str = payload.get("action", "")
+        event_key = EVENT_KEYS.get(message.get("event_type", ""))
+        rule = self.events.get(event_key) if event_key is not None else None
+
+        # 매핑되지 않았거나 설정이 없으면 기본적으로 표시
+        if rule is None:
+            return SHOW_ALL
+        if not rule.enabled:
+            return HIDE_ALL
+        if rule.allowed_actions is not None and action and action not in rule.allowed_actions:
+            return HIDE_ALL
+        if rule.predicate is not None and not _safe_predicate(rule.predicate, message):
+            return HIDE_ALL
+        return rule.decision
+
+
+# 설정 파싱 실패 시 모두 표시
+SHOW_ALL_RULES = CompiledRules(enabled=True, events=MappingProxyType({}))
+
+
+def compile_rules(settings_json: str) -> CompiledRules:
+    """notification_settings JSON 을 이벤트 키 → 규칙 테이블로 컴파일한다."""
+    try:
+        settings: Dict[str, Any] = json.loads(settings_json)
+    except json.JSONDecodeError:
+        return SHOW_ALL_RULES
+
+    try:
+        events = {
+            event_key: _compile_event(event_key, event_config)
+            for event_key, event_config in settings.get("events", {}).items()
+        }
+        return CompiledRules(
+            enabled=bool(settings.get("enabled", True)), events=MappingProxyType(events)
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.error("알림 필터 규칙 컴파일 실패: %s", exc)
+        return SHOW_ALL_RULES
+
+
+def _compile_event(event_key: str, event_config: Dict[str, Any]) -> EventRule:
+    actions: Dict[str, Any] = event_config.get("actions") or {}
+    return EventRule(
+        enabled=bool(event_config.get("enabled", True)),
+        allowed_actions=(
+            frozenset(name for name, allowed in actions.items() if allowed) if actions else None
+        ),
+        predicate=_compile_predicate(event_key, event_config),
+        decision=(
+            event_config.get("show_system_notification", True),
+            event_config.get("show_chat_bubble", True),
+        ),
+    )
+
+
+def _as_lookup(value: Any) -> Collection[str]:
+    """브랜치 목록은 set 으로 바꿔 O(1) 조회 (문자열 등은 기존 `in` 의미 유지)"""
+    return frozenset(value) if isinstance(value, (list, tuple, set, frozenset)) else value
+
+
+def _compile_predicate(event_key: str, event_config: Dict[str, Any]) -> Optional[Predicate]:
+    """이벤트별 세부 필터를 설정값이 고정된 closure 로 만든다."""
+    if event_key == "push":
+        min_commits = event_config.get("min_commits", 1)
+        max_commits = event_config.get("max_commits", 50)
+        exclude = _as_lookup(event_config.get("exclude_branches"))
+        include = _as_lookup(event_config.get("include_branches"))
+
+        def push_filter(message: Dict[str, Any]) -> bool:
+            payload: Dict[str, Any] = message.get("payload", {})
+            commit_count = len(payload.get("commits", []))
+            if commit_count < min_commits or commit_count > max_commits:
+                return False
+            ref = payload.get("ref", "")
+            branch = ref.replace("refs/heads/", "") if ref.startswith("refs/heads/") else ref
+            if exclude and branch in exclude:
+                return False
+            if include and branch not in include:
+                return False
+            return True
 
-class FilterEngine:
-    """GitHub 이벤트 알림 표시 여부를 판단하는 엔진"""
+        return push_filter
 
-    def __init__(self, config_manager: ConfigManager) -> None:
-        self.config_manager: ConfigManager = config_manager
+    if event_key == "release":
+        include_prerelease = event_config.get("include_prerelease", True)
+        include_draft = event_config.get("include_draft", False)
 
-    # ---------------------------------------------------------------------
-    # Public helpers
-    # ---------------------------------------------------------------------
-    def should_show_notification(self, message: Dict[str, Any]) -> Tuple[bool, bool]:
-        """설정에 따라 시스템 알림과 채팅 버블 표시 여부를 반환한다.
+        def release_filter(message: Dict[str, Any]) -> bool:
+            release = message.get("payload", {}).get("release", {})
+            if release.get("prerelease", False) and not include_prerelease:
+                return False
+            if release.get("draft", False) and not include_draft:
+                return False
+            return True
 
-        반환값: (show_system_notification, show_chat_bubble)
-        """
-        try:
-            settings_json: str = (
-                self.config_manager.get_config_value("GITHUB", "notification_settings", "{}")
-                or "{}"
-            )
+        return release_filter
 
-            import json
+    if event_key == "workflow":
+        actions: Dict[str, Any] = event_config.get("actions", {})
 
-            try:
-                settings: Dict[str, Any] = json.loads(settings_json)
-            except json.JSONDecodeError:
-                # 설정 파싱 실패 시 모두 표시
-                return True, True
+        def workflow_filter(message: Dict[str, Any]) -> bool:
+            payload: Dict[str, Any] = message.get("payload", {})
+            workflow_run = (
+                payload.get("workflow_run", {})
+                or payload.get("workflow_job", {})
+                or payload.get("check_run", {})
+                or payload.get("check_suite", {})
+            )
+            status = workflow_run.get("status", "")
+            conclusion = workflow_run.get("conclusion", "")
+            if status and not actions.get(status, False):
+                return False
+            if conclusion and not actions.get(conclusion, False):
+                return False
+            return True
 
-            # 전역 활성 여부
-            if not settings.get("enabled", True):
-                return False, False
+        return workflow_filter
 
-            # 이벤트 타입 매핑
-            event_type: str = message.get("event_type", "")
-            payload: Dict[str, Any] = message.get("payload", {})
-            action: str = payload.get("action", "")
-            event_key: Optional[str] = self._map_event_type(event_type, action, payload)
+    return None
 
-            events_settings: Dict[str, Any] = settings.get("events", {})
 
-            # 매핑되지 않았거나 설정이 없으면 기본적으로 표시
-            if event_key is None or event_key not in events_settings:
-                return True, True
+def _safe_predicate(predicate: Predicate, message: Dict[str, Any]) -> bool:
+    try:
+        return predicate(message)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.error("커스텀 필터링 확인 중 오류: %s", exc)
+        return True  # 오류 시 필터를 무시하고 표시함
 
-            event_config: Dict[str, Any] = events_settings[event_key]
 
-            # 이벤트 비활성화
-            if not event_config.get("enabled", True):
-                return False, False
+class FilterEngine:
+    """GitHub 이벤트 알림 표시 여부를 판단하는 엔진
 
-            # 액션 필터링
-            if event_config.get("actions") and action:
-                if not event_config["actions"].get(action, False):
-                    return False, False
+    notification_settings 는 설정 버전(``ConfigManager.config_version``)이 바뀔 때만
+    다시 읽어 :class:`CompiledRules` 로 컴파일하고, 메시지마다 JSON 을 파싱하지 않는다.
+    """
 
-            # 커스텀 필터 체크
-            if not self._check_custom_filters(event_key, event_config, message):
-                return False, False
+    def __init__(self, config_manager: ConfigManager) -> None:
+        self.config_manager: ConfigManager = config_manager
+        self._rules: CompiledRules = SHOW_ALL_RULES
+        self._rules_version: Optional[int] = None
 
-            return (
-                event_config.get("show_system_notification", True),
-                event_config.get("show_chat_bubble", True),
+    # ---------------------------------------------------------------------
+    # Public helpers
+    # ---------------------------------------------------------------------
+    @property
+    def rules(self) -> CompiledRules:
+        """현재 설정 버전의 컴파일된 규칙 (버전이 바뀌었으면 다시 컴파일)"""
+        version = self.config_manager.config_version
+        if version != self._rules_version:
+            settings_json: str = (
+                self.config_manager.get_config_value("GITHUB", "notification_settings", "{}")
+                or "{}"
             )
-        except Exception as exc:  # pylint: disable=broad-except
-            logger.error("필터링 확인 중 오류: %s", exc)
-            # 오류 발생 시 안전하게 모두 표시
-            return True, True
-
-    # ------------------------------------------------------------------
-    # Internal helpers (private)
-    # ------------------------------------------------------------------
-    @staticmethod
-    def _map_event_type(event_type: str, action: str, payload: Dict[str, Any]) -> Optional[str]:
-        """이벤트 타입 문자열을 설정 파일의 키로 매핑한다."""
-        if event_type == "push":
-            return "push"
-        if event_type == "pull_request":
-            return "pull_request"
-        if event_type == "issues":
-            return "issues"
-        if event_type == "release":
-            return "release"
-        if event_type in ("workflow_run", "workflow_job", "check_run", "check_suite"):
-            return "workflow"
-        if event_type in ("star", "fork", "watch", "create", "delete"):
-            return "repository"
-        return None
-
-    # pylint: disable=too-many-return-statements,too-many-branches
-    def _check_custom_filters(
-        self,
-        event_key: str,
-        event_config: Dict[str, Any],
-        message: Dict[str, Any],
-    ) -> bool:
-        """각 이벤트 타입별 세부 필터링 논리를 수행한다."""
-        try:
-            payload: Dict[str, Any] = message.get("payload", {})
+            self._rules = compile_rules(settings_json)
+            self._rules_version = version
+        return self._rules
 
-            if event_key == "push":
-                # 커밋 수 필터링
-                commits: List[Any] = payload.get("commits", [])
-                commit_count = len(commits)
-                min_commits = event_config.get("min_commits", 1)
-                max_commits = event_config.get("max_commits", 50)
-                if commit_count < min_commits or commit_count > max_commits:
-                    return False
-
-                # 브랜치 필터링
-                ref = payload.get("ref", "")
-                branch = ref.replace("refs/heads/", "") if ref.startswith("refs/heads/") else ref
-
-                if (exclude := event_config.get("exclude_branches")) and branch in exclude:
-                    return False
-                if (include := event_config.get("include_branches")) and branch not in include:
-                    return False
-
-            elif event_key == "release":
-                release = payload.get("release", {})
-                if release.get("prerelease", False) and not event_config.get(
-                    "include_prerelease", True
-                ):
-                    return False
-                if release.get("draft", False) and not event_config.get("include_draft", False):
-                    return False
-
-            elif event_key == "workflow":
-                workflow_run = (
-                    payload.get("workflow_run", {})
-                    or payload.get("workflow_job", {})
-                    or payload.get("check_run", {})
-                    or payload.get("check_suite", {})
-                )
-                status = workflow_run.get("status", "")
-                conclusion = workflow_run.get("conclusion", "")
-
-                actions = event_config.get("actions", {})
-                if status and not actions.get(status, False):
-                    return False
-                if conclusion and not actions.get(conclusion, False):
-                    return False
+    def should_show_notification(self, message: Dict[str, Any]) -> Decision:
+        """설정에 따라 시스템 알림과 채팅 버블 표시 여부를 반환한다.
 
-            return True
+        반환값: (show_system_notification, show_chat_bubble)
+        """
+        return self.filter_many((message,))[0]
+
+    def filter_many(self, messages: Iterable[Dict[str, Any]]) -> List[Decision]:
+        """여러 메시지의 표시 여부를 한 번에 판정한다 (규칙은 한 번만 확인)."""
+        try:
+            evaluate = self.rules.evaluate
         except Exception as exc:  # pylint: disable=broad-except
-            logger.error("커스텀 필터링 확인 중 오류: %s", exc)
-            return True  # 오류 시 필터를 무시하고 표시함
+            logger.error("필터 규칙 로드 중 오류: %s", exc)
+            evaluate = SHOW_ALL_RULES.evaluate
+
+        decisions: List[Decision] = []
+        for message in messages:
+            try:
+                decisions.append(evaluate(message))
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error("필터링 확인 중 오류: %s", exc)
+                # 오류 발생 시 안전하게 모두 표시
+                decisions.append(SHOW_ALL)
+        return decisions
@@ -1,31 +1,19 @@
 from __future__ import annotations
 
-"""Friendly message builder – 기존 WebhookClient._create_friendly_message 로직을
-간접 호출하여 WebhookClient 의존성을 제거한다.
-
-TODO: 향후 이벤트별 Builder 클래스로 세분화하고 직접 구현을 옮길 예정.
+"""Friendly message builder – 이벤트 타입별 빌더(`message_builders`)로 제목/내용을
+만드는 진입점. WebhookClient 에 의존하지 않는다.
 """
 
 from typing import Any, Dict, Tuple
 
-from application.util.message_builders import get_builder
+from application.util.message_builders import get_builder_or_default
 
 
 def build_friendly_message(message: Dict[str, Any]) -> Tuple[str, str]:
     """친숙한 제목/내용 쌍을 생성한다.
 
-    현재는 WebhookClient 내부 기존 구현을 재활용한다. 차후 독립 구현으로 대체.
+    push, pull_request 는 전용 빌더, 그 외 이벤트는 컴파일된 템플릿 빌더를 사용하고
+    템플릿이 없는 이벤트는 기본 템플릿으로 처리한다.
     """
-    # 1) 이벤트별 전용 빌더 우선 사용
     event_type = message.get("event_type", "")
-    builder = get_builder(event_type)
-    if builder is not None:
-        return builder.build(message)
-
-    # 2) 아직 분리되지 않은 이벤트는 기존 WebhookClient 메서드 재활용
-    from application.util.webhook_client import (
-        WebhookClient as _WC,  # pylint: disable=import-error, cyclic-import
-    )
-
-    dummy = object.__new__(_WC)  # type: ignore[arg-type]
-    return _WC._create_friendly_message(dummy, message)  # type: ignore[attr-defined]
+    return get_builder_or_default(event_type).build(message)
@@ -3,12 +3,28 @@ from __future__ import annotations
 """Event-specific friendly message builders.
 
 각 GitHub 이벤트 타입에 대해 인간 친화적인 제목/내용을 생성하는 전략 클래스.
-현재는 push, pull_request 두 타입만 별도 구현하고, 나머지는 WebhookClient 기존
-로직을 재사용한다.
+push, pull_request 는 전용 클래스로, 나머지 이벤트는 선언적 템플릿
+(:data:`EVENT_TEMPLATES`)으로 구현한다. 템플릿은 모듈 로드 시 한 번 컴파일되어
+payload 필드 접근 함수와 렌더러로 바뀌고, 이벤트 타입 dict 로 바로 찾아 쓴다.
 """
 
+import random
+import string
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Tuple
+from dataclasses import dataclass
+from operator import itemgetter
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 
 class BaseMessageBuilder(ABC):
@@ -46,12 +62,1087 @@ class PullRequestMessageBuilder(BaseMessageBuilder):
         return title, content
 
 
+# ---------------------------------------------------------------------------
+# 템플릿 정의용 타입
+# ---------------------------------------------------------------------------
+class Ref(NamedTuple):
+    """필드 기본값으로 앞서 읽은 다른 필드 값을 쓴다 (예: 작성자가 없으면 sender)."""
+
+    name: str
+
+
+class Opt(NamedTuple):
+    """``field`` 값이 참일 때만 붙는 문구"""
+
+    field: str
+    text: str
+
+
+Segment = Union[str, Opt]
+Template = Union[str, Tuple[Segment, ...]]
+Context = Dict[str, Any]
+Renderer = Callable[[Context], str]
+
+
+@dataclass(frozen=True)
+class Variant:
+    """제목/내용 후보 (무작위로 하나씩 고른다)와 모든 내용 뒤에 붙는 공통 문구
+
+    ``derive`` 는 이 variant 가 선택됐을 때만 필요한 파생 값을 채운다.
+    """
+
+    titles: Tuple[Template, ...]
+    messages: Tuple[Template, ...]
+    suffix: Tuple[Segment, ...] = ()
+    derive: Optional[Callable[[Context], None]] = None
+
+
+@dataclass(frozen=True)
+class EventTemplate:
+    """이벤트 하나의 선언적 메시지 템플릿
+
+    ``fields`` 는 컨텍스트 이름 → (``message`` 기준 점 경로, 기본값),
+    ``derive`` 는 읽은 필드로 파생 값을 채우고, ``select`` 는 읽은 필드로 사용할
+    variant 키를 고른다 (variant 의 ``derive`` 는 그 다음에 실행된다).
+    """
+
+    fields: Mapping[str, Tuple[str, Any]]
+    variants: Mapping[str, Variant]
+    derive: Optional[Callable[[Context], None]] = None
+    select: Optional[Callable[[Context], str]] = None
+
+
+# 모든 템플릿이 공통으로 쓰는 필드 (sender 는 다른 필드의 기본값으로도 쓰인다)
+COMMON_FIELDS: Mapping[str, Tuple[str, Any]] = MappingProxyType(
+    {
+        "event_type": ("event_type", "unknown"),
+        "org_name": ("org_name", ""),
+        "repo_name": ("repo_name", ""),
+        "action": ("payload.action", ""),
+        "sender": ("payload.sender.login", "누군가"),
+    }
+)
+
+_FORMATTER = string.Formatter()
+
+
+# ---------------------------------------------------------------------------
+# 컴파일
+#
+# 템플릿은 모듈 로드 시 한 번 컨텍스트 함수와 렌더러로 바꿔 둔다. 컨텍스트 함수는 중간
+# dict 를 경로당 한 번만 꺼내고, 렌더러는 필드 이름을 위치 인자로 바꾼 형식 문자열을
+# ``itemgetter`` 로 꺼낸 값으로 채워 메시지마다 템플릿을 다시 해석하지 않는다.
+# ---------------------------------------------------------------------------
+_EMPTY: Dict[str, Any] = {}
+
+# (필드 이름, 노드 번호, 마지막 키, 기본값, 기본값으로 쓸 앞선 필드 이름)
+_FieldRead = Tuple[str, int, str, Any, Optional[str]]
+
+
+def compile_context(fields: Mapping[str, Tuple[str, Any]]) -> Callable[[Any], Context]:
+    """필드 정의를 ``message`` → 컨텍스트 dict 함수로 컴파일한다.
+
+    중간 경로 값이 dict 가 아니면 빈 dict 로 보고 하위 필드는 기본값을 쓴다.
+    """
+    nodes: Dict[Tuple[str, ...], int] = {(): 0}
+    node_steps: List[Tuple[int, str]] = []  # 노드 번호 순서대로 (상위 노드 번호, 키)
+    reads: List[_FieldRead] = []
+
+    def node_index(parents: Tuple[str, ...]) -> int:
+        if parents not in nodes:
+            node_steps.append((node_index(parents[:-1]), parents[-1]))
+            nodes[parents] = len(nodes)
+        return nodes[parents]
+
+    for name, (path, default) in fields.items():
+        *parents, leaf = path.split(".")
+        ref = default.name if isinstance(default, Ref) else None
+        reads.append((name, node_index(tuple(parents)), leaf, default, ref))
+
+    def context(message: Any) -> Context:
+        values = [message]
+        for parent, key in node_steps:
+            node = values[parent].get(key, _EMPTY)
+            values.append(node if isinstance(node, dict) else _EMPTY)
+        ctx: Context = {}
+        for name, index, leaf, default, ref in reads:
+            ctx[name] = values[index].get(leaf, default if ref is None else ctx[ref])
+        return ctx
+
+    return context
+
+
+def _compile_text(text: str) -> Renderer:
+    """``str.format`` 형식 문구를 위치 인자 형식 문자열과 ``itemgetter`` 렌더러로 바꾼다."""
+    pieces: List[str] = []
+    names: List[str] = []
+    for literal, field, spec, conversion in _FORMATTER.parse(text):
+        pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field is None:
+            continue
+        if spec or conversion or not field.isidentifier():
+            raise ValueError(f"지원하지 않는 템플릿 필드: {field!r}")
+        pieces.append("{}")
+        names.append(field)
+
+    fill = "".join(pieces).format
+    if not names:
+        constant = fill()
+        return lambda c: constant
+    if len(names) == 1:
+        name = names[0]
+        return lambda c: fill(c[name])
+    values = itemgetter(*names)
+    return lambda c: fill(*values(c))
+
+
+def compile_template(template: Template, suffix: Tuple[Segment, ...] = ()) -> Renderer:
+    """템플릿 조각을 컨텍스트 → 문자열 렌더러로 컴파일한다.
+
+    조건이 같은 이웃 조각은 하나로 합쳐 렌더링하고, 조건 없는 템플릿은 합친 조각의
+    렌더러를 그대로 쓴다.
+    """
+    segments = ((template,) if isinstance(template, str) else tuple(template)) + suffix
+    texts: List[Tuple[Optional[str], str]] = []  # (조건 필드, 문구)
+    for seg in segments:
+        condition, text = (seg.field, seg.text) if isinstance(seg, Opt) else (None, seg)
+        if texts and texts[-1][0] == condition:
+            texts[-1] = (condition, texts[-1][1] + text)
+        else:
+            texts.append((condition, text))
+
+    parts = [(condition, _compile_text(text)) for condition, text in texts]
+    if not parts:
+        return lambda c: ""
+    if len(parts) == 1 and parts[0][0] is None:
+        return parts[0][1]
+
+    def render(c: Context) -> str:
+        out = ""
+        for condition, part in parts:
+            if condition is None or c[condition]:
+                out += part(c)
+        return out
+
+    return render
+
+
+_CompiledVariant = Tuple[List[Renderer], List[Renderer], Optional[Callable[[Context], None]]]
+
+
+class TemplateMessageBuilder(BaseMessageBuilder):
+    """:class:`EventTemplate` 을 한 번 컴파일해 두고 메시지마다 렌더링하는 빌더"""
+
+    def __init__(self, template: EventTemplate) -> None:
+        self.context: Callable[[Any], Context] = compile_context(
+            {**COMMON_FIELDS, **template.fields}
+        )
+        self._derive = template.derive
+        self._select = template.select
+        self._variants: Dict[str, _CompiledVariant] = {
+            key: (
+                [compile_template(title) for title in variant.titles],
+                [compile_template(body, variant.suffix) for body in variant.messages],
+                variant.derive,
+            )
+            for key, variant in template.variants.items()
+        }
+        self._default_variant = next(iter(self._variants.values()))
+
+    def build(self, message: Dict[str, Any]) -> Tuple[str, str]:
+        ctx = self.context(message)
+        if self._derive is not None:
+            self._derive(ctx)
+        titles, messages, derive = (
+            self._variants[self._select(ctx)] if self._select else self._default_variant
+        )
+        if derive is not None:
+            derive(ctx)
+        # 랜덤하게 선택 (고른 후보만 렌더링)
+        title = random.choice(titles)(ctx)
+        base_message = random.choice(messages)(ctx)
+
+        # 추가 정보가 있으면 덧붙이기
+        org_name, action = ctx["org_name"], ctx["action"]
+        timestamp = message.get("timestamp", "")
+        if not (org_name or action or timestamp):
+            return title, base_message
+        extra_info = []
+        if org_name:
+            extra_info.append(f"조직: {org_name}")
+        if action and action not in base_message:
+            extra_info.append(f"액션: {action}")
+        if timestamp:
+            extra_info.append("방금 전에 일어난 일이에요! ⏰")
+        if extra_info:
+            base_message += "\n\n" + " | ".join(extra_info)
+        return title, base_message
+
+
+# ---------------------------------------------------------------------------
+# 파생 값 계산
+# ---------------------------------------------------------------------------
+def _truncate(text: Any, limit: int) -> Any:
+    return text[:limit] + "..." if text and len(text) > limit else text
+
+
+def _preview(text: Any, limit: int) -> str:
+    """줄바꿈을 정리한 본문 미리보기"""
+    if not text or not text.strip():
+        return ""
+    clean: str = text.replace("\r\n", "\n").replace("\r", "\n").strip()
+    return clean[:limit] + "..." if len(clean) > limit else clean
+
+
+def _short_sha(ctx: Context) -> None:
+    commit_id = ctx["commit_id"]
+    ctx["commit_short"] = commit_id[:7] if commit_id else ""
+
+
+def _branch_info(ctx: Context) -> None:
+    base, head = ctx["base_branch"], ctx["head_branch"]
+    ctx["branch_info"] = f"{base} ← {head}" if base and head else ""
+
+
+_REVIEW_STATES: Mapping[str, Tuple[str, str, str]] = MappingProxyType(
+    {
+        "approved": ("✅", "승인", "코드가 승인되었어요!"),
+        "changes_requested": ("🔄", "변경 요청", "개선사항이 요청되었어요"),
+        "commented": ("💬", "코멘트", "리뷰 의견을 남겼어요"),
+    }
+)
+
+
+def _derive_review(ctx: Context) -> None:
+    ctx["state_emoji"], ctx["state_text"], ctx["state_description"] = _REVIEW_STATES.get(
+        ctx["review_state"], ("📝", "리뷰", "리뷰를 남겼어요")
+    )
+    ctx["review_preview"] = _preview(ctx["review_body"], 120)
+    _branch_info(ctx)
+    changed_files = ctx["changed_files"]
+    ctx["stats_info"] = (
+        f"파일 {changed_files}개 변경 (+{ctx['additions']}, -{ctx['deletions']})"
+        if changed_files > 0
+        else ""
+    )
+
+
+def _location_info(ctx: Context, line_number: Any) -> str:
+    location = f"📁 {ctx['file_path']}"
+    if line_number:
+        location += f" (라인 {line_number})"
+    if ctx["position"]:
+        location += f" [위치: {ctx['position']}]"
+    return location
+
+
+def _derive_review_comment(ctx: Context) -> None:
+    file_path = ctx["file_path"]
+    line_number = ctx["line"] or ctx["original_line"]
+    is_inline = bool(file_path and line_number)
+    ctx["comment_type"] = "인라인 코멘트" if is_inline else "리뷰 코멘트"
+    _short_sha(ctx)
+    ctx["comment_preview"] = _preview(ctx["comment_body"], 100)
+    file_name = file_path.split("/")[-1] if file_path else "파일"
+    ctx["location_title"] = file_name if is_inline else f"PR #{ctx['pr_number']}"
+    _branch_info(ctx)
+    location_info = ""
+    if is_inline:
+        location_info = _location_info(ctx, line_number)
+        if ctx["commit_short"]:
+            location_info += f" (커밋: {ctx['commit_short']})"
+    ctx["location_info"] = location_info
+
+
+def _names(items: Any, key: str) -> List[str]:
+    return [item.get(key, "") for item in items]
+
+
+def _derive_issue_opened(ctx: Context) -> None:
+    ctx["issue_body_preview"] = _truncate(ctx["issue_body"], 100)
+    details = []
+    label_names = _names(ctx["labels"], "name")
+    if label_names:
+        details.append(f"라벨: {', '.join(label_names)}")
+    assignee_names = _names(ctx["assignees"], "login")
+    if assignee_names:
+        details.append(f"담당자: {', '.join(assignee_names)}")
+    ctx["extra_details"] = " | ".join(details)
+
+
+def _derive_issue_closed(ctx: Context) -> None:
+    label_names = _names(ctx["labels"], "name")
+    ctx["label_text"] = f"라벨: {', '.join(label_names)}" if label_names else ""
+
+
+def _derive_issue_update(ctx: Context) -> None:
+    """라벨/담당자/마일스톤 변경 시 추가 정보"""
+    action = ctx["action"]
+    detail = ""
+    if action in ("labeled", "unlabeled"):
+        if ctx["label"]:
+            detail = f"\n\n{action}된 라벨: {ctx['label']}"
+            detail += f"\n\n현재 라벨: {', '.join(_names(ctx['labels'], 'name'))}"
+    elif action in ("assigned", "unassigned"):
+        if ctx["assignee"]:
+            assignee_action = "할당된" if action == "assigned" else "해제된"
+            detail = f"\n\n👤 {assignee_action} 담당자: {ctx['assignee']}"
+            assignee_names = _names(ctx["assignees"], "login")
+            if assignee_names:
+                detail += f"\n현재 담당자: {', '.join(assignee_names)}"
+    elif action in ("milestoned", "demilestoned"):
+        if ctx["milestone_title"]:
+            milestone_action = "설정된" if action == "milestoned" else "해제된"
+            detail = f"\n\n🎯 {milestone_action} 마일스톤: {ctx['milestone_title']}"
+    ctx["action_detail"] = detail
+
+
+def _select_opened_closed(ctx: Context) -> str:
+    action = ctx["action"]
+    return action if action in ("opened", "closed") else "other"
+
+
+def _derive_release(ctx: Context) -> None:
+    ctx["release_body_preview"] = _truncate(ctx["release_body"], 150)
+    ctx["release_type"] = "프리릴리즈" if ctx["is_prerelease"] else "정식 릴리즈"
+
+
+def _count_text(field: str, template: str) -> Callable[[Context], None]:
+    def derive(ctx: Context) -> None:
+        count = ctx[field]
+        ctx[f"{field}_text"] = template.format(count) if count else ""
+
+    return derive
+
+
+def _derive_issue_comment(ctx: Context) -> None:
+    ctx["comment_preview"] = _preview(ctx["comment_body"], 120)
+    is_pull_request = "pull_request" in ctx["issue"]  # PR인지 이슈인지 구분
+    ctx["item_type"] = "PR" if is_pull_request else "이슈"
+    ctx["emoji"] = "🔄" if is_pull_request else "🐛"
+
+
+def _ref_type(deleted: bool) -> Callable[[Context], None]:
+    types = {
+        "branch": ("🗑️" if deleted else "🌿", "브랜치"),
+        "tag": ("🏷️", "태그"),
+    }
+    fallback_emoji = "❌" if deleted else "📝"
+
+    def derive(ctx: Context) -> None:
+        ref_type = ctx["ref_type"]
+        ctx["type_emoji"], ctx["type_text"] = types.get(
+            ref_type, (fallback_emoji, ref_type or "항목")
+        )
+
+    return derive
+
+
+def _derive_commit_comment(ctx: Context) -> None:
+    _short_sha(ctx)
+    ctx["comment_preview"] = _preview(ctx["comment_body"], 100)
+    ctx["location_info"] = _location_info(ctx, ctx["line"]) if ctx["file_path"] else ""
+
+
+_PAGE_ACTIONS: Mapping[str, Tuple[str, str]] = MappingProxyType(
+    {"edited": ("✏️", "수정"), "created": ("📄", "생성")}
+)
+
+
+def _derive_gollum(ctx: Context) -> None:
+    pages = ctx["pages"]
+    summaries = []
+    for page in pages[:3]:  # 최대 3개까지만 표시
+        page_action = page.get("action", "")
+        action_emoji, action_text = _PAGE_ACTIONS.get(page_action, ("🔄", page_action))
+        summaries.append(f"{action_emoji} {page.get('title', '')} ({action_text})")
+    if len(pages) > 3:
+        summaries.append(f"... 그 외 {len(pages) - 3}개 페이지")
+    ctx["page_count"] = len(pages)
+    ctx["page_summaries"] = "\n".join(summaries)
+
+
+_MILESTONE_ACTIONS: Mapping[str, Tuple[str, str]] = MappingProxyType(
+    {"created": ("🎯", "생성"), "closed": ("🏁", "완료"), "opened": ("🔄", "재오픈")}
+)
+
+
+def _derive_milestone(ctx: Context) -> None:
+    ctx["action_emoji"], ctx["action_text"] = _MILESTONE_ACTIONS.get(
+        ctx["action"], ("📊", ctx["action"] or "업데이트")
+    )
+    closed_issues = ctx["closed_issues"]
+    total_issues = ctx["open_issues"] + closed_issues
+    ctx["progress_info"] = ""
+    if total_issues > 0:
+        progress_percent = int((closed_issues / total_issues) * 100)
+        ctx["progress_info"] = (
+            f"\n진행률: {progress_percent}% ({closed_issues}/{total_issues} 완료)"
+        )
+    ctx["description_preview"] = _truncate(ctx["milestone_description"], 100)
+
+
+def _derive_run(ctx: Context) -> None:
+    conclusion = ctx["conclusion"]
+    if conclusion == "success":
+        ctx["status_emoji"] = "🟢"
+    elif conclusion == "failure":
+        ctx["status_emoji"] = "🔴"
+    else:
+        ctx["status_emoji"] = "🟡" if ctx["status"] == "in_progress" else "⚪"
+    if "head_branch" in ctx:
+        ctx["branch_info"] = f"브랜치: {ctx['head_branch']}" if ctx["head_branch"] else ""
+
+
+_DEFAULT_PREVIEW_KEYS = ("id", "name", "title", "state", "description", "url", "html_url")
+
+
+def _derive_default(ctx: Context) -> None:
+    action = ctx["action"]
+    ctx["action_info"] = f"액션: {action}" if action else ""
+    # 페이로드에서 유용한 정보 추출 시도
+    payload = ctx["payload"]
+    extracted_info = [
+        f"{key}: {payload[key]}" for key in _DEFAULT_PREVIEW_KEYS if key in payload and payload[key]
+    ]
+    ctx["payload_preview"] = "\n\n" + "\n".join(extracted_info) if extracted_info else ""
+
+
+def _run_fields(key: str, **extra: Tuple[str, Any]) -> Dict[str, Tuple[str, Any]]:
+    return {
+        "run_name": (f"payload.{key}.name", "Unknown"),
+        "status": (f"payload.{key}.status", "unknown"),
+        "conclusion": (f"payload.{key}.conclusion", "진행중"),
+        "html_url": (f"payload.{key}.html_url", ""),
+        **extra,
+    }
+
+
+def _single(**variant: Any) -> Mapping[str, Variant]:
+    return MappingProxyType({"": Variant(**variant)})
+
+
+# ---------------------------------------------------------------------------
+# 이벤트 템플릿 테이블
+# ---------------------------------------------------------------------------
+_COMMENT_PREVIEW = Opt("comment_preview", '\n\n💭 코멘트:\n"{comment_preview}"')
+_COMMENT_URL = Opt("comment_html_url", "\n\n🔗 코멘트 보기: {comment_html_url}")
+_LOCATION = Opt("location_info", "\n\n{location_info}")
+_RUN_URL = Opt("html_url", "\n\n자세히 보기: {html_url}")
+
+EVENT_TEMPLATES: Mapping[str, EventTemplate] = MappingProxyType(
+    {
+        "issues": EventTemplate(
+            fields={
+                "issue_title": ("payload.issue.title", "제목 없음"),
+                "issue_number": ("payload.issue.number", ""),
+                "issue_author": ("payload.issue.user.login", Ref("sender")),
+                "issue_body": ("payload.issue.body", ""),
+                "labels": ("payload.issue.labels", []),
+                "assignees": ("payload.issue.assignees", []),
+                "label": ("payload.label.name", ""),
+                "assignee": ("payload.assignee.login", ""),
+                "milestone_title": ("payload.milestone.title", ""),
+            },
+            select=_select_opened_closed,
+            variants={
+                "opened": Variant(
+                    titles=(
+                        "🐛 새 이슈 #{issue_number}: {issue_title}",
+                        "❗ {issue_author}님의 이슈 리포트: {issue_title}",
+                        "🚨 새 이슈 등록: {issue_title}",
+                        "📋 #{issue_number} 이슈가 생성됐어요!",
+                    ),
+                    messages=(
+                        "어라? {issue_author}님이 {repo_name}에 새로운 이슈를 등록했어요! 🔍"
+                        '\n\n제목: "{issue_title}" (#{issue_number})',
+                        "{issue_author}님이 {repo_name}에서 문제를 발견했나봐요~ 확인해보세요! 👀"
+                        '\n\n"{issue_title}" (#{issue_number})',
+                        "{repo_name}에 {issue_author}님이 새 이슈를 올렸어요. "
+                        '개발자님의 도움이 필요해요! 🙏\n\n"{issue_title}" (#{issue_number})',
+                        '이슈 알림! {issue_author}님이 등록한 "{issue_title}"이 {repo_name}에서 '
+                        "여러분을 기다리고 있어요! 💻 (#{issue_number})",
+                    ),
+                    suffix=(
+                        Opt("issue_body_preview", "\n\n내용: {issue_body_preview}"),
+                        Opt("extra_details", "\n\n{extra_details}"),
+                    ),
+                    derive=_derive_issue_opened,
+                ),
+                "closed": Variant(
+                    titles=(
+                        "🎯 이슈 해결 완료: #{issue_number}",
+                        "✨ {sender}님이 이슈를 해결했어요!",
+                        "🏅 이슈 #{issue_number} 종료: {issue_title}",
+                        "📝 이슈 클리어: {issue_title}",
+                    ),
+                    messages=(
+                        '대단해요! {repo_name}의 이슈 "{issue_title}"이 {sender}님에 의해 '
+                        "깔끔하게 해결됐어요! 🎉 (#{issue_number})",
+                        "또 하나의 문제가 {repo_name}에서 사라졌네요! "
+                        '{sender}님이 "{issue_title}" 이슈를 닫았습니다. 👍',
+                        "{repo_name}가 더 안정적이 됐어요! "
+                        '{sender}님이 이슈 #{issue_number} "{issue_title}"을 해결했습니다! 🙌',
+                        "이슈 해결 완료! {sender}님 덕분에 "
+                        '{repo_name}의 "{issue_title}" 문제가 해결됐어요! ⭐',
+                    ),
+                    suffix=(Opt("label_text", "\n\n{label_text}"),),
+                    derive=_derive_issue_closed,
+                ),
+                "other": Variant(
+                    titles=("🔄 이슈 #{issue_number} 업데이트: {action}",),
+                    messages=(
+                        '{repo_name}의 이슈 "{issue_title}"에 {action} 액션이 일어났어요! '
+                        "{issue_author}님이 작성한 이슈 #{issue_number}입니다.",
+                    ),
+                    suffix=(Opt("action_detail", "{action_detail}"),),
+                    derive=_derive_issue_update,
+                ),
+            },
+        ),
+        "pull_request_review": EventTemplate(
+            fields={
+                "review_body": ("payload.review.body", ""),
+                "review_state": ("payload.review.state", ""),
+                "reviewer": ("payload.review.user.login", Ref("sender")),
+                "review_html_url": ("payload.review.html_url", ""),
+                "pr_title": ("payload.pull_request.title", ""),
+                "pr_number": ("payload.pull_request.number", ""),
+                "pr_author": ("payload.pull_request.user.login", ""),
+                "base_branch": ("payload.pull_request.base.ref", ""),
+                "head_branch": ("payload.pull_request.head.ref", ""),
+                "additions": ("payload.pull_request.additions", 0),
+                "deletions": ("payload.pull_request.deletions", 0),
+                "changed_files": ("payload.pull_request.changed_files", 0),
+            },
+            derive=_derive_review,
+            variants=_single(
+                titles=(
+                    "{state_emoji} {reviewer}님의 PR 리뷰: {state_text}",
+                    "📋 PR #{pr_number} 리뷰 완료: {state_text}",
+                    "{state_emoji} {pr_title} - 리뷰 {state_text}",
+                    "👀 {reviewer}님이 코드 리뷰를 완료했어요!",
+                ),
+                messages=(
+                    (
+                        "{reviewer}님이 {repo_name}의 PR #{pr_number}에 {state_text} 리뷰를 "
+                        "남겼어요! {state_emoji}\n\nPR: {pr_title}\n작성자: {pr_author}"
+                        "\n{state_description}",
+                        Opt("branch_info", "\n\n{branch_info}"),
+                        Opt("stats_info", "\n{stats_info}"),
+                    ),
+                    (
+                        '코드 리뷰 완료! {reviewer}님이 {repo_name}의 "{pr_title}"에 {state_text} '
+                        "의견을 주셨어요! {state_emoji}\n\n{state_description}",
+                        Opt("pr_author", "\n작성자: {pr_author}"),
+                        Opt("branch_info", "\n{branch_info}"),
+                    ),
+                    (
+                        "{repo_name}의 PR #{pr_number}이 {reviewer}님에 의해 리뷰되었어요! "
+                        "상태: {state_text} {state_emoji}\n\nPR: {pr_title}",
+                        Opt("pr_author", "\n작성자: {pr_author}"),
+                        Opt("stats_info", "\n{stats_info}"),
+                    ),
+                    (
+                        '팀워크! {reviewer}님이 {repo_name}의 "{pr_title}" PR을 꼼꼼히 '
+                        "리뷰해주셨어요! {state_emoji} ({state_text})",
+                        Opt("pr_author", "\n\n작성자: {pr_author}"),
+                        Opt("branch_info", "\n{branch_info}"),
+                    ),
+                ),
+                suffix=(
+                    Opt("review_preview", '\n\n💭 리뷰 내용:\n"{review_preview}"'),
+                    Opt("review_html_url", "\n\n🔗 리뷰 보기: {review_html_url}"),
+                ),
+            ),
+        ),
+        "pull_request_review_comment": EventTemplate(
+            fields={
+                "comment_body": ("payload.comment.body", ""),
+                "commenter": ("payload.comment.user.login", Ref("sender")),
+                "comment_html_url": ("payload.comment.html_url", ""),
+                "pr_title": ("payload.pull_request.title", ""),
+                "pr_number": ("payload.pull_request.number", ""),
+                "pr_author": ("payload.pull_request.user.login", ""),
+                "base_branch": ("payload.pull_request.base.ref", ""),
+                "head_branch": ("payload.pull_request.head.ref", ""),
+                "file_path": ("payload.comment.path", ""),
+                "line": ("payload.comment.line", None),
+                "original_line": ("payload.comment.original_line", ""),
+                "position": ("payload.comment.position", ""),
+                "commit_id": ("payload.comment.commit_id", ""),
+            },
+            derive=_derive_review_comment,
+            variants=_single(
+                titles=(
+                    "💬 {commenter}님의 {comment_type}",
+                    "📝 PR #{pr_number}에 새 {comment_type}",
+                    "🔍 {location_title}에 리뷰 의견",
+                    "💭 {commenter}님이 코드에 의견을 남겼어요!",
+                ),
+                messages=(
+                    (
+                        "{commenter}님이 {repo_name}의 PR #{pr_number}에 {comment_type}를 "
+                        "남겼어요! 💬\n\nPR: {pr_title}",
+                        Opt("pr_author", "\n작성자: {pr_author}"),
+                        Opt("branch_info", "\n{branch_info}"),
+                    ),
+                    (
+                        '{comment_type} 도착! {commenter}님이 {repo_name}의 "{pr_title}"에 '
+                        "의견을 주셨어요! 👀",
+                        Opt("pr_author", "\n작성자: {pr_author}"),
+                    ),
+                    (
+                        "{repo_name}의 PR #{pr_number}에 {commenter}님의 새로운 {comment_type}가 "
+                        "있어요! 📝\n\nPR: {pr_title}",
+                        Opt("pr_author", "\n작성자: {pr_author}"),
+                    ),
+                    (
+                        '세심한 리뷰! {commenter}님이 {repo_name}의 "{pr_title}" 코드에 '
+                        "피드백을 남겼어요! 🔍",
+                        Opt("branch_info", "\n\n{branch_info}"),
+                    ),
+                ),
+                suffix=(_LOCATION, _COMMENT_PREVIEW, _COMMENT_URL),
+            ),
+        ),
+        "release": EventTemplate(
+            fields={
+                "tag_name": ("payload.release.tag_name", ""),
+                "release_name": ("payload.release.name", Ref("tag_name")),
+                "release_body": ("payload.release.body", ""),
+                "author": ("payload.release.author.login", Ref("sender")),
+                "is_prerelease": ("payload.release.prerelease", False),
+            },
+            derive=_derive_release,
+            variants=_single(
+                titles=(
+                    "🎉 {repo_name} {release_name} 출시!",
+                    "🚀 {tag_name} 버전 업데이트!",
+                    "📦 {repo_name} {release_type}: {release_name}",
+                    "✨ 새 릴리즈: {release_name} ({tag_name})",
+                ),
+                messages=(
+                    "와우! {author}님이 {repo_name}의 새 버전 {release_name}을 출시했어요! 🌟"
+                    "\n\n태그: {tag_name} | {release_type}",
+                    "축하합니다! {repo_name}가 {author}님에 의해 {release_name} 버전으로 "
+                    "업그레이드됐어요! 🎊\n\n태그: {tag_name} | {release_type}",
+                    "{repo_name}의 개발팀이 {tag_name} 태그로 {release_name} 릴리즈를 "
+                    "선보였어요! 👨‍💻\n\n{release_type} | 작성자: {author}",
+                    "새로운 기능과 개선사항이 {repo_name}의 {release_name} 버전에 담겨 "
+                    "도착했어요! 확인해보세요! 🔥\n\n태그: {tag_name} | {release_type}",
+                ),
+                suffix=(Opt("release_body_preview", "\n\n릴리즈 노트:\n{release_body_preview}"),),
+            ),
+        ),
+        "star": EventTemplate(
+            fields={"stargazers_count": ("payload.repository.stargazers_count", "")},
+            derive=_count_text("stargazers_count", "현재 스타 {}개"),
+            variants=_single(
+                titles=(
+                    "⭐ {sender}님이 스타를 주셨어요!",
+                    "🌟 {repo_name}에 새 스타!",
+                    "✨ {sender}님이 인정한 프로젝트!",
+                    "🎯 {sender}님의 스타 감사합니다!",
+                ),
+                messages=(
+                    "오예! {sender}님이 {repo_name}에 스타를 주셨어요! ⭐ {stargazers_count_text}",
+                    "{sender}님이 {repo_name}에 스타를 눌러줬네요! 인기 프로젝트가 되어가고 "
+                    "있어요! 🌟 {stargazers_count_text}",
+                    "{repo_name}의 매력에 {sender}님이 빠졌나봐요! 스타 감사합니다! 😊 "
+                    "{stargazers_count_text}",
+                    "스타 하나 추가! {sender}님 덕분에 {repo_name}가 점점 더 빛나고 있어요! ✨ "
+                    "{stargazers_count_text}",
+                ),
+            ),
+        ),
+        "fork": EventTemplate(
+            fields={
+                "fork_full_name": ("payload.forkee.full_name", ""),
+                "forks_count": ("payload.repository.forks_count", ""),
+            },
+            derive=_count_text("forks_count", "현재 포크 {}개"),
+            variants=_single(
+                titles=(
+                    "🍴 {sender}님이 {repo_name}를 포크했어요!",
+                    "🌿 {sender}님의 새 포크 생성!",
+                    "🔀 {repo_name}가 {sender}님에 의해 포크됐어요!",
+                    "📋 {sender}님의 포크 알림!",
+                ),
+                messages=(
+                    "{sender}님이 {repo_name}를 포크했어요! 프로젝트가 더 널리 퍼져나가고 "
+                    "있네요! 🌱",
+                    "와! {sender}님이 {repo_name}를 자신의 계정으로 포크했어요! 🤝",
+                    "{repo_name}의 코드가 {sender}님에 의해 새로운 곳에서 활용될 예정이에요! "
+                    "기대돼요! 🚀",
+                    "포크 알림! {sender}님이 {repo_name}를 포크하여 오픈소스의 힘을 보여주고 "
+                    "있어요! 💪",
+                ),
+                suffix=(
+                    Opt("fork_full_name", "\n\n포크: {fork_full_name}"),
+                    Opt("forks_count_text", "\n\n{forks_count_text}"),
+                ),
+            ),
+        ),
+        "watch": EventTemplate(
+            fields={"watchers_count": ("payload.repository.watchers_count", "")},
+            derive=_count_text("watchers_count", "현재 구독자 {}명"),
+            variants=_single(
+                titles=(
+                    "👀 {sender}님이 {repo_name}를 구독했어요!",
+                    "🔔 {sender}님이 알림 설정을 했어요!",
+                    "👥 {sender}님이 새 팔로워로 추가됐어요!",
+                    "📺 {sender}님의 구독 알림!",
+                ),
+                messages=(
+                    "{sender}님이 {repo_name}를 지켜보기 시작했어요! 👀 {watchers_count_text}",
+                    "{sender}님이 {repo_name}의 소식을 받아보고 싶어해요! 관심 감사합니다! 😊 "
+                    "{watchers_count_text}",
+                    "{repo_name}의 팬이 한 명 더 늘었네요! {sender}님이 구독을 시작했어요! "
+                    "계속 좋은 코드 부탁해요! 👍 {watchers_count_text}",
+                    "구독 알림! {sender}님 덕분에 {repo_name}가 더 많은 사람들에게 알려지고 "
+                    "있어요! 🌟 {watchers_count_text}",
+                ),
+            ),
+        ),
+        "issue_comment": EventTemplate(
+            fields={
+                "comment_body": ("payload.comment.body", ""),
+                "commenter": ("payload.comment.user.login", Ref("sender")),
+                "comment_html_url": ("payload.comment.html_url", ""),
+                "issue": ("payload.issue", {}),
+                "issue_title": ("payload.issue.title", ""),
+                "issue_number": ("payload.issue.number", ""),
+                "issue_author": ("payload.issue.user.login", ""),
+                "issue_state": ("payload.issue.state", ""),
+            },
+            derive=_derive_issue_comment,
+            variants=_single(
+                titles=(
+                    "💬 {commenter}님의 {item_type} 코멘트",
+                    "📝 {item_type} #{issue_number}에 새 코멘트",
+                    "🗨️ {commenter}님이 의견을 남겼어요!",
+                    "💭 {item_type} 토론 참여!",
+                ),
+                messages=(
+                    (
+                        "{commenter}님이 {repo_name}의 {item_type} #{issue_number}에 코멘트를 "
+                        "남겼어요! 💬\n\n{emoji} {item_type}: {issue_title}",
+                        Opt("issue_author", "\n작성자: {issue_author}"),
+                        Opt("issue_state", "\n상태: {issue_state}"),
+                    ),
+                    (
+                        '{item_type} 코멘트 도착! {commenter}님이 {repo_name}의 "{issue_title}"에 '
+                        "의견을 주셨어요! 👀",
+                        Opt("issue_author", "\n작성자: {issue_author}"),
+                    ),
+                    (
+                        "{repo_name}의 {item_type} #{issue_number}에 {commenter}님의 새로운 "
+                        "코멘트가 있어요! 📝\n\n{emoji} {issue_title}",
+                        Opt("issue_author", "\n작성자: {issue_author}"),
+                    ),
+                    (
+                        '활발한 토론! {commenter}님이 {repo_name}의 "{issue_title}" {item_type}에 '
+                        "참여했어요! 🗣️",
+                        Opt("issue_state", "\n상태: {issue_state}"),
+                    ),
+                ),
+                suffix=(_COMMENT_PREVIEW, _COMMENT_URL),
+            ),
+        ),
+        "create": EventTemplate(
+            fields={
+                "ref": ("payload.ref", ""),
+                "ref_type": ("payload.ref_type", ""),
+                "master_branch": ("payload.master_branch", ""),
+            },
+            derive=_ref_type(deleted=False),
+            variants=_single(
+                titles=(
+                    "{type_emoji} {sender}님이 새 {type_text}를 만들었어요!",
+                    "✨ {repo_name}에 새 {type_text}: {ref}",
+                    "🎉 {type_text} 생성: {ref}",
+                    "🚀 {sender}님의 새 {type_text} 등장!",
+                ),
+                messages=(
+                    (
+                        "{sender}님이 {repo_name}에 새로운 {type_text} '{ref}'를 만들었어요! "
+                        "{type_emoji}",
+                        Opt("master_branch", "\n기준 브랜치: {master_branch}"),
+                    ),
+                    (
+                        "새로운 {type_text}가 {repo_name}에 등장했네요! '{ref}' {type_emoji}"
+                        "\n생성자: {sender}",
+                        Opt("master_branch", "\n기준: {master_branch}"),
+                    ),
+                    "{repo_name}의 {type_text} '{ref}'가 {sender}님에 의해 생성됐어요! "
+                    "개발이 활발해지고 있어요! 💪",
+                    (
+                        "{type_text} 생성 알림! {sender}님이 {repo_name}에 '{ref}'를 만들었어요! "
+                        "{type_emoji}",
+                        Opt("master_branch", "\n\n기준 브랜치: {master_branch}"),
+                    ),
+                ),
+            ),
+        ),
+        "delete": EventTemplate(
+            fields={"ref": ("payload.ref", ""), "ref_type": ("payload.ref_type", "")},
+            derive=_ref_type(deleted=True),
+            variants=_single(
+                titles=(
+                    "{type_emoji} {sender}님이 {type_text}를 삭제했어요",
+                    "🗑️ {repo_name}에서 {type_text} 삭제: {ref}",
+                    "❌ {type_text} 제거: {ref}",
+                    "🧹 {sender}님의 정리 작업",
+                ),
+                messages=(
+                    "{sender}님이 {repo_name}의 {type_text} '{ref}'를 삭제했어요! {type_emoji}"
+                    "\n\n정리 작업이 진행되고 있네요!",
+                    "{repo_name}에서 {type_text} '{ref}'가 제거됐어요! 🗑️\n삭제자: {sender}",
+                    "{type_text} 삭제 알림! {sender}님이 {repo_name}의 '{ref}'를 정리했어요! 🧹",
+                    "코드베이스 정리! {sender}님이 {repo_name}에서 {type_text} '{ref}'를 "
+                    "삭제했어요! ✨",
+                ),
+            ),
+        ),
+        "commit_comment": EventTemplate(
+            fields={
+                "comment_body": ("payload.comment.body", ""),
+                "commenter": ("payload.comment.user.login", Ref("sender")),
+                "comment_html_url": ("payload.comment.html_url", ""),
+                "commit_id": ("payload.comment.commit_id", ""),
+                "file_path": ("payload.comment.path", ""),
+                "line": ("payload.comment.line", ""),
+                "position": ("payload.comment.position", ""),
+            },
+            derive=_derive_commit_comment,
+            variants=_single(
+                titles=(
+                    "💬 {commenter}님의 커밋 코멘트",
+                    "📝 {commit_short} 커밋에 새 코멘트",
+                    "🔍 커밋 리뷰 의견",
+                    "💭 {commenter}님이 커밋에 의견을 남겼어요!",
+                ),
+                messages=(
+                    "{commenter}님이 {repo_name}의 커밋 {commit_short}에 코멘트를 남겼어요! 💬",
+                    "커밋 코멘트 도착! {commenter}님이 {repo_name}의 커밋에 의견을 주셨어요! 👀"
+                    "\n\n커밋: {commit_short}",
+                    "{repo_name}의 커밋 {commit_short}에 {commenter}님의 새로운 코멘트가 있어요! 📝",
+                    "코드 리뷰! {commenter}님이 {repo_name}의 커밋에 피드백을 남겼어요! 🔍"
+                    "\n\n커밋: {commit_short}",
+                ),
+                suffix=(_LOCATION, _COMMENT_PREVIEW, _COMMENT_URL),
+            ),
+        ),
+        "gollum": EventTemplate(
+            fields={"pages": ("payload.pages", [])},
+            select=lambda ctx: "pages" if ctx["pages"] else "empty",
+            variants={
+                "empty": Variant(
+                    titles=("📚 {sender}님이 위키를 수정했어요!",),
+                    messages=("{sender}님이 {repo_name}의 위키를 업데이트했어요! 📚",),
+                ),
+                "pages": Variant(
+                    titles=(
+                        "📚 {sender}님이 위키를 업데이트했어요!",
+                        "📖 {repo_name} 위키 수정",
+                        "✏️ 위키 편집: {page_count}개 페이지",
+                        "📝 {sender}님의 위키 작업",
+                    ),
+                    messages=(
+                        "{sender}님이 {repo_name}의 위키를 업데이트했어요! 📚\n\n{page_summaries}",
+                        "위키 업데이트 알림! {sender}님이 {repo_name}에서 {page_count}개의 위키 "
+                        "페이지를 수정했어요! 📖\n\n{page_summaries}",
+                        "{repo_name}의 문서가 {sender}님에 의해 개선됐어요! 더 나은 문서화! 💪"
+                        "\n\n{page_summaries}",
+                        "지식 공유! {sender}님이 {repo_name}의 위키를 풍성하게 만들어주셨어요! ✨"
+                        "\n\n{page_summaries}",
+                    ),
+                    derive=_derive_gollum,
+                ),
+            },
+        ),
+        "milestone": EventTemplate(
+            fields={
+                "milestone_title": ("payload.milestone.title", ""),
+                "milestone_number": ("payload.milestone.number", ""),
+                "milestone_description": ("payload.milestone.description", ""),
+                "due_date": ("payload.milestone.due_on", ""),
+                "open_issues": ("payload.milestone.open_issues", 0),
+                "closed_issues": ("payload.milestone.closed_issues", 0),
+            },
+            derive=_derive_milestone,
+            variants=_single(
+                titles=(
+                    "{action_emoji} 마일스톤 {action_text}: {milestone_title}",
+                    "🎯 마일스톤 #{milestone_number} {action_text}",
+                    "📊 {repo_name} 마일스톤 업데이트",
+                    "🚀 프로젝트 진척도 알림",
+                ),
+                messages=(
+                    (
+                        "{sender}님이 {repo_name}의 마일스톤을 {action_text}했어요! {action_emoji}"
+                        "\n\n🎯 마일스톤: {milestone_title}{progress_info}",
+                        Opt("due_date", "\n마감일: {due_date}"),
+                    ),
+                    "마일스톤 {action_text} 알림! {repo_name}의 '{milestone_title}' 마일스톤이 "
+                    "{action_text}됐어요! 📊{progress_info}",
+                    "프로젝트 관리! {sender}님이 {repo_name}의 마일스톤 #{milestone_number}을 "
+                    "{action_text}했어요! 🎯\n\n제목: {milestone_title}{progress_info}",
+                    (
+                        "팀워크! {repo_name}의 '{milestone_title}' 마일스톤이 {action_text}됐어요! "
+                        "🚀{progress_info}",
+                        Opt("due_date", "\n\n마감일: {due_date}"),
+                    ),
+                ),
+                suffix=(Opt("description_preview", "\n\n📝 설명: {description_preview}"),),
+            ),
+        ),
+        "workflow_run": EventTemplate(
+            fields=_run_fields(
+                "workflow_run", head_branch=("payload.workflow_run.head_branch", "")
+            ),
+            derive=_derive_run,
+            variants=_single(
+                titles=(
+                    "{status_emoji} 워크플로우 실행: {run_name}",
+                    "{status_emoji} GitHub Actions: {run_name} ({conclusion})",
+                    "{status_emoji} {repo_name}의 워크플로우 {conclusion}",
+                    "{status_emoji} CI/CD 알림: {run_name}",
+                ),
+                messages=(
+                    (
+                        "{repo_name}의 '{run_name}' 워크플로우가 {conclusion} 상태로 실행됐어요! "
+                        "{status_emoji}\n\n실행자: {sender}",
+                        Opt("branch_info", "\n\n{branch_info}"),
+                    ),
+                    (
+                        "{sender}님이 실행한 {repo_name}의 '{run_name}' 워크플로우가 "
+                        "{conclusion} 상태입니다. {status_emoji}",
+                        Opt("branch_info", "\n\n{branch_info}"),
+                    ),
+                    (
+                        "{repo_name}의 CI/CD 파이프라인 '{run_name}'이 {conclusion} 상태로 "
+                        "완료됐어요! {status_emoji}\n\n실행자: {sender}",
+                        Opt("branch_info", "\n\n{branch_info}"),
+                    ),
+                    (
+                        "GitHub Actions 알림: {repo_name}의 '{run_name}' 워크플로우 상태는 "
+                        "{conclusion}입니다. {status_emoji}\n\n실행자: {sender}",
+                        Opt("branch_info", "\n\n{branch_info}"),
+                    ),
+                ),
+                suffix=(_RUN_URL,),
+            ),
+        ),
+        "workflow_job": EventTemplate(
+            fields=_run_fields("workflow_job"),
+            derive=_derive_run,
+            variants=_single(
+                titles=(
+                    "{status_emoji} 작업 실행: {run_name}",
+                    "{status_emoji} GitHub Actions 작업: {run_name} ({conclusion})",
+                    "{status_emoji} {repo_name}의 작업 {conclusion}",
+                    "{status_emoji} CI/CD 작업 알림: {run_name}",
+                ),
+                messages=(
+                    "{repo_name}의 '{run_name}' 작업이 {conclusion} 상태로 실행됐어요! "
+                    "{status_emoji}",
+                    "{repo_name}의 '{run_name}' 작업이 {conclusion} 상태입니다. {status_emoji}",
+                    "{repo_name}의 CI/CD 작업 '{run_name}'이 {conclusion} 상태로 완료됐어요! "
+                    "{status_emoji}",
+                    "GitHub Actions 작업 알림: {repo_name}의 '{run_name}' 상태는 "
+                    "{conclusion}입니다. {status_emoji}",
+                ),
+                suffix=(_RUN_URL,),
+            ),
+        ),
+        "check_run": EventTemplate(
+            fields=_run_fields("check_run"),
+            derive=_derive_run,
+            variants=_single(
+                titles=(
+                    "{status_emoji} 체크 실행: {run_name}",
+                    "{status_emoji} GitHub 체크: {run_name} ({conclusion})",
+                    "{status_emoji} {repo_name}의 체크 {conclusion}",
+                    "{status_emoji} 코드 체크 알림: {run_name}",
+                ),
+                messages=(
+                    "{repo_name}의 '{run_name}' 체크가 {conclusion} 상태로 실행됐어요! "
+                    "{status_emoji}",
+                    "{repo_name}의 '{run_name}' 체크가 {conclusion} 상태입니다. {status_emoji}",
+                    "{repo_name}의 코드 체크 '{run_name}'이 {conclusion} 상태로 완료됐어요! "
+                    "{status_emoji}",
+                    "GitHub 체크 알림: {repo_name}의 '{run_name}' 상태는 {conclusion}입니다. "
+                    "{status_emoji}",
+                ),
+                suffix=(_RUN_URL,),
+            ),
+        ),
+        "check_suite": EventTemplate(
+            fields={
+                "status": ("payload.check_suite.status", "unknown"),
+                "conclusion": ("payload.check_suite.conclusion", "진행중"),
+            },
+            derive=_derive_run,
+            variants=_single(
+                titles=(
+                    "{status_emoji} 체크 스위트 실행",
+                    "{status_emoji} GitHub 체크 스위트 ({conclusion})",
+                    "{status_emoji} {repo_name}의 체크 스위트 {conclusion}",
+                    "{status_emoji} 코드 체크 스위트 알림",
+                ),
+                messages=(
+                    "{repo_name}의 체크 스위트가 {conclusion} 상태로 실행됐어요! {status_emoji}",
+                    "{repo_name}의 체크 스위트가 {conclusion} 상태입니다. {status_emoji}",
+                    "{repo_name}의 코드 체크 스위트가 {conclusion} 상태로 완료됐어요! "
+                    "{status_emoji}",
+                    "GitHub 체크 스위트 알림: {repo_name}의 상태는 {conclusion}입니다. "
+                    "{status_emoji}",
+                ),
+            ),
+        ),
+    }
+)
+
+# 템플릿이 없는 이벤트 - 가능한 정보를 payload 에서 추출
+DEFAULT_TEMPLATE = EventTemplate(
+    fields={"payload": ("payload", {})},
+    derive=_derive_default,
+    variants=_single(
+        titles=(
+            "📢 {event_type} 이벤트 발생!",
+            "🔔 {sender}님의 {event_type} 알림!",
+            "📬 {repo_name}의 {event_type} 업데이트!",
+            "🎯 {event_type} 액션 발생!",
+        ),
+        messages=(
+            "{sender}님이 {repo_name}에서 {event_type} 이벤트를 발생시켰어요!",
+            "{repo_name}의 {event_type} 소식을 전해드려요! 발생자: {sender}",
+            "어? {repo_name}에서 {sender}님이 {event_type} 이벤트를 발생시켰어요!",
+            "{repo_name}가 {sender}님에 의해 활발하게 움직이고 있어요! 이벤트: {event_type}",
+        ),
+        suffix=(Opt("action_info", "\n\n{action_info}"), "{payload_preview}"),
+    ),
+)
+
+
 # Mapping
 _BUILDER_MAP: Dict[str, BaseMessageBuilder] = {
     "push": PushMessageBuilder(),
     "pull_request": PullRequestMessageBuilder(),
+    **{
+        event_type: TemplateMessageBuilder(template)
+        for event_type, template in EVENT_TEMPLATES.items()
+    },
 }
+_DEFAULT_BUILDER = TemplateMessageBuilder(DEFAULT_TEMPLATE)
 
 
 def get_builder(event_type: str) -> BaseMessageBuilder | None:  # noqa: D401
     return _BUILDER_MAP.get(event_type)
+
+
+def get_builder_or_default(event_type: str) -> BaseMessageBuilder:
+    """전용 빌더가 없으면 기본 템플릿 빌더를 반환"""
+    return _BUILDER_MAP.get(event_type, _DEFAULT_BUILDER)
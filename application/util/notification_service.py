@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
@@ -10,13 +13,41 @@ from application.util.logger import setup_logger
 # setup_logger 가 None 을 반환할 수 있으므로 안전하게 기본 로거로 대체
 logger: logging.Logger = setup_logger("util") or logging.getLogger("util")
 
+BATCH_ENDPOINT = "/notifications/batch"
+# 개별 엔드포인트 → /notifications/batch 항목의 type
+_BATCH_TYPES = {"/notifications/info": "info", "/notifications/dialog/html": "dialog_html"}
 
-class NotificationService:  # pylint: disable=too-few-public-methods
-    """FastAPI-기반 API 서버에 알림을 전송한다."""
+_Outbound = Tuple[str, Dict[str, Any]]
 
-    def __init__(self, session: requests.Session, api_server_url: str) -> None:
+
+class NotificationService:  # pylint: disable=too-many-instance-attributes
+    """FastAPI-기반 API 서버에 알림을 전송한다.
+
+    ``batched=True`` 로 보낸 알림은 제한된 크기의 큐에 쌓였다가 백그라운드 스레드가
+    ``max_batch`` 개 또는 ``flush_interval`` 초 단위로 모아 ``/notifications/batch``
+    한 번으로 전송한다. 큐가 가득 차면 호출 스레드에서 바로 전송한다 (backpressure).
+    전달하지 못한 알림 수는 다음 :meth:`flush` 결과에 반영된다.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        api_server_url: str,
+        *,
+        max_batch: int = 100,
+        flush_interval: float = 0.05,
+        max_queue: int = 1000,
+    ) -> None:
         self._session: requests.Session = session
         self._api_server_url: str = api_server_url.rstrip("/")
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[_Outbound]" = queue.Queue(maxsize=max_queue)
+        self._flusher: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._batch_supported = True  # 구버전 API 서버면 개별 전송으로 폴백
+        self._failed = 0  # 마지막 flush() 이후 전달하지 못한 batched 알림 수
 
     # ------------------------------------------------------------------
     # Configuration helpers
@@ -40,6 +71,7 @@ class NotificationService:  # pylint: disable=too-few-public-methods
         duration: int = 5000,
         priority: str = "normal",
         show_bubble: bool | None = None,
+        batched: bool = False,
     ) -> bool:
         """단순 텍스트 알림(post /notifications/info)"""
         payload: Dict[str, Any] = {
@@ -51,7 +83,7 @@ class NotificationService:  # pylint: disable=too-few-public-methods
         if show_bubble is not None:
             payload["show_bubble"] = show_bubble
 
-        return self._post_json("/notifications/info", payload)
+        return self._send("/notifications/info", payload, batched)
 
     def send_dialog_html(
         self,
@@ -63,6 +95,7 @@ class NotificationService:  # pylint: disable=too-few-public-methods
         width: int = 550,
         height: int = 340,
         duration: int = 0,
+        batched: bool = False,
     ) -> bool:
         """HTML 다이얼로그 알림(post /notifications/dialog/html)"""
         payload: Dict[str, Any] = {
@@ -74,11 +107,110 @@ class NotificationService:  # pylint: disable=too-few-public-methods
             "height": height,
             "duration": duration,
         }
-        return self._post_json("/notifications/dialog/html", payload)
+        return self._send("/notifications/dialog/html", payload, batched)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """큐에 쌓인 알림이 모두 전송될 때까지 대기
+
+        timeout 안에 끝났고 마지막 flush() 이후 전달에 실패한 알림이 없으면 True.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        with self._lock:
+            failed, self._failed = self._failed, 0
+        if failed:
+            logger.warning("알림 %d개를 전달하지 못했습니다", failed)
+        return not failed
+
+    def close(self, timeout: float = 5.0) -> None:
+        """남은 알림을 전송하고 백그라운드 스레드 종료"""
+        self.flush(timeout)
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout)
+            self._flusher = None
+        self._closed.clear()
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _send(self, endpoint: str, payload: Dict[str, Any], batched: bool) -> bool:
+        if not batched:
+            return self._post_json(endpoint, payload)
+        self._ensure_flusher()
+        try:
+            self._queue.put_nowait((endpoint, payload))
+            return True
+        except queue.Full:
+            logger.warning("알림 큐가 가득 차 바로 전송합니다: %s", endpoint)
+            sent = self._post_json(endpoint, payload)
+            if not sent:
+                self._record_failures(1)
+            return sent
+
+    def _ensure_flusher(self) -> None:
+        with self._lock:
+            if self._flusher is None or not self._flusher.is_alive():
+                self._flusher = threading.Thread(
+                    target=self._flush_loop, name="notification-flusher", daemon=True
+                )
+                self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while not self._closed.is_set():
+            try:
+                first = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.max_batch:
+                remaining = max(0.0, deadline - time.monotonic())
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                self._record_failures(self._post_batch(batch))
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error("알림 일괄 전송 오류: %s", exc)
+                self._record_failures(len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _record_failures(self, count: int) -> None:
+        if count:
+            with self._lock:
+                self._failed += count
+
+    def _post_batch(self, batch: List[_Outbound]) -> int:
+        """알림 묶음 전송 - 전달하지 못한 알림 수를 반환"""
+        if self._batch_supported:
+            items = [{"type": _BATCH_TYPES[endpoint], **payload} for endpoint, payload in batch]
+            url = f"{self._api_server_url}{BATCH_ENDPOINT}"
+            try:
+                response = self._session.post(
+                    url, json={"notifications": items}, timeout=10, verify=False
+                )  # noqa: S501 SSL off
+                if response.status_code not in (404, 405):
+                    response.raise_for_status()
+                    failed = _failed_items(response, len(batch))
+                    logger.debug("알림 %d개 일괄 전송 완료 (실패 %d개)", len(batch), failed)
+                    return failed
+                logger.info("API 서버가 일괄 알림을 지원하지 않아 개별 전송합니다")
+                self._batch_supported = False
+            except requests.RequestException as exc:  # noqa: BLE001
+                logger.error("알림 일괄 전송 실패(%d개): %s", len(batch), exc)
+                return len(batch)
+
+        return sum(not self._post_json(endpoint, payload) for endpoint, payload in batch)
+
     def _post_json(self, endpoint: str, payload: Dict[str, Any]) -> bool:
         url = f"{self._api_server_url}{endpoint}"
         try:
@@ -86,8 +218,27 @@ class NotificationService:  # pylint: disable=too-few-public-methods
                 url, json=payload, timeout=5, verify=False
             )  # noqa: S501 SSL off
             response.raise_for_status()
+            if _failed_items(response, 1):
+                logger.error("알림 전송 실패(%s): %s", endpoint, response.text)
+                return False
             logger.debug("알림 전송 완료: %s", endpoint)
             return True
         except requests.RequestException as exc:  # noqa: BLE001
             logger.error("알림 전송 실패(%s): %s", endpoint, exc)
             return False
+
+
+def _failed_items(response: requests.Response, total: int) -> int:
+    """2xx 응답 본문의 처리 결과에서 실패한 항목 수 (본문이 JSON 이 아니면 0)
+
+    API 서버는 알림 표시에 실패해도 200 으로 ``{"status": "error", ...}`` 를 돌려주며,
+    일괄 전송은 ``details.failed`` 에 실패한 항목 번호를 담는다.
+    """
+    try:
+        body = response.json()
+    except ValueError:
+        return 0
+    if not isinstance(body, dict) or body.get("status") != "error":
+        return 0
+    failed = (body.get("details") or {}).get("failed")
+    return len(failed) if isinstance(failed, list) else total
@@ -1,30 +1,113 @@
 from __future__ import annotations
 
 import logging
+import random
 import threading
 import time
-from typing import Any, Callable, Dict, List, Optional, cast
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, Optional, Union, cast
 
 from application.util.logger import setup_logger
 
 logger = cast(logging.Logger, setup_logger("util") or logging.getLogger("util"))
 
 
-class PollingManager:  # pylint: disable=too-few-public-methods
-    """Runs a polling loop in a background daemon thread."""
+@dataclass
+class PollOutcome:
+    """Result of a single poll request as seen by the scheduler."""
+
+    messages: List[Dict[str, Any]] = field(default_factory=list)
+    error: bool = False
+    retry_after: Optional[float] = None  # 서버가 요청한 최소 대기 시간 (초)
+    not_modified: bool = False  # 304 (변경 없음)
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP-date) 를 대기 초로 변환"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+class AdaptivePollScheduler:
+    """Chooses the delay before the next poll from the previous outcome.
+
+    메시지를 받으면 간격을 ``min_interval`` 로 줄이고, 빈 응답이나 오류가 나면
+    ``max_interval`` 까지 지수적으로 늘린다. 여러 클라이언트가 같은 시각에 몰리지
+    않도록 ±``jitter`` 비율의 무작위 지연을 더하며, 서버의 Retry-After 보다 먼저
+    요청하지 않는다.
+    """
 
     def __init__(
         self,
-        fetch_messages: Callable[[], List[Dict[str, Any]]],
+        base_interval: float = 10.0,
+        min_interval: float = 1.0,
+        max_interval: float = 120.0,
+        backoff_factor: float = 2.0,
+        jitter: float = 0.2,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.base_interval = base_interval
+        self.min_interval = min(min_interval, base_interval)
+        self.max_interval = max(max_interval, base_interval)
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self._rng = rng or random.Random()
+        self.interval = base_interval
+
+    def next_delay(self, outcome: PollOutcome) -> float:
+        if outcome.messages:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff_factor)
+
+        delay = self.interval * self._rng.uniform(1 - self.jitter, 1 + self.jitter)
+        if outcome.retry_after is not None:
+            delay = max(delay, outcome.retry_after)
+        return delay
+
+
+FetchResult = Union[PollOutcome, List[Dict[str, Any]]]
+
+
+class PollingManager:  # pylint: disable=too-many-instance-attributes
+    """Runs an adaptive polling loop in a background daemon thread.
+
+    ``fetch_messages`` 는 메시지 목록 또는 :class:`PollOutcome` 을 반환한다.
+    시계(``clock``)와 대기 함수(``sleep``)를 주입하면 실제 시간 없이 loop 를 돌릴 수 있다.
+    """
+
+    def __init__(
+        self,
+        fetch_messages: Callable[[], FetchResult],
         handle_messages: Callable[[List[Dict[str, Any]], bool], None],
-        poll_interval: int = 10,
+        poll_interval: float = 10,
+        scheduler: Optional[AdaptivePollScheduler] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Optional[Callable[[float], None]] = None,
     ) -> None:
         self._fetch_messages = fetch_messages
         self._handle_messages = handle_messages
-        self._poll_interval = poll_interval
+        self.scheduler = scheduler or AdaptivePollScheduler(base_interval=poll_interval)
+        self._clock = clock
+        self._wake = threading.Event()
+        self._sleep = sleep or self._wake.wait
 
         self._thread: Optional[threading.Thread] = None
         self._running: bool = False
+        self._first_poll = True
+        self.poll_count = 0
 
     # ------------------------------------------------------------------
     # Public API
@@ -35,6 +118,7 @@ class PollingManager:  # pylint: disable=too-few-public-methods
             return
 
         self._running = True
+        self._wake.clear()
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
         logger.info("PollingManager started.")
@@ -44,25 +128,43 @@ class PollingManager:  # pylint: disable=too-few-public-methods
             return
 
         self._running = False
+        self._wake.set()  # 대기 중인 backoff 를 바로 깨운다
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=5)
         logger.info("PollingManager stopped.")
 
+    def run(self, duration: Optional[float] = None) -> None:
+        """현재 스레드에서 polling loop 실행 (duration 은 주입된 clock 기준)"""
+        self._running = True
+        self._run_loop(duration)
+
+    def poll_once(self) -> float:
+        """한 번 polling 하고 다음 poll 까지의 대기 시간(초)을 반환"""
+        self.poll_count += 1
+        try:
+            result = self._fetch_messages()
+            outcome = result if isinstance(result, PollOutcome) else PollOutcome(list(result))
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("Polling loop error: %s", exc)
+            outcome = PollOutcome(error=True)
+
+        if outcome.messages:
+            try:
+                self._handle_messages(outcome.messages, self._first_poll)
+                self._first_poll = False
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.error("Polling handler error: %s", exc)
+        return self.scheduler.next_delay(outcome)
+
     # ------------------------------------------------------------------
     # Internal
     # ------------------------------------------------------------------
-    def _run_loop(self) -> None:
-        first_poll = True
+    def _run_loop(self, duration: Optional[float] = None) -> None:
+        deadline = self._clock() + duration if duration is not None else None
         while self._running:
-            try:
-                messages = self._fetch_messages()
-                if not messages:
-                    time.sleep(self._poll_interval)
-                    continue
-
-                self._handle_messages(messages, first_poll)
-                first_poll = False
-                time.sleep(self._poll_interval)
-            except Exception as exc:  # pylint: disable=broad-except
-                logger.error("Polling loop error: %s", exc)
-                time.sleep(self._poll_interval)
+            delay = self.poll_once()
+            if deadline is not None and self._clock() + delay >= deadline:
+                self._running = False
+                break
+            if self._running:
+                self._sleep(delay)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Optional, TypeVar, cast
+
+from application.util.logger import setup_logger
+
+logger = cast(logging.Logger, setup_logger("util") or logging.getLogger("util"))
+
+T = TypeVar("T")
+AgentFactoryFn = Callable[[Any], Any]
+
+
+def _default_agent_factory(config_manager: Any) -> Any:
+    from application.llm.agents.agent_factory import AgentFactory
+
+    return AgentFactory.create_agent(config_manager, None)
+
+
+class SummarizerService:
+    """Owns one background asyncio loop and one lazily created summary agent.
+
+    요약 작업은 :meth:`submit` / :meth:`summarize` 로 어느 스레드에서든 넣을 수 있고
+    ``concurrent.futures.Future`` 로 결과를 받는다. Agent(와 그 HTTP 클라이언트)는
+    같은 loop 에서 재사용하며, LLM 설정 fingerprint 가 바뀔 때만 다시 만든다.
+    """
+
+    def __init__(
+        self,
+        config_manager: Any,
+        agent_factory: AgentFactoryFn = _default_agent_factory,
+    ) -> None:
+        self._config_manager = config_manager
+        self._agent_factory = agent_factory
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._agent: Any = None
+        self._fingerprint: Optional[str] = None
+        self.agents_created = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        with self._lock:
+            if self.is_running:
+                return
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            self._loop = loop
+            self._thread = threading.Thread(target=run, name="summarizer-loop", daemon=True)
+            self._thread.start()
+            ready.wait()
+            logger.info("SummarizerService started.")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or thread is None:
+                return
+            if thread.is_alive():
+                asyncio.run_coroutine_threadsafe(self._close_agent(), loop).result(timeout)
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join(timeout)
+            loop.close()
+            self._loop = None
+            self._thread = None
+            logger.info("SummarizerService stopped.")
+
+    def submit(self, coro: Awaitable[T]) -> "Future[T]":
+        """코루틴을 요약 loop 에서 실행 (thread-safe, loop 가 없으면 시작)"""
+        self.start()
+        assert self._loop is not None
+        return asyncio.run_coroutine_threadsafe(cast(Any, coro), self._loop)
+
+    def summarize(self, prompt: str) -> "Future[str]":
+        """프롬프트에 대한 LLM 응답 텍스트를 Future 로 반환"""
+        return self.submit(self.generate(prompt))
+
+    async def generate(self, prompt: str) -> str:
+        """요약 loop 위에서 agent 로 응답 생성 (요약마다 대화 기록은 비운다)"""
+        agent = await self._get_agent()
+        if hasattr(agent, "clear_conversation"):
+            agent.clear_conversation()
+        response = await agent.generate_response(prompt)
+        if isinstance(response, dict):
+            return str(response.get("response", ""))
+        return str(response)
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+    def _llm_fingerprint(self) -> str:
+        llm_config = self._config_manager.get_llm_config()
+        encoded = json.dumps(llm_config, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    async def _get_agent(self) -> Any:
+        fingerprint = self._llm_fingerprint()
+        if self._agent is None or fingerprint != self._fingerprint:
+            if self._agent is not None:
+                logger.info("LLM 설정 변경 감지: 요약 agent 재생성")
+                await self._close_agent()
+            self._agent = self._agent_factory(self._config_manager)
+            self._fingerprint = fingerprint
+            self.agents_created += 1
+        return self._agent
+
+    async def _close_agent(self) -> None:
+        agent, self._agent = self._agent, None
+        cleanup: Optional[Callable[[], Awaitable[None]]] = getattr(agent, "cleanup", None)
+        if cleanup is not None:
+            try:
+                await cleanup()
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.warning("요약 agent 정리 실패: %s", exc)
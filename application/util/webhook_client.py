@@ -1,26 +1,30 @@
 import logging
-import random
 import threading
 import time
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Set, cast
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from application.config.config_manager import ConfigManager
+from application.util.event_coalescer import EventCoalescer
+from application.util.event_stream_manager import EventStreamManager
 from application.util.filter_engine import FilterEngine
 from application.util.friendly_message_builder import build_friendly_message
 from application.util.logger import setup_logger
 from application.util.notification_service import NotificationService
-from application.util.polling_manager import PollingManager
+from application.util.polling_manager import PollingManager, PollOutcome, parse_retry_after
+from application.util.summarizer_service import SummarizerService
 
 logger = setup_logger("util") or logging.getLogger("util")
 
 # 전역 설정 변수
 SESSION_SOCKET_TIMEOUT = 5  # 기본 타임아웃 5초
+SUMMARY_TIMEOUT = 60  # LLM 요약 대기 시간 (초과 시 개별 알림으로 폴백)
 SESSION_VERIFY = False  # SSL 인증 활성화
+STREAM_READ_TIMEOUT = 60  # SSE 스트림 읽기 타임아웃 (서버 heartbeat 보다 길게)
 
 
 class WebhookClient:
@@ -32,11 +36,17 @@ class WebhookClient:
         client_name: str,
         client_description: str = "",
         poll_interval: int = 10,  # 10초 간격으로 polling
+        prefer_stream: bool = True,  # SSE 스트림 우선, 미지원 시 polling
+        payload_profile: str = "slim",  # 알림에 필요한 payload 필드만 수신 (full: 전체)
+        coalesce_window: float = 3.0,  # CI 상태 이벤트 묶음 대기 시간 (0 이면 묶지 않음)
     ):
         self.webhook_server_url = webhook_server_url.rstrip("/")
         self.client_name = client_name
         self.client_description = client_description
         self.poll_interval = poll_interval
+        self.prefer_stream = prefer_stream
+        self.payload_profile = payload_profile
+        self.coalesce_window = coalesce_window
 
         self.client_id: Optional[int] = None
         self.is_polling = False
@@ -49,6 +59,15 @@ class WebhookClient:
         self.filter_engine: Optional[FilterEngine] = None
         self.notification_service: Optional[NotificationService] = None
         self._polling_manager: Optional[PollingManager] = None
+        self._stream_manager: Optional[EventStreamManager] = None
+        self._summarizer: Optional[SummarizerService] = None
+        self._coalescer: Optional[EventCoalescer] = None
+        # 누적 ack 상태: 전달하지 못했거나 묶음기에 보관 중인 시퀀스가 남아 있으면
+        # 그 직전까지만 ack 한다
+        self._ack_lock = threading.Lock()
+        self._unacked: Set[int] = set()
+        self._handled_seq = 0
+        self._acked_seq = 0
 
         # HTTP 세션 설정 (재시도 로직 포함)
         self.session = requests.Session()
@@ -60,6 +79,11 @@ class WebhookClient:
         adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        # poll 은 429/503 을 재시도하지 않고 Retry-After 를 PollingManager 의 스케줄러에 넘긴다
+        self.session.mount(f"{self.webhook_server_url}/poll/", HTTPAdapter())
+        self._poll_etag: Optional[str] = None
+        # poll 응답은 서버에서 gzip 으로 압축해 보내며 requests 가 자동으로 해제한다
+        self.session.headers["Accept-Encoding"] = "gzip, deflate"
 
     def initialize_config(self) -> bool:
         """설정 초기화 - 별도 메서드로 분리하여 나중에 호출"""
@@ -234,11 +258,6 @@ class WebhookClient:
     async def _generate_llm_summary(self, messages: List[Dict[str, Any]]) -> tuple[str, str]:
         """LLM을 사용하여 메시지들을 요약"""
         try:
-            from application.llm.agents.agent_factory import AgentFactory
-
-            # Agent 초기화 (기본 모드로 사용)
-            llm_agent = AgentFactory.create_agent(self.config_manager, None)
-
             # 메시지 정보를 텍스트로 변환
             message_details = []
             for i, msg in enumerate(messages, 1):
@@ -321,8 +340,8 @@ class WebhookClient:
 내용: [상세한 요약 내용]
 """
 
-            # LLM 응답 생성
-            response = await llm_agent.generate_response(prompt)
+            # LLM 응답 생성 (요약 loop 에서 재사용 중인 agent 사용)
+            response = await self.summarizer.generate(prompt)
 
             # 응답에서 제목과 내용 분리
             lines = response.strip().split("\n")
@@ -578,6 +597,7 @@ class WebhookClient:
                     width=550,
                     height=380 if body_preview else 340,
                     duration=0,
+                    batched=True,
                 )
             else:
                 # Fallback to direct HTTP if service missing
@@ -632,1122 +652,111 @@ class WebhookClient:
 
     def poll_messages(self) -> List[Dict[str, Any]]:
         """새로운 메시지를 polling"""
+        return self.poll().messages
+
+    def poll(self) -> PollOutcome:
+        """새로운 메시지를 polling 하고 다음 poll 스케줄링에 필요한 정보까지 반환
+
+        빈 응답의 ETag 를 If-None-Match 로 보내 변경이 없으면 본문 없는 304 를 받는다.
+        """
         if not self.client_id:
             logger.error("클라이언트 ID가 없습니다. 먼저 등록해주세요.")
-            return []
+            return PollOutcome(error=True)
 
+        headers = {"If-None-Match": self._poll_etag} if self._poll_etag else {}
         try:
             url = f"{self.webhook_server_url}/poll/{self.client_id}"
-            response = self.session.get(url, timeout=SESSION_SOCKET_TIMEOUT, verify=SESSION_VERIFY)
+            # 처리 완료 후 ack_messages 로 확인 (미확인 메시지는 서버가 재전달)
+            response = self.session.get(
+                url,
+                params={"auto_ack": "false", "profile": self.payload_profile},
+                headers=headers,
+                timeout=SESSION_SOCKET_TIMEOUT,
+                verify=SESSION_VERIFY,
+            )
+            if response.status_code == 304:
+                return PollOutcome(not_modified=True)
+            if response.status_code in (429, 503):
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                logger.debug(f"서버가 polling 지연을 요청했습니다 (Retry-After={retry_after})")
+                return PollOutcome(error=True, retry_after=retry_after)
             response.raise_for_status()
 
             result = response.json()
             result_dict = cast(Dict[str, Any], result)
             messages = cast(List[Dict[str, Any]], result_dict.get("messages", []))
+            self._poll_etag = response.headers.get("ETag")
 
             if messages:
                 logger.info(f"새로운 메시지 {len(messages)}개 수신")
 
-            return messages
+            return PollOutcome(messages)
 
         except requests.exceptions.RequestException as e:
             logger.debug(f"메시지 polling 실패 (일시적): {e}")
-            return []
-
-    def _create_friendly_message(self, message: Dict[str, Any]) -> tuple[str, str]:
-        """메시지를 친숙하고 구어체 스타일로 가공"""
-        event_type = message.get("event_type", "unknown")
-        org_name = message.get("org_name", "")
-        repo_name = message.get("repo_name", "")
-        payload = message.get("payload", {})
-        action = payload.get("action", "")
-        sender = payload.get("sender", {}).get("login", "누군가")
-
-        # 이벤트별 친숙한 메시지 생성
-        if event_type == "push":
-            # 푸시 이벤트에서 추가 정보 추출
-            commits = payload.get("commits", [])
-            commit_count = len(commits)
-            branch = payload.get("ref", "").replace("refs/heads/", "")
-            pusher = payload.get("pusher", {}).get("name", sender)
-
-            # 푸시 정보
-            head_commit = payload.get("head_commit", {})
-            before = payload.get("before", "")
-            after = payload.get("after", "")
-            compare_url = payload.get("compare", "")
-
-            # 푸시 통계 (head_commit에서 추출)
-            added_files = head_commit.get("added", []) if head_commit else []
-            removed_files = head_commit.get("removed", []) if head_commit else []
-            modified_files = head_commit.get("modified", []) if head_commit else []
-
-            # 파일 변경 통계
-            files_stats = []
-            if added_files:
-                files_stats.append(f"추가 {len(added_files)}개")
-            if modified_files:
-                files_stats.append(f"수정 {len(modified_files)}개")
-            if removed_files:
-                files_stats.append(f"삭제 {len(removed_files)}개")
-
-            files_stats_text = f"파일: {', '.join(files_stats)}" if files_stats else ""
-
-            # 강제 푸시 여부 확인
-            is_force_push = payload.get("forced", False)
-            force_text = " (강제 푸시)" if is_force_push else ""
-
-            commit_messages = []
-            commit_authors = set()
-            for i, commit in enumerate(commits[:3]):  # 최대 3개까지만 표시
-                commit_msg = commit.get("message", "").split("\n")[0][:50]  # 첫 줄만, 최대 50자
-                commit_author = commit.get("author", {}).get("name", "")
-                commit_id = commit.get("id", "")
-                commit_short = commit_id[:7] if commit_id else ""
-
-                if commit_author:
-                    commit_authors.add(commit_author)
-
-                commit_line = f"- {commit_msg}"
-                if commit_short:
-                    commit_line += f" ({commit_short})"
-                if commit_author and commit_author != pusher:
-                    commit_line += f" by {commit_author}"
-
-                commit_messages.append(commit_line)
-
-            if len(commits) > 3:
-                commit_messages.append(f"- ... 그 외 {len(commits) - 3}개 커밋")
-
-            # 다중 작성자 정보
-            authors_text = ""
-            if len(commit_authors) > 1:
-                authors_text = f" (작성자: {', '.join(list(commit_authors)[:3])}{'...' if len(commit_authors) > 3 else ''})"
-
-            titles = [
-                f"🚀 {pusher}님이 {branch} 브랜치에 푸시했어요!{force_text}",
-                f"📦 {branch} 브랜치에 {commit_count}개의 새 커밋!{force_text}",
-                f"✨ {pusher}님의 {commit_count}개 커밋이 도착했어요!{force_text}",
-                f"🎯 {branch} 브랜치가 업데이트 됐어요!{force_text}",
-            ]
-            messages = [
-                f"{pusher}님이 {repo_name}의 {branch} 브랜치에 {commit_count}개의 새 커밋을 올렸어요!{force_text} 🤔{authors_text}"
-                + (f"\n{files_stats_text}" if files_stats_text else ""),
-                f"따끈따끈한 {commit_count}개의 새 코드가 {repo_name}의 {branch} 브랜치에 도착했습니다!{force_text} 👀{authors_text}"
-                + (f"\n{files_stats_text}" if files_stats_text else ""),
-                f"{repo_name}의 {branch} 브랜치가 {pusher}님에 의해 업데이트 됐어요~{force_text} 확인해보실래요? 😊{authors_text}"
-                + (f"\n{files_stats_text}" if files_stats_text else ""),
-                f"{pusher}님이 {repo_name}의 {branch} 브랜치에 열심히 코딩한 흔적을 남겼어요!{force_text} 💪{authors_text}"
-                + (f"\n{files_stats_text}" if files_stats_text else ""),
-            ]
-
-            # 커밋 메시지가 있으면 추가
-            if commit_messages:
-                for i in range(len(messages)):
-                    messages[i] += "\n\n📝 커밋 내용:\n" + "\n".join(commit_messages)
-
-            # 비교 URL이 있으면 추가
-            if compare_url:
-                for i in range(len(messages)):
-                    messages[i] += f"\n\n🔗 변경사항 보기: {compare_url}"
-
-        elif event_type == "pull_request":
-            # PR 정보 추출
-            pr = payload.get("pull_request", {})
-            pr_title = pr.get("title", "제목 없음")
-            pr_number = pr.get("number", "")
-            pr_author = pr.get("user", {}).get("login", sender)
-            pr_body = pr.get("body", "")
-            pr_body_preview = pr_body[:100] + "..." if pr_body and len(pr_body) > 100 else pr_body
-
-            # 브랜치 정보
-            base_branch = pr.get("base", {}).get("ref", "")
-            head_branch = pr.get("head", {}).get("ref", "")
-
-            # 변경 통계
-            additions = pr.get("additions", 0)
-            deletions = pr.get("deletions", 0)
-            changed_files = pr.get("changed_files", 0)
-
-            if action == "opened":
-                titles = [
-                    f"🔥 {pr_author}님이 새 PR을 열었어요: {pr_title}",
-                    f"📝 리뷰 요청: {pr_title}",
-                    f"🎉 새 PR #{pr_number}: {pr_title}",
-                    f"👥 {pr_author}님의 코드 리뷰 요청: {pr_title}",
-                ]
-                messages = [
-                    f'와! {pr_author}님이 {repo_name}에 새로운 PR을 올렸어요! 제목: "{pr_title}" 🙋‍♂️\n\n{base_branch} ← {head_branch} | 파일 {changed_files}개 변경 (+{additions}, -{deletions})',
-                    f'{pr_author}님이 {repo_name}에 멋진 코드를 들고 나타났습니다! PR #{pr_number}: "{pr_title}" 👨‍💻\n\n{base_branch} ← {head_branch} | 파일 {changed_files}개 변경 (+{additions}, -{deletions})',
-                    f'{repo_name}에서 {pr_author}님의 PR "{pr_title}"에 대한 코드 리뷰가 필요해요~ 함께 봐주실래요? 🤝\n\n{base_branch} ← {head_branch} | 파일 {changed_files}개 변경 (+{additions}, -{deletions})',
-                    f'새로운 PR #{pr_number}이 {repo_name}에서 여러분을 기다리고 있어요! {pr_author}님이 작성한 "{pr_title}" 😎\n\n{base_branch} ← {head_branch} | 파일 {changed_files}개 변경 (+{additions}, -{deletions})',
-                ]
-
-                # PR 설명이 있으면 추가
-                if pr_body_preview:
-                    for i in range(len(messages)):
-                        messages[i] += f"\n\nPR 설명: {pr_body_preview}"
-
-            elif action == "closed":
-                # 머지 여부 확인
-                merged = pr.get("merged", False)
-
-                if merged:
-                    titles = [
-                        f"✅ PR 머지 완료: {pr_title}",
-                        f"🎊 {pr_author}님의 PR이 머지됐어요!",
-                        f"🏆 PR #{pr_number} 머지 성공!",
-                        f"📋 {pr_title} - 코드베이스에 합류!",
-                    ]
-                    messages = [
-                        f'축하해요! {pr_author}님의 PR "{pr_title}"이 {repo_name}에 성공적으로 머지됐어요! 🎉\n\n{base_branch} ← {head_branch} | 파일 {changed_files}개 변경 (+{additions}, -{deletions})',
-                        f'또 하나의 멋진 작업이 {repo_name}에 합류했어요! {pr_author}님의 "{pr_title}" PR이 머지됐습니다! 👏\n\n{base_branch} ← {head_branch}',
-                        f'{repo_name}의 {base_branch} 브랜치가 {pr_author}님의 코드로 한층 더 발전했어요! PR "{pr_title}" 머지 완료! 💪',
-                        f'PR 머지 완료! {pr_author}님의 "{pr_title}"이 {repo_name}의 {base_branch} 브랜치에 반영됐어요! ✨',
-                    ]
-                else:
-                    titles = [
-                        f"❌ PR 닫힘: {pr_title}",
-                        f"🚫 PR #{pr_number} 종료",
-                        f"📕 {pr_author}님의 PR이 닫혔어요",
-                        f"🔒 PR 닫힘: {pr_title}",
-                    ]
-                    messages = [
-                        f'{repo_name}의 PR "{pr_title}"이 머지 없이 닫혔어요. 다음 기회에! 🤔',
-                        f"{pr_author}님의 PR #{pr_number}이 {repo_name}에서 종료됐어요. 머지되지 않았습니다. 👀",
-                        f'{repo_name}에서 PR "{pr_title}"이 닫혔어요. 머지 없이 종료되었습니다. 🙏',
-                        f'PR 닫힘 알림! {pr_author}님의 "{pr_title}"이 머지 없이 종료됐어요. 💻',
-                    ]
-            else:
-                titles = [f"📌 PR #{pr_number} 업데이트: {action}"]
-                messages = [
-                    f'{repo_name}의 PR "{pr_title}"에 {action} 액션이 일어났어요! {pr_author}님의 PR #{pr_number}입니다.'
-                ]
-
-        elif event_type == "issues":
-            # 이슈 정보 추출
-            issue = payload.get("issue", {})
-            issue_title = issue.get("title", "제목 없음")
-            issue_number = issue.get("number", "")
-            issue_author = issue.get("user", {}).get("login", sender)
-            issue_body = issue.get("body", "")
-            issue_body_preview = (
-                issue_body[:100] + "..." if issue_body and len(issue_body) > 100 else issue_body
-            )
-
-            # 라벨 정보
-            labels = issue.get("labels", [])
-            label_names = [label.get("name", "") for label in labels]
-            label_text = f"라벨: {', '.join(label_names)}" if label_names else ""
-
-            # 담당자 정보
-            assignees = issue.get("assignees", [])
-            assignee_names = [assignee.get("login", "") for assignee in assignees]
-            assignee_text = f"담당자: {', '.join(assignee_names)}" if assignee_names else ""
-
-            if action == "opened":
-                titles = [
-                    f"🐛 새 이슈 #{issue_number}: {issue_title}",
-                    f"❗ {issue_author}님의 이슈 리포트: {issue_title}",
-                    f"🚨 새 이슈 등록: {issue_title}",
-                    f"📋 #{issue_number} 이슈가 생성됐어요!",
-                ]
-                messages = [
-                    f'어라? {issue_author}님이 {repo_name}에 새로운 이슈를 등록했어요! 🔍\n\n제목: "{issue_title}" (#{issue_number})',
-                    f'{issue_author}님이 {repo_name}에서 문제를 발견했나봐요~ 확인해보세요! 👀\n\n"{issue_title}" (#{issue_number})',
-                    f'{repo_name}에 {issue_author}님이 새 이슈를 올렸어요. 개발자님의 도움이 필요해요! 🙏\n\n"{issue_title}" (#{issue_number})',
-                    f'이슈 알림! {issue_author}님이 등록한 "{issue_title}"이 {repo_name}에서 여러분을 기다리고 있어요! 💻 (#{issue_number})',
-                ]
-
-                # 이슈 본문이 있으면 추가
-                if issue_body_preview:
-                    for i in range(len(messages)):
-                        messages[i] += f"\n\n내용: {issue_body_preview}"
-
-                # 라벨이나 담당자 정보가 있으면 추가
-                extra_details = []
-                if label_text:
-                    extra_details.append(label_text)
-                if assignee_text:
-                    extra_details.append(assignee_text)
-
-                if extra_details:
-                    for i in range(len(messages)):
-                        messages[i] += "\n\n" + " | ".join(extra_details)
-
-            elif action == "closed":
-                # 이슈를 닫은 사람 정보 (가능하면)
-                closer = payload.get("sender", {}).get("login", "누군가")
-
-                titles = [
-                    f"🎯 이슈 해결 완료: #{issue_number}",
-                    f"✨ {closer}님이 이슈를 해결했어요!",
-                    f"🏅 이슈 #{issue_number} 종료: {issue_title}",
-                    f"📝 이슈 클리어: {issue_title}",
-                ]
-                messages = [
-                    f'대단해요! {repo_name}의 이슈 "{issue_title}"이 {closer}님에 의해 깔끔하게 해결됐어요! 🎉 (#{issue_number})',
-                    f'또 하나의 문제가 {repo_name}에서 사라졌네요! {closer}님이 "{issue_title}" 이슈를 닫았습니다. 👍',
-                    f'{repo_name}가 더 안정적이 됐어요! {closer}님이 이슈 #{issue_number} "{issue_title}"을 해결했습니다! 🙌',
-                    f'이슈 해결 완료! {closer}님 덕분에 {repo_name}의 "{issue_title}" 문제가 해결됐어요! ⭐',
-                ]
-
-                # 라벨 정보가 있으면 추가
-                if label_text:
-                    for i in range(len(messages)):
-                        messages[i] += f"\n\n{label_text}"
-
-            else:
-                titles = [f"🔄 이슈 #{issue_number} 업데이트: {action}"]
-                messages = [
-                    f'{repo_name}의 이슈 "{issue_title}"에 {action} 액션이 일어났어요! {issue_author}님이 작성한 이슈 #{issue_number}입니다.'
-                ]
-
-                # 라벨이나 담당자 변경 시 추가 정보
-                if action == "labeled" or action == "unlabeled":
-                    label = payload.get("label", {}).get("name", "")
-                    if label:
-                        messages[0] += f"\n\n{action}된 라벨: {label}"
-                        messages[0] += f"\n\n현재 라벨: {', '.join(label_names)}"
-
-                elif action == "assigned" or action == "unassigned":
-                    assignee = payload.get("assignee", {}).get("login", "")
-                    if assignee:
-                        assignee_action = "할당된" if action == "assigned" else "해제된"
-                        messages[0] += f"\n\n👤 {assignee_action} 담당자: {assignee}"
-                        if assignee_names:
-                            messages[0] += f"\n현재 담당자: {', '.join(assignee_names)}"
-
-                # 마일스톤 변경 시 추가 정보
-                elif action == "milestoned" or action == "demilestoned":
-                    milestone = payload.get("milestone", {})
-                    milestone_title = milestone.get("title", "") if milestone else ""
-                    if milestone_title:
-                        milestone_action = "설정된" if action == "milestoned" else "해제된"
-                        messages[0] += f"\n\n🎯 {milestone_action} 마일스톤: {milestone_title}"
-
-        elif event_type == "pull_request_review":
-            # PR 리뷰 정보 추출
-            review = payload.get("review", {})
-            pr = payload.get("pull_request", {})
-            review_body = review.get("body", "")
-            review_state = review.get("state", "")
-            reviewer = review.get("user", {}).get("login", sender)
-            review_html_url = review.get("html_url", "")
-
-            # PR 정보
-            pr_title = pr.get("title", "")
-            pr_number = pr.get("number", "")
-            pr_author = pr.get("user", {}).get("login", "")
-
-            # 브랜치 정보
-            base_branch = pr.get("base", {}).get("ref", "")
-            head_branch = pr.get("head", {}).get("ref", "")
-
-            # PR 통계
-            additions = pr.get("additions", 0)
-            deletions = pr.get("deletions", 0)
-            changed_files = pr.get("changed_files", 0)
-
-            # 리뷰 상태별 이모지와 텍스트
-            if review_state == "approved":
-                state_emoji = "✅"
-                state_text = "승인"
-                state_description = "코드가 승인되었어요!"
-            elif review_state == "changes_requested":
-                state_emoji = "🔄"
-                state_text = "변경 요청"
-                state_description = "개선사항이 요청되었어요"
-            elif review_state == "commented":
-                state_emoji = "💬"
-                state_text = "코멘트"
-                state_description = "리뷰 의견을 남겼어요"
-            else:
-                state_emoji = "📝"
-                state_text = "리뷰"
-                state_description = "리뷰를 남겼어요"
-
-            # 리뷰 본문 미리보기
-            review_preview = ""
-            if review_body and review_body.strip():
-                clean_review = review_body.replace("\r\n", "\n").replace("\r", "\n").strip()
-                if len(clean_review) > 120:
-                    review_preview = clean_review[:120] + "..."
-                else:
-                    review_preview = clean_review
-
-            titles = [
-                f"{state_emoji} {reviewer}님의 PR 리뷰: {state_text}",
-                f"📋 PR #{pr_number} 리뷰 완료: {state_text}",
-                f"{state_emoji} {pr_title} - 리뷰 {state_text}",
-                f"👀 {reviewer}님이 코드 리뷰를 완료했어요!",
-            ]
+            return PollOutcome(error=True)
 
-            branch_info = f"{base_branch} ← {head_branch}" if base_branch and head_branch else ""
-            stats_info = (
-                f"파일 {changed_files}개 변경 (+{additions}, -{deletions})"
-                if changed_files > 0
-                else ""
+    def fetch_event_payload(self, sequence_id: int) -> Optional[Dict[str, Any]]:
+        """slim 메시지에서 생략된 필드가 필요할 때 전체 payload 조회"""
+        try:
+            response = self.session.get(
+                f"{self.webhook_server_url}/events/{sequence_id}/payload",
+                timeout=SESSION_SOCKET_TIMEOUT,
+                verify=SESSION_VERIFY,
             )
+            response.raise_for_status()
+            return cast(Dict[str, Any], response.json())
+        except requests.exceptions.RequestException as e:
+            logger.error(f"전체 payload 조회 실패 (seq={sequence_id}): {e}")
+            return None
 
-            messages = [
-                f"{reviewer}님이 {repo_name}의 PR #{pr_number}에 {state_text} 리뷰를 남겼어요! {state_emoji}\n\nPR: {pr_title}\n작성자: {pr_author}\n{state_description}"
-                + (f"\n\n{branch_info}" if branch_info else "")
-                + (f"\n{stats_info}" if stats_info else ""),
-                f'코드 리뷰 완료! {reviewer}님이 {repo_name}의 "{pr_title}"에 {state_text} 의견을 주셨어요! {state_emoji}\n\n{state_description}'
-                + (f"\n작성자: {pr_author}" if pr_author else "")
-                + (f"\n{branch_info}" if branch_info else ""),
-                f"{repo_name}의 PR #{pr_number}이 {reviewer}님에 의해 리뷰되었어요! 상태: {state_text} {state_emoji}\n\nPR: {pr_title}"
-                + (f"\n작성자: {pr_author}" if pr_author else "")
-                + (f"\n{stats_info}" if stats_info else ""),
-                f'팀워크! {reviewer}님이 {repo_name}의 "{pr_title}" PR을 꼼꼼히 리뷰해주셨어요! {state_emoji} ({state_text})'
-                + (f"\n\n작성자: {pr_author}" if pr_author else "")
-                + (f"\n{branch_info}" if branch_info else ""),
-            ]
-
-            # 리뷰 내용이 있으면 추가
-            if review_preview:
-                for i in range(len(messages)):
-                    messages[i] += f'\n\n💭 리뷰 내용:\n"{review_preview}"'
-
-            # 리뷰 URL이 있으면 추가
-            if review_html_url:
-                for i in range(len(messages)):
-                    messages[i] += f"\n\n🔗 리뷰 보기: {review_html_url}"
-
-        elif event_type == "pull_request_review_comment":
-            # PR 리뷰 코멘트 정보 추출
-            comment = payload.get("comment", {})
-            pr = payload.get("pull_request", {})
-            comment_body = comment.get("body", "")
-            commenter = comment.get("user", {}).get("login", sender)
-            comment_html_url = comment.get("html_url", "")
-            comment_id = comment.get("id", "")
-
-            # PR 정보
-            pr_title = pr.get("title", "")
-            pr_number = pr.get("number", "")
-            pr_author = pr.get("user", {}).get("login", "")
-
-            # 브랜치 정보
-            base_branch = pr.get("base", {}).get("ref", "")
-            head_branch = pr.get("head", {}).get("ref", "")
-
-            # 파일 및 라인 정보
-            file_path = comment.get("path", "")
-            line_number = comment.get("line") or comment.get("original_line", "")
-            position = comment.get("position", "")
-            original_position = comment.get("original_position", "")
-
-            # 인라인 코멘트 vs 일반 코멘트 구분
-            is_inline = bool(file_path and line_number)
-            comment_type = "인라인 코멘트" if is_inline else "리뷰 코멘트"
-
-            # 커밋 정보
-            commit_id = comment.get("commit_id", "")
-            commit_short = commit_id[:7] if commit_id else ""
-
-            # 코멘트 본문 미리보기
-            comment_preview = ""
-            if comment_body and comment_body.strip():
-                clean_comment = comment_body.replace("\r\n", "\n").replace("\r", "\n").strip()
-                if len(clean_comment) > 100:
-                    comment_preview = clean_comment[:100] + "..."
-                else:
-                    comment_preview = clean_comment
+    def open_event_stream(self, last_event_id: Optional[str] = None) -> requests.Response:
+        """webhook 서버의 SSE 스트림 연결 (Last-Event-ID 로 이어받기)"""
+        url = f"{self.webhook_server_url}/stream/{self.client_id}"
+        headers = {"Accept": "text/event-stream"}
+        if last_event_id:
+            headers["Last-Event-ID"] = last_event_id
+
+        response = self.session.get(
+            url,
+            params={"profile": self.payload_profile},
+            headers=headers,
+            stream=True,
+            timeout=(SESSION_SOCKET_TIMEOUT, STREAM_READ_TIMEOUT),
+            verify=SESSION_VERIFY,
+        )
+        response.raise_for_status()
+        return response
 
-            # 파일명만 추출 (경로가 길면)
-            file_name = file_path.split("/")[-1] if file_path else "파일"
+    def ack_messages(self, messages: List[Dict[str, Any]]) -> bool:
+        """처리한 메시지들의 마지막 시퀀스까지 서버에 확인(ack)"""
+        if not self.client_id or not messages:
+            return False
 
-            titles = [
-                f"💬 {commenter}님의 {comment_type}",
-                f"📝 PR #{pr_number}에 새 {comment_type}",
-                f"🔍 {file_name}에 리뷰 의견" if is_inline else f"🔍 PR #{pr_number}에 리뷰 의견",
-                f"💭 {commenter}님이 코드에 의견을 남겼어요!",
-            ]
+        sequence_ids = _sequence_ids(messages)
+        if not sequence_ids:
+            return False
+        return self.ack_sequence(max(sequence_ids))
 
-            branch_info = f"{base_branch} ← {head_branch}" if base_branch and head_branch else ""
-
-            messages = [
-                f"{commenter}님이 {repo_name}의 PR #{pr_number}에 {comment_type}를 남겼어요! 💬\n\nPR: {pr_title}"
-                + (f"\n작성자: {pr_author}" if pr_author else "")
-                + (f"\n{branch_info}" if branch_info else ""),
-                f'{comment_type} 도착! {commenter}님이 {repo_name}의 "{pr_title}"에 의견을 주셨어요! 👀'
-                + (f"\n작성자: {pr_author}" if pr_author else ""),
-                f"{repo_name}의 PR #{pr_number}에 {commenter}님의 새로운 {comment_type}가 있어요! 📝\n\nPR: {pr_title}"
-                + (f"\n작성자: {pr_author}" if pr_author else ""),
-                f'세심한 리뷰! {commenter}님이 {repo_name}의 "{pr_title}" 코드에 피드백을 남겼어요! 🔍'
-                + (f"\n\n{branch_info}" if branch_info else ""),
-            ]
+    def ack_sequence(self, sequence_id: int) -> bool:
+        """sequence_id 까지의 메시지를 서버에 확인(ack)"""
+        if not self.client_id:
+            return False
 
-            # 파일 위치 정보 추가 (인라인 코멘트인 경우)
-            if is_inline:
-                location_info = f"📁 {file_path}"
-                if line_number:
-                    location_info += f" (라인 {line_number})"
-                if position:
-                    location_info += f" [위치: {position}]"
-                if commit_short:
-                    location_info += f" (커밋: {commit_short})"
-
-                for i in range(len(messages)):
-                    messages[i] += f"\n\n{location_info}"
-
-            # 코멘트 내용이 있으면 추가
-            if comment_preview:
-                for i in range(len(messages)):
-                    messages[i] += f'\n\n💭 코멘트:\n"{comment_preview}"'
-
-            # 코멘트 URL이 있으면 추가
-            if comment_html_url:
-                for i in range(len(messages)):
-                    messages[i] += f"\n\n🔗 코멘트 보기: {comment_html_url}"
-
-        elif event_type == "release":
-            # 릴리즈 정보 추출
-            release = payload.get("release", {})
-            tag_name = release.get("tag_name", "")
-            release_name = release.get("name", tag_name)
-            release_body = release.get("body", "")
-            release_body_preview = (
-                release_body[:150] + "..."
-                if release_body and len(release_body) > 150
-                else release_body
+        try:
+            url = f"{self.webhook_server_url}/ack/{self.client_id}"
+            response = self.session.post(
+                url,
+                json={"sequence_id": sequence_id},
+                timeout=SESSION_SOCKET_TIMEOUT,
+                verify=SESSION_VERIFY,
             )
+            response.raise_for_status()
+            return True
 
-            # 릴리즈 작성자
-            author = release.get("author", {}).get("login", sender)
-
-            # 릴리즈 유형 (정식 출시 vs 프리릴리즈)
-            is_prerelease = release.get("prerelease", False)
-            release_type = "프리릴리즈" if is_prerelease else "정식 릴리즈"
-
-            # 릴리즈 생성 시간
-            created_at = release.get("created_at", "")
-
-            titles = [
-                f"🎉 {repo_name} {release_name} 출시!",
-                f"🚀 {tag_name} 버전 업데이트!",
-                f"📦 {repo_name} {release_type}: {release_name}",
-                f"✨ 새 릴리즈: {release_name} ({tag_name})",
-            ]
-            messages = [
-                f"와우! {author}님이 {repo_name}의 새 버전 {release_name}을 출시했어요! 🌟\n\n태그: {tag_name} | {release_type}",
-                f"축하합니다! {repo_name}가 {author}님에 의해 {release_name} 버전으로 업그레이드됐어요! 🎊\n\n태그: {tag_name} | {release_type}",
-                f"{repo_name}의 개발팀이 {tag_name} 태그로 {release_name} 릴리즈를 선보였어요! 👨‍💻\n\n{release_type} | 작성자: {author}",
-                f"새로운 기능과 개선사항이 {repo_name}의 {release_name} 버전에 담겨 도착했어요! 확인해보세요! 🔥\n\n태그: {tag_name} | {release_type}",
-            ]
-
-            # 릴리즈 노트가 있으면 추가
-            if release_body_preview:
-                for i in range(len(messages)):
-                    messages[i] += f"\n\n릴리즈 노트:\n{release_body_preview}"
-
-        elif event_type == "star":
-            # 스타를 준 사용자 정보
-            stargazer = sender
-
-            # 현재 스타 수 (가능한 경우)
-            stargazers_count = payload.get("repository", {}).get("stargazers_count", "")
-            star_count_text = f"현재 스타 {stargazers_count}개" if stargazers_count else ""
-
-            titles = [
-                f"⭐ {stargazer}님이 스타를 주셨어요!",
-                f"🌟 {repo_name}에 새 스타!",
-                f"✨ {stargazer}님이 인정한 프로젝트!",
-                f"🎯 {stargazer}님의 스타 감사합니다!",
-            ]
-            messages = [
-                f"오예! {stargazer}님이 {repo_name}에 스타를 주셨어요! ⭐ {star_count_text}",
-                f"{stargazer}님이 {repo_name}에 스타를 눌러줬네요! 인기 프로젝트가 되어가고 있어요! 🌟 {star_count_text}",
-                f"{repo_name}의 매력에 {stargazer}님이 빠졌나봐요! 스타 감사합니다! 😊 {star_count_text}",
-                f"스타 하나 추가! {stargazer}님 덕분에 {repo_name}가 점점 더 빛나고 있어요! ✨ {star_count_text}",
-            ]
-
-        elif event_type == "fork":
-            # 포크한 사용자 정보
-            forker = sender
-
-            # 포크된 저장소 정보
-            forkee = payload.get("forkee", {})
-            fork_full_name = forkee.get("full_name", "")
-
-            # 현재 포크 수 (가능한 경우)
-            forks_count = payload.get("repository", {}).get("forks_count", "")
-            fork_count_text = f"현재 포크 {forks_count}개" if forks_count else ""
-
-            titles = [
-                f"🍴 {forker}님이 {repo_name}를 포크했어요!",
-                f"🌿 {forker}님의 새 포크 생성!",
-                f"🔀 {repo_name}가 {forker}님에 의해 포크됐어요!",
-                f"📋 {forker}님의 포크 알림!",
-            ]
-            messages = [
-                f"{forker}님이 {repo_name}를 포크했어요! 프로젝트가 더 널리 퍼져나가고 있네요! 🌱"
-                + (f"\n\n포크: {fork_full_name}" if fork_full_name else "")
-                + (f"\n\n{fork_count_text}" if fork_count_text else ""),
-                f"와! {forker}님이 {repo_name}를 자신의 계정으로 포크했어요! 🤝"
-                + (f"\n\n포크: {fork_full_name}" if fork_full_name else "")
-                + (f"\n\n{fork_count_text}" if fork_count_text else ""),
-                f"{repo_name}의 코드가 {forker}님에 의해 새로운 곳에서 활용될 예정이에요! 기대돼요! 🚀"
-                + (f"\n\n포크: {fork_full_name}" if fork_full_name else "")
-                + (f"\n\n{fork_count_text}" if fork_count_text else ""),
-                f"포크 알림! {forker}님이 {repo_name}를 포크하여 오픈소스의 힘을 보여주고 있어요! 💪"
-                + (f"\n\n포크: {fork_full_name}" if fork_full_name else "")
-                + (f"\n\n{fork_count_text}" if fork_count_text else ""),
-            ]
-
-        elif event_type == "watch":
-            # 구독한 사용자 정보
-            watcher = sender
-
-            # 현재 구독자 수 (가능한 경우)
-            watchers_count = payload.get("repository", {}).get("watchers_count", "")
-            watch_count_text = f"현재 구독자 {watchers_count}명" if watchers_count else ""
-
-            titles = [
-                f"👀 {watcher}님이 {repo_name}를 구독했어요!",
-                f"🔔 {watcher}님이 알림 설정을 했어요!",
-                f"👥 {watcher}님이 새 팔로워로 추가됐어요!",
-                f"📺 {watcher}님의 구독 알림!",
-            ]
-            messages = [
-                f"{watcher}님이 {repo_name}를 지켜보기 시작했어요! 👀 {watch_count_text}",
-                f"{watcher}님이 {repo_name}의 소식을 받아보고 싶어해요! 관심 감사합니다! 😊 {watch_count_text}",
-                f"{repo_name}의 팬이 한 명 더 늘었네요! {watcher}님이 구독을 시작했어요! 계속 좋은 코드 부탁해요! 👍 {watch_count_text}",
-                f"구독 알림! {watcher}님 덕분에 {repo_name}가 더 많은 사람들에게 알려지고 있어요! 🌟 {watch_count_text}",
-            ]
-
-        elif event_type == "issue_comment":
-            # 이슈/PR 코멘트 정보 추출
-            comment = payload.get("comment", {})
-            issue = payload.get("issue", {})
-            comment_body = comment.get("body", "")
-            commenter = comment.get("user", {}).get("login", sender)
-            comment_html_url = comment.get("html_url", "")
-
-            # 이슈/PR 정보
-            issue_title = issue.get("title", "")
-            issue_number = issue.get("number", "")
-            issue_author = issue.get("user", {}).get("login", "")
-            is_pull_request = "pull_request" in issue  # PR인지 이슈인지 구분
-
-            # 이슈/PR 상태
-            issue_state = issue.get("state", "")
-
-            # 코멘트 본문 미리보기
-            comment_preview = ""
-            if comment_body and comment_body.strip():
-                clean_comment = comment_body.replace("\r\n", "\n").replace("\r", "\n").strip()
-                if len(clean_comment) > 120:
-                    comment_preview = clean_comment[:120] + "..."
-                else:
-                    comment_preview = clean_comment
-
-            # 이슈/PR 구분
-            item_type = "PR" if is_pull_request else "이슈"
-            emoji = "🔄" if is_pull_request else "🐛"
-
-            titles = [
-                f"💬 {commenter}님의 {item_type} 코멘트",
-                f"📝 {item_type} #{issue_number}에 새 코멘트",
-                f"🗨️ {commenter}님이 의견을 남겼어요!",
-                f"💭 {item_type} 토론 참여!",
-            ]
-
-            messages = [
-                f"{commenter}님이 {repo_name}의 {item_type} #{issue_number}에 코멘트를 남겼어요! 💬\n\n{emoji} {item_type}: {issue_title}"
-                + (f"\n작성자: {issue_author}" if issue_author else "")
-                + (f"\n상태: {issue_state}" if issue_state else ""),
-                f'{item_type} 코멘트 도착! {commenter}님이 {repo_name}의 "{issue_title}"에 의견을 주셨어요! 👀'
-                + (f"\n작성자: {issue_author}" if issue_author else ""),
-                f"{repo_name}의 {item_type} #{issue_number}에 {commenter}님의 새로운 코멘트가 있어요! 📝\n\n{emoji} {issue_title}"
-                + (f"\n작성자: {issue_author}" if issue_author else ""),
-                f'활발한 토론! {commenter}님이 {repo_name}의 "{issue_title}" {item_type}에 참여했어요! 🗣️'
-                + (f"\n상태: {issue_state}" if issue_state else ""),
-            ]
-
-            # 코멘트 내용이 있으면 추가
-            if comment_preview:
-                for i in range(len(messages)):
-                    messages[i] += f'\n\n💭 코멘트:\n"{comment_preview}"'
-
-            # 코멘트 URL이 있으면 추가
-            if comment_html_url:
-                for i in range(len(messages)):
-                    messages[i] += f"\n\n🔗 코멘트 보기: {comment_html_url}"
-
-        elif event_type == "create":
-            # 브랜치/태그 생성 이벤트
-            ref = payload.get("ref", "")
-            ref_type = payload.get("ref_type", "")
-            creator = sender
-            master_branch = payload.get("master_branch", "")
-
-            # 타입별 이모지와 텍스트
-            if ref_type == "branch":
-                type_emoji = "🌿"
-                type_text = "브랜치"
-            elif ref_type == "tag":
-                type_emoji = "🏷️"
-                type_text = "태그"
-            else:
-                type_emoji = "📝"
-                type_text = ref_type or "항목"
-
-            titles = [
-                f"{type_emoji} {creator}님이 새 {type_text}를 만들었어요!",
-                f"✨ {repo_name}에 새 {type_text}: {ref}",
-                f"🎉 {type_text} 생성: {ref}",
-                f"🚀 {creator}님의 새 {type_text} 등장!",
-            ]
-
-            messages = [
-                f"{creator}님이 {repo_name}에 새로운 {type_text} '{ref}'를 만들었어요! {type_emoji}"
-                + (f"\n기준 브랜치: {master_branch}" if master_branch else ""),
-                f"새로운 {type_text}가 {repo_name}에 등장했네요! '{ref}' {type_emoji}\n생성자: {creator}"
-                + (f"\n기준: {master_branch}" if master_branch else ""),
-                f"{repo_name}의 {type_text} '{ref}'가 {creator}님에 의해 생성됐어요! 개발이 활발해지고 있어요! 💪",
-                f"{type_text} 생성 알림! {creator}님이 {repo_name}에 '{ref}'를 만들었어요! {type_emoji}"
-                + (f"\n\n기준 브랜치: {master_branch}" if master_branch else ""),
-            ]
-
-        elif event_type == "delete":
-            # 브랜치/태그 삭제 이벤트
-            ref = payload.get("ref", "")
-            ref_type = payload.get("ref_type", "")
-            deleter = sender
-
-            # 타입별 이모지와 텍스트
-            if ref_type == "branch":
-                type_emoji = "🗑️"
-                type_text = "브랜치"
-            elif ref_type == "tag":
-                type_emoji = "🏷️"
-                type_text = "태그"
-            else:
-                type_emoji = "❌"
-                type_text = ref_type or "항목"
-
-            titles = [
-                f"{type_emoji} {deleter}님이 {type_text}를 삭제했어요",
-                f"🗑️ {repo_name}에서 {type_text} 삭제: {ref}",
-                f"❌ {type_text} 제거: {ref}",
-                f"🧹 {deleter}님의 정리 작업",
-            ]
-
-            messages = [
-                f"{deleter}님이 {repo_name}의 {type_text} '{ref}'를 삭제했어요! {type_emoji}\n\n정리 작업이 진행되고 있네요!",
-                f"{repo_name}에서 {type_text} '{ref}'가 제거됐어요! 🗑️\n삭제자: {deleter}",
-                f"{type_text} 삭제 알림! {deleter}님이 {repo_name}의 '{ref}'를 정리했어요! 🧹",
-                f"코드베이스 정리! {deleter}님이 {repo_name}에서 {type_text} '{ref}'를 삭제했어요! ✨",
-            ]
-
-        elif event_type == "commit_comment":
-            # 커밋 코멘트 이벤트
-            comment = payload.get("comment", {})
-            comment_body = comment.get("body", "")
-            commenter = comment.get("user", {}).get("login", sender)
-            comment_html_url = comment.get("html_url", "")
-            commit_id = comment.get("commit_id", "")
-            commit_short = commit_id[:7] if commit_id else ""
-
-            # 파일 및 라인 정보 (있는 경우)
-            file_path = comment.get("path", "")
-            line_number = comment.get("line", "")
-            position = comment.get("position", "")
-
-            # 코멘트 본문 미리보기
-            comment_preview = ""
-            if comment_body and comment_body.strip():
-                clean_comment = comment_body.replace("\r\n", "\n").replace("\r", "\n").strip()
-                if len(clean_comment) > 100:
-                    comment_preview = clean_comment[:100] + "..."
-                else:
-                    comment_preview = clean_comment
-
-            # 파일명만 추출 (경로가 길면)
-            file_name = file_path.split("/")[-1] if file_path else ""
-
-            titles = [
-                f"💬 {commenter}님의 커밋 코멘트",
-                f"📝 {commit_short} 커밋에 새 코멘트",
-                f"🔍 커밋 리뷰 의견",
-                f"💭 {commenter}님이 커밋에 의견을 남겼어요!",
-            ]
-
-            messages = [
-                f"{commenter}님이 {repo_name}의 커밋 {commit_short}에 코멘트를 남겼어요! 💬",
-                f"커밋 코멘트 도착! {commenter}님이 {repo_name}의 커밋에 의견을 주셨어요! 👀\n\n커밋: {commit_short}",
-                f"{repo_name}의 커밋 {commit_short}에 {commenter}님의 새로운 코멘트가 있어요! 📝",
-                f"코드 리뷰! {commenter}님이 {repo_name}의 커밋에 피드백을 남겼어요! 🔍\n\n커밋: {commit_short}",
-            ]
-
-            # 파일 위치 정보 추가 (있는 경우)
-            if file_path:
-                location_info = f"📁 {file_path}"
-                if line_number:
-                    location_info += f" (라인 {line_number})"
-                if position:
-                    location_info += f" [위치: {position}]"
-
-                for i in range(len(messages)):
-                    messages[i] += f"\n\n{location_info}"
-
-            # 코멘트 내용이 있으면 추가
-            if comment_preview:
-                for i in range(len(messages)):
-                    messages[i] += f'\n\n💭 코멘트:\n"{comment_preview}"'
-
-            # 코멘트 URL이 있으면 추가
-            if comment_html_url:
-                for i in range(len(messages)):
-                    messages[i] += f"\n\n🔗 코멘트 보기: {comment_html_url}"
-
-        elif event_type == "gollum":
-            # 위키 업데이트 이벤트
-            pages = payload.get("pages", [])
-            editor = sender
-
-            if not pages:
-                titles = [f"📚 {editor}님이 위키를 수정했어요!"]
-                messages = [f"{editor}님이 {repo_name}의 위키를 업데이트했어요! 📚"]
-            else:
-                # 페이지별 정보 추출
-                page_summaries = []
-                for page in pages[:3]:  # 최대 3개까지만 표시
-                    page_title = page.get("title", "")
-                    page_action = page.get("action", "")
-                    page_html_url = page.get("html_url", "")
-
-                    action_emoji = (
-                        "✏️"
-                        if page_action == "edited"
-                        else "📄" if page_action == "created" else "🔄"
-                    )
-                    action_text = (
-                        "수정"
-                        if page_action == "edited"
-                        else "생성" if page_action == "created" else page_action
-                    )
-
-                    page_summaries.append(f"{action_emoji} {page_title} ({action_text})")
-
-                if len(pages) > 3:
-                    page_summaries.append(f"... 그 외 {len(pages) - 3}개 페이지")
-
-                titles = [
-                    f"📚 {editor}님이 위키를 업데이트했어요!",
-                    f"📖 {repo_name} 위키 수정",
-                    f"✏️ 위키 편집: {len(pages)}개 페이지",
-                    f"📝 {editor}님의 위키 작업",
-                ]
-
-                messages = [
-                    f"{editor}님이 {repo_name}의 위키를 업데이트했어요! 📚\n\n"
-                    + "\n".join(page_summaries),
-                    f"위키 업데이트 알림! {editor}님이 {repo_name}에서 {len(pages)}개의 위키 페이지를 수정했어요! 📖\n\n"
-                    + "\n".join(page_summaries),
-                    f"{repo_name}의 문서가 {editor}님에 의해 개선됐어요! 더 나은 문서화! 💪\n\n"
-                    + "\n".join(page_summaries),
-                    f"지식 공유! {editor}님이 {repo_name}의 위키를 풍성하게 만들어주셨어요! ✨\n\n"
-                    + "\n".join(page_summaries),
-                ]
-
-        elif event_type == "milestone":
-            # 마일스톤 이벤트
-            milestone = payload.get("milestone", {})
-            milestone_title = milestone.get("title", "")
-            milestone_number = milestone.get("number", "")
-            milestone_state = milestone.get("state", "")
-            milestone_description = milestone.get("description", "")
-            due_date = milestone.get("due_on", "")
-
-            # 마일스톤 통계
-            open_issues = milestone.get("open_issues", 0)
-            closed_issues = milestone.get("closed_issues", 0)
-            total_issues = open_issues + closed_issues
-
-            # 액션별 처리
-            if action == "created":
-                action_emoji = "🎯"
-                action_text = "생성"
-            elif action == "closed":
-                action_emoji = "🏁"
-                action_text = "완료"
-            elif action == "opened":
-                action_emoji = "🔄"
-                action_text = "재오픈"
-            else:
-                action_emoji = "📊"
-                action_text = action or "업데이트"
-
-            titles = [
-                f"{action_emoji} 마일스톤 {action_text}: {milestone_title}",
-                f"🎯 마일스톤 #{milestone_number} {action_text}",
-                f"📊 {repo_name} 마일스톤 업데이트",
-                f"🚀 프로젝트 진척도 알림",
-            ]
-
-            progress_info = ""
-            if total_issues > 0:
-                progress_percent = int((closed_issues / total_issues) * 100)
-                progress_info = (
-                    f"\n진행률: {progress_percent}% ({closed_issues}/{total_issues} 완료)"
-                )
-
-            messages = [
-                f"{sender}님이 {repo_name}의 마일스톤을 {action_text}했어요! {action_emoji}\n\n🎯 마일스톤: {milestone_title}"
-                + progress_info
-                + (f"\n마감일: {due_date}" if due_date else ""),
-                f"마일스톤 {action_text} 알림! {repo_name}의 '{milestone_title}' 마일스톤이 {action_text}됐어요! 📊"
-                + progress_info,
-                f"프로젝트 관리! {sender}님이 {repo_name}의 마일스톤 #{milestone_number}을 {action_text}했어요! 🎯\n\n제목: {milestone_title}"
-                + progress_info,
-                f"팀워크! {repo_name}의 '{milestone_title}' 마일스톤이 {action_text}됐어요! 🚀"
-                + progress_info
-                + (f"\n\n마감일: {due_date}" if due_date else ""),
-            ]
-
-            # 마일스톤 설명이 있으면 추가
-            if milestone_description:
-                description_preview = (
-                    milestone_description[:100] + "..."
-                    if len(milestone_description) > 100
-                    else milestone_description
-                )
-                for i in range(len(messages)):
-                    messages[i] += f"\n\n📝 설명: {description_preview}"
-
-        elif event_type in ["workflow_run", "workflow_job", "check_run", "check_suite"]:
-            # GitHub Actions 관련 이벤트 처리
-            if event_type == "workflow_run":
-                # 워크플로우 실행 정보 추출
-                workflow_run = payload.get("workflow_run", {})
-                workflow_name = workflow_run.get("name", "Unknown")
-                workflow_id = workflow_run.get("id", "")
-                status = workflow_run.get("status", "unknown")
-                conclusion = workflow_run.get("conclusion", "진행중")
-
-                # 워크플로우 URL
-                html_url = workflow_run.get("html_url", "")
-
-                # 워크플로우 실행자
-                actor = payload.get("sender", {}).get("login", sender)
-
-                # 브랜치 정보
-                head_branch = workflow_run.get("head_branch", "")
-                branch_info = f"브랜치: {head_branch}" if head_branch else ""
-
-                # 상태에 따른 이모지 선택
-                status_emoji = (
-                    "🟢"
-                    if conclusion == "success"
-                    else (
-                        "🔴"
-                        if conclusion == "failure"
-                        else "🟡" if status == "in_progress" else "⚪"
-                    )
-                )
-
-                titles = [
-                    f"{status_emoji} 워크플로우 실행: {workflow_name}",
-                    f"{status_emoji} GitHub Actions: {workflow_name} ({conclusion})",
-                    f"{status_emoji} {repo_name}의 워크플로우 {conclusion}",
-                    f"{status_emoji} CI/CD 알림: {workflow_name}",
-                ]
-
-                messages = [
-                    f"{repo_name}의 '{workflow_name}' 워크플로우가 {conclusion} 상태로 실행됐어요! {status_emoji}\n\n실행자: {actor}"
-                    + (f"\n\n{branch_info}" if branch_info else ""),
-                    f"{actor}님이 실행한 {repo_name}의 '{workflow_name}' 워크플로우가 {conclusion} 상태입니다. {status_emoji}"
-                    + (f"\n\n{branch_info}" if branch_info else ""),
-                    f"{repo_name}의 CI/CD 파이프라인 '{workflow_name}'이 {conclusion} 상태로 완료됐어요! {status_emoji}\n\n실행자: {actor}"
-                    + (f"\n\n{branch_info}" if branch_info else ""),
-                    f"GitHub Actions 알림: {repo_name}의 '{workflow_name}' 워크플로우 상태는 {conclusion}입니다. {status_emoji}\n\n실행자: {actor}"
-                    + (f"\n\n{branch_info}" if branch_info else ""),
-                ]
-
-                # URL이 있으면 추가
-                if html_url:
-                    for i in range(len(messages)):
-                        messages[i] += f"\n\n자세히 보기: {html_url}"
-
-            elif event_type == "workflow_job":
-                # 워크플로우 잡 정보 추출
-                job = payload.get("workflow_job", {})
-                job_name = job.get("name", "Unknown")
-                job_id = job.get("id", "")
-                status = job.get("status", "unknown")
-                conclusion = job.get("conclusion", "진행중")
-
-                # 워크플로우 URL
-                html_url = job.get("html_url", "")
-
-                # 상태에 따른 이모지 선택
-                status_emoji = (
-                    "🟢"
-                    if conclusion == "success"
-                    else (
-                        "🔴"
-                        if conclusion == "failure"
-                        else "🟡" if status == "in_progress" else "⚪"
-                    )
-                )
-
-                titles = [
-                    f"{status_emoji} 작업 실행: {job_name}",
-                    f"{status_emoji} GitHub Actions 작업: {job_name} ({conclusion})",
-                    f"{status_emoji} {repo_name}의 작업 {conclusion}",
-                    f"{status_emoji} CI/CD 작업 알림: {job_name}",
-                ]
-
-                messages = [
-                    f"{repo_name}의 '{job_name}' 작업이 {conclusion} 상태로 실행됐어요! {status_emoji}",
-                    f"{repo_name}의 '{job_name}' 작업이 {conclusion} 상태입니다. {status_emoji}",
-                    f"{repo_name}의 CI/CD 작업 '{job_name}'이 {conclusion} 상태로 완료됐어요! {status_emoji}",
-                    f"GitHub Actions 작업 알림: {repo_name}의 '{job_name}' 상태는 {conclusion}입니다. {status_emoji}",
-                ]
-
-                # URL이 있으면 추가
-                if html_url:
-                    for i in range(len(messages)):
-                        messages[i] += f"\n\n자세히 보기: {html_url}"
-
-            elif event_type == "check_run":
-                # 체크 런 정보 추출
-                check_run = payload.get("check_run", {})
-                check_name = check_run.get("name", "Unknown")
-                status = check_run.get("status", "unknown")
-                conclusion = check_run.get("conclusion", "진행중")
-
-                # 체크 URL
-                html_url = check_run.get("html_url", "")
-
-                # 상태에 따른 이모지 선택
-                status_emoji = (
-                    "🟢"
-                    if conclusion == "success"
-                    else (
-                        "🔴"
-                        if conclusion == "failure"
-                        else "🟡" if status == "in_progress" else "⚪"
-                    )
-                )
-
-                titles = [
-                    f"{status_emoji} 체크 실행: {check_name}",
-                    f"{status_emoji} GitHub 체크: {check_name} ({conclusion})",
-                    f"{status_emoji} {repo_name}의 체크 {conclusion}",
-                    f"{status_emoji} 코드 체크 알림: {check_name}",
-                ]
-
-                messages = [
-                    f"{repo_name}의 '{check_name}' 체크가 {conclusion} 상태로 실행됐어요! {status_emoji}",
-                    f"{repo_name}의 '{check_name}' 체크가 {conclusion} 상태입니다. {status_emoji}",
-                    f"{repo_name}의 코드 체크 '{check_name}'이 {conclusion} 상태로 완료됐어요! {status_emoji}",
-                    f"GitHub 체크 알림: {repo_name}의 '{check_name}' 상태는 {conclusion}입니다. {status_emoji}",
-                ]
-
-                # URL이 있으면 추가
-                if html_url:
-                    for i in range(len(messages)):
-                        messages[i] += f"\n\n자세히 보기: {html_url}"
-
-            else:  # check_suite
-                # 체크 스위트 정보 추출
-                check_suite = payload.get("check_suite", {})
-                status = check_suite.get("status", "unknown")
-                conclusion = check_suite.get("conclusion", "진행중")
-
-                # 상태에 따른 이모지 선택
-                status_emoji = (
-                    "🟢"
-                    if conclusion == "success"
-                    else (
-                        "🔴"
-                        if conclusion == "failure"
-                        else "🟡" if status == "in_progress" else "⚪"
-                    )
-                )
-
-                titles = [
-                    f"{status_emoji} 체크 스위트 실행",
-                    f"{status_emoji} GitHub 체크 스위트 ({conclusion})",
-                    f"{status_emoji} {repo_name}의 체크 스위트 {conclusion}",
-                    f"{status_emoji} 코드 체크 스위트 알림",
-                ]
-
-                messages = [
-                    f"{repo_name}의 체크 스위트가 {conclusion} 상태로 실행됐어요! {status_emoji}",
-                    f"{repo_name}의 체크 스위트가 {conclusion} 상태입니다. {status_emoji}",
-                    f"{repo_name}의 코드 체크 스위트가 {conclusion} 상태로 완료됐어요! {status_emoji}",
-                    f"GitHub 체크 스위트 알림: {repo_name}의 상태는 {conclusion}입니다. {status_emoji}",
-                ]
-
-        else:
-            # 기본 메시지 - 가능한 정보 추출 시도
-            # 이벤트 발생자
-            actor = sender
-
-            # 액션 정보 (있는 경우)
-            action_info = f"액션: {action}" if action else ""
-
-            # 페이로드에서 유용한 정보 추출 시도
-            payload_preview = ""
-            important_keys = ["id", "name", "title", "state", "description", "url", "html_url"]
-            extracted_info = []
-
-            for key in important_keys:
-                if key in payload and payload[key]:
-                    extracted_info.append(f"{key}: {payload[key]}")
-
-            if extracted_info:
-                payload_preview = "\n\n" + "\n".join(extracted_info)
-
-            titles = [
-                f"📢 {event_type} 이벤트 발생!",
-                f"🔔 {actor}님의 {event_type} 알림!",
-                f"📬 {repo_name}의 {event_type} 업데이트!",
-                f"🎯 {event_type} 액션 발생!",
-            ]
-            messages = [
-                f"{actor}님이 {repo_name}에서 {event_type} 이벤트를 발생시켰어요!"
-                + (f"\n\n{action_info}" if action_info else "")
-                + payload_preview,
-                f"{repo_name}의 {event_type} 소식을 전해드려요! 발생자: {actor}"
-                + (f"\n\n{action_info}" if action_info else "")
-                + payload_preview,
-                f"어? {repo_name}에서 {actor}님이 {event_type} 이벤트를 발생시켰어요!"
-                + (f"\n\n{action_info}" if action_info else "")
-                + payload_preview,
-                f"{repo_name}가 {actor}님에 의해 활발하게 움직이고 있어요! 이벤트: {event_type}"
-                + (f"\n\n{action_info}" if action_info else "")
-                + payload_preview,
-            ]
-
-        # 랜덤하게 선택
-        title = random.choice(titles)
-        base_message = random.choice(messages)
-
-        # 추가 정보가 있으면 덧붙이기
-        extra_info = []
-        if org_name:
-            extra_info.append(f"조직: {org_name}")
-        if action and action not in base_message:
-            extra_info.append(f"액션: {action}")
-
-        # 시간 정보를 친숙하게 표현
-        timestamp = message.get("timestamp", "")
-        if timestamp:
-            extra_info.append(f"방금 전에 일어난 일이에요! ⏰")
-
-        # 최종 메시지 구성
-        final_message = base_message
-        if extra_info:
-            final_message += "\n\n" + " | ".join(extra_info)
-
-        return title, final_message
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"메시지 ack 실패 (lease 만료 후 재전달됨): {e}")
+            return False
 
     def send_notification_to_self(self, message: Dict[str, Any]) -> bool:
         """수신된 메시지를 자기 자신의 API로 전달"""
@@ -1781,6 +790,14 @@ class WebhookClient:
                 logger.warning(f"빈 메시지 내용으로 인해 알림 건너뜀: {title}")
                 return True
 
+            coalesced = message.get("coalesced")
+            if coalesced:
+                states: defaultdict[str, int] = defaultdict(int)
+                for state in coalesced.get("runs", {}).values():
+                    states[state or "unknown"] += 1
+                tally = ", ".join(f"{state} {count}" for state, count in states.items())
+                content += f"\n\n📦 CI 이벤트 {coalesced.get('count', 0)}개 묶음: {tally}"
+
             # 자기 자신의 API로 알림 전송 (시스템 알림인 경우)
             if should_show_system and self.notification_service:
                 self.notification_service.send_info(
@@ -1789,8 +806,9 @@ class WebhookClient:
                     duration=5000,
                     priority="normal",
                     show_bubble=should_show_bubble,
+                    batched=True,
                 )
-                logger.info("알림 전송 성공: %s", title)
+                logger.info("알림 전송 대기열 추가: %s", title)
             else:
                 logger.debug(f"시스템 알림 비활성화로 건너뜀: {title}")
 
@@ -1837,38 +855,43 @@ class WebhookClient:
         logger.info("Webhook polling 종료")
 
     def _process_messages_with_summary_sync(self, messages: List[Dict[str, Any]]) -> None:
-        """메시지들을 요약하여 처리 (동기 버전)"""
+        """메시지들을 요약하여 처리 (동기 버전) - 요약 서비스의 loop 에서 실행"""
+        future = self.summarizer.submit(self._process_messages_with_summary(messages))
         try:
-            import asyncio
-
-            # 새로운 이벤트 루프에서 비동기 처리 실행
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    # 이미 실행 중인 루프가 있으면 새 스레드에서 실행
-                    import concurrent.futures
-
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(self._run_async_summary, messages)
-                        future.result(timeout=30)  # 30초 타임아웃
-                else:
-                    loop.run_until_complete(self._process_messages_with_summary(messages))
-            except RuntimeError:
-                # 새로운 이벤트 루프 생성하여 실행
-                asyncio.run(self._process_messages_with_summary(messages))
-
+            future.result(timeout=SUMMARY_TIMEOUT)
         except Exception as e:
+            future.cancel()
             logger.error(f"요약 처리 실패: {e}")
             # 폴백: 개별 메시지 처리
             logger.info("폴백으로 개별 메시지 처리를 수행합니다.")
             for message in messages:
                 self.send_notification_to_self(message)
 
-    def _run_async_summary(self, messages: List[Dict[str, Any]]) -> None:
-        """별도 스레드에서 비동기 요약 실행"""
-        import asyncio
-
-        asyncio.run(self._process_messages_with_summary(messages))
+    @property
+    def summarizer(self) -> SummarizerService:
+        """요약 전용 loop/agent 를 가진 서비스 (처음 사용할 때 생성)"""
+        if self._summarizer is None:
+            self._summarizer = SummarizerService(self.config_manager)
+        return self._summarizer
+
+    @property
+    def coalescer(self) -> EventCoalescer:
+        """CI 상태 이벤트를 잠시 모아 하나의 알림으로 내보내는 묶음기 (처음 사용할 때 시작)"""
+        if self._coalescer is None:
+            self._coalescer = EventCoalescer(self._emit_coalesced, window=self.coalesce_window)
+        self._coalescer.start()
+        return self._coalescer
+
+    def _emit_coalesced(self, message: Dict[str, Any]) -> None:
+        """묶음기 타이머 스레드에서 호출 - 묶인 알림 한 건 전송 후 묶인 메시지들을 ack"""
+        self.send_notification_to_self(message)
+        coalesced = message.get("coalesced")
+        sequence_ids = coalesced["sequence_ids"] if coalesced else _sequence_ids([message])
+        if self._flush_notifications():
+            self._settle_acks(sequence_ids)
+        else:
+            logger.warning("묶음 알림 전달 실패로 메시지 %d개를 ack 하지 않습니다", len(sequence_ids))
+            self._request_redelivery()
 
     async def _process_messages_with_summary(self, messages: List[Dict[str, Any]]) -> None:
         """메시지들을 요약하여 처리"""
@@ -1959,23 +982,48 @@ class WebhookClient:
                 logger.error("클라이언트 등록에 실패했습니다.")
                 return False
 
+        if self.prefer_stream:
+            if self._stream_manager is None:
+                self._stream_manager = EventStreamManager(
+                    self.open_event_stream,
+                    self._handle_polled_messages,
+                    self._start_polling_manager,
+                )
+            self._stream_manager.start()
+            logger.info("백그라운드 이벤트 스트림 시작 (EventStreamManager)")
+            return True
+
+        self._start_polling_manager()
+        return True
+
+    def _start_polling_manager(self) -> None:
+        """주기적 polling 시작 (스트림 미지원 시 폴백 경로)"""
         if self._polling_manager is None:
             self._polling_manager = PollingManager(
-                self.poll_messages,
+                self.poll,
                 self._handle_polled_messages,
                 self.poll_interval,
             )
         self._polling_manager.start()
         logger.info("백그라운드 polling 시작 (PollingManager)")
-        return True
 
     def stop_polling(self) -> None:
-        """백그라운드 polling 중지"""
-        if self._polling_manager is None:
+        """백그라운드 polling/스트림 중지"""
+        if self._polling_manager is None and self._stream_manager is None:
             logger.warning("PollingManager 가 초기화되지 않았습니다.")
             return
-        self._polling_manager.stop()
-        logger.info("백그라운드 polling 중지 (PollingManager)")
+        if self._stream_manager is not None:
+            self._stream_manager.stop()
+            logger.info("백그라운드 이벤트 스트림 중지 (EventStreamManager)")
+        if self._polling_manager is not None:
+            self._polling_manager.stop()
+            logger.info("백그라운드 polling 중지 (PollingManager)")
+        if self._coalescer is not None:
+            self._coalescer.stop()  # 대기 중인 묶음을 알림 서비스 종료 전에 내보낸다
+        if self.notification_service is not None:
+            self.notification_service.close()
+        if self._summarizer is not None:
+            self._summarizer.stop()
 
     def get_client_info(self) -> Optional[Dict[str, Any]]:
         """클라이언트 정보 조회"""
@@ -2001,9 +1049,82 @@ class WebhookClient:
 
     def _handle_polled_messages(self, messages: List[Dict[str, Any]], first_poll: bool) -> None:
         """PollingManager 에서 전달된 메시지 처리"""
+        # 묶음기가 보관한 메시지는 묶음 알림을 전달한 뒤에 ack 하므로 먼저 미확인으로 기록
+        messages = self._track_unacked(messages)
+        if not messages:
+            return
         should_summarize = first_poll and len(messages) >= 3
         if should_summarize:
             self._process_messages_with_summary_sync(messages)
+            pending = messages
         else:
-            for message in messages:
+            # CI 상태 이벤트는 묶음기가 보관했다가 창이 닫히면 따로 내보낸다
+            pending = self.coalescer.add(messages) if self.coalesce_window > 0 else messages
+            for message in pending:
                 self.send_notification_to_self(message)
+        # 대기열의 알림이 API 서버에 전달된 뒤에만 ack (미전달 시 lease 만료 후 서버가 재전달)
+        if self._flush_notifications():
+            self._settle_acks(_sequence_ids(pending))
+        else:
+            logger.warning("알림 전달 실패로 메시지 %d개를 ack 하지 않습니다", len(pending))
+            self._request_redelivery()
+
+    def _flush_notifications(self) -> bool:
+        """대기열의 알림을 API 서버로 내보내고 모두 전달되었는지 반환"""
+        if self.notification_service is None:
+            return True
+        return self.notification_service.flush(timeout=SESSION_SOCKET_TIMEOUT)
+
+    def _track_unacked(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """미확인 시퀀스를 기록하고 아직 전달하지 않은 메시지만 반환
+
+        재전달 받은 범위에는 이미 전달한 메시지도 섞여 있으므로 다시 알리지 않는다.
+        """
+        with self._ack_lock:
+            fresh = [
+                m
+                for m in messages
+                if m.get("sequence_id") is None
+                or int(m["sequence_id"]) > self._handled_seq
+                or int(m["sequence_id"]) in self._unacked
+            ]
+            sequence_ids = _sequence_ids(fresh)
+            self._unacked.update(sequence_ids)
+            self._handled_seq = max([self._handled_seq, *sequence_ids])
+        return fresh
+
+    def _request_redelivery(self) -> None:
+        """스트림 모드에서 전달하지 못한 메시지를 다시 받도록 ack 지점부터 스트림을 되감는다
+
+        polling 은 서버가 lease 만료 후 재전달하지만 SSE 스트림은 커서 이후만 보내므로
+        되감지 않으면 미확인 메시지가 다시 오지 않아 ack 가 멈춘다.
+        """
+        manager = self._stream_manager
+        if manager is None or not manager.is_running:
+            return
+        with self._ack_lock:
+            acked_seq = self._acked_seq
+        manager.rewind(str(acked_seq))
+
+    def _settle_acks(self, delivered: List[int]) -> None:
+        """전달한 시퀀스를 기록하고 전달되지 않은 가장 오래된 메시지 직전까지 ack
+
+        서버의 ack 는 누적이므로 뒤의 메시지를 전달했더라도 앞에 전달하지 못했거나
+        묶음기에 보관 중인 메시지가 있으면 그 앞까지만 확인한다. 재전달된 메시지나
+        묶음 알림이 전달되면 상한이 풀린다.
+        """
+        with self._ack_lock:
+            self._unacked.difference_update(delivered)
+            target = min(self._unacked) - 1 if self._unacked else self._handled_seq
+            previous = self._acked_seq
+            if target <= previous:
+                return
+            self._acked_seq = target
+        if not self.ack_sequence(target):
+            with self._ack_lock:
+                if self._acked_seq == target:
+                    self._acked_seq = previous  # 다음 전달 때 다시 ack
+
+
+def _sequence_ids(messages: List[Dict[str, Any]]) -> List[int]:
+    return [int(m["sequence_id"]) for m in messages if m.get("sequence_id") is not None]
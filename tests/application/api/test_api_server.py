@@ -222,6 +222,33 @@ def test_notification_system_success(client: TestClient) -> None:
     assert json_data["status"] == "success"
 
 
+def test_notification_batch_success(client: TestClient) -> None:
+    """일괄 알림 성공 테스트"""
+    response = client.post(
+        "/notifications/batch",
+        json={
+            "notifications": [
+                {"title": "Info", "message": "first"},
+                {"type": "warning", "title": "Warning", "message": "second"},
+                {"type": "dialog_html", "title": "PR", "html_message": "<b>PR</b>"},
+            ]
+        }
+    )
+    assert response.status_code == 200
+    json_data = response.json()
+    assert json_data["status"] == "success"
+    assert json_data["data"]["sent"] == 3
+
+
+def test_notification_batch_invalid_type_422(client: TestClient) -> None:
+    """일괄 알림 잘못된 타입 테스트"""
+    response = client.post(
+        "/notifications/batch",
+        json={"notifications": [{"type": "system", "title": "x", "message": "y"}]}
+    )
+    assert response.status_code == 422
+
+
 # MCP 관련 테스트
 
 
@@ -170,13 +170,17 @@ class TestAppConfigManager:
         assert saved_config["webhook_enabled"] is True
         assert saved_config["webhook_port"] == 9000
 
-    @patch("builtins.open", new_callable=mock_open)
-    def test_save_config_called(self, mock_file: Mock, mock_app_config_manager: AppConfigManager):
+    def test_save_config_called(self, mock_app_config_manager: AppConfigManager):
         """설정 저장 메서드 호출 테스트"""
-        mock_app_config_manager.save_config()
-        
-        # 파일이 쓰기 모드로 열렸는지 확인
-        mock_file.assert_called_once_with(mock_app_config_manager.config_file, "w", encoding="utf-8")
+        with patch(
+            "application.config.apps.managers.app_config_manager.atomic_write_text"
+        ) as mock_write:
+            mock_app_config_manager.save_config()
+
+        # 설정 파일이 원자적 쓰기로 저장되었는지 확인
+        mock_write.assert_called_once()
+        assert mock_write.call_args.args[0] == mock_app_config_manager.config_file
+        assert "[LLM]" in mock_write.call_args.args[1]
 
     @patch("configparser.ConfigParser.read", side_effect=configparser.Error("파싱 오류"))
     @patch("os.path.exists", return_value=True)
@@ -0,0 +1,110 @@
+"""AppConfigManager 저장 묶음(batch)/지연 저장/원자적 저장 테스트"""
+
+import configparser
+import os
+import time
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import patch
+
+import pytest
+
+from application.config.apps.managers import app_config_manager as module
+from application.config.apps.managers.app_config_manager import AppConfigManager
+from application.config.libs.utils import atomic_write_text
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> str:
+    return str(tmp_path / "app.config")
+
+
+def count_writes(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    writes: List[str] = []
+
+    def recording_write(file_path: Any, content: str, encoding: str = "utf-8") -> None:
+        writes.append(content)
+        atomic_write_text(file_path, content, encoding)
+
+    monkeypatch.setattr(module, "atomic_write_text", recording_write)
+    return writes
+
+
+def read_file(config_file: str) -> configparser.ConfigParser:
+    parser = configparser.ConfigParser()
+    parser.read(config_file, encoding="utf-8")
+    return parser
+
+
+def test_batch_writes_once(config_file: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = AppConfigManager(config_file)
+    writes = count_writes(monkeypatch)
+
+    with manager.batch():
+        for i in range(30):
+            manager.set_config_value("DIALOG", f"key{i}", str(i))
+        with manager.batch():  # 중첩 batch 는 바깥 batch 에 합쳐진다
+            manager.set_ui_config("Arial", 16, 700, "dark")
+        assert writes == []
+
+    assert len(writes) == 1
+    saved = read_file(config_file)
+    assert saved["DIALOG"]["key29"] == "29"
+    assert saved["UI"]["window_theme"] == "dark"
+
+
+def test_unbatched_sets_are_coalesced(config_file: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = AppConfigManager(config_file, save_delay=0.05)
+    writes = count_writes(monkeypatch)
+
+    for i in range(30):
+        manager.set_config_value("DIALOG", f"key{i}", str(i))
+    assert writes == []
+
+    deadline = time.monotonic() + 2
+    while not writes and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+    assert len(writes) == 1
+    assert read_file(config_file)["DIALOG"]["key29"] == "29"
+
+
+def test_reload_does_not_drop_pending_changes(config_file: str) -> None:
+    manager = AppConfigManager(config_file, save_delay=60)
+    manager.set_config_value("UI", "font_size", "20")
+
+    assert manager.get_ui_config()["font_size"] == 20  # get_ui_config 는 파일을 다시 읽는다
+    assert read_file(config_file)["UI"]["font_size"] == "20"
+
+
+def test_failed_batch_rolls_back(config_file: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    manager = AppConfigManager(config_file)
+    before = Path(config_file).read_text(encoding="utf-8")
+    writes = count_writes(monkeypatch)
+
+    with pytest.raises(RuntimeError):
+        with manager.batch():
+            manager.set_config_value("UI", "font_size", "99")
+            manager.set_config_value("NEW", "key", "value")
+            raise RuntimeError("검증 실패")
+
+    assert writes == []
+    assert manager.get_config_value("UI", "font_size") == "14"
+    assert not manager.config.has_section("NEW")
+    assert Path(config_file).read_text(encoding="utf-8") == before
+
+
+@pytest.mark.parametrize("crash_point", ["os.fsync", "os.replace"])
+def test_interrupted_save_never_replaces_config(config_file: str, crash_point: str) -> None:
+    manager = AppConfigManager(config_file)
+    before = Path(config_file).read_text(encoding="utf-8")
+    manager.config["UI"]["font_size"] = "99"
+
+    with patch(crash_point, side_effect=OSError("중단")):
+        manager.save_config()  # 실패는 로그로 남기고 예외를 던지지 않는다
+
+    assert Path(config_file).read_text(encoding="utf-8") == before
+    assert os.listdir(os.path.dirname(config_file)) == ["app.config"]  # 임시 파일 정리
+
+    manager.save_config()  # 실패한 변경은 다음 저장에서 기록된다
+    assert read_file(config_file)["UI"]["font_size"] == "99"
@@ -0,0 +1,94 @@
+"""backup_config_file 순환 백업 테스트"""
+
+import os
+from pathlib import Path
+from typing import Any, Callable, List
+
+import pytest
+
+from application.config.libs.utils import backup_config_file
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> Path:
+    path = tmp_path / "app.config"
+    path.write_text("v0", encoding="utf-8")
+    return path
+
+
+def count_calls(monkeypatch: pytest.MonkeyPatch, name: str) -> List[Any]:
+    calls: List[Any] = []
+    original: Callable[..., Any] = getattr(Path, name)
+
+    def counting(self: Path, *args: Any, **kwargs: Any) -> Any:
+        calls.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, name, counting)
+    return calls
+
+
+def test_ring_overwrites_oldest_slot(config_file: Path) -> None:
+    backups = []
+    for version in range(7):
+        config_file.write_text(f"v{version}", encoding="utf-8")
+        backups.append(backup_config_file(config_file, max_backups=3))
+
+    assert [Path(b).name for b in backups] == [
+        f"app.config.bak.{slot}" for slot in (1, 2, 3, 1, 2, 3, 1)
+    ]
+    contents = {
+        p.name: p.read_text(encoding="utf-8") for p in config_file.parent.glob("*.bak.?")
+    }
+    assert contents == {
+        "app.config.bak.1": "v6",
+        "app.config.bak.2": "v4",
+        "app.config.bak.3": "v5",
+    }
+
+
+def test_identical_consecutive_saves_are_deduplicated(config_file: Path) -> None:
+    first = backup_config_file(config_file, deduplicate=True)
+    assert backup_config_file(config_file, deduplicate=True) == first
+
+    config_file.write_text("changed", encoding="utf-8")
+    second = backup_config_file(config_file, deduplicate=True)
+    assert second != first
+    assert Path(second).read_text(encoding="utf-8") == "changed"  # type: ignore[arg-type]
+
+
+def test_legacy_backups_are_cleaned_up_once(config_file: Path) -> None:
+    legacy = [config_file.with_name("app.config.bak")] + [
+        config_file.with_name(f"app.config.bak.{n}") for n in range(1, 13)
+    ]
+    for age, entry in enumerate(legacy):
+        entry.write_text(f"legacy{age}", encoding="utf-8")
+        os.utime(entry, ns=(age * 10**9, age * 10**9))
+
+    backup_config_file(config_file, max_backups=5)
+
+    names = sorted(p.name for p in config_file.parent.iterdir())
+    assert names == ["app.config"] + [f"app.config.bak.{n}" for n in range(1, 6)] + [
+        "app.config.bak.manifest"
+    ]
+    kept = [config_file.with_name(f"app.config.bak.{n}").read_text() for n in range(1, 6)]
+    assert kept == ["v0", "legacy9", "legacy10", "legacy11", "legacy12"]
+
+
+def test_constant_work_after_10k_saves(
+    config_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    backup_config_file(config_file)
+    listings = count_calls(monkeypatch, "iterdir")
+    probes = count_calls(monkeypatch, "exists")
+
+    per_call = []
+    for version in range(10_000):
+        config_file.write_text(f"v{version}", encoding="utf-8")
+        before = len(probes)
+        backup_config_file(config_file)
+        per_call.append(len(probes) - before)
+
+    assert listings == []  # 정리 이후에는 디렉토리를 훑지 않는다
+    assert set(per_call) == {per_call[0]}
+    assert len(os.listdir(config_file.parent)) == 1 + 5 + 1  # 원본 + 슬롯 5개 + manifest
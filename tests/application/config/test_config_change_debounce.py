@@ -0,0 +1,169 @@
+"""ConfigChangeNotifier debounce / 내용 해시 비교 / 자체 저장 무시 테스트
+
+합성 watchdog 이벤트로 ConfigFileWatcher 를 직접 구동해 논리적 변경 한 번당
+콜백이 정확히 한 번 호출되는지 확인한다.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+import pytest
+from watchdog.events import (
+    FileCreatedEvent,
+    FileDeletedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+)
+
+from application.config.libs.config_change_notifier import ConfigChangeNotifier, ConfigFileWatcher
+from application.config.libs.utils import atomic_write_text
+
+Calls = List[Tuple[str, str]]
+
+
+@pytest.fixture
+def notifier() -> Iterator[ConfigChangeNotifier]:
+    notifier = ConfigChangeNotifier(debounce=0.05)
+    try:
+        yield notifier
+    finally:
+        notifier.stop_all()
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> str:
+    path = tmp_path / "app.config"
+    path.write_text("[UI]\nfont_size = 14\n", encoding="utf-8")
+    return str(path)
+
+
+def watch(notifier: ConfigChangeNotifier, config_file: str) -> Tuple[ConfigFileWatcher, Calls]:
+    calls: Calls = []
+    notifier.register_callback(config_file, lambda path, kind: calls.append((path, kind)))
+    return ConfigFileWatcher(notifier._watched_files, notifier), calls
+
+
+def settle(notifier: ConfigChangeNotifier) -> None:
+    """예약된 debounce 타이머가 모두 처리될 때까지 대기"""
+    deadline = time.monotonic() + 2
+    while notifier._pending_timers and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(notifier.debounce * 2)
+
+
+def test_editor_burst_fires_once(notifier: ConfigChangeNotifier, config_file: str) -> None:
+    watcher, calls = watch(notifier, config_file)
+
+    # 편집기의 저장: 비우기 → 여러 번에 나눠 쓰기 → 메타데이터 갱신
+    Path(config_file).write_text("", encoding="utf-8")
+    watcher.on_modified(FileModifiedEvent(config_file))
+    Path(config_file).write_text("[UI]\nfont_size = 16\n", encoding="utf-8")
+    watcher.on_created(FileCreatedEvent(config_file))
+    watcher.on_modified(FileModifiedEvent(config_file))
+    settle(notifier)
+
+    assert calls == [(config_file, "modified")]
+
+
+def test_atomic_replace_is_detected_once(notifier: ConfigChangeNotifier, config_file: str) -> None:
+    watcher, calls = watch(notifier, config_file)
+
+    temp_file = config_file + ".tmp"
+    Path(temp_file).write_text("[UI]\nfont_size = 18\n", encoding="utf-8")
+    watcher.on_created(FileCreatedEvent(temp_file))
+    os.replace(temp_file, config_file)
+    watcher.on_moved(FileMovedEvent(temp_file, config_file))
+    watcher.on_modified(FileModifiedEvent(config_file))
+    settle(notifier)
+
+    assert calls == [(config_file, "modified")]
+
+
+def test_events_without_content_change_are_ignored(
+    notifier: ConfigChangeNotifier, config_file: str
+) -> None:
+    watcher, calls = watch(notifier, config_file)
+
+    os.utime(config_file)  # touch
+    watcher.on_modified(FileModifiedEvent(config_file))
+    settle(notifier)
+
+    assert calls == []
+
+
+def test_own_writes_are_suppressed(notifier: ConfigChangeNotifier, config_file: str) -> None:
+    watcher, calls = watch(notifier, config_file)
+
+    with notifier.self_write(config_file):
+        atomic_write_text(config_file, "[UI]\nfont_size = 20\n")
+    watcher.on_moved(FileMovedEvent(config_file + ".tmp", config_file))
+    settle(notifier)
+    assert calls == []
+
+    # 이후의 외부 변경은 정상적으로 알린다
+    Path(config_file).write_text("[UI]\nfont_size = 22\n", encoding="utf-8")
+    watcher.on_modified(FileModifiedEvent(config_file))
+    settle(notifier)
+    assert calls == [(config_file, "modified")]
+
+
+def test_delete_and_recreate(notifier: ConfigChangeNotifier, config_file: str) -> None:
+    watcher, calls = watch(notifier, config_file)
+
+    os.remove(config_file)
+    watcher.on_deleted(FileDeletedEvent(config_file))
+    settle(notifier)
+    Path(config_file).write_text("[UI]\n", encoding="utf-8")
+    watcher.on_created(FileCreatedEvent(config_file))
+    watcher.on_modified(FileModifiedEvent(config_file))
+    settle(notifier)
+
+    assert calls == [(config_file, "deleted"), (config_file, "created")]
+
+
+def test_event_during_own_write_without_debounce(config_file: str) -> None:
+    notifier = ConfigChangeNotifier(debounce=0)
+    try:
+        watcher, calls = watch(notifier, config_file)
+
+        with notifier.self_write(config_file):
+            atomic_write_text(config_file, "[UI]\nfont_size = 24\n")
+            # watchdog 이벤트가 저장 블록이 끝나기 전에 도착
+            watcher.on_moved(FileMovedEvent(config_file + ".tmp", config_file))
+        settle(notifier)
+
+        assert calls == []
+    finally:
+        notifier.stop_all()
+
+
+def test_callbacks_run_outside_notifier_lock(
+    notifier: ConfigChangeNotifier, config_file: str
+) -> None:
+    """콜백이 기다리는 잠금을 쥔 채 self_write 로 저장해도 교착되지 않는다"""
+    save_lock = threading.Lock()  # 설정 관리자의 저장 잠금 역할
+    in_callback = threading.Event()
+
+    def callback(path: str, kind: str) -> None:
+        in_callback.set()
+        with save_lock:
+            pass
+
+    notifier.register_callback(config_file, callback)
+    watcher = ConfigFileWatcher(notifier._watched_files, notifier)
+
+    def save() -> None:
+        with notifier.self_write(config_file):
+            atomic_write_text(config_file, "[UI]\nfont_size = 28\n")
+
+    with save_lock:
+        atomic_write_text(config_file, "[UI]\nfont_size = 26\n")
+        watcher.on_moved(FileMovedEvent(config_file + ".tmp", config_file))
+        assert in_callback.wait(2)  # 콜백이 save_lock 을 기다리는 중
+        saver = threading.Thread(target=save, daemon=True)
+        saver.start()
+        saver.join(2)
+        assert not saver.is_alive()
@@ -253,7 +253,7 @@ class TestConfigFileWatcher(unittest.TestCase):
         self.watcher.on_modified(event)
         
         # 첫 번째 이벤트만 처리되어야 함
-        self.notifier._notify_change.assert_called_once()
+        self.notifier._handle_file_event.assert_called_once()
 
     def test_on_created(self):
         """파일 생성 이벤트 테스트"""
@@ -263,7 +263,7 @@ class TestConfigFileWatcher(unittest.TestCase):
         self.watcher.on_created(event)
         
         # 생성 이벤트가 알림되었는지 확인
-        self.notifier._notify_change.assert_called_once_with(
+        self.notifier._handle_file_event.assert_called_once_with(
             os.path.abspath(self.test_file), "created"
         )
 
@@ -275,7 +275,7 @@ class TestConfigFileWatcher(unittest.TestCase):
         self.watcher.on_deleted(event)
         
         # 삭제 이벤트가 알림되었는지 확인
-        self.notifier._notify_change.assert_called_once_with(
+        self.notifier._handle_file_event.assert_called_once_with(
             os.path.abspath(self.test_file), "deleted"
         )
 
@@ -287,7 +287,7 @@ class TestConfigFileWatcher(unittest.TestCase):
         self.watcher.on_modified(event)
         
         # 디렉토리 이벤트는 처리되지 않아야 함
-        self.notifier._notify_change.assert_not_called()
+        self.notifier._handle_file_event.assert_not_called()
 
     def test_ignore_non_watched_files(self):
         """감시하지 않는 파일 이벤트 무시 테스트"""
@@ -298,7 +298,7 @@ class TestConfigFileWatcher(unittest.TestCase):
         self.watcher.on_modified(event)
         
         # 감시하지 않는 파일 이벤트는 처리되지 않아야 함
-        self.notifier._notify_change.assert_not_called()
+        self.notifier._handle_file_event.assert_not_called()
 
 
 class TestGlobalNotifier(unittest.TestCase):
@@ -0,0 +1,118 @@
+"""ConfigManager.get_llm_config 스냅샷 캐시 테스트"""
+
+import builtins
+import json
+import time
+from pathlib import Path
+from typing import Any, Iterator, List
+
+import pytest
+
+from application.config.config_manager import ConfigManager
+from application.config.libs.config_change_notifier import (
+    cleanup_global_notifier,
+    reset_global_notifier,
+)
+
+# 파일 감시 쿨다운(100ms) + inotify 지연을 넉넉히 포함한 관찰 허용 시간
+OBSERVE_WINDOW = 1.0
+
+
+def write_profiles(path: Path, model: str) -> None:
+    profiles = {
+        "profiles": {
+            "test": {
+                "name": "테스트 프로필",
+                "api_key": "test-api-key",
+                "base_url": "http://test.example.com",
+                "model": model,
+                "temperature": 0.8,
+            }
+        },
+        "current_profile": "test",
+    }
+    path.write_text(json.dumps(profiles, ensure_ascii=False), encoding="utf-8")
+
+
+@pytest.fixture
+def manager(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[ConfigManager]:
+    reset_global_notifier()
+    profiles_file = tmp_path / "llm_profiles.json"
+    write_profiles(profiles_file, "model-a")
+    app_config = tmp_path / "app.config"
+    app_config.write_text("[LLM]\napi_key = key\n", encoding="utf-8")
+    monkeypatch.setattr(
+        "application.config.apps.managers.llm_profile_manager.DEFAULT_LLM_PROFILES_JSON",
+        str(profiles_file),
+    )
+
+    config_manager = ConfigManager(str(app_config))
+    try:
+        yield config_manager
+    finally:
+        config_manager.cleanup()
+        cleanup_global_notifier()
+
+
+def count_opens(monkeypatch: pytest.MonkeyPatch) -> List[Any]:
+    opened: List[Any] = []
+    real_open = builtins.open
+
+    def counting_open(file: Any, *args: Any, **kwargs: Any) -> Any:
+        opened.append(file)
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+    return opened
+
+
+@pytest.mark.parametrize("watching", [True, False])
+def test_repeated_calls_do_not_open_files(
+    manager: ConfigManager, monkeypatch: pytest.MonkeyPatch, watching: bool
+) -> None:
+    if not watching:  # 파일 감시를 쓸 수 없으면 mtime/size 비교로 판단한다
+        monkeypatch.setattr(manager._file_change_notifier, "is_watching", lambda path: False)
+    assert manager.get_llm_config()["model"] == "model-a"
+
+    opened = count_opens(monkeypatch)
+    for _ in range(10_000):
+        config = manager.get_llm_config()
+    monkeypatch.undo()
+
+    assert opened == []
+    assert config["model"] == "model-a"
+
+
+def test_returned_config_is_a_private_copy(manager: ConfigManager) -> None:
+    manager.get_llm_config()["model"] = "mutated"
+
+    assert manager.get_llm_config()["model"] == "model-a"
+    with pytest.raises(TypeError):
+        manager.get_llm_config_snapshot().values["model"] = "mutated"  # type: ignore[index]
+
+
+def test_setter_invalidates_snapshot(manager: ConfigManager) -> None:
+    before = manager.get_llm_config_snapshot()
+    manager.update_llm_profile("test", {"model": "model-b"})
+
+    after = manager.get_llm_config_snapshot()
+    assert after.version > before.version
+    assert after.values["model"] == "model-b"
+
+
+@pytest.mark.parametrize("watching", [True, False])
+def test_external_edit_is_observed_within_window(
+    manager: ConfigManager, monkeypatch: pytest.MonkeyPatch, watching: bool
+) -> None:
+    if watching:
+        assert manager._is_watching_llm_files()
+    else:
+        monkeypatch.setattr(manager._file_change_notifier, "is_watching", lambda path: False)
+    assert manager.get_llm_config()["model"] == "model-a"
+
+    time.sleep(0.15)  # 직전 쓰기의 감시 쿨다운이 지나도록
+    write_profiles(Path(manager.llm_profiles_file), "model-external")
+    started = time.monotonic()
+    while manager.get_llm_config()["model"] != "model-external":
+        assert time.monotonic() - started < OBSERVE_WINDOW
+        time.sleep(0.01)
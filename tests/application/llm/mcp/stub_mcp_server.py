@@ -0,0 +1,62 @@
+"""테스트용 stdio FastMCP 스텁 서버
+
+인터프리터 기동과 mcp 임포트 비용을 그대로 치르므로 세션 재사용 효과 측정에 쓴다.
+기동 동작은 환경 변수로 바꾼다.
+
+- STUB_STARTUP_DELAY: 서버 시작 전 대기 시간(초)
+- STUB_MODE=crash: 시작하자마자 종료
+- STUB_MODE=hang: 응답하지 않고 멈춤
+- STUB_FAIL_FLAG: 지정한 파일이 있으면 시작하자마자 종료
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+from mcp.server.fastmcp import FastMCP
+
+FAIL_FLAG = os.environ.get("STUB_FAIL_FLAG")
+if os.environ.get("STUB_MODE") == "crash" or (FAIL_FLAG and os.path.exists(FAIL_FLAG)):
+    sys.exit(1)
+if os.environ.get("STUB_MODE") == "hang":
+    time.sleep(3600)
+time.sleep(float(os.environ.get("STUB_STARTUP_DELAY", "0")))
+
+server = FastMCP("stub")
+
+
+@server.tool()
+def echo(text: str) -> str:
+    """입력 문자열을 그대로 반환"""
+    return text
+
+
+@server.tool()
+def add(a: int, b: int) -> int:
+    """두 정수의 합"""
+    return a + b
+
+
+@server.tool()
+def pid() -> int:
+    """서버 프로세스 ID"""
+    return os.getpid()
+
+
+@server.tool()
+async def sleep(seconds: float) -> str:
+    """seconds 초 뒤 응답 (큰 값이면 멈춘 도구처럼 동작)"""
+    await asyncio.sleep(seconds)
+    return "done"
+
+
+@server.tool()
+def crash() -> str:
+    """서버 프로세스를 즉시 종료"""
+    sys.stdout.flush()
+    os._exit(1)
+
+
+if __name__ == "__main__":
+    server.run("stdio")
@@ -0,0 +1,257 @@
+"""MCP 도구 호출 보호 테스트 - 제한 시간, 동시 호출 한도, 회로 차단기
+
+stub_mcp_server.py 의 sleep 도구를 큰 값으로 호출해 멈춘 도구를 흉내 낸다.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from application.llm.mcp.call_guard import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CallLimits,
+    CircuitBreaker,
+    CircuitOpenError,
+    MCPToolTimeoutError,
+)
+from application.llm.mcp.mcp_manager import MCPManager
+from application.llm.mcp.mcp_tool_manager import MCPToolManager
+from application.llm.mcp.session_pool import MCPSessionPool
+
+STUB_SERVER = str(Path(__file__).with_name("stub_mcp_server.py"))
+HANG = {"seconds": 3600}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def stub_connection() -> Dict[str, Any]:
+    return {
+        "transport": "stdio",
+        "command": sys.executable,
+        "args": [STUB_SERVER],
+        "env": dict(os.environ),
+    }
+
+
+def make_pool(limits: CallLimits, **kwargs: Any) -> MCPSessionPool:
+    return MCPSessionPool(
+        {"stub": stub_connection()},
+        health_check_interval=0,
+        call_limits={"stub": limits},
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def pools() -> Iterator[List[MCPSessionPool]]:
+    created: List[MCPSessionPool] = []
+    try:
+        yield created
+    finally:
+        for pool in created:
+            pool.close()
+
+
+async def text_of(pool: MCPSessionPool, tool: str, arguments: Dict[str, Any]) -> str:
+    result = await pool.call_tool("stub", tool, arguments)
+    return result.content[0].text  # type: ignore[union-attr]
+
+
+# ----------------------------------------------------------------------
+# 회로 차단기 상태 전이
+# ----------------------------------------------------------------------
+def test_breaker_opens_after_consecutive_failures() -> None:
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=10, clock=FakeClock())
+    error = TimeoutError("느림")
+
+    assert not breaker.record_failure(error)
+    assert not breaker.record_failure(error)
+    breaker.record_success()  # 성공하면 연속 실패 수가 초기화된다
+    assert not breaker.record_failure(error)
+    assert not breaker.record_failure(error)
+    assert breaker.record_failure(error)
+
+    assert breaker.state == CIRCUIT_OPEN
+    assert not breaker.allow()
+    assert breaker.snapshot()["retry_in"] == 10
+    assert breaker.snapshot()["last_error"] == "느림"
+
+
+def test_breaker_half_opens_after_cooldown() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=10, clock=clock)
+    breaker.record_failure(RuntimeError("x"))
+
+    clock.now += 10
+    assert breaker.allow()  # 시험 호출 하나만 허용
+    assert breaker.state == CIRCUIT_HALF_OPEN
+    assert not breaker.allow()
+
+    assert breaker.record_failure(RuntimeError("y"))  # 시험 호출 실패 → 다시 열림
+    assert breaker.state == CIRCUIT_OPEN
+    assert not breaker.allow()
+
+    clock.now += 10
+    assert breaker.allow()
+    breaker.release_trial()  # 결과 없이 끝난 시험 호출은 다음 호출에 기회를 넘긴다
+    assert breaker.allow()
+    assert breaker.record_success()
+    assert breaker.state == CIRCUIT_CLOSED
+    assert breaker.allow() and breaker.allow()
+
+
+# ----------------------------------------------------------------------
+# 세션 풀
+# ----------------------------------------------------------------------
+async def test_per_tool_timeout(pools: List[MCPSessionPool]) -> None:
+    pool = make_pool(CallLimits(timeout=30, tool_timeouts={"sleep": 0.5}))
+    pools.append(pool)
+    assert await text_of(pool, "echo", {"text": "warm"}) == "warm"
+
+    started = time.monotonic()
+    with pytest.raises(MCPToolTimeoutError, match="호출 시간 초과"):
+        await pool.call_tool("stub", "sleep", HANG)
+    assert time.monotonic() - started < 5
+
+    assert await text_of(pool, "echo", {"text": "ok"}) == "ok"  # 기본 제한 시간 적용
+    assert pool.get_circuit_state("stub")["consecutive_failures"] == 0
+
+
+async def test_concurrency_limit(pools: List[MCPSessionPool]) -> None:
+    delay = 0.5
+    limited = make_pool(CallLimits(max_concurrency=1))
+    parallel = make_pool(CallLimits(max_concurrency=2))
+    pools.extend([limited, parallel])
+
+    async def run_two(pool: MCPSessionPool) -> float:
+        await pool.warm_up("stub")
+        started = time.monotonic()
+        results = await asyncio.gather(
+            *(text_of(pool, "sleep", {"seconds": delay}) for _ in range(2))
+        )
+        assert results == ["done", "done"]
+        return time.monotonic() - started
+
+    assert await run_two(limited) >= delay * 2
+    assert await run_two(parallel) < delay * 2
+
+
+async def test_waiting_for_a_slot_is_not_a_server_failure(pools: List[MCPSessionPool]) -> None:
+    pool = make_pool(
+        CallLimits(max_concurrency=1, tool_timeouts={"echo": 0.3}, failure_threshold=1)
+    )
+    pools.append(pool)
+    await pool.warm_up("stub")
+
+    busy = asyncio.ensure_future(text_of(pool, "sleep", {"seconds": 1.5}))
+    await asyncio.sleep(0.2)
+    with pytest.raises(MCPToolTimeoutError, match="대기 시간 초과"):
+        await pool.call_tool("stub", "echo", {"text": "queued"})
+
+    assert pool.get_circuit_state("stub")["state"] == CIRCUIT_CLOSED
+    assert await busy == "done"
+
+
+async def test_breaker_fast_fails_and_recovers_hung_server(pools: List[MCPSessionPool]) -> None:
+    transitions: List[str] = []
+    pool = make_pool(
+        CallLimits(tool_timeouts={"sleep": 0.5}, failure_threshold=2, cooldown=1.0),
+        on_circuit_change=lambda server, circuit: transitions.append(circuit["state"]),
+    )
+    pools.append(pool)
+    first_pid = int(await text_of(pool, "pid", {}))
+
+    for _ in range(2):
+        with pytest.raises(MCPToolTimeoutError):
+            await pool.call_tool("stub", "sleep", HANG)
+    assert transitions == [CIRCUIT_OPEN]
+
+    started = time.monotonic()
+    with pytest.raises(CircuitOpenError, match="회로 차단기 열림"):
+        await pool.call_tool("stub", "echo", {"text": "x"})
+    assert time.monotonic() - started < 0.2  # 서버에 보내지 않고 바로 실패
+
+    await asyncio.sleep(1.0)
+    # 시험 호출은 멈춘 프로세스 대신 새로 띄운 프로세스로 간다
+    assert int(await text_of(pool, "pid", {})) != first_pid
+    assert transitions == [CIRCUIT_OPEN, CIRCUIT_CLOSED]
+    assert pool.get_circuit_state("stub")["consecutive_failures"] == 0
+
+
+# ----------------------------------------------------------------------
+# MCPToolManager / MCPManager 상태
+# ----------------------------------------------------------------------
+def make_manager(server: Dict[str, Any], tmp_path: Path) -> MCPToolManager:
+    servers = {"stub": {"command": sys.executable, "args": [STUB_SERVER], **server}}
+    config_manager = SimpleNamespace(get_mcp_config=lambda: {"mcpServers": servers})
+    return MCPToolManager(
+        MCPManager(config_manager), config_manager, tool_cache_file=str(tmp_path / "tools.json")
+    )
+
+
+async def test_breaker_state_is_reported_through_mcp_manager(tmp_path: Path) -> None:
+    manager = make_manager(
+        {
+            "env": dict(os.environ),
+            "call_timeout": 0.5,
+            "circuit_breaker": {"failure_threshold": 1, "cooldown": 60},
+        },
+        tmp_path,
+    )
+    try:
+        assert await manager.initialize()
+        status = manager.mcp_manager.get_server_status("stub")
+        assert status.is_healthy()
+        assert status.metadata["circuit"]["state"] == CIRCUIT_CLOSED
+
+        started = time.monotonic()
+        assert "시간 초과" in await manager.call_mcp_tool("sleep", HANG)
+        assert time.monotonic() - started < 5
+
+        status = manager.mcp_manager.get_server_status("stub")
+        assert not status.is_healthy()
+        assert status.metadata["state"] == "ready"
+        assert status.metadata["circuit"]["state"] == CIRCUIT_OPEN
+        assert "회로 차단기 열림" in (status.error_message or "")
+        assert status.get_tool_count() == 5
+
+        assert "회로 차단기 열림" in await manager.call_mcp_tool("echo", {"text": "x"})
+        statuses = manager.mcp_manager.get_all_server_statuses()
+        assert statuses["stub"].metadata["circuit"]["consecutive_failures"] == 1
+    finally:
+        await manager.cleanup()
+
+
+async def test_call_limit_settings(tmp_path: Path) -> None:
+    manager = make_manager(
+        {
+            "env": dict(os.environ),
+            "call_timeout": "abc",
+            "tool_timeouts": {"sleep": 2, "echo": -1},
+            "max_concurrency": 2,
+            "circuit_breaker": {"failure_threshold": True, "cooldown": "15"},
+        },
+        tmp_path,
+    )
+    try:
+        assert await manager.initialize()
+        assert manager.session_pool is not None
+        assert manager.session_pool.call_limits["stub"] == CallLimits(
+            timeout=120.0, tool_timeouts={"sleep": 2.0}, max_concurrency=2, cooldown=15.0
+        )
+    finally:
+        await manager.cleanup()
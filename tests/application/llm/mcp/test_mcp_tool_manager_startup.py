@@ -0,0 +1,185 @@
+"""MCPToolManager 서버 시작 테스트 - 동시 시작, 실패 격리, lazy 시작, 백그라운드 재시도
+
+tests/application/llm/mcp/stub_mcp_server.py 를 느리게/죽도록/멈추도록 띄워 확인한다.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict
+
+import pytest
+
+from application.llm.mcp.mcp_manager import MCPManager
+from application.llm.mcp.mcp_tool_manager import (
+    SERVER_DEGRADED,
+    SERVER_LAZY,
+    SERVER_READY,
+    MCPToolManager,
+)
+
+STUB_SERVER = str(Path(__file__).with_name("stub_mcp_server.py"))
+HANG_TIMEOUT = 3.0  # 멈추는 서버에만 짧은 연결 제한 시간을 준다
+
+
+def stub_server(**options: Any) -> Dict[str, Any]:
+    env = {key: str(options.pop(key)) for key in list(options) if key.startswith("STUB_")}
+    return {
+        "command": sys.executable,
+        "args": [STUB_SERVER],
+        "env": {**os.environ, **env},
+        "connect_timeout": 30,
+        **options,
+    }
+
+
+def make_manager(
+    servers: Dict[str, Dict[str, Any]], tmp_path: Path, **kwargs: Any
+) -> MCPToolManager:
+    config_manager = SimpleNamespace(get_mcp_config=lambda: {"mcpServers": servers})
+    mcp_manager = MCPManager(config_manager)
+    return MCPToolManager(
+        mcp_manager, config_manager, tool_cache_file=str(tmp_path / "tools.json"), **kwargs
+    )
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "조건을 만족하지 못함"
+        time.sleep(0.05)
+
+
+async def test_broken_servers_do_not_block_healthy_ones(tmp_path: Path) -> None:
+    manager = make_manager(
+        {
+            "good": stub_server(),
+            "crashing": stub_server(STUB_MODE="crash"),
+            "hanging": stub_server(STUB_MODE="hang", connect_timeout=HANG_TIMEOUT),
+        },
+        tmp_path,
+    )
+    try:
+        started = time.monotonic()
+        assert await manager.initialize()
+        elapsed = time.monotonic() - started
+
+        # 멈춘 서버는 연결 제한 시간 + 프로세스 종료 유예(2초) 뒤에 포기한다
+        assert elapsed < HANG_TIMEOUT + 10
+        assert manager.get_server_states() == {
+            "good": SERVER_READY,
+            "crashing": SERVER_DEGRADED,
+            "hanging": SERVER_DEGRADED,
+        }
+        assert {tool.name for tool in manager.langchain_tools} == {
+            "echo",
+            "add",
+            "pid",
+            "sleep",
+            "crash",
+        }
+        assert await manager.call_mcp_tool("echo", {"text": "ok"}) == "ok"
+
+        statuses = manager.mcp_manager.get_all_server_statuses()
+        assert statuses["good"].is_healthy()
+        assert statuses["good"].get_tool_count() == 5
+        assert not statuses["hanging"].connected
+        assert "시간 초과" in (statuses["hanging"].error_message or "")
+        assert statuses["crashing"].metadata["state"] == SERVER_DEGRADED
+    finally:
+        await manager.cleanup()
+
+
+async def test_servers_start_concurrently(tmp_path: Path) -> None:
+    delay = 2.0
+    servers = {f"slow{i}": stub_server(STUB_STARTUP_DELAY=delay) for i in range(3)}
+    manager = make_manager(servers, tmp_path)
+    try:
+        started = time.monotonic()
+        assert await manager.initialize()
+        elapsed = time.monotonic() - started
+
+        assert set(manager.get_server_states().values()) == {SERVER_READY}
+        assert elapsed < delay * 3  # 순차 시작이면 delay * 3 + 기동 시간 3회
+    finally:
+        await manager.cleanup()
+
+
+async def test_lazy_server_starts_on_first_use(tmp_path: Path) -> None:
+    servers = {"eager": stub_server(), "lazy": stub_server(lazy=True)}
+
+    # 처음에는 도구 정의를 알아야 하므로 한 번 조회하고 프로세스를 내린다
+    first = make_manager(servers, tmp_path)
+    try:
+        assert await first.initialize()
+        assert first.session_pool is not None
+        assert not first.session_pool.is_server_running("lazy")
+        assert first.get_server_states()["lazy"] == SERVER_LAZY
+    finally:
+        await first.cleanup()
+
+    # 이후에는 캐시된 정의로 도구를 만들고 첫 호출 때 프로세스를 띄운다
+    manager = make_manager(servers, tmp_path)
+    try:
+        assert await manager.initialize()
+        pool = manager.session_pool
+        assert pool is not None
+        assert not pool.is_server_running("lazy")
+        assert pool.sessions_started == 1  # eager 서버만
+        assert len(manager.langchain_tools) == 10
+
+        (lazy_add,) = [tool for tool in manager._server_tools["lazy"] if tool.name == "add"]
+        assert await lazy_add.ainvoke({"a": 1, "b": 2}) == "3"
+        assert pool.is_server_running("lazy")
+        assert pool.sessions_started == 2
+    finally:
+        await manager.cleanup()
+
+
+async def test_lazy_cache_is_ignored_when_connection_changes(tmp_path: Path) -> None:
+    manager = make_manager({"lazy": stub_server(lazy=True)}, tmp_path)
+    try:
+        assert await manager.initialize()
+    finally:
+        await manager.cleanup()
+
+    changed = make_manager({"lazy": stub_server(lazy=True, args=[STUB_SERVER, "-"])}, tmp_path)
+    try:
+        assert await changed.initialize()
+        assert changed.session_pool is not None
+        assert changed.session_pool.sessions_started == 1  # 캐시를 쓰지 않고 다시 조회
+    finally:
+        await changed.cleanup()
+
+
+async def test_degraded_server_recovers_in_background(tmp_path: Path) -> None:
+    fail_flag = tmp_path / "fail"
+    fail_flag.touch()
+    manager = make_manager(
+        {"good": stub_server(), "flaky": stub_server(STUB_FAIL_FLAG=fail_flag)},
+        tmp_path,
+        retry_interval=0.2,
+    )
+    try:
+        assert await manager.initialize()
+        assert manager.get_server_states()["flaky"] == SERVER_DEGRADED
+        assert len(manager.langchain_tools) == 5
+
+        fail_flag.unlink()
+        wait_until(lambda: manager.get_server_states()["flaky"] == SERVER_READY)
+        assert len(manager.langchain_tools) == 10
+        assert manager.mcp_manager.get_server_status("flaky").is_healthy()
+    finally:
+        await manager.cleanup()
+
+
+@pytest.mark.parametrize("value", ["abc", -1])
+async def test_invalid_timeout_falls_back_to_default(tmp_path: Path, value: Any) -> None:
+    manager = make_manager({"good": {**stub_server(), "discovery_timeout": value}}, tmp_path)
+    try:
+        assert await manager.initialize()
+        assert manager._server_settings["good"].discovery_timeout == 30.0
+    finally:
+        await manager.cleanup()
@@ -0,0 +1,140 @@
+"""MCPToolManager 도구 레지스트리(이름 색인 + OpenAI 스키마 캐시) 테스트 및 벤치마크"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+import pytest
+from langchain_core.tools import StructuredTool
+from pydantic import Field, create_model
+
+from application.llm.mcp.mcp_tool_manager import MCPToolManager
+
+STUB_SERVER = str(Path(__file__).with_name("stub_mcp_server.py"))
+SYNTHETIC_TOOLS = 300
+TURNS = 5
+
+
+def make_tool(index: int, name: str = "") -> StructuredTool:
+    args_schema = create_model(  # type: ignore[call-overload]
+        f"Tool{index}Args",
+        query=(str, Field(..., description="검색어")),
+        limit=(int, Field(10, description="최대 결과 수")),
+        filters=(Dict[str, List[str]], Field(default_factory=dict, description="필터")),
+    )
+
+    async def run(**kwargs: Any) -> str:
+        return f"tool{index}:{kwargs['query']}"
+
+    return StructuredTool.from_function(
+        coroutine=run,
+        name=name or f"tool_{index}",
+        description=f"합성 도구 {index}",
+        args_schema=args_schema,
+    )
+
+
+@pytest.fixture
+def manager() -> MCPToolManager:
+    manager = MCPToolManager(SimpleNamespace(), config_manager=None)  # type: ignore[arg-type]
+    manager._publish_tools([make_tool(i) for i in range(SYNTHETIC_TOOLS)])
+    return manager
+
+
+def best_of(rounds: int, func: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+async def test_benchmark_cached_schemas_and_lookup(manager: MCPToolManager) -> None:
+    tools = manager.langchain_tools
+    last = tools[-1].name
+
+    def derive_per_turn() -> None:  # 이전 동작: 매 턴 스키마 재계산 + 선형 탐색
+        for _ in range(TURNS):
+            [manager._build_openai_schema(tool) for tool in tools]
+            next(tool for tool in tools if tool.name == last)
+
+    def cached_per_turn() -> None:
+        registry = manager.get_tool_registry()
+        for _ in range(TURNS):
+            list(registry.openai_tools)
+            registry.by_name[last]
+
+    derived = best_of(3, derive_per_turn) / TURNS
+    cached = best_of(3, cached_per_turn) / TURNS
+    print(
+        f"\n도구 {SYNTHETIC_TOOLS}개, 턴당: 매번 계산 {derived * 1000:.2f}ms, "
+        f"캐시 {cached * 1000:.4f}ms ({derived / cached:.0f}배)"
+    )
+    assert cached * 20 < derived
+    assert len(await manager.get_openai_tools()) == SYNTHETIC_TOOLS
+
+
+async def test_schemas_are_precomputed_and_read_only(manager: MCPToolManager) -> None:
+    registry = manager.get_tool_registry()
+    assert manager.get_tool_registry().openai_tools[0] is registry.openai_tools[0]
+    assert manager.tools_generation == 1
+    parameters = registry.openai_tools[0]["function"]["parameters"]
+    assert set(parameters["properties"]) == {"query", "limit", "filters"}
+    with pytest.raises(TypeError):
+        parameters["properties"]["query"] = {}
+    with pytest.raises(TypeError):
+        registry.openai_tools[0]["function"]["name"] = "renamed"  # type: ignore[index]
+
+
+async def test_openai_tools_are_plain_json_copies(manager: MCPToolManager) -> None:
+    first = await manager.get_openai_tools()
+    json.dumps(first, ensure_ascii=False)  # UI 가 도구 스키마를 그대로 직렬화한다
+
+    first[0]["function"]["name"] = "renamed"  # 호출자가 고쳐도 레지스트리는 그대로
+    second = await manager.get_openai_tools()
+    assert second[0]["function"]["name"] == "tool_0"
+    assert second[0] == manager._build_openai_schema(manager.langchain_tools[0])
+
+
+async def test_call_dispatches_by_name() -> None:
+    manager = MCPToolManager(SimpleNamespace(), config_manager=None)  # type: ignore[arg-type]
+    manager._publish_tools([make_tool(1, "dup"), make_tool(2, "dup"), make_tool(3)])
+
+    assert manager.get_tool_count() == 3
+    assert await manager.call_mcp_tool("dup", {"query": "q"}) == "tool1:q"  # 먼저 나온 도구
+    assert await manager.call_mcp_tool("tool_3", {"query": "q"}) == "tool3:q"
+    assert "찾을 수 없습니다" in await manager.call_mcp_tool("missing", {})
+
+
+async def test_generation_changes_only_when_tools_change(tmp_path: Path) -> None:
+    servers = {"stub": {"command": sys.executable, "args": [STUB_SERVER], "env": dict(os.environ)}}
+    mcp_config = SimpleNamespace(enabled=True, get_enabled_servers=lambda: servers)
+    manager = MCPToolManager(
+        SimpleNamespace(get_mcp_config=lambda: mcp_config),  # type: ignore[arg-type]
+        config_manager=None,
+        tool_cache_file=str(tmp_path / "tools.json"),
+    )
+    try:
+        assert await manager.initialize()
+        generation = manager.tools_generation
+        echo_schema = next(
+            tool for tool in await manager.get_openai_tools() if tool["function"]["name"] == "echo"
+        )
+        assert "text" in echo_schema["function"]["parameters"]["properties"]
+
+        await manager.get_langchain_tools()
+        await manager.call_mcp_tool("echo", {"text": "hi"})
+        assert manager.tools_generation == generation
+
+        await manager.refresh_tools()
+        assert manager.tools_generation == generation + 1
+    finally:
+        await manager.cleanup()
+
+    assert manager.get_tool_count() == 0
+    assert manager.tools_generation == generation + 2
@@ -0,0 +1,174 @@
+"""MCPSessionPool 테스트 및 세션 재사용 벤치마크
+
+tests/application/llm/mcp/stub_mcp_server.py 를 stdio 로 띄워 실제 프로세스 기동 비용을
+포함해 측정한다.
+"""
+
+import os
+import signal
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, Iterator, List
+
+import pytest
+from langchain_mcp_adapters.tools import load_mcp_tools
+
+from application.llm.mcp.mcp_tool_manager import MCPToolManager
+from application.llm.mcp.session_pool import MCPSessionPool
+
+STUB_SERVER = str(Path(__file__).with_name("stub_mcp_server.py"))
+BENCH_CALLS = 5
+
+
+def stub_connection() -> Dict[str, Any]:
+    return {
+        "transport": "stdio",
+        "command": sys.executable,
+        "args": [STUB_SERVER],
+        "env": dict(os.environ),
+    }
+
+
+@pytest.fixture
+def pool() -> Iterator[MCPSessionPool]:
+    pool = MCPSessionPool({"stub": stub_connection()}, health_check_interval=0)
+    try:
+        yield pool
+    finally:
+        pool.close()
+
+
+async def server_pid(pool: MCPSessionPool) -> int:
+    result = await pool.call_tool("stub", "pid")
+    return int(result.content[0].text)  # type: ignore[union-attr]
+
+
+def process_exists(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    # 종료됐지만 아직 회수되지 않은 프로세스는 살아있지 않은 것으로 본다
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as f:
+            return f.read().split()[2] != "Z"
+    except OSError:
+        return True
+
+
+async def measure(call: Callable[[], Awaitable[Any]]) -> List[float]:
+    latencies = []
+    for _ in range(BENCH_CALLS):
+        started = time.perf_counter()
+        await call()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def test_benchmark_pooled_vs_per_call_sessions(pool: MCPSessionPool) -> None:
+    # 풀 없이: 세션 없이 만든 도구는 호출마다 서버 프로세스를 새로 띄운다
+    (unpooled_echo,) = [
+        tool
+        for tool in await load_mcp_tools(None, connection=stub_connection())
+        if tool.name == "echo"
+    ]
+    unpooled = await measure(lambda: unpooled_echo.ainvoke({"text": "hi"}))
+
+    (pooled_echo,) = [
+        tool
+        for tool in await load_mcp_tools(pool.session("stub"), server_name="stub")
+        if tool.name == "echo"
+    ]
+    await pooled_echo.ainvoke({"text": "warm-up"})
+    pooled = await measure(lambda: pooled_echo.ainvoke({"text": "hi"}))
+
+    print(
+        f"\nMCP 호출 지연 (중앙값, {BENCH_CALLS}회): "
+        f"세션 풀 없음 {statistics.median(unpooled) * 1000:.1f}ms, "
+        f"세션 풀 {statistics.median(pooled) * 1000:.1f}ms"
+    )
+    assert statistics.median(pooled) * 5 < statistics.median(unpooled)
+    assert pool.sessions_started == 1
+
+
+async def test_calls_reuse_one_server_process(pool: MCPSessionPool) -> None:
+    pids = {await server_pid(pool) for _ in range(5)}
+
+    assert len(pids) == 1
+    assert pool.sessions_started == 1
+
+
+async def test_sessions_are_used_round_robin() -> None:
+    pool = MCPSessionPool({"stub": stub_connection()}, sizes={"stub": 2}, health_check_interval=0)
+    try:
+        pids = [await server_pid(pool) for _ in range(4)]
+    finally:
+        await pool.aclose()
+
+    assert len(set(pids)) == 2
+    assert pids[:2] == pids[2:]
+
+
+async def test_dead_process_is_restarted(pool: MCPSessionPool) -> None:
+    pid = await server_pid(pool)
+    os.kill(pid, signal.SIGKILL)
+
+    assert await pool.health_check() == {"stub": False}
+    new_pid = await server_pid(pool)
+    assert new_pid != pid
+    assert await pool.health_check() == {"stub": True}
+
+
+async def test_call_on_dead_session_is_retried_once(pool: MCPSessionPool) -> None:
+    pid = await server_pid(pool)
+    os.kill(pid, signal.SIGKILL)
+    time.sleep(0.2)
+
+    result = await pool.call_tool("stub", "add", {"a": 2, "b": 3})
+    assert result.content[0].text == "5"  # type: ignore[union-attr]
+    assert pool.sessions_started == 2
+
+
+async def test_crash_during_call_is_not_retried(pool: MCPSessionPool) -> None:
+    with pytest.raises(Exception):
+        await pool.call_tool("stub", "crash")
+
+    assert await server_pid(pool) > 0
+    assert pool.sessions_started == 2  # crash 를 다시 실행하지 않고 세션만 교체
+
+
+async def test_close_stops_server_processes() -> None:
+    pool = MCPSessionPool({"stub": stub_connection()}, size=2, health_check_interval=0)
+    pids = {await server_pid(pool) for _ in range(2)}
+    pool.close()
+
+    deadline = time.monotonic() + 5
+    while any(process_exists(pid) for pid in pids) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not any(process_exists(pid) for pid in pids)
+    assert not pool.is_running
+
+
+async def test_tool_manager_calls_through_pool() -> None:
+    servers = {"stub": {**stub_connection(), "pool_size": 1}}
+    del servers["stub"]["transport"]
+    mcp_config = SimpleNamespace(enabled=True, get_enabled_servers=lambda: servers)
+    mcp_manager = SimpleNamespace(get_mcp_config=lambda: mcp_config)
+    manager = MCPToolManager(mcp_manager, config_manager=None)  # type: ignore[arg-type]
+
+    try:
+        assert await manager.initialize()
+        assert {tool.name for tool in manager.langchain_tools} >= {"echo", "add", "pid"}
+        first = await manager.call_mcp_tool("pid", {})
+        second = await manager.call_mcp_tool("pid", {})
+        assert first == second
+        assert manager.session_pool is not None
+        assert manager.session_pool.sessions_started == 1
+    finally:
+        await manager.cleanup()
+
+    assert manager.session_pool is None
+    assert not process_exists(int(first))
@@ -0,0 +1,265 @@
+"""MCP 도구 결과 캐시 테스트 - 인자 정규화, 정책, LRU 한도, 무효화, 지표"""
+
+import unicodedata
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+import pytest
+from langchain_core.tools import StructuredTool
+from pydantic import BaseModel
+
+from application.llm.mcp.mcp_tool_manager import MCPToolManager
+from application.llm.mcp.tool_result_cache import (
+    CACHE_NEVER,
+    CACHE_SESSION,
+    CACHE_TTL,
+    ToolCachePolicy,
+    ToolResultCache,
+    canonicalize_arguments,
+    is_write_tool,
+)
+
+SESSION = ToolCachePolicy(CACHE_SESSION)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# ----------------------------------------------------------------------
+# 인자 정규화
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "left, right",
+    [
+        ({"a": 1, "b": 2}, {"b": 2, "a": 1}),
+        ({"limit": 10}, {"limit": 10.0}),
+        ({"q": "x", "lang": None}, {"q": "x"}),
+        ({"city": unicodedata.normalize("NFD", "서울")}, {"city": "서울"}),
+        ({"tags": {"b", "a"}}, {"tags": {"a", "b"}}),
+        ({"filter": {"z": [1, {"y": 2, "x": 1}]}}, {"filter": {"z": (1, {"x": 1, "y": 2.0})}}),
+        (None, {}),
+    ],
+)
+def test_equivalent_arguments_share_a_key(left: Any, right: Any) -> None:
+    assert canonicalize_arguments(left) == canonicalize_arguments(right)
+
+
+@pytest.mark.parametrize(
+    "left, right",
+    [
+        ({"q": "a"}, {"q": "A"}),
+        ({"path": [1, 2]}, {"path": [2, 1]}),  # 리스트 순서는 의미가 있다
+        ({"flag": True}, {"flag": 1}),
+        ({"limit": 1.5}, {"limit": 1}),
+        ({"q": ""}, {}),
+    ],
+)
+def test_different_arguments_get_different_keys(left: Any, right: Any) -> None:
+    assert canonicalize_arguments(left) != canonicalize_arguments(right)
+
+
+# ----------------------------------------------------------------------
+# 정책
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("never", ToolCachePolicy(CACHE_NEVER)),
+        ("Session", ToolCachePolicy(CACHE_SESSION)),
+        (60, ToolCachePolicy(CACHE_TTL, 60.0)),
+        ({"ttl": 5}, ToolCachePolicy(CACHE_TTL, 5.0)),
+        ({"policy": "ttl", "ttl": "2.5"}, ToolCachePolicy(CACHE_TTL, 2.5)),
+        ({"policy": "session"}, ToolCachePolicy(CACHE_SESSION)),
+    ],
+)
+def test_policy_parsing(value: Any, expected: ToolCachePolicy) -> None:
+    assert ToolCachePolicy.parse(value) == expected
+
+
+@pytest.mark.parametrize("value", ["forever", 0, {"policy": "ttl"}, True, ["session"]])
+def test_invalid_policy_is_rejected(value: Any) -> None:
+    with pytest.raises((TypeError, ValueError)):
+        ToolCachePolicy.parse(value)
+
+
+@pytest.mark.parametrize(
+    "name, hints, expected",
+    [
+        ("write_file", None, True),
+        ("applyPatch", None, True),
+        ("kill_process", None, True),
+        ("read_file", None, False),
+        ("get_current_time", None, False),
+        ("list_directory", None, False),
+        ("frobnicate", {"destructiveHint": True}, True),
+        ("frobnicate", {"readOnlyHint": False}, True),
+        ("set_title", {"readOnlyHint": True}, False),  # 서버가 읽기 전용이라고 알린 도구
+    ],
+)
+def test_write_tool_detection(name: str, hints: Optional[Dict[str, Any]], expected: bool) -> None:
+    assert is_write_tool(name, hints) is expected
+
+
+def test_server_default_policy_skips_write_tools() -> None:
+    cache = ToolResultCache()
+    cache.configure("fs", {"*": "session", "write_file": 30, "bad": "forever"})
+
+    assert cache.policy_for("fs", "read_file") == SESSION
+    assert cache.policy_for("fs", "delete_file").mode == CACHE_NEVER
+    assert cache.policy_for("fs", "write_file") == ToolCachePolicy(CACHE_TTL, 30.0)  # 명시적 선언
+    assert cache.policy_for("fs", "bad").mode == CACHE_SESSION  # 잘못된 항목은 무시
+    assert cache.policy_for("other", "read_file").mode == CACHE_NEVER
+
+
+# ----------------------------------------------------------------------
+# 저장 / 만료 / 한도
+# ----------------------------------------------------------------------
+def test_ttl_entries_expire() -> None:
+    clock = FakeClock()
+    cache = ToolResultCache(clock=clock)
+    cache.put("s", "time", {}, "12:00", ToolCachePolicy(CACHE_TTL, 10))
+    cache.put("s", "info", {}, "v1", SESSION)
+
+    clock.now += 9.9
+    assert cache.get("s", "time", {}) == "12:00"
+    clock.now += 0.2
+    assert cache.get("s", "time", {}) is None
+    assert cache.get("s", "info", {}) == "v1"  # session 정책은 시간으로 만료되지 않는다
+    assert cache.get_stats()["expirations"] == 1
+
+
+def test_lru_entry_bound() -> None:
+    cache = ToolResultCache(max_entries=2)
+    cache.put("s", "t", {"n": 1}, "one", SESSION)
+    cache.put("s", "t", {"n": 2}, "two", SESSION)
+    assert cache.get("s", "t", {"n": 1}) == "one"  # 최근 사용으로 갱신
+    cache.put("s", "t", {"n": 3}, "three", SESSION)
+
+    assert cache.get("s", "t", {"n": 2}) is None
+    assert cache.get("s", "t", {"n": 1}) == "one"
+    assert len(cache) == 2
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_lru_byte_bound() -> None:
+    cache = ToolResultCache(max_bytes=10)
+    assert cache.put("s", "t", {"n": 1}, "가나", SESSION)  # 6 bytes
+    assert cache.put("s", "t", {"n": 2}, "abcd", SESSION)
+    assert cache.total_bytes == 10
+    assert cache.put("s", "t", {"n": 3}, "x", SESSION)
+
+    assert cache.get("s", "t", {"n": 1}) is None
+    assert cache.total_bytes == 5
+    assert not cache.put("s", "t", {"n": 4}, "x" * 11, SESSION)  # 한도보다 큰 결과
+    assert not cache.put("s", "t", {"n": 5}, "x", ToolCachePolicy(CACHE_NEVER))
+
+
+def test_invalidation_scopes() -> None:
+    cache = ToolResultCache()
+    for server in ("a", "b"):
+        for tool in ("x", "y"):
+            cache.put(server, tool, {}, f"{server}{tool}", SESSION)
+
+    assert cache.invalidate("a", "x") == 1
+    assert cache.invalidate("a") == 1
+    assert cache.get("b", "x", {}) == "bx"
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.total_bytes == 0
+
+
+# ----------------------------------------------------------------------
+# MCPToolManager.call_mcp_tool 통합
+# ----------------------------------------------------------------------
+class QueryArgs(BaseModel):
+    query: str = ""
+
+
+def counting_tool(
+    name: str, calls: List[str], fail: bool = False, hints: Optional[Dict[str, Any]] = None
+) -> StructuredTool:
+    async def run(query: str = "") -> str:
+        calls.append(name)
+        if fail:
+            raise RuntimeError("실패")
+        return f"{name}:{query}:{len(calls)}"
+
+    return StructuredTool.from_function(
+        coroutine=run, name=name, description=name, args_schema=QueryArgs, metadata=hints
+    )
+
+
+@pytest.fixture
+def calls() -> List[str]:
+    return []
+
+
+@pytest.fixture
+def manager(calls: List[str]) -> MCPToolManager:
+    manager = MCPToolManager(SimpleNamespace(), config_manager=None)  # type: ignore[arg-type]
+    tools = [
+        counting_tool("search", calls),
+        counting_tool("get_time", calls),
+        counting_tool("write_file", calls),
+        counting_tool("frobnicate", calls, hints={"readOnlyHint": False}),
+        counting_tool("flaky", calls, fail=True),
+    ]
+    manager._publish_tools(tools, {tool.name: "fs" for tool in tools})
+    manager.result_cache.configure("fs", {"*": "session", "get_time": "never"})
+    return manager
+
+
+async def test_repeated_read_only_calls_hit_cache(
+    manager: MCPToolManager, calls: List[str]
+) -> None:
+    first = await manager.call_mcp_tool("search", {"query": "날씨"})
+    assert await manager.call_mcp_tool("search", {"query": "날씨"}) == first
+    await manager.call_mcp_tool("get_time", {})
+    await manager.call_mcp_tool("get_time", {})
+
+    assert calls == ["search", "get_time", "get_time"]
+    stats = manager.result_cache.get_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert stats["per_tool"]["fs/search"] == {"hits": 1, "misses": 1, "bypasses": 0}
+
+
+async def test_bypass_refreshes_cached_result(manager: MCPToolManager, calls: List[str]) -> None:
+    first = await manager.call_mcp_tool("search", {"query": "q"})
+    fresh = await manager.call_mcp_tool("search", {"query": "q"}, use_cache=False)
+
+    assert fresh != first
+    assert await manager.call_mcp_tool("search", {"query": "q"}) == fresh
+    assert manager.result_cache.get_stats()["bypasses"] == 1
+
+
+async def test_write_tools_are_not_cached_and_invalidate_server(
+    manager: MCPToolManager, calls: List[str]
+) -> None:
+    await manager.call_mcp_tool("search", {"query": "q"})
+    await manager.call_mcp_tool("write_file", {"query": "data"})
+    await manager.call_mcp_tool("write_file", {"query": "data"})
+    await manager.call_mcp_tool("frobnicate", {})
+    await manager.call_mcp_tool("search", {"query": "q"})
+
+    assert calls == ["search", "write_file", "write_file", "frobnicate", "search"]
+
+
+async def test_failed_calls_are_not_cached(manager: MCPToolManager, calls: List[str]) -> None:
+    assert "실패" in await manager.call_mcp_tool("flaky", {})
+    assert "실패" in await manager.call_mcp_tool("flaky", {})
+
+    assert calls == ["flaky", "flaky"]
+    assert len(manager.result_cache) == 0
+
+
+async def test_cleanup_clears_cache(manager: MCPToolManager) -> None:
+    await manager.call_mcp_tool("search", {"query": "q"})
+    assert len(manager.result_cache) == 1
+
+    await manager.cleanup()
+    assert len(manager.result_cache) == 0
@@ -0,0 +1,220 @@
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from application.util.event_coalescer import REF_PATHS, EventCoalescer, coalesce_key
+from application.util.webhook_client import WebhookClient
+from webhook.payloads import ACTIONS_MAP, generate_payload
+from webhook.projection import project_payload
+
+SHA = "a1b2c3d"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def ci_event(seq: int, event_type: str, name: str, state: str, sha: str = SHA) -> Dict[str, Any]:
+    if event_type == "status":
+        payload: Dict[str, Any] = {"sha": sha, "context": name, "state": state}
+    else:
+        payload = {event_type: {"head_sha": sha, "name": name, "conclusion": state}}
+    return {
+        "sequence_id": seq,
+        "event_type": event_type,
+        "repo_name": "acme/api",
+        "payload": payload,
+    }
+
+
+def recorded_burst() -> List[Tuple[float, Dict[str, Any]]]:
+    """push 한 번 뒤에 같은 커밋의 CI 상태 이벤트가 몰려오는 실제 흐름 (시각, 메시지)"""
+    burst: List[Tuple[float, Dict[str, Any]]] = [
+        (0.0, {"sequence_id": 1, "event_type": "push", "repo_name": "acme/api", "payload": {}})
+    ]
+    seq = 2
+    for i, name in enumerate(("lint", "unit", "e2e", "build")):
+        burst.append((0.2 + i * 0.1, ci_event(seq, "check_run", name, "in_progress")))
+        seq += 1
+    for i, (name, state) in enumerate(
+        (("lint", "success"), ("unit", "success"), ("build", "success"), ("e2e", "failure"))
+    ):
+        burst.append((1.0 + i * 0.5, ci_event(seq, "check_run", name, state)))
+        seq += 1
+    burst.append((2.8, ci_event(seq, "workflow_run", "CI", "failure")))
+    burst.append((2.9, ci_event(seq + 1, "status", "ci/deploy", "pending")))
+    burst.append((3.0, ci_event(seq + 2, "status", "ci/deploy", "success")))
+    return burst
+
+
+def replay(coalescer: EventCoalescer, clock: FakeClock, until: float) -> List[Dict[str, Any]]:
+    passthrough: List[Dict[str, Any]] = []
+    for at, message in recorded_burst():
+        clock.now = at
+        coalescer.flush_due()
+        passthrough.extend(coalescer.add([message]))
+    clock.now = until
+    coalescer.flush_due()
+    return passthrough
+
+
+def test_recorded_burst_is_coalesced_per_group() -> None:
+    clock = FakeClock()
+    emitted: List[Dict[str, Any]] = []
+    coalescer = EventCoalescer(emitted.append, window=3.0, clock=clock)
+
+    passthrough = replay(coalescer, clock, until=5.0)
+    assert [m["event_type"] for m in passthrough] == ["push"]
+    assert emitted == []  # 마지막 이벤트로부터 창(3초)이 아직 닫히지 않았다
+
+    clock.now = 6.0
+    assert coalescer.flush_due() == float("inf")
+    by_type = {m["event_type"]: m for m in emitted}
+    assert sorted(by_type) == ["check_run", "status", "workflow_run"]
+
+    check_run = by_type["check_run"]
+    assert check_run["sequence_id"] == 9  # 최신 상태의 메시지
+    assert check_run["coalesced"] == {
+        "count": 8,
+        "runs": {"lint": "success", "unit": "success", "e2e": "failure", "build": "success"},
+        "sequence_ids": [2, 3, 4, 5, 6, 7, 8, 9],
+    }
+    assert by_type["status"]["coalesced"]["runs"] == {"ci/deploy": "success"}
+    assert "coalesced" not in by_type["workflow_run"]  # 한 건뿐이면 그대로 전달
+    assert coalescer.pending_groups == 0
+
+
+def test_slim_projected_ci_payloads_are_coalesced() -> None:
+    """서버가 slim 프로필로 줄인 payload 에도 묶음 키와 실행 상태가 남아 있어야 한다"""
+    emitted: List[Dict[str, Any]] = []
+    coalescer = EventCoalescer(emitted.append, clock=FakeClock())
+    messages = []
+    for event_type in REF_PATHS:
+        for action in ACTIONS_MAP[event_type]:
+            full = generate_payload(event_type, action, "acme", "api", pr_number=7)
+            message = {
+                "sequence_id": len(messages) + 1,
+                "event_type": event_type,
+                "repo_name": "acme/api",
+                "payload": project_payload(full, event_type, "slim"),
+            }
+            assert coalesce_key(message) == ("acme/api", event_type, "abc123def456")
+            messages.append(message)
+
+    assert coalescer.add(messages) == []
+    coalescer.flush_all()
+
+    by_type = {m["event_type"]: m["coalesced"] for m in emitted}
+    assert sorted(by_type) == sorted(REF_PATHS)
+    for event_type, coalesced in by_type.items():
+        assert coalesced["count"] == len(ACTIONS_MAP[event_type])
+    assert by_type["status"]["runs"] == {"ci/deploy": "failure"}
+    assert by_type["check_suite"]["runs"] == {"GitHub Actions": "success"}
+    assert by_type["workflow_job"]["runs"] == {"build": "success"}
+
+
+def test_coalesce_key_falls_back_to_pull_request_number() -> None:
+    payload = generate_payload("workflow_run", "completed", "acme", "api", pr_number=7)
+    del payload["workflow_run"]["head_sha"]
+    message = {"event_type": "workflow_run", "repo_name": "acme/api", "payload": payload}
+    assert coalesce_key(message) == ("acme/api", "workflow_run", 7)
+    payload["workflow_run"]["pull_requests"] = []
+    assert coalesce_key(message) is None
+
+
+def test_max_hold_caps_latency_of_a_long_burst() -> None:
+    clock = FakeClock()
+    emitted: List[Dict[str, Any]] = []
+    coalescer = EventCoalescer(emitted.append, window=3.0, max_hold=5.0, clock=clock)
+
+    for seq in range(20):  # 1초마다 와서 창은 계속 연장되지만 최대 대기 시간은 넘지 않는다
+        clock.now = float(seq)
+        coalescer.flush_due()
+        coalescer.add([ci_event(seq, "check_run", f"job{seq}", "success")])
+        if emitted:
+            break
+
+    assert clock.now == 5.0
+    assert emitted[0]["coalesced"]["count"] == 5
+
+
+def test_group_count_is_bounded() -> None:
+    clock = FakeClock()
+    emitted: List[Dict[str, Any]] = []
+    coalescer = EventCoalescer(emitted.append, max_groups=3, clock=clock)
+
+    coalescer.add([ci_event(i, "check_run", "unit", "success", sha=f"sha{i}") for i in range(5)])
+
+    assert coalescer.pending_groups == 3
+    assert [coalesce_key(m)[2] for m in emitted] == ["sha0", "sha1"]  # type: ignore[index]
+    coalescer.flush_all()
+    assert len(emitted) == 5
+
+
+def test_timer_thread_emits_and_stop_flushes() -> None:
+    emitted: List[Dict[str, Any]] = []
+    done = threading.Event()
+
+    def emit(message: Dict[str, Any]) -> None:
+        emitted.append(message)
+        done.set()
+
+    coalescer = EventCoalescer(emit, window=0.1)
+    coalescer.start()
+    try:
+        coalescer.add([ci_event(i, "check_run", "unit", "success") for i in range(3)])
+        assert done.wait(2)
+        assert emitted[0]["coalesced"]["count"] == 3
+
+        coalescer.window = coalescer.max_hold = 60.0
+        coalescer.add([ci_event(10, "status", "ci/deploy", "pending")])
+    finally:
+        coalescer.stop()
+    assert [m["sequence_id"] for m in emitted] == [2, 10]
+
+
+def test_webhook_client_sends_one_notification_per_ci_burst(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = WebhookClient("http://127.0.0.1:9", "coalesce", coalesce_window=0.2)
+    sent: List[Dict[str, Any]] = []
+    acked: List[int] = []
+    monkeypatch.setattr(client, "send_notification_to_self", lambda m: sent.append(m) or True)
+    monkeypatch.setattr(client, "ack_sequence", lambda seq: acked.append(seq) or True)
+
+    try:
+        for _, message in recorded_burst():
+            client._handle_polled_messages([message], first_poll=False)
+        deadline = time.time() + 3
+        while len(sent) < 4 and time.time() < deadline:
+            time.sleep(0.02)
+    finally:
+        client.coalescer.stop()
+
+    assert [m["event_type"] for m in sent][0] == "push"
+    assert sorted(m["event_type"] for m in sent[1:]) == ["check_run", "status", "workflow_run"]
+    assert acked[-1] == recorded_burst()[-1][1]["sequence_id"]
+
+
+def test_webhook_client_acks_held_ci_events_after_summary(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client = WebhookClient("http://127.0.0.1:9", "coalesce", coalesce_window=60.0)
+    acked: List[int] = []
+    monkeypatch.setattr(client, "send_notification_to_self", lambda m: True)
+    monkeypatch.setattr(client, "ack_sequence", lambda seq: acked.append(seq) or True)
+
+    try:
+        for _, message in recorded_burst():
+            client._handle_polled_messages([message], first_poll=False)
+        # push 만 전달되었고 CI 이벤트는 묶음기에 보관 중이라 그 앞까지만 ack
+        assert acked == [1]
+    finally:
+        client.coalescer.stop()  # 보관 중인 묶음을 내보낸다
+    assert acked[-1] == recorded_burst()[-1][1]["sequence_id"]
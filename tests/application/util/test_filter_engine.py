@@ -1,4 +1,6 @@
 import json
+import random
+import time
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
@@ -68,4 +70,233 @@ def test_show_system_only(fresh_config: ConfigManager) -> None:
     engine = FilterEngine(fresh_config)
 
     result: Tuple[bool, bool] = engine.should_show_notification(make_push_message(3))
-    assert result == (True, False) 
\ No newline at end of file
+    assert result == (True, False)
+
+
+class StaticConfig:
+    """파일 감시 없이 notification_settings 와 설정 버전만 제공하는 ConfigManager 대역"""
+
+    def __init__(self, settings: Any = "{}") -> None:
+        self.config_version = 0
+        self.reads = 0
+        self.set(settings)
+
+    def set(self, settings: Any) -> None:
+        self.settings_json = settings if isinstance(settings, str) else json.dumps(settings)
+        self.config_version += 1
+
+    def get_config_value(self, section: str, key: str, fallback: str = "") -> str:
+        self.reads += 1
+        return self.settings_json
+
+
+def test_rules_recompile_only_when_config_version_changes() -> None:
+    config = StaticConfig()
+    engine = FilterEngine(config)  # type: ignore[arg-type]
+    assert engine.filter_many([make_push_message()] * 100) == [(True, True)] * 100
+    rules = engine.rules
+    assert engine.rules is rules  # 버전이 같으면 컴파일된 테이블 재사용
+    assert config.reads == 1
+
+    config.set({"enabled": False})
+    assert engine.rules is not rules
+    assert engine.should_show_notification(make_push_message()) == (False, False)
+    assert config.reads == 2
+
+
+def test_config_manager_bumps_version_on_change(fresh_config: ConfigManager) -> None:
+    version = fresh_config.config_version
+    fresh_config.set_config_value("GITHUB", "notification_settings", "{}")
+    assert fresh_config.config_version > version
+
+    # 파일 변경 감지 콜백도 버전을 올린다
+    version = fresh_config.config_version
+    fresh_config._on_app_config_changed(str(fresh_config.config_file), "modified")
+    assert fresh_config.config_version > version
+
+
+# ----------------------------------------------------------------------
+# 기존 (메시지마다 JSON 을 파싱하던) 구현과의 동치성 / 성능 비교
+# ----------------------------------------------------------------------
+
+
+def legacy_should_show(settings_json: str, message: Dict[str, Any]) -> Tuple[bool, bool]:
+    """컴파일 도입 전 FilterEngine.should_show_notification 의 판정 로직"""
+    try:
+        try:
+            settings: Dict[str, Any] = json.loads(settings_json)
+        except json.JSONDecodeError:
+            return True, True
+        if not settings.get("enabled", True):
+            return False, False
+
+        event_type = message.get("event_type", "")
+        payload: Dict[str, Any] = message.get("payload", {})
+        action = payload.get("action", "")
+        event_key = {
+            "push": "push",
+            "pull_request": "pull_request",
+            "issues": "issues",
+            "release": "release",
+            "workflow_run": "workflow",
+            "workflow_job": "workflow",
+            "check_run": "workflow",
+            "check_suite": "workflow",
+            "star": "repository",
+            "fork": "repository",
+            "watch": "repository",
+            "create": "repository",
+            "delete": "repository",
+        }.get(event_type)
+
+        events_settings: Dict[str, Any] = settings.get("events", {})
+        if event_key is None or event_key not in events_settings:
+            return True, True
+        event_config: Dict[str, Any] = events_settings[event_key]
+        if not event_config.get("enabled", True):
+            return False, False
+        if event_config.get("actions") and action:
+            if not event_config["actions"].get(action, False):
+                return False, False
+
+        try:
+            if event_key == "push":
+                commit_count = len(payload.get("commits", []))
+                if commit_count < event_config.get("min_commits", 1) or commit_count > event_config.get(
+                    "max_commits", 50
+                ):
+                    return False, False
+                ref = payload.get("ref", "")
+                branch = ref.replace("refs/heads/", "") if ref.startswith("refs/heads/") else ref
+                if (exclude := event_config.get("exclude_branches")) and branch in exclude:
+                    return False, False
+                if (include := event_config.get("include_branches")) and branch not in include:
+                    return False, False
+            elif event_key == "release":
+                release = payload.get("release", {})
+                if release.get("prerelease", False) and not event_config.get(
+                    "include_prerelease", True
+                ):
+                    return False, False
+                if release.get("draft", False) and not event_config.get("include_draft", False):
+                    return False, False
+            elif event_key == "workflow":
+                workflow_run = (
+                    payload.get("workflow_run", {})
+                    or payload.get("workflow_job", {})
+                    or payload.get("check_run", {})
+                    or payload.get("check_suite", {})
+                )
+                actions = event_config.get("actions", {})
+                status = workflow_run.get("status", "")
+                conclusion = workflow_run.get("conclusion", "")
+                if status and not actions.get(status, False):
+                    return False, False
+                if conclusion and not actions.get(conclusion, False):
+                    return False, False
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+        return (
+            event_config.get("show_system_notification", True),
+            event_config.get("show_chat_bubble", True),
+        )
+    except Exception:  # pylint: disable=broad-except
+        return True, True
+
+
+EVENT_TYPES = [
+    "push", "pull_request", "issues", "release", "workflow_run", "workflow_job",
+    "check_run", "check_suite", "star", "fork", "create", "delete", "gollum",
+]
+ACTIONS = ["", "opened", "closed", "synchronize", "published", "completed", "requested", "created"]
+BRANCHES = ["main", "develop", "feature/x", "release/1.0"]
+STATES = ["", "queued", "in_progress", "completed", "success", "failure", "cancelled"]
+
+
+def random_settings(rng: random.Random) -> Dict[str, Any]:
+    events: Dict[str, Any] = {}
+    for key in ("push", "pull_request", "issues", "release", "workflow", "repository"):
+        if rng.random() < 0.2:
+            continue
+        config: Dict[str, Any] = {
+            "enabled": rng.random() < 0.85,
+            "show_system_notification": rng.random() < 0.7,
+            "show_chat_bubble": rng.random() < 0.7,
+        }
+        if rng.random() < 0.6:
+            config["actions"] = {name: rng.random() < 0.6 for name in ACTIONS[1:] + STATES[1:]}
+        if key == "push":
+            config["min_commits"] = rng.randint(0, 3)
+            config["max_commits"] = rng.randint(3, 40)
+            config["exclude_branches"] = rng.sample(BRANCHES, rng.randint(0, 2))
+            config["include_branches"] = rng.sample(BRANCHES, rng.randint(0, 3))
+        if key == "release":
+            config["include_prerelease"] = rng.random() < 0.5
+            config["include_draft"] = rng.random() < 0.5
+        events[key] = config
+    return {"enabled": rng.random() < 0.95, "events": events}
+
+
+def random_message(rng: random.Random) -> Dict[str, Any]:
+    event_type = rng.choice(EVENT_TYPES)
+    payload: Dict[str, Any] = {"action": rng.choice(ACTIONS)}
+    if event_type == "push":
+        payload["commits"] = [{}] * rng.randint(0, 45)
+        payload["ref"] = rng.choice(["refs/heads/", "refs/tags/"]) + rng.choice(BRANCHES)
+    elif event_type == "release":
+        payload["release"] = {"prerelease": rng.random() < 0.5, "draft": rng.random() < 0.3}
+    elif event_type in ("workflow_run", "workflow_job", "check_run", "check_suite"):
+        payload[event_type] = {"status": rng.choice(STATES), "conclusion": rng.choice(STATES)}
+    return {"event_type": event_type, "payload": payload}
+
+
+def test_compiled_rules_match_legacy_implementation() -> None:
+    rng = random.Random(2024)
+    config = StaticConfig()
+    engine = FilterEngine(config)  # type: ignore[arg-type]
+
+    for _ in range(40):
+        settings_json = json.dumps(random_settings(rng))
+        config.set(settings_json)
+        messages = [random_message(rng) for _ in range(300)]
+        expected = [legacy_should_show(settings_json, message) for message in messages]
+        assert engine.filter_many(messages) == expected
+        assert [engine.should_show_notification(m) for m in messages[:50]] == expected[:50]
+
+    for broken in ("not json", "[]", '{"events": {"push": "on"}}'):
+        config.set(broken)
+        message = make_push_message()
+        assert engine.should_show_notification(message) == legacy_should_show(broken, message)
+
+
+def test_benchmark_filter_50k_events() -> None:
+    rng = random.Random(7)
+    config = StaticConfig(random_settings(rng))
+    messages = [random_message(rng) for _ in range(50_000)]
+    engine = FilterEngine(config)  # type: ignore[arg-type]
+    assert engine.rules  # 첫 컴파일은 측정에서 제외
+
+    started = time.perf_counter()
+    legacy = [
+        legacy_should_show(
+            config.get_config_value("GITHUB", "notification_settings", "{}") or "{}", message
+        )
+        for message in messages
+    ]
+    legacy_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    single = [engine.should_show_notification(message) for message in messages]
+    single_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batched = engine.filter_many(messages)
+    batched_elapsed = time.perf_counter() - started
+
+    print(
+        f"\n[filter 50k] legacy={legacy_elapsed * 1000:.0f}ms "
+        f"should_show={single_elapsed * 1000:.0f}ms filter_many={batched_elapsed * 1000:.0f}ms"
+    )
+    assert legacy == single == batched
+    assert batched_elapsed * 5 < legacy_elapsed
@@ -1,4 +1,17 @@
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+import pytest
+
 from application.util.friendly_message_builder import build_friendly_message
+from application.util.message_builders import EVENT_TEMPLATES
+from webhook.payloads import ACTIONS_MAP, generate_payload
+
+# golden_corpus() 순서대로 기존 if/elif 구현이 만든 제목/내용 후보 (0~3번째 선택)
+RECORDED_MESSAGES = Path(__file__).with_name("friendly_messages.json")
 
 
 def test_push_builder() -> None:
@@ -19,4 +32,201 @@ def test_fallback_builder() -> None:
     message = {"event_type": "star", "payload": {"sender": {"login": "me"}}}
     title, content = build_friendly_message(message)
     # fallback still returns strings
-    assert isinstance(title, str) and isinstance(content, str) and title 
\ No newline at end of file
+    assert isinstance(title, str) and isinstance(content, str) and title
+
+
+LONG_TEXT = "긴 본문입니다.\r\n" * 30
+USER = {"login": "octo"}
+
+
+def simulator_messages() -> List[Dict[str, Any]]:
+    """시뮬레이터 payload 생성기로 만든 이벤트/액션 조합"""
+    messages = []
+    for event_type, actions in ACTIONS_MAP.items():
+        for action in actions:
+            for org in ("acme", ""):
+                payload = generate_payload(event_type, action, org, "api", pr_number=7)
+                messages.append(
+                    {
+                        "event_type": event_type,
+                        "org_name": org,
+                        "repo_name": f"{org}/api" if org else "api",
+                        "payload": payload,
+                        "timestamp": "2024-01-01T00:00:00Z" if org else "",
+                    }
+                )
+    return messages
+
+
+def event(event_type: str, **payload: Any) -> Dict[str, Any]:
+    return {"event_type": event_type, "repo_name": "acme/api", "payload": payload}
+
+
+PR = {
+    "title": "기능",
+    "number": 9,
+    "user": {"login": "lee"},
+    "base": {"ref": "main"},
+    "head": {"ref": "feat"},
+    "additions": 10,
+    "deletions": 2,
+    "changed_files": 3,
+}
+
+
+def synthetic_messages() -> List[Dict[str, Any]]:
+    """시뮬레이터가 만들지 않는 이벤트와 분기 (빈 값, 긴 본문, 누락 필드 포함)"""
+    issue = {
+        "title": "버그",
+        "number": 3,
+        "body": LONG_TEXT,
+        "user": USER,
+        "labels": [{"name": "bug"}, {"name": "p1"}],
+        "assignees": [{"login": "kim"}],
+    }
+    comment = {
+        "body": "여기\r\n수정",
+        "user": USER,
+        "path": "src/app/main.py",
+        "line": 12,
+        "position": 4,
+        "commit_id": "abcdef1234",
+        "html_url": "c",
+    }
+    milestone = {
+        "title": "v1",
+        "number": 1,
+        "description": LONG_TEXT,
+        "due_on": "2024-12-31",
+        "open_issues": 3,
+        "closed_issues": 1,
+    }
+    pages = [
+        {"title": f"p{i}", "action": action, "html_url": "w"}
+        for i, action in enumerate(("edited", "created", "renamed", "edited"))
+    ]
+    return [
+        event("issues", action="opened", issue=issue),
+        event("issues", action="closed", sender=USER, issue=issue),
+        event("issues", action="labeled", label={"name": "bug"}, issue=issue),
+        event("issues", action="unassigned", assignee={"login": "kim"}, issue=issue),
+        event("issues", action="milestoned", milestone={"title": "v1"}, issue={}),
+        event("issues", action="demilestoned", milestone=None),
+        event(
+            "pull_request_review",
+            action="submitted",
+            review={"state": "changes_requested", "body": LONG_TEXT, "user": USER},
+            pull_request=PR,
+        ),
+        event("pull_request_review", review={"state": "commented", "html_url": "u"}),
+        event("pull_request_review_comment", action="created", comment=comment, pull_request=PR),
+        event("pull_request_review_comment", comment={"path": "a.py", "original_line": 5}),
+        event(
+            "release",
+            action="published",
+            release={
+                "tag_name": "v1.0",
+                "name": "첫 릴리즈",
+                "body": LONG_TEXT,
+                "prerelease": True,
+                "author": USER,
+            },
+        ),
+        event("release", release={"tag_name": "v2"}),
+        event("star", action="created", sender=USER, repository={"stargazers_count": 42}),
+        event("fork", forkee={"full_name": "octo/api"}, repository={"forks_count": 5}),
+        event("fork"),
+        event("watch", action="started", repository={"watchers_count": 8}),
+        event(
+            "issue_comment",
+            action="created",
+            comment={"body": LONG_TEXT, "user": USER, "html_url": "c"},
+            issue={**issue, "pull_request": {}, "state": "open"},
+        ),
+        event("issue_comment", issue={"title": "이슈"}),
+        event("create", ref="feat", ref_type="branch", master_branch="main", sender=USER),
+        event("create", ref="v1", ref_type="tag"),
+        event("create", ref="x", ref_type=""),
+        event("delete", ref="feat", ref_type="branch"),
+        event("delete", ref="v1", ref_type="tag"),
+        event("delete", ref="x", ref_type="other"),
+        event("commit_comment", action="created", comment=comment),
+        event("commit_comment", comment={}),
+        event("gollum", pages=pages),
+        event("gollum", pages=[]),
+        *(
+            event("milestone", action=action, milestone=milestone)
+            for action in ("created", "closed", "opened", "edited", "")
+        ),
+        event("milestone", milestone={"title": "빈 마일스톤"}),
+        event(
+            "check_run",
+            action="completed",
+            check_run={"name": "lint", "status": "completed", "conclusion": "failure"},
+        ),
+        event("check_run", check_run={"status": "in_progress", "html_url": "h"}),
+        event("check_suite", check_suite={"conclusion": "success"}),
+        event("check_suite"),
+        event("workflow_run", workflow_run={"status": "queued"}),
+        event("ping", zen="Keep it simple", hook_id=1),
+        event("deployment", action="created", id=5, name="prod", state="", url="d"),
+        {"payload": {}},
+    ]
+
+
+def golden_corpus() -> List[Dict[str, Any]]:
+    return [
+        message
+        for message in simulator_messages() + synthetic_messages()
+        if message.get("event_type") not in ("push", "pull_request")  # 전용 빌더
+    ]
+
+
+def choose_by_index(*indices: int) -> Callable[[Sequence[Any]], Any]:
+    """random.choice 대체: 호출 순서대로 주어진 번호의 후보를 고른다."""
+    order = iter(indices)
+    return lambda seq: seq[min(next(order), len(seq) - 1)]
+
+
+def test_templates_cover_every_legacy_event_type() -> None:
+    legacy_types = set(
+        "issues pull_request_review pull_request_review_comment release star fork watch "
+        "issue_comment create delete commit_comment gollum milestone workflow_run "
+        "workflow_job check_run check_suite".split()
+    )
+    assert set(EVENT_TEMPLATES) == legacy_types
+    assert legacy_types <= {m.get("event_type") for m in golden_corpus()}
+
+
+@pytest.mark.parametrize("title_index,message_index", [(i, i) for i in range(4)] + [(0, 3)])
+def test_templates_match_recorded_messages(
+    monkeypatch: pytest.MonkeyPatch, title_index: int, message_index: int
+) -> None:
+    corpus = golden_corpus()
+    recorded = json.loads(RECORDED_MESSAGES.read_text(encoding="utf-8"))
+    assert len(recorded) == len(corpus)
+    for message, expected in zip(corpus, recorded):
+        assert message.get("event_type") == expected["event_type"]
+        monkeypatch.setattr(random, "choice", choose_by_index(title_index, message_index))
+        assert build_friendly_message(message) == (
+            expected["titles"][title_index],
+            expected["messages"][message_index],
+        ), message
+
+
+def test_benchmark_mixed_simulator_corpus() -> None:
+    corpus = simulator_messages()
+    messages = [corpus[i % len(corpus)] for i in range(20000)]
+
+    def best_of_three(render: Callable[[Dict[str, Any]], Any]) -> float:
+        timings = []
+        for _ in range(3):
+            started = time.perf_counter()
+            for message in messages:
+                render(message)
+            timings.append(time.perf_counter() - started)
+        return min(timings)
+
+    compiled = best_of_three(build_friendly_message)
+    print(f"\n[message builders] n={len(messages)} templates={compiled * 1000:.1f}ms")
+    assert all(title for title, _ in map(build_friendly_message, corpus))
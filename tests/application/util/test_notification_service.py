@@ -0,0 +1,215 @@
+import socket
+import threading
+import time
+from typing import Any, Dict, Generator, List, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+import uvicorn
+
+from application.api.api_server import APIServer
+from application.util.notification_service import NotificationService
+from application.util.webhook_client import WebhookClient
+
+
+class _StubSignals:
+    def __init__(self) -> None:
+        self.shown: List[Tuple[Any, ...]] = []
+
+    def __getattr__(self, item: str) -> Any:
+        signal = MagicMock()
+        if item == "show_notification":
+            signal.emit.side_effect = lambda *args: self.shown.append(args)
+        setattr(self, item, signal)
+        return signal
+
+
+@pytest.fixture()
+def api_server() -> Generator[Tuple[str, _StubSignals], None, None]:
+    """uvicorn 으로 API 서버를 띄우고 (base URL, 시그널 스텁) 을 반환한다."""
+    signals = _StubSignals()
+    server_app = APIServer(MagicMock(), MagicMock(), signals)  # type: ignore[arg-type]
+    server_app.register_endpoints()
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = uvicorn.Server(
+        uvicorn.Config(server_app.api_app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.time() + 10
+    while not server.started and time.time() < deadline:
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}", signals
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+
+
+def counting_session() -> Tuple[requests.Session, List[str]]:
+    session = requests.Session()
+    paths: List[str] = []
+    session.hooks["response"].append(
+        lambda response, *args, **kwargs: paths.append(response.request.path_url)
+    )
+    return session, paths
+
+
+def test_batched_notifications_are_delivered_in_order(
+    api_server: Tuple[str, _StubSignals],
+) -> None:
+    base_url, signals = api_server
+    session, paths = counting_session()
+    service = NotificationService(session, base_url, max_batch=50)
+
+    for i in range(120):
+        assert service.send_info(f"title {i}", f"message {i}", batched=True)
+    assert service.flush(timeout=10)
+    service.close()
+
+    assert [args[1] for args in signals.shown] == [f"title {i}" for i in range(120)]
+    assert paths and set(paths) == {"/notifications/batch"}
+    assert len(paths) <= 5
+
+
+def test_falls_back_to_single_posts_without_batch_route() -> None:
+    posted: List[str] = []
+
+    class OldServerSession:
+        def post(self, url: str, **kwargs: Any) -> Any:
+            posted.append(url)
+            response = requests.Response()
+            response.status_code = 404 if url.endswith("/batch") else 200
+            return response
+
+    service = NotificationService(OldServerSession(), "http://api")  # type: ignore[arg-type]
+    service.send_info("a", "1", batched=True)
+    service.send_info("b", "2", batched=True)
+    assert service.flush(timeout=5)
+    service.send_info("c", "3", batched=True)
+    assert service.flush(timeout=5)
+    service.close()
+
+    assert posted[0] == "http://api/notifications/batch"
+    assert posted.count("http://api/notifications/batch") == 1
+    assert posted.count("http://api/notifications/info") == 3
+
+
+class ScriptedSession:
+    """batch 요청마다 정해 둔 응답(상태 코드, 본문) 또는 예외를 돌려주는 세션"""
+
+    def __init__(self, *results: Any) -> None:
+        self.results = list(results)
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        status, body = result
+        response = requests.Response()
+        response.status_code = status
+        response._content = body.encode()
+        return response
+
+
+def test_flush_reports_failed_batches() -> None:
+    partial = (
+        '{"status": "error", "error_code": "BATCH_PARTIAL",'
+        ' "details": {"total": 1, "sent": 0, "failed": [0]}}'
+    )
+    session = ScriptedSession(
+        (200, '{"status": "success"}'),
+        requests.ConnectionError("down"),
+        (200, partial),
+        (500, ""),
+    )
+    service = NotificationService(session, "http://api")  # type: ignore[arg-type]
+
+    service.send_info("ok", "1", batched=True)
+    assert service.flush(timeout=5)
+    service.send_info("lost", "2", batched=True)
+    assert not service.flush(timeout=5)  # 연결 실패
+    service.send_info("hidden", "3", batched=True)
+    assert not service.flush(timeout=5)  # 200 이지만 항목 표시 실패
+    service.send_info("error", "4", batched=True)
+    assert not service.flush(timeout=5)  # 5xx
+    assert service.flush(timeout=5)  # 실패는 flush 마다 한 번만 보고
+    service.close()
+
+
+def test_webhook_client_acks_only_delivered_messages(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = WebhookClient("http://127.0.0.1:9", "ack", coalesce_window=0)
+    outcomes = [True, False, True, True]
+    acked: List[int] = []
+    monkeypatch.setattr(client, "send_notification_to_self", lambda m: True)
+    monkeypatch.setattr(client, "_flush_notifications", lambda: outcomes.pop(0))
+    monkeypatch.setattr(client, "ack_sequence", lambda seq: acked.append(seq) or True)
+
+    def handle(*seqs: int) -> None:
+        client._handle_polled_messages([{"sequence_id": s} for s in seqs], first_poll=False)
+
+    handle(1, 2)
+    handle(3)  # 전달 실패 - ack 하지 않는다
+    handle(4)  # 누적 ack 가 3 을 건너뛰지 않도록 그 앞까지만
+    assert acked == [2]
+    handle(3, 4)  # lease 만료 후 재전달
+    assert acked == [2, 4]
+
+
+def test_full_queue_sends_synchronously() -> None:
+    released = threading.Event()
+    posted: List[Dict[str, Any]] = []
+
+    class SlowSession:
+        def post(self, url: str, json: Dict[str, Any], **kwargs: Any) -> Any:
+            if url.endswith("/batch"):
+                released.wait(5)
+            posted.append(json)
+            response = requests.Response()
+            response.status_code = 200
+            return response
+
+    service = NotificationService(
+        SlowSession(), "http://api", max_batch=1, max_queue=1  # type: ignore[arg-type]
+    )
+    service.send_info("first", "1", batched=True)
+    time.sleep(0.1)  # flusher 가 첫 알림을 꺼내 전송 중
+    service.send_info("queued", "2", batched=True)
+    service.send_info("overflow", "3", batched=True)
+    assert posted == [{"title": "overflow", "message": "3", "duration": 5000, "priority": "normal"}]
+    released.set()
+    assert service.flush(timeout=5)
+    service.close()
+
+
+def test_benchmark_dispatch_time(api_server: Tuple[str, _StubSignals]) -> None:
+    base_url, _ = api_server
+    timings: Dict[Tuple[str, int], float] = {}
+
+    for count in (1, 100, 1000):
+        session, _ = counting_session()
+        service = NotificationService(session, base_url)
+        started = time.perf_counter()
+        for i in range(count):
+            service.send_info(f"t{i}", "m")
+        timings[("single", count)] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for i in range(count):
+            service.send_info(f"t{i}", "m", batched=True)
+        assert service.flush(timeout=30)
+        timings[("batched", count)] = time.perf_counter() - started
+        service.close()
+
+    for count in (1, 100, 1000):
+        print(
+            f"\n[notification dispatch] n={count} "
+            f"single={timings[('single', count)] * 1000:.1f}ms "
+            f"batched={timings[('batched', count)] * 1000:.1f}ms"
+        )
+    assert timings[("batched", 1000)] * 3 < timings[("single", 1000)]
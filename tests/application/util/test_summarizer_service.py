@@ -0,0 +1,133 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import pytest
+import requests
+
+from application.util.summarizer_service import SummarizerService
+from application.util.webhook_client import WebhookClient
+
+INIT_DELAY = 0.3  # 가짜 agent 의 초기화 비용 (LLM 클라이언트 생성 등)
+
+
+class FakeConfig:
+    def __init__(self) -> None:
+        self.llm_config: Dict[str, Any] = {"model": "fake-1", "base_url": "http://llm"}
+
+    def get_llm_config(self) -> Dict[str, Any]:
+        return dict(self.llm_config)
+
+
+class FakeAgent:
+    def __init__(self, config: FakeConfig) -> None:
+        time.sleep(INIT_DELAY)
+        self.model = config.llm_config["model"]
+        self.loop_ids: List[int] = []
+        self.history: List[str] = []
+        self.cleaned_up = False
+
+    def clear_conversation(self) -> None:
+        self.history.clear()
+
+    async def generate_response(self, prompt: str) -> Dict[str, Any]:
+        self.loop_ids.append(id(asyncio.get_running_loop()))
+        self.history.append(prompt)
+        await asyncio.sleep(0.001)
+        return {"response": f"{self.model}:{prompt}:{len(self.history)}"}
+
+    async def cleanup(self) -> None:
+        self.cleaned_up = True
+
+
+@pytest.fixture()
+def service() -> Any:
+    agents: List[FakeAgent] = []
+
+    def factory(config: FakeConfig) -> FakeAgent:
+        agents.append(FakeAgent(config))
+        return agents[-1]
+
+    config = FakeConfig()
+    summarizer = SummarizerService(config, agent_factory=factory)
+    summarizer.agents = agents  # type: ignore[attr-defined]
+    summarizer.config = config  # type: ignore[attr-defined]
+    yield summarizer
+    summarizer.stop()
+
+
+def test_summaries_reuse_agent_and_loop(service: Any) -> None:
+    durations: List[float] = []
+    results: List[str] = []
+    for i in range(5):
+        started = time.perf_counter()
+        results.append(service.summarize(f"p{i}").result(timeout=5))
+        durations.append(time.perf_counter() - started)
+
+    print(
+        f"\n[summarizer] first={durations[0] * 1000:.1f}ms "
+        f"next_max={max(durations[1:]) * 1000:.1f}ms"
+    )
+    assert durations[0] >= INIT_DELAY
+    assert max(durations[1:]) < INIT_DELAY / 3  # 이후 요약에는 초기화 비용이 없다
+    assert service.agents_created == 1
+    assert len(set(service.agents[0].loop_ids)) == 1
+    # 요약마다 대화 기록을 비워 이전 요약이 프롬프트에 쌓이지 않는다
+    assert results == [f"fake-1:p{i}:1" for i in range(5)]
+
+
+def test_agent_recreated_when_llm_config_changes(service: Any) -> None:
+    assert service.summarize("a").result(timeout=5).startswith("fake-1")
+    service.config.llm_config["model"] = "fake-2"
+    assert service.summarize("b").result(timeout=5).startswith("fake-2")
+
+    assert service.agents_created == 2
+    assert service.agents[0].cleaned_up
+
+
+def test_submit_is_thread_safe(service: Any) -> None:
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(lambda i=i: service.summarize(f"t{i}").result(5)) for i in range(32)
+        ]
+        results = [future.result() for future in futures]
+
+    assert sorted(results) == sorted(f"fake-1:t{i}:1" for i in range(32))
+    assert service.agents_created == 1
+
+
+def test_stop_and_restart(service: Any) -> None:
+    service.summarize("x").result(timeout=5)
+    service.stop()
+    assert not service.is_running
+    assert service.agents[0].cleaned_up
+
+    assert service.submit(asyncio.sleep(0, result="ok")).result(timeout=5) == "ok"
+    assert service.is_running
+    service.summarize("y").result(timeout=5)
+    assert service.agents_created == 2
+
+
+def test_webhook_client_digests_share_summarizer(
+    service: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = WebhookClient("http://127.0.0.1:9", "digest")
+    client._summarizer = service
+    posted: List[Dict[str, Any]] = []
+
+    def fake_post(url: str, json: Dict[str, Any], **kwargs: Any) -> requests.Response:
+        posted.append(json)
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+    monkeypatch.setattr(client.session, "post", fake_post)
+    messages = [{"event_type": "push", "repo_name": "acme/api", "payload": {"commits": [{}]}}] * 3
+    for _ in range(3):
+        client._process_messages_with_summary_sync(messages)
+
+    assert service.agents_created == 1
+    finals = [body for body in posted if body.get("priority") == "high"]
+    # 가짜 agent 는 프롬프트를 그대로 돌려주므로 응답 형식의 제목이 파싱된다 (폴백 요약이 아님)
+    assert len(finals) == 3 and finals[0]["title"] == "[친근한 요약 제목]"
@@ -0,0 +1,66 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Generator
+
+import pytest
+
+# webhook.app 은 import 시점에 DB/데이터 폴더를 만들기 때문에 먼저 임시 경로를 지정한다
+_WEBHOOK_TMP_DIR = Path(tempfile.mkdtemp(prefix="webhook-tests-"))
+os.environ.setdefault("WEBHOOK_DATABASE_URL", f"sqlite:///{_WEBHOOK_TMP_DIR / 'webhook.db'}")
+os.environ.setdefault("WEBHOOK_DATA_DIR", str(_WEBHOOK_TMP_DIR / "data"))
+
+from webhook.models import Base, SessionLocal, create_tables, engine  # noqa: E402
+from webhook.routing import interest_index  # noqa: E402
+
+
+@pytest.fixture()
+def db() -> Generator[Any, None, None]:
+    """테스트마다 비어 있는 webhook DB 세션을 제공한다."""
+    Base.metadata.drop_all(bind=engine)
+    create_tables()
+    session = SessionLocal()
+    interest_index.rebuild(session)
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture()
+def api(db: Any) -> Generator[Any, None, None]:
+    """요청 사이에도 수신 큐 writer 가 동작하도록 이벤트 루프를 유지하는 TestClient"""
+    from fastapi.testclient import TestClient
+
+    from webhook.app import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture()
+def live_server(db: Any) -> Generator[str, None, None]:
+    """uvicorn 으로 webhook 서버를 띄우고 base URL 을 반환한다 (스트리밍 테스트용)."""
+    import socket
+    import threading
+    import time
+
+    import uvicorn
+
+    from webhook.app import app
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.time() + 10
+    while not server.started and time.time() < deadline:
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
@@ -0,0 +1,162 @@
+import asyncio
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List
+
+import pytest
+import requests
+from fastapi.testclient import TestClient
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import Session
+
+import webhook.app as webhook_app
+from tests.server.test_ingest import SIMULATED_EVENTS, simulator_payload
+from webhook.models import Client, engine, run_db
+
+POLLERS = 200
+POLLS_PER_CLIENT = 5
+REPOS = 20
+
+
+class CountingLock:
+    """write_lock 을 감싸 잠금 획득 횟수를 센다"""
+
+    def __init__(self, lock: Any) -> None:
+        self.lock = lock
+        self.acquired = 0
+
+    def __enter__(self) -> "CountingLock":
+        self.lock.acquire()
+        self.acquired += 1
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.lock.release()
+
+
+def test_sqlite_pragmas_and_indexes(db: Session) -> None:
+    assert db.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+    assert db.execute(text("PRAGMA busy_timeout")).scalar() >= 1000
+
+    inspector = inspect(engine)
+    indexes = {
+        table: {tuple(index["column_names"]) for index in inspector.get_indexes(table)}
+        for table in ("webhook_events", "message_consumptions")
+    }
+    assert ("org_name", "repo_name") in indexes["webhook_events"]
+    assert ("client_id", "message_file") in indexes["message_consumptions"]
+
+
+def test_run_db_keeps_event_loop_free(db: Session) -> None:
+    def slow_query(session: Session) -> int:
+        time.sleep(0.2)
+        return int(session.execute(text("SELECT 1")).scalar() or 0)
+
+    async def scenario() -> List[float]:
+        ticks: List[float] = []
+
+        async def ticker() -> None:
+            for _ in range(10):
+                ticks.append(time.perf_counter())
+                await asyncio.sleep(0.01)
+
+        results = await asyncio.gather(run_db(slow_query), ticker())
+        assert results[0] == 1
+        return ticks
+
+    ticks = asyncio.run(scenario())
+    # DB 작업이 스레드에서 도는 동안에도 이벤트 루프가 계속 동작한다
+    assert ticks[-1] - ticks[0] < 0.2
+
+
+def test_concurrent_pollers_with_ingest_stream(live_server: str, db: Session) -> None:
+    with requests.Session() as session:
+        client_ids = [
+            session.post(
+                f"{live_server}/clients",
+                json={"name": f"poller-{i}", "interested_repos": [f"acme/svc-{i % REPOS}"]},
+            ).json()["id"]
+            for i in range(POLLERS)
+        ]
+
+    ingesting = threading.Event()
+    ingesting.set()
+    sent: List[int] = []
+
+    def ingest_stream() -> None:
+        with requests.Session() as session:
+            i = 0
+            while ingesting.is_set():
+                event_type, action = SIMULATED_EVENTS[i % len(SIMULATED_EVENTS)]
+                payload = simulator_payload(event_type, action, repo=f"svc-{i % REPOS}")
+                response = session.post(
+                    f"{live_server}/webhook", json=payload, headers={"X-GitHub-Event": event_type}
+                )
+                sent.append(response.status_code)
+                i += 1
+
+    latencies: List[float] = []
+    received: List[int] = []
+
+    def poll(client_id: int) -> None:
+        with requests.Session() as session:
+            for _ in range(POLLS_PER_CLIENT):
+                started = time.perf_counter()
+                response = session.get(f"{live_server}/poll/{client_id}", params={"limit": 50})
+                latencies.append(time.perf_counter() - started)
+                assert response.status_code == 200
+                received.append(response.json()["total_new_messages"])
+
+    ingester = threading.Thread(target=ingest_stream)
+    ingester.start()
+    try:
+        with ThreadPoolExecutor(max_workers=POLLERS) as executor:
+            list(executor.map(poll, client_ids))
+    finally:
+        ingesting.clear()
+        ingester.join()
+
+    p50 = statistics.median(latencies)
+    p99 = statistics.quantiles(latencies, n=100)[98]
+    print(
+        f"\n[db concurrency] pollers={POLLERS} polls={len(latencies)} events_sent={len(sent)} "
+        f"delivered={sum(received)} p50={p50 * 1000:.1f}ms p99={p99 * 1000:.1f}ms"
+    )
+
+    assert len(latencies) == POLLERS * POLLS_PER_CLIENT
+    assert set(sent) <= {202, 503}
+
+
+def test_empty_polls_do_not_take_write_lock(
+    db: Session, api: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client_ids = [
+        api.post("/clients", json={"name": f"idle-{i}", "interested_repos": ["acme/api"]}).json()[
+            "id"
+        ]
+        for i in range(10)
+    ]
+    lock = CountingLock(webhook_app.write_lock)
+    monkeypatch.setattr(webhook_app, "write_lock", lock)
+
+    def poll_all() -> List[int]:
+        return [
+            len(api.get(f"/poll/{client_id}").json()["messages"]) for client_id in client_ids
+        ]
+
+    for _ in range(5):
+        assert poll_all() == [0] * len(client_ids)
+    # 처음 poll 시간을 기록할 때만 쓴다
+    assert lock.acquired == len(client_ids)
+    assert all(client.last_poll_at is not None for client in db.query(Client))
+
+    webhook_app.event_store.append(db, "push", {}, "acme", "acme/api")
+    lock.acquired = 0
+    assert poll_all() == [1] * len(client_ids)
+    assert lock.acquired == len(client_ids)  # 커서가 바뀐 poll 만 commit
+
+    lock.acquired = 0
+    assert poll_all() == [0] * len(client_ids)
+    assert lock.acquired == 0
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from webhook.delivery import DeliveryTracker
+from webhook.event_store import EventStore
+from webhook.models import Client, MessageConsumption
+
+
+def make_client(db: Session, name: str = "cursor-client") -> Client:
+    client = Client(name=name)
+    db.add(client)
+    db.commit()
+    EventStore().route_client(db, client)
+    return client
+
+
+def append_events(db: Session, count: int) -> list[int]:
+    store = EventStore()
+    return [store.append(db, "push", {"n": i}, "acme", "acme/api").id for i in range(count)]
+
+
+def test_auto_ack_advances_cursor(db: Session) -> None:
+    tracker = DeliveryTracker()
+    client = make_client(db)
+    seqs = append_events(db, 3)
+
+    events, has_more = tracker.next_batch(db, client, limit=2)
+    assert [e.id for e in events] == seqs[:2] and has_more
+    assert client.acked_seq == seqs[1]
+
+    events, has_more = tracker.next_batch(db, client, limit=2)
+    assert [e.id for e in events] == seqs[2:] and not has_more
+    assert tracker.next_batch(db, client)[0] == []
+
+
+def test_unacked_messages_redelivered_after_lease(db: Session) -> None:
+    tracker = DeliveryTracker(lease_timeout=30)
+    client = make_client(db)
+    seqs = append_events(db, 2)
+    now = datetime(2024, 1, 1, 12, 0, 0)
+
+    events, _ = tracker.next_batch(db, client, auto_ack=False, now=now)
+    assert [e.id for e in events] == seqs
+
+    # lease 유효 기간 안에는 같은 메시지를 다시 보내지 않는다
+    assert tracker.next_batch(db, client, auto_ack=False, now=now + timedelta(seconds=10))[0] == []
+
+    # 첫 번째 메시지만 ack 후 lease 만료 → 두 번째 메시지만 재전달
+    tracker.ack(db, client, seqs[0])
+    redelivered, _ = tracker.next_batch(
+        db, client, auto_ack=False, now=now + timedelta(seconds=31)
+    )
+    assert [e.id for e in redelivered] == seqs[1:]
+
+    tracker.ack(db, client, seqs[1])
+    assert client.lease_expires_at is None
+    assert tracker.next_batch(db, client, auto_ack=False, now=now + timedelta(days=1))[0] == []
+
+
+def test_ack_is_clamped_to_delivered_range(db: Session) -> None:
+    tracker = DeliveryTracker()
+    client = make_client(db)
+    seqs = append_events(db, 3)
+
+    tracker.next_batch(db, client, limit=1, auto_ack=False)
+    assert tracker.ack(db, client, seqs[-1]) == seqs[0]
+
+
+def test_migrate_consumptions_to_cursor(db: Session) -> None:
+    client = make_client(db)
+    events = [EventStore().append(db, "push", {}, None, None) for _ in range(3)]
+    for event in events[:2]:
+        db.add(
+            MessageConsumption(
+                client_id=client.id, message_file=event.filename, event_type="push"
+            )
+        )
+    db.commit()
+
+    assert DeliveryTracker.migrate_consumptions(db) == 1
+    assert client.acked_seq == events[1].id
+    assert DeliveryTracker.migrate_consumptions(db) == 0
+
+    remaining, _ = DeliveryTracker().next_batch(db, client)
+    assert [e.id for e in remaining] == [events[2].id]
+
+
+def test_poll_and_ack_endpoints(db: Session, api: TestClient) -> None:
+    client_id = api.post("/clients", json={"name": "acker"}).json()["id"]
+    api.post(
+        "/webhook",
+        json={"repository": {"full_name": "acme/api"}},
+        headers={"X-GitHub-Event": "push"},
+    )
+
+    first = api.get(f"/poll/{client_id}", params={"auto_ack": "false", "wait": 5}).json()
+    assert first["total_new_messages"] == 1
+    assert api.get(f"/poll/{client_id}", params={"auto_ack": "false"}).json()["messages"] == []
+
+    ack = api.post(f"/ack/{client_id}", json={"sequence_id": first["last_sequence_id"]})
+    assert ack.status_code == 200
+    assert ack.json()["acked_sequence_id"] == first["last_sequence_id"]
+    assert api.get(f"/clients/{client_id}").json()["acked_sequence_id"] == first["last_sequence_id"]
+
+    assert api.post("/ack/999999", json={"sequence_id": 1}).status_code == 404
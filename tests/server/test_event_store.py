@@ -0,0 +1,156 @@
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from webhook.app import message_matches_client_interest
+from webhook.event_store import EventStore, encode_payload, split_repo_short_name
+from webhook.models import Client, WebhookEvent
+
+
+def make_client(db: Session, name: str, orgs: List[str], repos: List[str]) -> Client:
+    client = Client(name=name)
+    client.set_interested_orgs(orgs)
+    client.set_interested_repos(repos)
+    db.add(client)
+    db.commit()
+    EventStore().route_client(db, client)
+    return client
+
+
+def bulk_insert_events(db: Session, count: int, repo_name: str, start: datetime) -> None:
+    """ORM 을 거치지 않고 대량의 이벤트를 빠르게 적재한다."""
+    payload = encode_payload({"action": "completed"})
+    org_name = repo_name.split("/")[0]
+    rows = [
+        {
+            "filename": f"bulk_{repo_name.replace('/', '_')}_{i}.json",
+            "event_type": "workflow_run",
+            "org_name": org_name,
+            "repo_name": repo_name,
+            "repo_short_name": split_repo_short_name(repo_name),
+            "received_at": start + timedelta(milliseconds=i),
+            "payload": payload,
+            "payload_size": len(payload),
+        }
+        for i in range(count)
+    ]
+    db.execute(insert(WebhookEvent), rows)
+    db.commit()
+
+
+def test_append_assigns_monotonic_sequence(db: Session) -> None:
+    store = EventStore()
+    first = store.append(db, "push", {"ref": "refs/heads/main"}, "acme", "acme/api")
+    second = store.append(db, "issues", {"action": "opened"}, "acme", "acme/api")
+
+    assert second.id > first.id
+    assert first.repo_short_name == "api"
+    assert EventStore.to_message(first)["payload"] == {"ref": "refs/heads/main"}
+
+
+@pytest.mark.parametrize(
+    "orgs,repos",
+    [
+        ([], []),
+        (["acme"], []),
+        ([], ["acme/api"]),
+        ([], ["web"]),
+        (["other"], ["api"]),
+    ],
+)
+def test_events_after_matches_legacy_interest_predicate(
+    db: Session, orgs: List[str], repos: List[str]
+) -> None:
+    store = EventStore()
+    samples: List[tuple[Optional[str], Optional[str]]] = [
+        ("acme", "acme/api"),
+        ("acme", "acme/web"),
+        (None, "someone/api"),
+        ("other", "other/tool"),
+        (None, None),
+    ]
+    for org_name, repo_name in samples:
+        store.append(db, "push", {}, org_name, repo_name)
+    client = make_client(db, "c", orgs, repos)
+
+    pending = {event.id for event in store.events_after(db, client, 0)}
+    expected = {
+        event.id
+        for event in store.list_events(db)
+        if message_matches_client_interest(
+            {"org_name": event.org_name, "repo_name": event.repo_name}, client
+        )
+    }
+    assert pending == expected
+
+
+def test_import_legacy_files_is_idempotent(db: Session, tmp_path: Path) -> None:
+    store = EventStore()
+    for i, event_type in enumerate(["push", "issues"]):
+        legacy: Dict[str, Any] = {
+            "timestamp": f"2024-01-01T00:00:0{i}",
+            "event_type": event_type,
+            "org_name": "acme",
+            "repo_name": "acme/api",
+            "payload": {"n": i},
+        }
+        (tmp_path / f"{event_type}_legacy.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    assert store.import_legacy_files(db, tmp_path) == 2
+    assert store.import_legacy_files(db, tmp_path) == 0
+
+    events = sorted(store.list_events(db), key=lambda e: e.id)
+    assert [e.event_type for e in events] == ["push", "issues"]
+    assert [e.filename for e in events] == ["push_legacy.json", "issues_legacy.json"]
+
+
+def test_poll_delivers_each_event_once(db: Session, api: TestClient) -> None:
+    client_id = api.post("/clients", json={"name": "poller", "interested_repos": ["acme/api"]}).json()[
+        "id"
+    ]
+    headers = {"X-GitHub-Event": "push"}
+    api.post("/webhook", json={"repository": {"full_name": "acme/api"}}, headers=headers)
+    api.post("/webhook", json={"repository": {"full_name": "acme/web"}}, headers=headers)
+
+    first = api.get(f"/poll/{client_id}", params={"wait": 5}).json()
+    second = api.get(f"/poll/{client_id}").json()
+
+    assert [m["repo_name"] for m in first["messages"]] == ["acme/api"]
+    assert first["messages"][0]["sequence_id"] > 0
+    assert second["total_new_messages"] == 0
+
+
+def _median_poll_seconds(store: EventStore, db: Session, client: Client) -> float:
+    samples = []
+    for _ in range(15):
+        started = time.perf_counter()
+        store.events_after(db, client, 0)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def test_poll_latency_flat_from_1k_to_100k_events(db: Session) -> None:
+    store = EventStore()
+    client = make_client(db, "watcher", [], ["acme/widgets"])
+    start = datetime(2024, 1, 1)
+
+    bulk_insert_events(db, 20, "acme/widgets", start)
+    bulk_insert_events(db, 1_000, "noise/other", start)
+    store.route_client(db, client)
+    small = _median_poll_seconds(store, db, client)
+
+    bulk_insert_events(db, 99_000, "noise/more", start)
+    store.route_client(db, client)
+    large = _median_poll_seconds(store, db, client)
+
+    assert len(store.events_after(db, client, 0)) == 20
+    # 전체 이력이 100배 늘어나도 poll 비용은 관심 이벤트 수에만 비례해야 한다
+    assert large < small * 3 + 0.002
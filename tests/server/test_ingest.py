@@ -0,0 +1,188 @@
+import asyncio
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+import requests
+from fastapi.testclient import TestClient
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+import webhook.app as webhook_app
+from webhook import ingest
+from webhook.ingest import IngestItem, IngestPipeline
+from webhook.models import WebhookEvent
+from webhook.simulator import GitHubWebhookSimulator
+
+SIMULATED_EVENTS = [
+    ("workflow_run", "completed"),
+    ("workflow_job", "queued"),
+    ("pull_request", "opened"),
+    ("pull_request_review", "submitted"),
+    ("issues", "opened"),
+    ("issue_comment", "created"),
+]
+
+
+class _Field:
+    """시뮬레이터 입력 위젯 대체 (get 만 사용)"""
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+    def get(self) -> str:
+        return self.value
+
+
+def simulator_payload(event_type: str, action: str, repo: str = "api") -> Dict[str, Any]:
+    form = SimpleNamespace(
+        org_entry=_Field("acme"), repo_entry=_Field(repo), pr_number_var=_Field("7")
+    )
+    return GitHubWebhookSimulator.generate_payload(form, event_type, action)  # type: ignore
+
+
+def test_writer_group_commits_burst() -> None:
+    batch_sizes: List[int] = []
+
+    def persist(db: Session, items: List[IngestItem]) -> int:
+        time.sleep(0.01)  # 저장하는 동안 큐에 이벤트가 쌓인다
+        batch_sizes.append(len(items))
+        return sum(batch_sizes)
+
+    published: List[int] = []
+
+    async def on_persisted(seq: int) -> None:
+        published.append(seq)
+
+    async def burst() -> IngestPipeline:
+        pipeline = IngestPipeline(persist, on_persisted, maxsize=500, batch_size=50)
+        for i in range(200):
+            assert pipeline.submit(IngestItem("push", {"n": i}))
+        await pipeline.stop()
+        return pipeline
+
+    pipeline = asyncio.run(burst())
+
+    assert sum(batch_sizes) == 200
+    assert len(batch_sizes) < 200 and max(batch_sizes) <= 50
+    assert published[-1] == 200
+    assert pipeline.stats()["persisted"] == 200 and pipeline.depth == 0
+
+
+def test_failed_event_does_not_drop_its_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ingest, "INGEST_RETRY_DELAY", 0.01)
+    attempts: List[int] = []
+    saved: List[int] = []
+
+    def persist(db: Session, items: List[IngestItem]) -> int:
+        attempts.append(len(items))
+        if any(item.payload.get("bad") for item in items):
+            raise ValueError("저장할 수 없는 이벤트")
+        saved.extend(item.payload["n"] for item in items)
+        return saved[-1]
+
+    published: List[int] = []
+
+    async def on_persisted(seq: int) -> None:
+        published.append(seq)
+
+    async def run() -> IngestPipeline:
+        pipeline = IngestPipeline(persist, on_persisted, batch_size=10)
+        for i in range(5):
+            pipeline.submit(IngestItem("push", {"n": i, "bad": i == 2}))
+        await pipeline.stop()
+        return pipeline
+
+    pipeline = asyncio.run(run())
+
+    assert attempts == [5, 5, 1, 1, 1, 1, 1]  # 재시도 후 한 건씩
+    assert saved == [0, 1, 3, 4]
+    assert published == [4]
+    assert pipeline.stats()["persisted"] == 4 and pipeline.stats()["failed"] == 1
+
+
+def test_full_queue_answers_503_with_retry_after(
+    api: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    gate = threading.Event()
+
+    def blocked_persist(db: Session, items: List[IngestItem]) -> int:
+        gate.wait(10)
+        return 0
+
+    monkeypatch.setattr(webhook_app, "ingest_pipeline", IngestPipeline(blocked_persist, maxsize=2))
+    headers = {"X-GitHub-Event": "push"}
+    try:
+        statuses = [api.post("/webhook", json={}, headers=headers).status_code for _ in range(6)]
+        assert statuses[0] == 202
+        assert 503 in statuses
+
+        response = api.post("/webhook", json={}, headers=headers)
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        assert api.get("/ingest/stats").json()["queue_depth"] == 2
+    finally:
+        gate.set()
+
+
+def test_load_burst_keeps_polls_responsive(live_server: str, db: Session) -> None:
+    total = 600
+    client_id = requests.post(f"{live_server}/clients", json={"name": "load"}).json()["id"]
+    bodies = [
+        json.dumps(simulator_payload(*SIMULATED_EVENTS[i % len(SIMULATED_EVENTS)])).encode()
+        for i in range(total)
+    ]
+
+    def send(i: int) -> int:
+        event_type = SIMULATED_EVENTS[i % len(SIMULATED_EVENTS)][0]
+        headers = {"Content-Type": "application/json", "X-GitHub-Event": event_type}
+        with requests.Session() as session:
+            while True:
+                response = session.post(f"{live_server}/webhook", data=bodies[i], headers=headers)
+                if response.status_code != 503:
+                    return response.status_code
+                time.sleep(float(response.headers.get("Retry-After", "1")) / 10)
+
+    # 수신 폭주 중에도 poll 응답 시간 측정
+    poll_latencies: List[float] = []
+    sending = threading.Event()
+    sending.set()
+
+    def poll_during_burst() -> None:
+        with requests.Session() as session:
+            while sending.is_set():
+                started = time.perf_counter()
+                session.get(f"{live_server}/poll/{client_id}", params={"limit": 50})
+                poll_latencies.append(time.perf_counter() - started)
+
+    poller = threading.Thread(target=poll_during_burst)
+    poller.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        statuses = list(executor.map(send, range(total)))
+    accept_seconds = time.perf_counter() - started
+
+    deadline = time.monotonic() + 30
+    while db.query(func.count(WebhookEvent.id)).scalar() < total:
+        assert time.monotonic() < deadline, "수신 큐가 비워지지 않았습니다"
+        db.rollback()
+        time.sleep(0.05)
+    sending.clear()
+    poller.join()
+
+    stats = requests.get(f"{live_server}/ingest/stats").json()
+    p99 = statistics.quantiles(poll_latencies, n=100)[98] if len(poll_latencies) > 1 else 0.0
+    print(
+        f"\n[ingest load] events={total} accepted in {accept_seconds:.2f}s "
+        f"({total / accept_seconds:.0f}/s) batches={stats['batches']} "
+        f"rejected={stats['rejected']} polls={len(poll_latencies)} poll_p99={p99 * 1000:.1f}ms"
+    )
+
+    assert set(statuses) == {202}
+    assert stats["batches"] < total  # 여러 이벤트를 한 트랜잭션으로 저장
+    assert p99 < 1.0
@@ -0,0 +1,74 @@
+import json
+from pathlib import Path
+
+import pytest
+from sqlalchemy.orm import Session
+
+from webhook.loadgen import LoadConfig, LoadGenerator, main, parse_mix, percentiles
+from webhook.payloads import build_request, generate_payload, generate_signature
+
+
+def test_parse_mix() -> None:
+    assert parse_mix("pull_request=3, issues") == {"pull_request": 3.0, "issues": 1.0}
+    with pytest.raises(ValueError):
+        parse_mix("unknown_event=1")
+    with pytest.raises(ValueError):
+        parse_mix("issues=0")
+
+
+def test_percentiles() -> None:
+    summary = percentiles([i / 1000 for i in range(1, 101)])
+    assert summary["count"] == 100
+    assert summary["p50"] == pytest.approx(50.5)
+    assert summary["p99"] == pytest.approx(99.01)
+    assert summary["max"] == 100.0
+    assert percentiles([]) == {"count": 0}
+
+
+def test_signed_request_matches_server_check() -> None:
+    payload = generate_payload("issues", "opened", "acme", "api", pr_number=3)
+    assert payload["issue"]["number"] == 3
+    assert payload["repository"]["full_name"] == "acme/api"
+
+    body, headers = build_request("issues", payload, secret="s3cret", delivery_id="d-1")
+    assert json.loads(body) == payload
+    assert headers["X-GitHub-Event"] == "issues"
+    assert headers["X-GitHub-Delivery"] == "d-1"
+    assert headers["X-Hub-Signature-256"] == generate_signature(body, "s3cret")
+    assert "X-Hub-Signature-256" not in build_request("issues", payload)[1]
+
+
+def test_load_run_reports_delivery(live_server: str, db: Session) -> None:
+    config = LoadConfig(
+        url=live_server,
+        duration=1.0,
+        rate=40,
+        concurrency=4,
+        clients=6,
+        repos=4,
+        repos_per_client=2,
+        poll_interval=0.1,
+        seed=1,
+    )
+    summary = LoadGenerator(config).run()
+
+    assert summary["ingest"]["accepted"] == 40
+    assert summary["ingest"]["latency_ms"]["count"] == 40
+    assert summary["poll"]["errors"] == 0
+    assert summary["poll"]["latency_ms"]["count"] > 0
+    delivery = summary["delivery"]
+    assert delivery["expected"] > 0
+    assert delivery["delivered"] == delivery["expected"] and delivery["complete"]
+    assert delivery["lag_ms"]["count"] == delivery["delivered"]
+
+
+def test_cli_writes_json_summary(live_server: str, db: Session, tmp_path: Path) -> None:
+    output = tmp_path / "summary.json"
+    args = ["--url", live_server, "--duration", "0.5", "--rate", "20", "--clients", "2"]
+    args += ["--mix", "pull_request=1", "--poll-interval", "0.1", "--output", str(output)]
+    assert main(args) == 0
+
+    summary = json.loads(output.read_text(encoding="utf-8"))
+    assert summary["config"]["mix"] == {"pull_request": 1.0}
+    assert summary["ingest"]["accepted"] == 10
+    assert set(summary["delivery"]["lag_ms"]) >= {"p50", "p90", "p99", "max"}
@@ -0,0 +1,166 @@
+import gzip
+import json
+from typing import Any, Dict, List
+
+import pytest
+import requests
+from fastapi.testclient import TestClient
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+from application.util.webhook_client import WebhookClient
+from tests.server.test_ingest import SIMULATED_EVENTS, simulator_payload
+from webhook.event_store import EventStore
+from webhook.models import WebhookEvent
+from webhook.payload_codec import (
+    PayloadCodec,
+    RawCodec,
+    ZlibCodec,
+    decode_payload,
+    encode_payload,
+    register_codec,
+)
+from webhook.retention import RetentionManager
+
+
+def corpus(count: int = 60) -> List[Dict[str, Any]]:
+    """시뮬레이터 payload 에 실제 GitHub 처럼 본문/커밋 목록을 덧붙인 예제 모음"""
+    payloads = []
+    for i in range(count):
+        event_type, action = SIMULATED_EVENTS[i % len(SIMULATED_EVENTS)]
+        payload = simulator_payload(event_type, action, repo=f"service-{i % 7}")
+        payload["commits"] = [
+            {"id": f"{i:04d}{n:036d}", "message": f"Fix issue #{n} in module {n % 5}"}
+            for n in range(20)
+        ]
+        payloads.append(payload)
+    return payloads
+
+
+@pytest.mark.parametrize("codec", [RawCodec(), ZlibCodec()])
+def test_codec_round_trip_with_version_byte(codec: PayloadCodec) -> None:
+    payload = {"action": "opened", "title": "한글 제목", "n": [1, 2, 3]}
+    data = encode_payload(payload, codec)
+
+    assert data[0] == codec.codec_id
+    assert decode_payload(data) == payload
+
+
+def test_legacy_and_unknown_formats() -> None:
+    legacy = json.dumps({"a": 1}).encode("utf-8")
+    assert decode_payload(legacy) == {"a": 1}
+
+    with pytest.raises(ValueError):
+        decode_payload(bytes([200]) + b"???")
+    with pytest.raises(ValueError):
+        register_codec(type("Bad", (RawCodec,), {"codec_id": ord("{")})())
+
+
+def test_codec_must_implement_encode_and_decode() -> None:
+    class EncodeOnly(PayloadCodec):
+        codec_id = 9
+
+        def encode(self, data: bytes) -> bytes:
+            return data
+
+    with pytest.raises(TypeError):
+        EncodeOnly()  # type: ignore[abstract]
+
+
+def test_store_compresses_and_compaction_converts_legacy_rows(db: Session) -> None:
+    store = EventStore()
+    payload = corpus(1)[0]
+    event = store.append(db, "push", payload, "acme", "acme/api")
+    assert event.payload[0] == ZlibCodec.codec_id
+    assert event.payload_size < len(json.dumps(payload))
+    assert store.to_message(event)["payload"] == payload
+
+    # 압축 도입 이전 형식으로 저장된 행
+    legacy = json.dumps(payload).encode("utf-8")
+    db.execute(
+        update(WebhookEvent)
+        .where(WebhookEvent.id == event.id)
+        .values(payload=legacy, payload_size=len(legacy))
+    )
+    db.commit()
+
+    assert RetentionManager().compact(db)["recompressed"] == 1
+    db.refresh(event)
+    assert event.payload[0] == ZlibCodec.codec_id
+    assert store.to_message(event)["payload"] == payload
+
+
+def test_poll_response_gzip_is_negotiated(db: Session, api: TestClient) -> None:
+    plain_id = api.post("/clients", json={"name": "plain"}).json()["id"]
+    gzip_id = api.post("/clients", json={"name": "gz"}).json()["id"]
+    store = EventStore()
+    for payload in corpus(5):
+        store.append(db, "push", payload, "acme", "acme/api")
+
+    plain = api.get(f"/poll/{plain_id}", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+
+    compressed = api.get(f"/poll/{gzip_id}", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.json()["messages"] == plain.json()["messages"]
+
+
+def test_webhook_client_receives_gzip_poll(live_server: str, db: Session) -> None:
+    client = WebhookClient(live_server, "gzip-client", prefer_stream=False)
+    encodings: List[str] = []
+    client.session.hooks["response"].append(
+        lambda response, *args, **kwargs: encodings.append(
+            response.headers.get("Content-Encoding", "")
+        )
+    )
+    assert "gzip" in client.session.headers["Accept-Encoding"]
+    assert client.register_client()
+
+    for payload in corpus(5):
+        EventStore().append(db, "push", payload, "acme", "acme/api")
+
+    messages = client.poll_messages()
+    assert len(messages) == 5 and messages[0]["payload"]["commits"]
+    assert encodings[-1] == "gzip"
+
+
+def test_benchmark_bytes_on_disk_and_on_wire(
+    live_server: str, db: Session, capsys: pytest.CaptureFixture[str]
+) -> None:
+    payloads = corpus()
+    ids = [
+        requests.post(f"{live_server}/clients", json={"name": name}).json()["id"]
+        for name in ("bench-plain", "bench-gzip")
+    ]
+    store = EventStore()
+    for payload in payloads:
+        store.append(db, "push", payload, "acme", "acme/api")
+
+    raw_bytes = sum(len(encode_payload(p, RawCodec())) for p in payloads)
+    disk_bytes = db.query(func.sum(WebhookEvent.payload_size)).scalar()
+
+    def wire_bytes(client_id: int, encoding: str) -> int:
+        response = requests.get(
+            f"{live_server}/poll/{client_id}",
+            params={"limit": len(payloads)},
+            headers={"Accept-Encoding": encoding},
+            stream=True,
+        )
+        body = response.raw.read(decode_content=False)
+        if encoding == "gzip":
+            assert response.headers["Content-Encoding"] == "gzip"
+            assert len(json.loads(gzip.decompress(body))["messages"]) == len(payloads)
+        return len(body)
+
+    wire_plain = wire_bytes(ids[0], "identity")
+    wire_gzip = wire_bytes(ids[1], "gzip")
+
+    with capsys.disabled():
+        print(
+            f"\n[payload bytes] events={len(payloads)} "
+            f"disk raw={raw_bytes} zlib={disk_bytes} ({disk_bytes / raw_bytes:.0%}), "
+            f"wire plain={wire_plain} gzip={wire_gzip} ({wire_gzip / wire_plain:.0%})"
+        )
+
+    assert disk_bytes < raw_bytes / 2
+    assert wire_gzip < wire_plain / 2
@@ -0,0 +1,155 @@
+import random
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Any, Dict, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from application.util.polling_manager import (
+    AdaptivePollScheduler,
+    PollingManager,
+    PollOutcome,
+    parse_retry_after,
+)
+from application.util.webhook_client import WebhookClient
+from webhook.event_store import EventStore
+
+DAY = 24 * 60 * 60
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def scheduler(**kwargs: Any) -> AdaptivePollScheduler:
+    return AdaptivePollScheduler(rng=random.Random(7), **kwargs)
+
+
+def test_scheduler_backs_off_with_jitter_and_resets_on_messages() -> None:
+    sched = scheduler(base_interval=10, min_interval=1, max_interval=120, jitter=0.2)
+
+    delays = [sched.next_delay(PollOutcome()) for _ in range(6)]
+    for expected, delay in zip([20, 40, 80, 120, 120, 120], delays):
+        assert expected * 0.8 <= delay <= expected * 1.2
+
+    delay = sched.next_delay(PollOutcome(messages=[{"id": 1}]))
+    assert 0.8 <= delay <= 1.2
+    assert sched.interval == 1
+
+
+def test_scheduler_honors_retry_after() -> None:
+    sched = scheduler(base_interval=10, max_interval=60)
+    assert sched.next_delay(PollOutcome(error=True, retry_after=300)) == 300
+    assert sched.next_delay(PollOutcome(error=True, retry_after=1)) <= 60 * 1.2
+
+
+def test_parse_retry_after() -> None:
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(format_datetime(now + timedelta(seconds=30), usegmt=True), now) == 30
+    assert parse_retry_after(format_datetime(now - timedelta(seconds=30), usegmt=True), now) == 0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_idle_day_needs_far_fewer_requests_than_fixed_interval() -> None:
+    clock = FakeClock()
+    manager = PollingManager(
+        lambda: PollOutcome(not_modified=True),
+        lambda messages, first: None,
+        poll_interval=10,
+        scheduler=scheduler(base_interval=10, max_interval=120),
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    manager.run(duration=DAY)
+
+    fixed_interval_polls = DAY // 10
+    print(f"\n[idle day] adaptive={manager.poll_count} fixed={fixed_interval_polls}")
+    assert manager.poll_count * 10 < fixed_interval_polls
+
+
+def test_messages_are_handled_and_polled_quickly() -> None:
+    clock = FakeClock()
+    batches: List[List[Dict[str, Any]]] = [[{"id": 1}], [{"id": 2}, {"id": 3}], []]
+    handled: List[Any] = []
+
+    def fetch() -> List[Dict[str, Any]]:
+        return batches.pop(0) if batches else []
+
+    manager = PollingManager(
+        fetch,
+        lambda messages, first: handled.append((len(messages), first)),
+        scheduler=scheduler(base_interval=10, min_interval=1),
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    assert manager.poll_once() < 2
+    assert manager.poll_once() < 2
+    assert manager.poll_once() > 1.5
+    assert handled == [(1, True), (2, False)]
+
+
+def test_fetch_errors_back_off() -> None:
+    def fetch() -> List[Dict[str, Any]]:
+        raise RuntimeError("boom")
+
+    manager = PollingManager(fetch, lambda messages, first: None, scheduler=scheduler())
+    assert manager.poll_once() >= 16
+
+
+def test_empty_poll_returns_304_for_matching_etag(db: Session, api: TestClient) -> None:
+    client_id = api.post("/clients", json={"name": "etag", "interested_repos": ["acme/api"]}).json()[
+        "id"
+    ]
+
+    first = api.get(f"/poll/{client_id}")
+    etag = first.headers["ETag"]
+    assert first.status_code == 200 and first.json()["messages"] == []
+
+    second = api.get(f"/poll/{client_id}", headers={"If-None-Match": etag})
+    assert second.status_code == 304 and second.content == b""
+
+    EventStore().append(db, "push", {"ref": "main"}, "acme", "acme/api")
+    third = api.get(f"/poll/{client_id}", headers={"If-None-Match": etag})
+    assert third.status_code == 200 and len(third.json()["messages"]) == 1
+    assert "ETag" not in third.headers
+
+    # 커서가 이동했으므로 이전 ETag 로는 304 를 받지 않는다
+    fourth = api.get(f"/poll/{client_id}", headers={"If-None-Match": etag})
+    assert fourth.status_code == 200 and fourth.headers["ETag"] != etag
+
+
+def test_webhook_client_uses_conditional_poll(live_server: str, db: Session) -> None:
+    client = WebhookClient(live_server, "etag-client", prefer_stream=False)
+    client.interested_repos = ["acme/api"]
+    assert client.register_client()
+
+    assert client.poll() == PollOutcome()
+    assert client.poll().not_modified
+
+    EventStore().append(db, "push", {"ref": "main"}, "acme", "acme/api")
+    outcome = client.poll()
+    assert len(outcome.messages) == 1 and not outcome.not_modified
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_webhook_client_reports_retry_after(status: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    client = WebhookClient("http://127.0.0.1:9", "throttled")
+    client.client_id = 1
+
+    class Throttled:
+        status_code = status
+        headers = {"Retry-After": "45"}
+
+    monkeypatch.setattr(client.session, "get", lambda *args, **kwargs: Throttled())
+    assert client.poll() == PollOutcome(error=True, retry_after=45)
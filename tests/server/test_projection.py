@@ -0,0 +1,156 @@
+import random
+from typing import Any, Dict, List, Optional, Set
+
+import pytest
+from fastapi.testclient import TestClient
+
+from application.util.event_coalescer import REF_PATHS
+from application.util.friendly_message_builder import build_friendly_message
+from tests.server.test_ingest import simulator_payload
+from webhook.projection import SLIM_PROFILES, project_payload, slim_tree
+
+# 메시지 분기를 모두 지나가도록 이벤트별로 바꿔 가며 넣어 보는 action 값
+ACTIONS = [
+    "opened",
+    "closed",
+    "reopened",
+    "edited",
+    "synchronize",
+    "created",
+    "deleted",
+    "submitted",
+    "labeled",
+    "assigned",
+    "milestoned",
+    "published",
+    "requested",
+    "in_progress",
+    "queued",
+    "completed",
+]
+
+
+class RecordingPayload(dict):
+    """읽힌 필드 경로를 기록하고, 어떤 키든 기본값 타입에 맞는 값을 돌려주는 payload"""
+
+    def __init__(self, seen: Set[str], action: str, path: str = "") -> None:
+        super().__init__()
+        self._seen = seen
+        self._action = action
+        self._path = path
+
+    def _read(self, key: str, default: Any) -> Any:
+        path = f"{self._path}.{key}" if self._path else key
+        self._seen.add(path)
+        if key == "action":
+            return self._action
+        if isinstance(default, dict):
+            return RecordingPayload(self._seen, self._action, path)
+        if isinstance(default, list):
+            return [RecordingPayload(self._seen, self._action, f"{path}[]")]
+        if isinstance(default, bool):
+            return True
+        if isinstance(default, int):
+            return 3
+        return "value"
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        return self._read(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._read(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        return True
+
+    def __bool__(self) -> bool:
+        return True
+
+
+def is_kept(tree: Optional[Dict[str, Any]], path: str) -> bool:
+    for token in path.replace("[]", ".[]").split("."):
+        if tree is None:
+            return True  # 상위 값을 통째로 유지
+        if token not in tree:
+            return False
+        tree = tree[token]
+    return True
+
+
+def accessed_fields(event_type: str) -> Set[str]:
+    seen: Set[str] = set()
+    for action in ACTIONS:
+        payload = RecordingPayload(seen, action)
+        build_friendly_message({"event_type": event_type, "payload": payload})
+    return seen
+
+
+@pytest.mark.parametrize("event_type", sorted(SLIM_PROFILES) + ["ping"])
+def test_slim_profile_covers_client_message_fields(event_type: str) -> None:
+    tree = slim_tree(event_type)
+    missing = sorted(path for path in accessed_fields(event_type) if not is_kept(tree, path))
+    assert missing == []
+
+
+@pytest.mark.parametrize("event_type", sorted(REF_PATHS))
+def test_slim_profile_keeps_coalescing_keys(event_type: str) -> None:
+    tree = slim_tree(event_type)
+    paths = [path.replace(".0.", "[].") for path in REF_PATHS[event_type]]
+    assert [path for path in paths if not is_kept(tree, path)] == []
+
+
+def test_slim_payload_renders_same_message() -> None:
+    for event_type, action in [
+        ("pull_request", "opened"),
+        ("pull_request_review", "submitted"),
+        ("issues", "opened"),
+        ("issue_comment", "created"),
+        ("workflow_run", "completed"),
+    ]:
+        full = simulator_payload(event_type, action)
+        slim = project_payload(full, event_type, "slim")
+        assert len(str(slim)) < len(str(full))
+        base = {"event_type": event_type, "org_name": "acme", "repo_name": "api"}
+        # 메시지 문구는 무작위로 고르므로 같은 시드로 비교
+        random.seed(7)
+        expected = build_friendly_message({**base, "payload": full})
+        random.seed(7)
+        assert build_friendly_message({**base, "payload": slim}) == expected
+
+
+def test_fields_parameter_selects_paths() -> None:
+    payload = {
+        "action": "synchronize",
+        "commits": [{"id": "a", "message": "fix", "tree_id": "t"}],
+        "repository": {"full_name": "acme/api", "owner": {"login": "acme"}},
+    }
+    assert project_payload(payload, "push", fields="commits[].message,repository") == {
+        "commits": [{"message": "fix"}],
+        "repository": {"full_name": "acme/api", "owner": {"login": "acme"}},
+    }
+    # 프로필과 fields 를 함께 주면 합집합
+    merged = project_payload(payload, "push", "slim", fields="commits[].tree_id")
+    assert merged["commits"] == [{"id": "a", "message": "fix", "tree_id": "t"}]
+    assert "owner" not in merged["repository"]
+    assert project_payload(payload, "push", "full") is payload
+
+
+def test_poll_slim_profile_and_full_payload_endpoint(db: Any, api: TestClient) -> None:
+    client_id = api.post("/clients", json={"name": "slim-client"}).json()["id"]
+    full = simulator_payload("pull_request", "opened")
+    api.post("/webhook", json=full, headers={"X-GitHub-Event": "pull_request"})
+
+    messages: List[Dict[str, Any]] = api.get(
+        f"/poll/{client_id}", params={"wait": 5, "profile": "slim", "auto_ack": "false"}
+    ).json()["messages"]
+    assert len(messages) == 1
+    message = messages[0]
+    assert message["payload_projected"] is True
+    assert message["payload"]["pull_request"]["title"] == full["pull_request"]["title"]
+    assert "owner" not in message["payload"]["repository"]
+
+    response = api.get(f"/events/{message['sequence_id']}/payload")
+    assert response.status_code == 200
+    assert response.json() == full
+    assert api.get("/events/999999/payload").status_code == 404
+    assert api.get(f"/poll/{client_id}", params={"profile": "tiny"}).status_code == 422
@@ -0,0 +1,192 @@
+import json
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+import webhook.app as webhook_app
+from webhook.delivery import DeliveryTracker
+from webhook.event_store import EventStore
+from webhook.models import Client, EventRoute, MessageConsumption, WebhookEvent, write_lock
+from webhook.retention import RetentionManager, RetentionPolicy
+
+
+class FakeClock:
+    def __init__(self, start: datetime) -> None:
+        self.now = start
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, **kwargs: float) -> None:
+        self.now += timedelta(**kwargs)
+
+
+def make_client(db: Session, name: str, clock: FakeClock, repos: List[str]) -> Client:
+    client = Client(name=name, created_at=clock())
+    client.set_interested_repos(repos)
+    db.add(client)
+    db.commit()
+    EventStore().route_client(db, client)
+    return client
+
+
+def poll(db: Session, client: Client, clock: FakeClock, ack: bool = True) -> None:
+    DeliveryTracker().next_batch(db, client, auto_ack=ack, now=clock())
+    client.last_poll_at = clock()  # type: ignore[assignment]
+    db.commit()
+
+
+def receive_day(db: Session, clock: FakeClock, per_repo: int = 5) -> None:
+    store = EventStore()
+    for repo in ("acme/api", "acme/web"):
+        for _ in range(per_repo):
+            store.append(db, "push", {"pad": "x" * 100}, "acme", repo, received_at=clock())
+            clock.advance(minutes=10)
+
+
+def event_times(db: Session, repo: str) -> List[datetime]:
+    return [
+        event.received_at
+        for event in db.query(WebhookEvent).filter(WebhookEvent.repo_name == repo)
+    ]
+
+
+def test_weeks_of_traffic_keep_only_retention_window(db: Session) -> None:
+    clock = FakeClock(datetime(2024, 1, 1))
+    manager = RetentionManager(RetentionPolicy(max_age=timedelta(days=14), batch_size=7), clock)
+    active = make_client(db, "active", clock, ["acme/api"])
+    lagging = make_client(db, "lagging", clock, ["acme/web"])
+
+    # 6주 동안 매일 수신, active 는 매일 ack, lagging 은 poll 만 하고 ack 하지 않음
+    for _ in range(42):
+        receive_day(db, clock)
+        poll(db, active, clock)
+        poll(db, lagging, clock, ack=False)
+        manager.compact(db)
+        clock.advance(days=1)
+
+    last_compacted_at = clock() - timedelta(days=1)
+    cutoff = last_compacted_at - timedelta(days=14)
+    assert min(event_times(db, "acme/api")) >= cutoff
+    # 아직 확인하지 않은 이벤트는 보존 기간이 지나도 남아 있다
+    assert len(event_times(db, "acme/web")) == 42 * 5
+
+    # lagging 클라이언트가 보존 기간 이상 poll 하지 않으면 더 이상 보존하지 않는다
+    clock.advance(days=15)
+    result = manager.compact(db)
+    assert result["expired_events"] > 0
+    assert event_times(db, "acme/web") == []
+    # 확인이 끝난 전달 경로도 정리된다
+    assert db.query(EventRoute).filter(EventRoute.client_id == active.id).count() == 0
+
+
+def test_size_cap_prunes_oldest_acked_events(db: Session) -> None:
+    clock = FakeClock(datetime(2024, 1, 1))
+    client = make_client(db, "reader", clock, [])
+    for _ in range(7):
+        receive_day(db, clock)
+        clock.advance(days=1)
+    poll(db, client, clock)
+
+    total = db.query(func.sum(WebhookEvent.payload_size)).scalar()
+    cap = total // 3
+    manager = RetentionManager(
+        RetentionPolicy(max_age=timedelta(days=365), max_total_bytes=cap, batch_size=4), clock
+    )
+    newest = db.query(func.max(WebhookEvent.id)).scalar()
+
+    assert manager.compact(db)["oversize_events"] > 0
+    assert db.query(func.sum(WebhookEvent.payload_size)).scalar() <= cap
+    assert db.query(func.max(WebhookEvent.id)).scalar() == newest
+
+
+def test_unacked_events_are_not_pruned_for_size(db: Session) -> None:
+    clock = FakeClock(datetime(2024, 1, 1))
+    client = make_client(db, "slow", clock, [])
+    receive_day(db, clock)
+    poll(db, client, clock, ack=False)
+
+    manager = RetentionManager(RetentionPolicy(max_total_bytes=1), clock)
+    assert manager.compact(db)["oversize_events"] == 0
+    assert manager.stats(db)["pinned_event_count"] == 10
+
+    manager.policy.keep_until_acked = False
+    assert manager.compact(db)["oversize_events"] == 10
+
+
+def test_admin_endpoints_report_and_compact(
+    api: TestClient, db: Session, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clock = FakeClock(datetime(2024, 3, 1))
+    legacy = {
+        "timestamp": "2024-01-01T00:00:00",
+        "event_type": "push",
+        "org_name": "acme",
+        "repo_name": "acme/api",
+        "payload": {},
+    }
+    (tmp_path / "push_legacy.json").write_text(json.dumps(legacy), encoding="utf-8")
+    EventStore().import_legacy_files(db, tmp_path)
+    client = make_client(db, "old", clock, [])
+    db.add(
+        MessageConsumption(
+            client_id=client.id,
+            message_file="push_legacy.json",
+            event_type="push",
+            consumed_at=datetime(2024, 1, 2),
+        )
+    )
+    db.commit()
+
+    policy = RetentionPolicy(max_age=timedelta(days=14), delete_legacy_files=True)
+    manager = RetentionManager(policy, clock, data_dir=tmp_path)
+    monkeypatch.setattr(webhook_app, "retention_manager", manager)
+
+    before = api.get("/admin/storage").json()
+    assert before["event_count"] == 1 and before["legacy_file_count"] == 1
+    assert before["pinned_event_count"] == 1  # 새 클라이언트가 아직 확인하지 않음
+
+    poll(db, client, clock)
+    response = api.post("/admin/compact").json()
+    assert response["pruned"]["expired_events"] == 1
+    assert response["pruned"]["consumptions"] == 1
+    assert response["pruned"]["legacy_files"] == 1
+    assert response["storage"]["event_count"] == 0
+    assert not (tmp_path / "push_legacy.json").exists()
+
+
+def test_legacy_files_are_kept_by_default(db: Session, tmp_path: Path) -> None:
+    legacy = {"timestamp": "2024-01-01T00:00:00", "event_type": "push", "payload": {}}
+    (tmp_path / "push_legacy.json").write_text(json.dumps(legacy), encoding="utf-8")
+    EventStore().import_legacy_files(db, tmp_path)
+
+    manager = RetentionManager(RetentionPolicy(), data_dir=tmp_path)
+    assert manager.compact(db)["legacy_files"] == 0
+    assert (tmp_path / "push_legacy.json").exists()
+
+
+def test_compaction_writes_wait_for_write_lock(db: Session) -> None:
+    clock = FakeClock(datetime(2024, 1, 1))
+    receive_day(db, clock)
+    clock.advance(days=30)
+    manager = RetentionManager(RetentionPolicy(max_age=timedelta(days=14)), clock)
+
+    result: List[int] = []
+    with write_lock:
+        worker = threading.Thread(
+            target=lambda: result.append(manager.compact(db)["expired_events"])
+        )
+        worker.start()
+        worker.join(timeout=0.5)
+        # 수신 writer 가 잠금을 잡고 있는 동안 정리는 쓰기를 시작하지 않는다
+        assert worker.is_alive()
+    worker.join(timeout=10)
+
+    assert result == [10]
+    assert db.query(WebhookEvent).count() == 0
@@ -0,0 +1,221 @@
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from webhook.app import message_matches_client_interest
+from webhook.event_store import EventStore, encode_payload, split_repo_short_name
+from webhook.models import Client, EventRoute, WebhookEvent, write_lock
+from webhook.routing import InterestIndex, interest_index
+
+SAMPLES: List[tuple[Optional[str], Optional[str]]] = [
+    ("acme", "acme/api"),
+    ("acme", "acme/web"),
+    (None, "someone/api"),
+    ("other", "other/tool"),
+    (None, None),
+]
+
+INTERESTS: List[tuple[List[str], List[str]]] = [
+    ([], []),
+    (["acme"], []),
+    ([], ["acme/api"]),
+    ([], ["web"]),
+    (["other"], ["api"]),
+]
+
+
+def add_client(db: Session, name: str, orgs: List[str], repos: List[str]) -> Client:
+    client = Client(name=name)
+    client.set_interested_orgs(orgs)
+    client.set_interested_repos(repos)
+    db.add(client)
+    return client
+
+
+def test_index_matches_legacy_predicate(db: Session) -> None:
+    clients = [add_client(db, f"c{i}", orgs, repos) for i, (orgs, repos) in enumerate(INTERESTS)]
+    db.commit()
+    index = InterestIndex()
+    index.rebuild(db)
+
+    for org_name, repo_name in SAMPLES:
+        message = {"org_name": org_name, "repo_name": repo_name}
+        expected = {c.id for c in clients if message_matches_client_interest(message, c)}
+        assert index.match(org_name, repo_name) == expected
+
+
+def test_ingest_records_routes_for_registered_clients(db: Session, api: TestClient) -> None:
+    ids = [
+        api.post(
+            "/clients", json={"name": f"c{i}", "interested_orgs": orgs, "interested_repos": repos}
+        ).json()["id"]
+        for i, (orgs, repos) in enumerate(INTERESTS)
+    ]
+    store = EventStore()
+    for org_name, repo_name in SAMPLES:
+        store.append(db, "push", {}, org_name, repo_name)
+
+    for client_id in ids:
+        client = db.get(Client, client_id)
+        pending = {event.id for event in store.events_after(db, client, 0)}
+        expected = {
+            event.id
+            for event in store.list_events(db)
+            if message_matches_client_interest(
+                {"org_name": event.org_name, "repo_name": event.repo_name}, client
+            )
+        }
+        assert pending == expected
+
+
+def test_update_client_reroutes_unacked_events(db: Session, api: TestClient) -> None:
+    client_id = api.post(
+        "/clients", json={"name": "mover", "interested_repos": ["acme/api"]}
+    ).json()["id"]
+    headers = {"X-GitHub-Event": "push"}
+    api.post("/webhook", json={"repository": {"full_name": "acme/api"}}, headers=headers)
+    assert api.get(f"/poll/{client_id}", params={"wait": 5}).json()["total_new_messages"] == 1
+
+    api.post("/webhook", json={"repository": {"full_name": "acme/web"}}, headers=headers)
+    response = api.put(f"/clients/{client_id}", json={"interested_repos": ["acme/web"]})
+    assert response.json()["interested_repos"] == ["acme/web"]
+
+    # 이미 확인한 이벤트는 다시 전달하지 않고, 변경 전 수신된 미확인 이벤트는 새 관심사로 전달
+    messages = api.get(f"/poll/{client_id}", params={"wait": 5}).json()["messages"]
+    assert [m["repo_name"] for m in messages] == ["acme/web"]
+    assert api.put("/clients/999", json={}).status_code == 404
+
+
+def test_client_changes_reroute_under_write_lock(
+    api: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    locked: List[bool] = []
+    route_client = EventStore.route_client
+
+    def checked_route_client(self: EventStore, db: Session, client: Client) -> int:
+        locked.append(write_lock.locked())  # 수신 writer 가 옛 색인으로 저장하지 않는다
+        return route_client(self, db, client)
+
+    monkeypatch.setattr(EventStore, "route_client", checked_route_client)
+    client_id = api.post("/clients", json={"name": "locked"}).json()["id"]
+    api.put(f"/clients/{client_id}", json={"interested_orgs": ["acme"]})
+    assert locked == [True, True]
+
+
+# ---------------------------------------------------------------------------
+# microbenchmark: 500 clients x 50k events
+# ---------------------------------------------------------------------------
+CLIENT_COUNT = 500
+EVENT_COUNT = 50_000
+ORG_COUNT = 100
+REPOS_PER_ORG = 5
+
+
+def _benchmark_interests(i: int) -> tuple[List[str], List[str]]:
+    org = f"org{i % ORG_COUNT}"
+    kind = i % 4
+    if kind == 0:
+        return [org], []
+    if kind == 1:
+        return [], [f"{org}/svc{i % (ORG_COUNT * REPOS_PER_ORG)}"]
+    if kind == 2:
+        return [], [f"svc{(i * 7) % (ORG_COUNT * REPOS_PER_ORG)}"]
+    if i == 3:
+        return [], []  # 전체 이벤트를 받는 클라이언트 하나
+    return [f"org{(i + 1) % ORG_COUNT}"], [f"svc{(i * 3) % (ORG_COUNT * REPOS_PER_ORG)}"]
+
+
+def _benchmark_events() -> List[Dict[str, Any]]:
+    start = datetime(2024, 1, 1)
+    payload = encode_payload({"action": "completed"})
+    rows = []
+    for seq in range(1, EVENT_COUNT + 1):
+        repo_index = (seq * 7919) % (ORG_COUNT * REPOS_PER_ORG)
+        org_name = f"org{repo_index // REPOS_PER_ORG}"
+        repo_name = f"{org_name}/svc{repo_index}"
+        rows.append(
+            {
+                "id": seq,
+                "filename": f"bench_{seq}.json",
+                "event_type": "push",
+                "org_name": org_name,
+                "repo_name": repo_name,
+                "repo_short_name": split_repo_short_name(repo_name),
+                "received_at": start + timedelta(milliseconds=seq),
+                "payload": payload,
+                "payload_size": len(payload),
+            }
+        )
+    return rows
+
+
+def _median_seconds(func: Any, rounds: int = 5) -> float:
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def test_benchmark_indexed_routing_vs_predicate_per_poll(
+    db: Session, capsys: pytest.CaptureFixture[str]
+) -> None:
+    for i in range(CLIENT_COUNT):
+        add_client(db, f"bench{i}", *_benchmark_interests(i))
+    db.commit()
+    clients = list(db.query(Client).order_by(Client.id))
+
+    events = _benchmark_events()
+    db.execute(insert(WebhookEvent), events)
+
+    # 수신 경로: 이벤트마다 색인으로 대상 클라이언트를 한 번 계산
+    interest_index.rebuild(db)
+    started = time.perf_counter()
+    routes = [
+        {"client_id": client_id, "event_id": event["id"]}
+        for event in events
+        for client_id in interest_index.match(event["org_name"], event["repo_name"])
+    ]
+    ingest_seconds = time.perf_counter() - started
+    db.execute(insert(EventRoute), routes)
+    db.commit()
+
+    store = EventStore()
+    messages = [{"org_name": e["org_name"], "repo_name": e["repo_name"]} for e in events]
+    sample = [c for c in clients if c.get_interested_orgs() or c.get_interested_repos()][:5]
+
+    # 기존 경로: poll 마다 모든 이벤트에 대해 관심사 판정 (JSON 해석 포함)
+    def legacy_poll(client: Client) -> List[int]:
+        return [
+            event["id"]
+            for event, message in zip(events, messages)
+            if message_matches_client_interest(message, client)
+        ]
+
+    for client in sample:
+        assert [e.id for e in store.events_after(db, client, 0)] == legacy_poll(client)
+
+    legacy = statistics.median(
+        _median_seconds(lambda c=client: legacy_poll(c), rounds=3) for client in sample
+    )
+    indexed = statistics.median(
+        _median_seconds(lambda c=client: store.events_after(db, client, 0)) for client in sample
+    )
+
+    with capsys.disabled():
+        print(
+            f"\n[routing benchmark] clients={CLIENT_COUNT} events={EVENT_COUNT} "
+            f"routes={len(routes)} ingest_match={ingest_seconds * 1000:.1f}ms "
+            f"poll legacy={legacy * 1000:.2f}ms indexed={indexed * 1000:.2f}ms "
+            f"(x{legacy / indexed:.0f}); full poll round legacy≈{legacy * CLIENT_COUNT:.1f}s "
+            f"indexed≈{indexed * CLIENT_COUNT:.2f}s"
+        )
+
+    assert indexed * 10 < legacy
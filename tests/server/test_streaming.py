@@ -0,0 +1,280 @@
+import asyncio
+import contextlib
+import json
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pytest
+import requests
+
+import webhook.app as webhook_app
+from application.util.event_stream_manager import EventStreamManager
+from application.util.webhook_client import WebhookClient
+from webhook.models import Client
+
+
+def register(base_url: str, **interests: Any) -> int:
+    response = requests.post(f"{base_url}/clients", json={"name": "stream-client", **interests})
+    response.raise_for_status()
+    return int(response.json()["id"])
+
+
+def post_event(base_url: str, repo: str = "acme/api", wait: bool = True) -> None:
+    payload = {"repository": {"full_name": repo, "owner": {"login": repo.split("/")[0]}}}
+    response = requests.post(
+        f"{base_url}/webhook", json=payload, headers={"X-GitHub-Event": "push"}
+    )
+    assert response.status_code == 202
+    if wait:
+        wait_ingested(base_url)
+
+
+def wait_ingested(base_url: str, timeout: float = 5) -> None:
+    """수신 큐에 들어간 이벤트가 모두 저장될 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        stats = requests.get(f"{base_url}/ingest/stats", timeout=5).json()
+        if stats["accepted"] == stats["persisted"] + stats["failed"]:
+            return
+        time.sleep(0.01)
+    raise AssertionError("수신 큐가 비워지지 않았습니다")
+
+
+def read_sse(response: requests.Response) -> Iterator[Tuple[str, str]]:
+    """(event, data) 쌍을 순서대로 반환 (heartbeat 주석은 ("comment", 내용))"""
+    event, data = "message", ""
+    for line in response.iter_lines(decode_unicode=True):
+        if line.startswith(":"):
+            yield "comment", line[1:].strip()
+        elif line.startswith("event:"):
+            event = line.split(":", 1)[1].strip()
+        elif line.startswith("data:"):
+            data = line.split(":", 1)[1].strip()
+        elif not line:
+            yield event, data
+            event, data = "message", ""
+
+
+def test_long_poll_wakes_on_ingest(live_server: str) -> None:
+    client_id = register(live_server)
+    threading.Timer(0.3, post_event, args=(live_server, "acme/api", False)).start()
+
+    started = time.monotonic()
+    response = requests.get(f"{live_server}/poll/{client_id}", params={"wait": 10}, timeout=15)
+    elapsed = time.monotonic() - started
+
+    assert response.json()["total_new_messages"] == 1
+    assert elapsed < 5  # wait 전체를 채우지 않고 수신 즉시 응답
+
+
+def test_long_poll_times_out_without_events(live_server: str) -> None:
+    client_id = register(live_server, interested_repos=["other"])
+    post_event(live_server)  # 관심 없는 이벤트로는 깨어나도 응답하지 않는다
+
+    response = requests.get(f"{live_server}/poll/{client_id}", params={"wait": 1}, timeout=10)
+    assert response.json()["total_new_messages"] == 0
+
+
+def test_stream_backlog_ready_and_live_events(live_server: str) -> None:
+    client_id = register(live_server)
+    post_event(live_server)
+
+    with requests.get(f"{live_server}/stream/{client_id}", stream=True, timeout=10) as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = read_sse(response)
+        event, data = next(events)
+        assert event == "webhook"
+        first = json.loads(data)["sequence_id"]
+        assert next(events)[0] == "ready"
+
+        post_event(live_server)
+        event, data = next(events)
+        second = json.loads(data)["sequence_id"]
+        assert event == "webhook" and second > first
+
+    # Last-Event-ID 이후부터 이어받기
+    with requests.get(
+        f"{live_server}/stream/{client_id}",
+        stream=True,
+        timeout=10,
+        headers={"Last-Event-ID": str(first)},
+    ) as response:
+        event, data = next(read_sse(response))
+        assert event == "webhook" and json.loads(data)["sequence_id"] == second
+
+
+def test_stream_heartbeat(live_server: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(webhook_app, "STREAM_HEARTBEAT_SECONDS", 0.2)
+    client_id = register(live_server)
+
+    with requests.get(f"{live_server}/stream/{client_id}", stream=True, timeout=10) as response:
+        events = read_sse(response)
+        assert next(events)[0] == "ready"
+        assert next(events) == ("comment", "heartbeat")
+
+
+def test_stream_limit_and_unknown_client(live_server: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    client_id = register(live_server)
+    assert requests.get(f"{live_server}/stream/999", timeout=5).status_code == 404
+
+    monkeypatch.setattr(webhook_app, "MAX_CONCURRENT_STREAMS", 0)
+    response = requests.get(f"{live_server}/stream/{client_id}", timeout=5)
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
+
+
+async def test_stream_limit_holds_under_concurrent_burst(
+    db: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = Client(name="burst-client")
+    db.add(client)
+    db.commit()
+    monkeypatch.setattr(webhook_app, "MAX_CONCURRENT_STREAMS", 2)
+    monkeypatch.setattr(webhook_app, "_active_streams", 0)
+
+    async def disconnected() -> bool:
+        return True
+
+    request = SimpleNamespace(is_disconnected=disconnected)
+    results = await asyncio.gather(
+        *(
+            webhook_app.stream_messages(client.id, request, None, "full", None)  # type: ignore
+            for _ in range(5)
+        ),
+        return_exceptions=True,
+    )
+
+    # 클라이언트 조회를 기다리는 동안 들어온 요청도 자리를 잡은 요청 수로 제한된다
+    responses = [result for result in results if not isinstance(result, Exception)]
+    rejected = [result for result in results if isinstance(result, webhook_app.HTTPException)]
+    assert len(responses) == 2
+    assert [error.status_code for error in rejected] == [503] * 3
+    assert webhook_app._active_streams == 2
+
+    for response in responses:
+        async for _ in response.body_iterator:
+            pass
+    assert webhook_app._active_streams == 0
+
+
+async def test_abandoned_streams_release_their_slots(
+    db: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client = Client(name="abandon-client")
+    db.add(client)
+    db.commit()
+    monkeypatch.setattr(webhook_app, "_active_streams", 0)
+
+    async def connected() -> bool:
+        return False
+
+    async def gone(message: Any) -> None:
+        raise OSError("클라이언트 연결 끊김")
+
+    async def disconnect() -> Dict[str, str]:
+        return {"type": "http.disconnect"}
+
+    async def never_sent(message: Any) -> None:
+        await asyncio.sleep(3600)
+
+    request = SimpleNamespace(is_disconnected=connected)
+    # 본문이 시작되기 전에 끊긴 연결 (ASGI 2.4 는 send 실패, 이전 버전은 disconnect 수신)
+    for spec_version, send in (("2.4", gone), ("2.0", never_sent)):
+        response = await webhook_app.stream_messages(
+            client.id, request, None, "full", None  # type: ignore[arg-type]
+        )
+        assert webhook_app._active_streams == 1
+        scope = {"type": "http", "asgi": {"spec_version": spec_version}}
+        with contextlib.suppress(Exception):
+            await response(scope, disconnect, send)
+        assert webhook_app._active_streams == 0
+
+
+def test_event_stream_manager_batches_backlog_then_falls_back(live_server: str) -> None:
+    client_id = register(live_server)
+    post_event(live_server)
+    post_event(live_server)
+
+    batches: List[Tuple[List[Dict[str, Any]], bool]] = []
+    received = threading.Event()
+    fell_back = threading.Event()
+
+    def handle(messages: List[Dict[str, Any]], first_batch: bool) -> None:
+        batches.append((messages, first_batch))
+        received.set()
+
+    def open_stream(last_event_id: Any) -> requests.Response:
+        response = requests.get(f"{live_server}/stream/{client_id}", stream=True, timeout=10)
+        response.raise_for_status()
+        return response
+
+    manager = EventStreamManager(open_stream, handle, fell_back.set)
+    manager.start()
+    try:
+        assert received.wait(5)
+        assert len(batches[0][0]) == 2 and batches[0][1] is True
+        assert manager.last_event_id == str(batches[0][0][-1]["sequence_id"])
+    finally:
+        manager.stop()
+
+    # 스트림을 지원하지 않는 서버에서는 즉시 polling 으로 전환
+    def open_missing(last_event_id: Any) -> requests.Response:
+        response = requests.get(f"{live_server}/stream-missing", stream=True, timeout=5)
+        response.raise_for_status()
+        return response
+
+    fallback = EventStreamManager(open_missing, handle, fell_back.set)
+    fallback.start()
+    assert fell_back.wait(5)
+    assert not fallback.is_running
+
+
+def test_stream_redelivers_after_failed_flush(
+    live_server: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    client_id = register(live_server)
+    post_event(live_server)
+    post_event(live_server)
+
+    client = WebhookClient(live_server, "stream-ack", coalesce_window=0)
+    client.client_id = client_id
+    delivered: List[int] = []
+    outcomes = [False]  # 첫 전달은 API 서버 장애로 실패, 이후 복구
+    monkeypatch.setattr(
+        client, "send_notification_to_self", lambda m: delivered.append(m["sequence_id"]) or True
+    )
+    monkeypatch.setattr(
+        client, "_flush_notifications", lambda: outcomes.pop(0) if outcomes else True
+    )
+    opened: List[Any] = []
+
+    def open_stream(last_event_id: Any) -> requests.Response:
+        opened.append(last_event_id)
+        return client.open_event_stream(last_event_id)
+
+    manager = EventStreamManager(
+        open_stream, client._handle_polled_messages, lambda: None, reconnect_delay=0.05
+    )
+    client._stream_manager = manager
+
+    def acked_seq() -> int:
+        return int(client.get_client_info()["acked_sequence_id"])  # type: ignore[index]
+
+    manager.start()
+    try:
+        deadline = time.monotonic() + 5
+        while acked_seq() == 0 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        first, second = delivered[:2]
+        assert acked_seq() == second  # 되감은 스트림으로 다시 받아 ack 커서가 전진
+        assert opened[:2] == [None, "0"]
+
+        post_event(live_server)
+        while acked_seq() == second and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert acked_seq() > second
+        assert delivered == [first, second, first, second, acked_seq()]
+    finally:
+        manager.stop()
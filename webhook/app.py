@@ -1,33 +1,96 @@
+import asyncio
 import hashlib
 import hmac
 import json
 import os
-from werkzeug.utils import secure_filename
-from datetime import datetime
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Literal, NamedTuple, Optional
 
 import uvicorn
-from fastapi import Depends, FastAPI, Header, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from loguru import logger
 from pydantic import BaseModel
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from webhook.models import Client, MessageConsumption, create_tables, get_db
-
-app = FastAPI(title="GitHub Webhook Server", version="1.0.0")
+from webhook.delivery import delivery_tracker
+from webhook.event_store import event_store
+from webhook.ingest import IngestItem, IngestPipeline
+from webhook.models import (
+    Client,
+    SessionLocal,
+    WebhookEvent,
+    create_tables,
+    get_db,
+    run_db,
+    write_lock,
+)
+from webhook.notifier import event_notifier
+from webhook.payload_codec import decode_payload
+from webhook.retention import RetentionManager
+from webhook.routing import interest_index
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    retention_task = asyncio.create_task(retention_manager.run_periodic())
+    yield
+    retention_task.cancel()
+    # 종료 전에 수신 큐에 남은 이벤트 저장
+    await ingest_pipeline.stop()
+
+
+app = FastAPI(title="GitHub Webhook Server", version="1.0.0", lifespan=lifespan)
+
+# Accept-Encoding: gzip 요청에 poll 응답 등을 압축해서 전달 (SSE 스트림은 압축 제외)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
 
 # 환경변수에서 GitHub webhook secret 가져오기
 GITHUB_WEBHOOK_SECRET = os.getenv("GITHUB_WEBHOOK_SECRET", "")
 
-# 데이터 저장 폴더 설정
-DATA_DIR = Path("data")
+# 데이터 저장 폴더 설정 (기존 파일 기반 저장소, 이벤트 저장소로 가져오기 전용)
+DATA_DIR = Path(os.getenv("WEBHOOK_DATA_DIR", "data"))
 DATA_DIR.mkdir(exist_ok=True)
 
 # 데이터베이스 테이블 생성
 create_tables()
 
+# 관심사 라우팅 색인을 만들고, 기존 data/*.json 파일과 소비 이력을
+# 이벤트 저장소/커서로 한 번 가져오기
+with SessionLocal() as _migration_db:
+    interest_index.rebuild(_migration_db)
+    event_store.backfill_routes(_migration_db)
+    event_store.import_legacy_files(_migration_db, DATA_DIR)
+    delivery_tracker.migrate_consumptions(_migration_db)
+    event_notifier.latest_seq = _migration_db.query(func.max(WebhookEvent.id)).scalar() or 0
+
+# 보존 기간/용량 정책에 따른 주기적 저장소 정리 (WEBHOOK_RETENTION_* 환경변수)
+retention_manager = RetentionManager(data_dir=DATA_DIR)
+
+# poll 한 번에 전달하는 최대 메시지 수
+POLL_BATCH_LIMIT = int(os.getenv("WEBHOOK_POLL_BATCH_LIMIT", "500"))
+
+# long-poll 최대 대기 시간 (초)
+MAX_POLL_WAIT_SECONDS = 60
+
+# 커서가 바뀌지 않은 poll 은 이 간격마다만 last_poll_at 을 기록한다 (초)
+POLL_TOUCH_INTERVAL = timedelta(seconds=float(os.getenv("WEBHOOK_POLL_TOUCH_INTERVAL", "60")))
+
+# SSE 스트림 설정
+MAX_CONCURRENT_STREAMS = int(os.getenv("WEBHOOK_MAX_STREAMS", "100"))
+STREAM_HEARTBEAT_SECONDS = float(os.getenv("WEBHOOK_STREAM_HEARTBEAT", "15"))
+_active_streams = 0
+
+# payload projection (slim: 클라이언트 알림 메시지에 필요한 필드만 전달)
+PayloadProfile = Literal["full", "slim"]
+PROFILE_DESCRIPTION = "slim 이면 알림 표시에 필요한 필드만 전달 (전체는 /events/{id}/payload)"
+FIELDS_DESCRIPTION = "쉼표로 구분한 payload 필드 경로 (예: action,pull_request.title,commits[].message)"
+
 
 # Pydantic 모델들
 class ClientCreate(BaseModel):
@@ -37,6 +100,12 @@ class ClientCreate(BaseModel):
     interested_repos: Optional[List[str]] = None
 
 
+class ClientUpdate(BaseModel):
+    description: Optional[str] = None
+    interested_orgs: Optional[List[str]] = None
+    interested_repos: Optional[List[str]] = None
+
+
 class ClientResponse(BaseModel):
     id: int
     name: str
@@ -45,6 +114,7 @@ class ClientResponse(BaseModel):
     interested_repos: List[str]
     created_at: datetime
     last_poll_at: Optional[datetime]
+    acked_sequence_id: int = 0
     
     @classmethod
     def from_client(cls, client: Client) -> 'ClientResponse':
@@ -55,7 +125,8 @@ class ClientResponse(BaseModel):
             interested_orgs=client.get_interested_orgs(),
             interested_repos=client.get_interested_repos(),
             created_at=client.created_at,  # type: ignore
-            last_poll_at=client.last_poll_at  # type: ignore
+            last_poll_at=client.last_poll_at,  # type: ignore
+            acked_sequence_id=client.acked_seq or 0,  # type: ignore
         )
 
 
@@ -64,6 +135,17 @@ class PollResponse(BaseModel):
     messages: List[Dict[str, Any]]
     total_new_messages: int
     poll_timestamp: datetime
+    last_sequence_id: Optional[int] = None
+    has_more: bool = False
+
+
+class AckRequest(BaseModel):
+    sequence_id: int
+
+
+class AckResponse(BaseModel):
+    client_id: int
+    acked_sequence_id: int
 
 
 def verify_signature(payload_body: bytes, signature_header: str) -> bool:
@@ -113,50 +195,59 @@ def extract_org_repo_info(
 
 
 def save_webhook_data(
-    payload: Dict[str, Any], event_type: str
-) -> tuple[str, Optional[str], Optional[str]]:
-    """Webhook 데이터를 파일로 저장하고 org/repo 정보 반환"""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]  # 밀리초까지
-
-    # 파일명 생성 (이벤트 타입과 타임스탬프 포함)
-    sanitized_event_type = secure_filename(event_type)
-    filename = f"{sanitized_event_type}_{timestamp}.json"
-    filepath = os.path.normpath(DATA_DIR / filename)
-
-    # Ensure the filepath is within the DATA_DIR
-    if not str(filepath).startswith(str(DATA_DIR)):
-        raise ValueError("Invalid file path: potential directory traversal detected")
-
+    payload: Dict[str, Any],
+    event_type: str,
+    db: Session,
+    received_at: Optional[datetime] = None,
+    commit: bool = True,
+) -> tuple[WebhookEvent, Optional[str], Optional[str]]:
+    """Webhook 데이터를 이벤트 저장소에 기록하고 org/repo 정보 반환"""
     # org/repo 정보 추출
     org_name, repo_name = extract_org_repo_info(payload)
 
-    # 저장할 데이터 구성
-    webhook_data = {
-        "timestamp": datetime.now().isoformat(),
-        "event_type": event_type,
-        "org_name": org_name,
-        "repo_name": repo_name,
-        "payload": payload,
-    }
-
-    # JSON 파일로 저장
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(webhook_data, f, indent=2, ensure_ascii=False)
+    event = event_store.append(
+        db, event_type, payload, org_name, repo_name, received_at=received_at, commit=commit
+    )
 
     logger.info(
-        f"Webhook 데이터가 저장되었습니다: {filepath} (org: {org_name}, repo: {repo_name})"
+        f"Webhook 데이터가 저장되었습니다: {event.filename} "
+        f"(seq: {event.id}, org: {org_name}, repo: {repo_name})"
     )
-    return str(filepath), org_name, repo_name
+    return event, org_name, repo_name
+
+
+def persist_webhook_batch(db: Session, items: List[IngestItem]) -> int:
+    """수신 큐의 이벤트들을 하나의 트랜잭션으로 저장하고 마지막 시퀀스 반환 (group commit)"""
+    with write_lock:
+        try:
+            last_seq = 0
+            for item in items:
+                event, _, _ = save_webhook_data(
+                    item.payload, item.event_type, db, received_at=item.received_at, commit=False
+                )
+                last_seq = int(event.id)  # type: ignore
+            db.commit()
+        except Exception:
+            db.rollback()  # 다음 writer 가 쓰기 전에 트랜잭션을 정리
+            raise
+    return last_seq
+
+
+# 저장은 백그라운드 writer 가 모아서 처리하고, 저장 후 대기 중인 long-poll/스트림을 깨운다
+ingest_pipeline = IngestPipeline(persist_webhook_batch, event_notifier.publish)
 
+# 수신 큐가 가득 찼을 때 재시도를 권장하는 시간 (초)
+INGEST_RETRY_AFTER_SECONDS = 1
 
-@app.post("/webhook")
+
+@app.post("/webhook", status_code=202)
 async def receive_webhook(
     request: Request,
     x_github_event: Optional[str] = Header(None),
     x_hub_signature_256: Optional[str] = Header(None),
     x_github_delivery: Optional[str] = Header(None),
 ) -> JSONResponse:
-    """GitHub Webhook 수신 엔드포인트"""
+    """GitHub Webhook 수신 엔드포인트 (저장은 비동기로 처리하고 202 응답)"""
     try:
         # 요청 본문 읽기
         payload_body = await request.body()
@@ -180,20 +271,27 @@ async def receive_webhook(
             f"GitHub Webhook 수신: {event_type} (Delivery: {x_github_delivery})"
         )
 
-        # 데이터 저장
-        saved_file, org_name, repo_name = save_webhook_data(payload, event_type)
+        # 수신 큐에 넣고 바로 응답 (가득 찼으면 잠시 후 재전송 요청)
+        item = IngestItem(event_type=event_type, payload=payload, delivery_id=x_github_delivery)
+        if not ingest_pipeline.submit(item):
+            logger.warning(f"수신 큐가 가득 찼습니다 (depth: {ingest_pipeline.depth})")
+            raise HTTPException(
+                status_code=503,
+                detail="수신 대기열이 가득 찼습니다",
+                headers={"Retry-After": str(INGEST_RETRY_AFTER_SECONDS)},
+            )
 
         # 응답
         response_data = {
-            "status": "success",
+            "status": "accepted",
             "message": "Webhook 수신 완료",
             "event_type": event_type,
             "delivery_id": x_github_delivery,
-            "saved_file": saved_file,
+            "queue_depth": ingest_pipeline.depth,
             "timestamp": datetime.now().isoformat(),
         }
 
-        return JSONResponse(content=response_data, status_code=200)
+        return JSONResponse(content=response_data, status_code=202)
 
     except HTTPException:
         raise
@@ -219,31 +317,54 @@ async def health_check() -> Dict[str, str]:
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
 
+@app.get("/ingest/stats")
+async def ingest_stats() -> Dict[str, int]:
+    """수신 큐 상태 (대기 이벤트 수, 처리/거절 건수)"""
+    return ingest_pipeline.stats()
+
+
+@app.get("/admin/storage")
+def storage_stats(db: Session = Depends(get_db)) -> Dict[str, Any]:
+    """이벤트 저장소 사용량과 보존 정책"""
+    return retention_manager.stats(db)
+
+
+def _compact_storage(db: Session) -> Dict[str, Any]:
+    pruned = retention_manager.compact(db)
+    return {"pruned": pruned, "storage": retention_manager.stats(db)}
+
+
+@app.post("/admin/compact")
+async def compact_storage() -> Dict[str, Any]:
+    """보존 정책에 따른 저장소 정리를 즉시 실행 (수신 저장과 같은 DB 스레드/쓰기 잠금 사용)"""
+    return await run_db(_compact_storage)
+
+
+def _list_saved_files(db: Session) -> List[Dict[str, Any]]:
+    return [
+        {
+            "filename": event.filename,
+            "sequence_id": event.id,
+            "size": event.payload_size,
+            "created": event.received_at.isoformat(),
+            "modified": event.received_at.isoformat(),
+        }
+        for event in event_store.list_events(db)
+    ]
+
+
 @app.get("/files")
 async def list_saved_files() -> Dict[str, Any]:
-    """저장된 webhook 파일 목록 조회"""
-    files = []
-    for file_path in DATA_DIR.glob("*.json"):
-        stat = file_path.stat()
-        files.append(
-            {
-                "filename": file_path.name,
-                "size": stat.st_size,
-                "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            }
-        )
-
+    """저장된 webhook 이벤트 목록 조회"""
+    files = await run_db(_list_saved_files)
     return {
         "total_files": len(files),
-        "files": sorted(files, key=lambda x: x["created"], reverse=True),
+        "files": files,
     }
 
 
 # 클라이언트 관리 API
-@app.post("/clients", response_model=ClientResponse)
-async def create_client(client_data: ClientCreate, db: Session = Depends(get_db)) -> ClientResponse:
-    """새 클라이언트 등록 또는 기존 클라이언트 반환"""
+def _create_client(db: Session, client_data: ClientCreate) -> ClientResponse:
     # 이름 중복 체크
     existing_client = db.query(Client).filter(Client.name == client_data.name).first()
     if existing_client:
@@ -262,9 +383,12 @@ async def create_client(client_data: ClientCreate, db: Session = Depends(get_db)
     if client_data.interested_repos:
         new_client.set_interested_repos(client_data.interested_repos)
 
-    db.add(new_client)
-    db.commit()
-    db.refresh(new_client)
+    # 라우팅 색인 재구축 및 기존 이벤트 전달 대상 반영 (수신 writer 와 차례를 정한다)
+    with write_lock:
+        db.add(new_client)
+        db.commit()
+        db.refresh(new_client)
+        event_store.route_client(db, new_client)
 
     # 응답용 데이터 구성
     response_data = ClientResponse.from_client(new_client)
@@ -275,28 +399,73 @@ async def create_client(client_data: ClientCreate, db: Session = Depends(get_db)
     return response_data
 
 
-@app.get("/clients", response_model=List[ClientResponse])
-async def list_clients(db: Session = Depends(get_db)) -> List[ClientResponse]:
-    """클라이언트 목록 조회"""
+@app.post("/clients", response_model=ClientResponse)
+async def create_client(client_data: ClientCreate) -> ClientResponse:
+    """새 클라이언트 등록 또는 기존 클라이언트 반환"""
+    return await run_db(_create_client, client_data)
+
+
+def _list_clients(db: Session) -> List[ClientResponse]:
     clients = db.query(Client).all()
 
     return [ClientResponse.from_client(client) for client in clients]
 
 
+@app.get("/clients", response_model=List[ClientResponse])
+async def list_clients() -> List[ClientResponse]:
+    """클라이언트 목록 조회"""
+    return await run_db(_list_clients)
+
+
+def _get_client(db: Session, client_id: int) -> ClientResponse:
+    client = db.query(Client).filter(Client.id == client_id).first()
+    if not client:
+        raise HTTPException(status_code=404, detail="클라이언트를 찾을 수 없습니다")
+
+    return ClientResponse.from_client(client)
+
+
 @app.get("/clients/{client_id}", response_model=ClientResponse)
-async def get_client(client_id: int, db: Session = Depends(get_db)) -> ClientResponse:
+async def get_client(client_id: int) -> ClientResponse:
     """특정 클라이언트 정보 조회"""
+    return await run_db(_get_client, client_id)
+
+
+def _update_client(db: Session, client_id: int, client_data: ClientUpdate) -> ClientResponse:
     client = db.query(Client).filter(Client.id == client_id).first()
     if not client:
         raise HTTPException(status_code=404, detail="클라이언트를 찾을 수 없습니다")
 
+    with write_lock:
+        if client_data.description is not None:
+            client.description = client_data.description  # type: ignore
+        if client_data.interested_orgs is not None:
+            client.set_interested_orgs(client_data.interested_orgs)
+        if client_data.interested_repos is not None:
+            client.set_interested_repos(client_data.interested_repos)
+        db.commit()
+
+        # 관심사가 바뀌었으므로 색인과 미확인 이벤트의 전달 대상을 다시 계산
+        event_store.route_client(db, client)
+
+    logger.info(f"클라이언트 정보가 변경되었습니다: {client.name} (ID: {client_id})")
     return ClientResponse.from_client(client)
 
 
+@app.put("/clients/{client_id}", response_model=ClientResponse)
+async def update_client(client_id: int, client_data: ClientUpdate) -> ClientResponse:
+    """클라이언트 설명/관심사 변경 (지정한 항목만 변경)"""
+    return await run_db(_update_client, client_id, client_data)
+
+
 def message_matches_client_interest(
     webhook_data: Dict[str, Any], client: Client
 ) -> bool:
-    """메시지가 클라이언트의 관심사와 일치하는지 확인"""
+    """메시지가 클라이언트의 관심사와 일치하는지 확인
+
+    poll 은 수신 시점에 기록한 전달 경로를 사용하며, 이 함수는 라우팅 색인
+    (`webhook.routing.InterestIndex`)과 같은 규칙을 정의하는 기준 구현이다.
+    """
     org_name = webhook_data.get("org_name")
     repo_name = webhook_data.get("repo_name")
 
@@ -325,81 +494,280 @@ def message_matches_client_interest(
     return False
 
 
-@app.get("/poll/{client_id}", response_model=PollResponse)
-async def poll_messages(client_id: int, db: Session = Depends(get_db)) -> PollResponse:
-    """클라이언트가 새로운 메시지를 polling"""
+class PollBatch(NamedTuple):
+    client_name: str
+    messages: List[Dict[str, Any]]
+    last_seq: Optional[int]
+    has_more: bool
+    etag: str  # 전달할 메시지가 없는 상태의 식별자 (커서가 바뀌면 달라짐)
+
+
+def _poll_batch(
+    db: Session,
+    client_id: int,
+    limit: int,
+    auto_ack: bool,
+    profile: Optional[str],
+    fields: Optional[str],
+) -> PollBatch:
+    """전달 커서 이후의 관심 이벤트를 메시지로 변환하고 커서/poll 시간 기록"""
     # 클라이언트 존재 확인
     client = db.query(Client).filter(Client.id == client_id).first()
     if not client:
         raise HTTPException(status_code=404, detail="클라이언트를 찾을 수 없습니다")
 
-    # 이미 소비한 메시지 목록 가져오기
-    consumed_files = set()
-    consumed_messages = (
-        db.query(MessageConsumption)
-        .filter(MessageConsumption.client_id == client_id)
-        .all()
+    events, has_more = delivery_tracker.next_batch(db, client, limit=limit, auto_ack=auto_ack)
+
+    messages = []
+    for event in events:
+        try:
+            messages.append(event_store.to_message(event, profile, fields))
+        except Exception as e:
+            logger.error(f"이벤트 읽기 오류 ({event.filename}): {e}")
+
+    last_seq = int(events[-1].id) if events else None  # type: ignore
+    etag = f'W/"{client_id}-{client.acked_seq or 0}-{client.delivered_seq or 0}"'
+    batch = PollBatch(str(client.name), messages, last_seq, has_more, etag)
+    _record_poll(db, client)
+    return batch
+
+
+def _record_poll(db: Session, client: Client) -> None:
+    """커서가 바뀌었거나 last_poll_at 이 POLL_TOUCH_INTERVAL 보다 오래됐을 때만 commit
+
+    빈 poll 마다 전역 쓰기 잠금을 잡으면 동시에 poll 하는 클라이언트가 한 줄로 서게 된다.
+    """
+    now = datetime.now()
+    last_poll_at = client.last_poll_at
+    stale = last_poll_at is None or now - last_poll_at >= POLL_TOUCH_INTERVAL
+    if not stale and not db.is_modified(client):
+        return
+    client.last_poll_at = now  # type: ignore[assignment]
+    with write_lock:
+        db.commit()
+
+
+@app.get("/poll/{client_id}", response_model=PollResponse)
+async def poll_messages(
+    client_id: int,
+    auto_ack: bool = Query(True, description="false 이면 /ack 전까지 lease 만료 후 재전달"),
+    limit: int = Query(POLL_BATCH_LIMIT, ge=1, le=5000),
+    wait: int = Query(0, ge=0, le=MAX_POLL_WAIT_SECONDS, description="long-poll 대기 시간(초)"),
+    profile: PayloadProfile = Query("full", description=PROFILE_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+    if_none_match: Optional[str] = Header(None),
+) -> Any:
+    """클라이언트가 새로운 메시지를 polling
+
+    새 메시지가 없으면 ETag 를 붙여 응답하고, 다음 요청의 If-None-Match 가 같은
+    상태를 가리키면 본문 없이 304 로 응답한다.
+    """
+    # 전달 커서 이후의 관심 이벤트만 조회 (조회 전 알림 세대를 기록해 두어 누락 방지)
+    seen = event_notifier.generation
+    batch_args = (client_id, limit, auto_ack, profile, fields)
+    batch = await run_db(_poll_batch, *batch_args)
+
+    # long-poll: 새 메시지가 없으면 관심 이벤트가 저장될 때까지 대기 (대기 중 세션 없음)
+    if batch.last_seq is None and wait > 0:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait
+        while batch.last_seq is None:
+            remaining = deadline - loop.time()
+            if remaining <= 0 or not await event_notifier.wait_for_newer(seen, remaining):
+                break
+            seen = event_notifier.generation
+            batch = await run_db(_poll_batch, *batch_args)
+
+    if batch.last_seq is None:
+        if if_none_match == batch.etag:
+            return Response(status_code=304, headers={"ETag": batch.etag})
+    else:
+        logger.info(
+            f"클라이언트 {batch.client_name} (ID: {client_id})가 "
+            f"{len(batch.messages)}개의 새 메시지를 polling했습니다"
+        )
+
+    response = PollResponse(
+        client_id=client_id,
+        messages=batch.messages,
+        total_new_messages=len(batch.messages),
+        poll_timestamp=datetime.now(),
+        last_sequence_id=batch.last_seq,
+        has_more=batch.has_more,
     )
+    headers = {"ETag": batch.etag} if batch.last_seq is None else None
+    return JSONResponse(content=jsonable_encoder(response), headers=headers)
 
-    for msg in consumed_messages:
-        consumed_files.add(msg.message_file)
 
-    # 새로운 메시지 찾기
-    new_messages = []
+def _get_event_payload(db: Session, event_id: int) -> Dict[str, Any]:
+    event = db.get(WebhookEvent, event_id)
+    if not event:
+        raise HTTPException(status_code=404, detail="이벤트를 찾을 수 없습니다")
+    return decode_payload(event.payload)  # type: ignore
 
-    for file_path in DATA_DIR.glob("*.json"):
-        filename = file_path.name
 
-        # 이미 소비한 메시지는 건너뛰기
-        if filename in consumed_files:
-            continue
+@app.get("/events/{event_id}/payload")
+async def get_event_payload(event_id: int) -> Dict[str, Any]:
+    """이벤트의 전체 payload 조회 (slim poll 응답에서 생략된 필드가 필요할 때)"""
+    return await run_db(_get_event_payload, event_id)
 
-        try:
-            # 파일 읽기
-            with open(file_path, "r", encoding="utf-8") as f:
-                webhook_data = json.load(f)
-
-            # 클라이언트 관심사와 매칭 확인
-            if message_matches_client_interest(webhook_data, client):
-                new_messages.append(
-                    {
-                        "filename": filename,
-                        "timestamp": webhook_data.get("timestamp"),
-                        "event_type": webhook_data.get("event_type"),
-                        "org_name": webhook_data.get("org_name"),
-                        "repo_name": webhook_data.get("repo_name"),
-                        "payload": webhook_data.get("payload"),
-                    }
-                )
 
-                # 소비 이력 기록
-                consumption = MessageConsumption(
-                    client_id=client_id,
-                    message_file=filename,
-                    event_type=webhook_data.get("event_type", "unknown"),
-                    org_name=webhook_data.get("org_name"),
-                    repo_name=webhook_data.get("repo_name"),
-                )
-                db.add(consumption)
+def _ack_messages(db: Session, client_id: int, sequence_id: int) -> int:
+    client = db.query(Client).filter(Client.id == client_id).first()
+    if not client:
+        raise HTTPException(status_code=404, detail="클라이언트를 찾을 수 없습니다")
+    with write_lock:
+        return delivery_tracker.ack(db, client, sequence_id)
+
+
+@app.post("/ack/{client_id}", response_model=AckResponse)
+async def ack_messages(client_id: int, ack: AckRequest) -> AckResponse:
+    """sequence_id 까지의 메시지를 처리 완료로 확인"""
+    acked = await run_db(_ack_messages, client_id, ack.sequence_id)
+    return AckResponse(client_id=client_id, acked_sequence_id=acked)
+
+
+def _format_sse(event_id: Optional[int], event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 형식의 메시지 생성"""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def _stream_batch(
+    db: Session,
+    client_id: int,
+    cursor: int,
+    profile: Optional[str],
+    fields: Optional[str],
+) -> Optional[List[Dict[str, Any]]]:
+    """cursor 이후의 관심 이벤트를 메시지로 변환 (클라이언트가 삭제되었으면 None)"""
+    client = db.query(Client).filter(Client.id == client_id).first()
+    if client is None:
+        return None
+    events = event_store.events_after(db, client, cursor, POLL_BATCH_LIMIT)
+    messages = [event_store.to_message(event, profile, fields) for event in events]
+    if events:
+        last_seq = int(events[-1].id)  # type: ignore
+        # /ack 가 스트림으로 전달된 범위까지 반영되도록 전달 커서 갱신
+        if last_seq > int(client.delivered_seq or 0):
+            client.delivered_seq = last_seq  # type: ignore
+        _record_poll(db, client)
+    return messages
+
+
+class _StreamSlot:
+    """동시 스트림 한도에서 잡아 둔 자리 하나 (여러 번 반납해도 한 번만 돌려준다)"""
+
+    def __init__(self, client_id: int) -> None:
+        global _active_streams
+        _active_streams += 1
+        self.client_id = client_id
+        self._held = True
+
+    def release(self) -> None:
+        global _active_streams
+        if not self._held:
+            return
+        self._held = False
+        _active_streams -= 1
+        logger.info(f"클라이언트 {self.client_id} 스트림 종료 (활성 스트림: {_active_streams})")
+
+
+class _SlotStreamingResponse(StreamingResponse):
+    """응답이 끝나면 스트림 자리를 반납하는 StreamingResponse
+
+    본문이 시작되기 전에 클라이언트가 끊으면 generator 가 한 번도 실행되지 않으므로
+    generator 의 finally 만으로는 자리를 돌려받지 못한다.
+    """
+
+    def __init__(self, content: Any, slot: _StreamSlot, **kwargs: Any) -> None:
+        super().__init__(content, **kwargs)
+        self.slot = slot
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self.slot.release()
 
-        except Exception as e:
-            logger.error(f"파일 읽기 오류 ({filename}): {e}")
-            continue
 
-    # 클라이언트의 마지막 poll 시간 업데이트
-    now = datetime.now()
-    db.query(Client).filter(Client.id == client_id).update({"last_poll_at": now})
-    db.commit()
+async def _stream_client_events(
+    request: Request,
+    client_id: int,
+    start_seq: int,
+    slot: _StreamSlot,
+    profile: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> Any:
+    """클라이언트 관심 이벤트를 SSE 로 계속 전달 (heartbeat 포함)
+
+    stream_messages 가 잡아 둔 스트림 자리는 스트림이 끝날 때 반납한다.
+    """
+    cursor = start_seq
+    caught_up = False
+    try:
+        while not await request.is_disconnected():
+            seen = event_notifier.generation
+            messages = await run_db(_stream_batch, client_id, cursor, profile, fields)
+            if messages is None:
+                break
+            if messages:
+                cursor = int(messages[-1]["sequence_id"])
+
+            for message in messages:
+                yield _format_sse(message["sequence_id"], "webhook", message)
+
+            if len(messages) >= POLL_BATCH_LIMIT:
+                continue
+            if not caught_up:
+                # 밀린 메시지를 모두 보냈음을 알림
+                caught_up = True
+                yield _format_sse(None, "ready", {"last_event_id": cursor})
+
+            if not await event_notifier.wait_for_newer(seen, STREAM_HEARTBEAT_SECONDS):
+                yield ": heartbeat\n\n"
+    finally:
+        slot.release()
+
+
+@app.get("/stream/{client_id}")
+async def stream_messages(
+    client_id: int,
+    request: Request,
+    last_event_id: Optional[str] = Header(None),
+    profile: PayloadProfile = Query("full", description=PROFILE_DESCRIPTION),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
+) -> StreamingResponse:
+    """클라이언트 관심 이벤트를 Server-Sent Events 로 push
 
-    logger.info(
-        f"클라이언트 {client.name} (ID: {client_id})가 {len(new_messages)}개의 새 메시지를 polling했습니다"
-    )
+    Last-Event-ID 헤더가 있으면 그 이후부터, 없으면 마지막 ack 이후부터 전달한다.
+    """
+    client = await run_db(_get_client, client_id)
 
-    return PollResponse(
-        client_id=client_id,
-        messages=new_messages,
-        total_new_messages=len(new_messages),
-        poll_timestamp=datetime.now(),
+    try:
+        start_seq = int(last_event_id) if last_event_id else client.acked_sequence_id
+    except ValueError:
+        raise HTTPException(status_code=400, detail="유효하지 않은 Last-Event-ID")
+
+    if _active_streams >= MAX_CONCURRENT_STREAMS:
+        raise HTTPException(
+            status_code=503,
+            detail="동시 스트림 수가 한도를 초과했습니다",
+            headers={"Retry-After": str(int(STREAM_HEARTBEAT_SECONDS))},
+        )
+    # 응답 본문이 시작되기 전에 자리를 잡아야 동시에 들어온 요청이 모두 검사를 통과하지 않는다
+    slot = _StreamSlot(client_id)
+
+    logger.info(f"클라이언트 {client.name} (ID: {client_id}) 스트림 시작 (seq > {start_seq})")
+    return _SlotStreamingResponse(
+        _stream_client_events(request, client_id, start_seq, slot, profile, fields),
+        slot,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
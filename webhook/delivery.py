@@ -0,0 +1,118 @@
+"""클라이언트별 전달 커서 관리
+
+클라이언트마다 확인(ack)된 마지막 시퀀스와 전달된 마지막 시퀀스만 기록한다.
+poll 은 커서 이후의 이벤트만 조회하므로 작업량이 새 메시지 수에 비례한다.
+
+- auto_ack 모드: 전달과 동시에 확인 처리 (기존 MessageConsumption 과 동일한 동작)
+- 수동 ack 모드: 확인되지 않은 메시지는 lease 가 만료되면 다시 전달 (at-least-once)
+"""
+
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from webhook.event_store import EventStore, event_store
+from webhook.models import Client, MessageConsumption, WebhookEvent
+
+# 미확인 메시지를 재전달하기까지의 대기 시간 (초)
+LEASE_TIMEOUT_SECONDS = float(os.getenv("WEBHOOK_LEASE_TIMEOUT", "60"))
+
+
+class DeliveryTracker:
+    """Client 의 acked_seq/delivered_seq 커서를 기준으로 메시지를 전달한다."""
+
+    def __init__(
+        self, store: EventStore = event_store, lease_timeout: float = LEASE_TIMEOUT_SECONDS
+    ) -> None:
+        self.store = store
+        self.lease_timeout = lease_timeout
+
+    def next_batch(
+        self,
+        db: Session,
+        client: Client,
+        limit: Optional[int] = None,
+        auto_ack: bool = True,
+        now: Optional[datetime] = None,
+    ) -> Tuple[List[WebhookEvent], bool]:
+        """다음에 전달할 이벤트와 남은 이벤트 존재 여부를 반환하고 커서를 갱신한다
+
+        commit 은 호출자 책임이다.
+        """
+        now = now or datetime.now()
+        acked_seq = int(client.acked_seq or 0)
+        delivered_seq = max(int(client.delivered_seq or 0), acked_seq)
+
+        # 전달 중인 메시지의 lease 가 만료되었으면 마지막 ack 이후부터 다시 전달
+        lease_expired = client.lease_expires_at is None or client.lease_expires_at <= now
+        start_seq = acked_seq if lease_expired else delivered_seq
+
+        # 한 건 더 읽어서 남은 메시지가 있는지 확인
+        events = self.store.events_after(
+            db, client, start_seq, limit + 1 if limit is not None else None
+        )
+        has_more = limit is not None and len(events) > limit
+        if has_more:
+            events = events[:limit]
+
+        if auto_ack:
+            last_seq = events[-1].id if events else delivered_seq
+            client.acked_seq = last_seq  # type: ignore[assignment]
+            client.delivered_seq = last_seq  # type: ignore[assignment]
+            client.lease_expires_at = None  # type: ignore[assignment]
+        elif events:
+            client.delivered_seq = max(int(events[-1].id), delivered_seq)  # type: ignore
+            client.lease_expires_at = now + timedelta(  # type: ignore[assignment]
+                seconds=self.lease_timeout
+            )
+        return events, has_more
+
+    def ack(self, db: Session, client: Client, sequence_id: int) -> int:
+        """sequence_id 까지 처리 완료로 기록하고 확인된 커서를 반환
+
+        전달되지 않은 시퀀스까지 ack 하더라도 전달된 범위까지만 반영한다.
+        """
+        acked_seq = int(client.acked_seq or 0)
+        delivered_seq = int(client.delivered_seq or 0)
+        new_acked = max(acked_seq, min(sequence_id, delivered_seq))
+
+        client.acked_seq = new_acked  # type: ignore[assignment]
+        if new_acked >= delivered_seq:
+            client.lease_expires_at = None  # type: ignore[assignment]
+        db.commit()
+        return new_acked
+
+    @staticmethod
+    def migrate_consumptions(db: Session) -> int:
+        """기존 MessageConsumption 이력을 클라이언트 커서로 변환
+
+        클라이언트별로 소비한 이벤트 중 가장 큰 시퀀스를 커서로 사용한다.
+        여러 번 실행해도 커서는 뒤로 가지 않으며, 갱신된 클라이언트 수를 반환한다.
+        """
+        rows: Any = db.execute(
+            select(MessageConsumption.client_id, func.max(WebhookEvent.id))
+            .join(WebhookEvent, WebhookEvent.filename == MessageConsumption.message_file)
+            .group_by(MessageConsumption.client_id)
+        ).all()
+        cursors: Dict[int, int] = {client_id: seq for client_id, seq in rows if seq}
+
+        updated = 0
+        for client in db.scalars(select(Client).where(Client.id.in_(list(cursors)))):
+            seq = cursors[client.id]
+            if seq > int(client.acked_seq or 0):
+                delivered_seq = max(seq, int(client.delivered_seq or 0))
+                client.acked_seq = seq  # type: ignore[assignment]
+                client.delivered_seq = delivered_seq  # type: ignore[assignment]
+                updated += 1
+        db.commit()
+
+        if updated:
+            logger.info(f"소비 이력을 커서로 변환했습니다: 클라이언트 {updated}개")
+        return updated
+
+
+delivery_tracker = DeliveryTracker()
@@ -0,0 +1,246 @@
+"""Webhook 이벤트 저장소
+
+수신 시점에 이벤트를 색인된 `webhook_events` 테이블에 기록하여, poll 요청이
+저장 폴더 전체를 읽지 않고 색인 범위 질의만으로 응답할 수 있도록 한다.
+이벤트를 받을 클라이언트도 수신 시점에 한 번 계산해 `event_routes` 에 함께
+기록하므로, poll 은 해당 클라이언트의 대기 목록 조회가 된다.
+기존 `data/*.json` 파일은 `import_legacy_files` 로 한 번에 옮겨올 수 있다.
+"""
+
+import json
+import sys
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from loguru import logger
+from sqlalchemy import delete, insert, literal, or_, select
+from sqlalchemy.orm import Session
+from werkzeug.utils import secure_filename
+
+from webhook.models import Client, EventRoute, WebhookEvent
+from webhook.payload_codec import decode_payload, encode_payload
+from webhook.projection import project_payload
+from webhook.routing import InterestIndex, interest_index
+
+
+def split_repo_short_name(repo_name: Optional[str]) -> Optional[str]:
+    """`owner/repo` 형태의 full_name 에서 repo 부분만 반환"""
+    if repo_name and "/" in repo_name:
+        return repo_name.split("/")[-1]
+    return None
+
+
+class EventStore:
+    """SQLite 테이블 기반 webhook 이벤트 저장소
+
+    이벤트의 id 는 단조 증가하는 시퀀스 번호이며, 수신 시점에 관심사 색인으로
+    구한 대상 클라이언트를 `event_routes` 에 기록해 두므로 클라이언트별 조회가
+    전체 이력 크기와 무관하게 동작한다.
+    """
+
+    def __init__(self, index: InterestIndex = interest_index) -> None:
+        self.index = index
+
+    def make_filename(self, event_type: str, received_at: datetime) -> str:
+        """기존 파일 저장 방식과 호환되는 이벤트 식별자 생성"""
+        timestamp = received_at.strftime("%Y%m%d_%H%M%S_%f")[:-3]  # 밀리초까지
+        sanitized_event_type = secure_filename(event_type) or "unknown"
+        return f"{sanitized_event_type}_{timestamp}_{uuid.uuid4().hex[:8]}.json"
+
+    def append(
+        self,
+        db: Session,
+        event_type: str,
+        payload: Dict[str, Any],
+        org_name: Optional[str],
+        repo_name: Optional[str],
+        received_at: Optional[datetime] = None,
+        filename: Optional[str] = None,
+        commit: bool = True,
+        client_ids: Optional[Iterable[int]] = None,
+    ) -> WebhookEvent:
+        """이벤트 한 건을 저장하고 시퀀스 번호가 부여된 행을 반환
+
+        client_ids 를 주지 않으면 관심사 색인으로 전달 대상을 계산한다.
+        """
+        received_at = received_at or datetime.now()
+        data = encode_payload(payload)
+        event = WebhookEvent(
+            filename=filename or self.make_filename(event_type, received_at),
+            event_type=event_type,
+            org_name=org_name,
+            repo_name=repo_name,
+            repo_short_name=split_repo_short_name(repo_name),
+            received_at=received_at,
+            payload=data,
+            payload_size=len(data),
+        )
+        db.add(event)
+        db.flush()  # 시퀀스 번호 확정
+
+        if client_ids is None:
+            client_ids = self.index.match(org_name, repo_name)
+        db.add_all(EventRoute(client_id=client_id, event_id=event.id) for client_id in client_ids)
+        if commit:
+            db.commit()
+            db.refresh(event)
+        return event
+
+    def events_after(
+        self, db: Session, client: Client, after_seq: int, limit: Optional[int] = None
+    ) -> List[WebhookEvent]:
+        """after_seq 이후의 클라이언트 관심 이벤트를 시퀀스 순으로 반환"""
+        query = (
+            select(WebhookEvent)
+            .join(EventRoute, EventRoute.event_id == WebhookEvent.id)
+            .where(
+                EventRoute.client_id == client.id,
+                EventRoute.event_id > after_seq,  # type: ignore[arg-type]
+            )
+            .order_by(EventRoute.event_id)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        return list(db.scalars(query))
+
+    def route_client(self, db: Session, client: Client) -> int:
+        """클라이언트 등록/관심사 변경 반영
+
+        색인을 다시 만들고, 아직 확인(ack)하지 않은 이벤트의 전달 대상을 새 관심사로
+        다시 계산한다. 추가된 전달 경로 수를 반환한다.
+
+        write_lock 을 잡고 호출해야 한다. 수신 writer 가 옛 색인으로 경로를 기록하는 사이에
+        색인을 바꾸거나 backfill 하면 그 사이에 저장된 이벤트가 어느 쪽 경로에도 들어가지 않는다.
+        """
+        self.index.rebuild(db)
+        after_seq = int(client.acked_seq or 0)
+        db.execute(
+            delete(EventRoute).where(
+                EventRoute.client_id == client.id,
+                EventRoute.event_id > after_seq,  # type: ignore[arg-type]
+            )
+        )
+        added = self._backfill(db, client, after_seq)
+        db.commit()
+        return added
+
+    def backfill_routes(self, db: Session) -> int:
+        """전달 경로가 없는 이전 버전 DB 의 이벤트에 전달 대상을 기록 (시작 시 1회)"""
+        if db.scalars(select(EventRoute.event_id).limit(1)).first() is not None:
+            return 0
+        added = 0
+        for client in db.scalars(select(Client)):
+            added += self._backfill(db, client, int(client.acked_seq or 0))
+        db.commit()
+        if added:
+            logger.info(f"기존 이벤트의 전달 경로 {added}개를 기록했습니다")
+        return added
+
+    @staticmethod
+    def _backfill(db: Session, client: Client, after_seq: int) -> int:
+        """after_seq 이후 이벤트 중 클라이언트 관심 이벤트의 전달 경로를 SQL 로 일괄 추가"""
+        query: Any = select(literal(int(client.id)), WebhookEvent.id).where(
+            WebhookEvent.id > after_seq  # type: ignore[arg-type]
+        )
+
+        interested_orgs = client.get_interested_orgs()
+        interested_repos = client.get_interested_repos()
+
+        # 관심 조직/저장소가 없으면 모든 이벤트에 관심
+        if interested_orgs or interested_repos:
+            conditions: List[Any] = []
+            if interested_orgs:
+                conditions.append(WebhookEvent.org_name.in_(interested_orgs))
+            if interested_repos:
+                conditions.append(WebhookEvent.repo_name.in_(interested_repos))
+                conditions.append(WebhookEvent.repo_short_name.in_(interested_repos))
+            query = query.where(or_(*conditions))
+
+        result = db.execute(
+            insert(EventRoute).from_select([EventRoute.client_id, EventRoute.event_id], query)
+        )
+        return int(result.rowcount or 0)  # type: ignore[attr-defined]
+
+    def list_events(self, db: Session) -> List[WebhookEvent]:
+        """저장된 이벤트를 최신순으로 반환 (payload 제외 목적의 목록 조회용)"""
+        return list(db.scalars(select(WebhookEvent).order_by(WebhookEvent.id.desc())))
+
+    @staticmethod
+    def to_message(
+        event: WebhookEvent, profile: Optional[str] = None, fields: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """poll 응답에 사용하는 메시지 형태로 변환
+
+        profile/fields 를 주면 payload 의 필요한 필드만 남긴다 (`webhook.projection`).
+        """
+        payload = decode_payload(event.payload)  # type: ignore[arg-type]
+        message = {
+            "sequence_id": event.id,
+            "filename": event.filename,
+            "timestamp": event.received_at.isoformat(),
+            "event_type": event.event_type,
+            "org_name": event.org_name,
+            "repo_name": event.repo_name,
+            "payload": project_payload(payload, str(event.event_type), profile, fields),
+        }
+        if message["payload"] is not payload:
+            message["payload_projected"] = True  # 전체 payload 는 /events/{id}/payload
+        return message
+
+    def import_legacy_files(self, db: Session, data_dir: Path) -> int:
+        """기존 `data/*.json` 파일을 저장소로 옮겨온다 (이미 옮긴 파일은 건너뜀)
+
+        여러 번 실행해도 안전하며, 가져온 이벤트 수를 반환한다.
+        """
+        files = list(data_dir.glob("*.json"))
+        if not files:
+            return 0
+
+        known: Set[str] = set(db.scalars(select(WebhookEvent.filename)))
+        legacy_events = []
+        for file_path in files:
+            if file_path.name in known:
+                continue
+            try:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    webhook_data = json.load(f)
+                received_at = datetime.fromisoformat(webhook_data["timestamp"])
+            except Exception as e:
+                logger.error(f"기존 webhook 파일 가져오기 실패 ({file_path.name}): {e}")
+                continue
+            legacy_events.append((received_at, file_path.name, webhook_data))
+
+        # 원래 수신 순서대로 시퀀스 번호가 부여되도록 정렬
+        legacy_events.sort(key=lambda item: item[0])
+        for received_at, filename, webhook_data in legacy_events:
+            self.append(
+                db,
+                webhook_data.get("event_type") or "unknown",
+                webhook_data.get("payload") or {},
+                webhook_data.get("org_name"),
+                webhook_data.get("repo_name"),
+                received_at=received_at,
+                filename=filename,
+                commit=False,
+            )
+        db.commit()
+
+        if legacy_events:
+            logger.info(f"기존 webhook 파일 {len(legacy_events)}개를 이벤트 저장소로 가져왔습니다")
+        return len(legacy_events)
+
+
+event_store = EventStore()
+
+
+if __name__ == "__main__":
+    # 사용법: python -m webhook.event_store [data_dir]
+    from webhook.models import SessionLocal, create_tables
+
+    create_tables()
+    target_dir = Path(sys.argv[1] if len(sys.argv) > 1 else "data")
+    with SessionLocal() as session:
+        imported = event_store.import_legacy_files(session, target_dir)
+    print(f"{imported}개의 이벤트를 가져왔습니다")
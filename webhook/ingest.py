@@ -0,0 +1,176 @@
+"""비동기 webhook 수신 파이프라인
+
+receive_webhook 은 서명 검증 후 이벤트를 제한된 크기의 asyncio 큐에 넣고 바로
+202 를 응답한다. 백그라운드 writer 가 큐를 비우며 여러 이벤트를 하나의
+트랜잭션으로 저장(group commit)하므로, 수신 폭주가 이벤트 루프와 poll 요청을
+막지 않는다. 큐가 가득 차면 호출자는 503 + Retry-After 로 backpressure 를 알린다.
+
+이미 202 로 응답한 이벤트이므로 배치 저장이 실패하면 다시 시도하고, 그래도 실패하면
+한 건씩 저장해 문제가 있는 이벤트만 버린다.
+"""
+
+import asyncio
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+from webhook.models import run_db
+
+# 큐 최대 길이와 한 트랜잭션에 저장하는 최대 이벤트 수
+INGEST_QUEUE_SIZE = int(os.getenv("WEBHOOK_INGEST_QUEUE_SIZE", "1000"))
+INGEST_BATCH_SIZE = int(os.getenv("WEBHOOK_INGEST_BATCH_SIZE", "200"))
+# 배치 저장 실패 시 다시 시도하는 횟수와 대기 시간 (초, 시도마다 늘어남)
+INGEST_RETRIES = 1
+INGEST_RETRY_DELAY = 0.5
+
+
+@dataclass
+class IngestItem:
+    """저장 대기 중인 webhook 이벤트"""
+
+    event_type: str
+    payload: Dict[str, Any]
+    delivery_id: Optional[str] = None
+    received_at: datetime = field(default_factory=datetime.now)
+
+
+class IngestPipeline:
+    """제한된 큐와 group commit writer
+
+    persist_batch(db, items) 는 이벤트 목록을 한 트랜잭션으로 저장하고 마지막 시퀀스를
+    반환하는 동기 함수로, 다른 DB 작업과 같은 DB 전용 스레드 풀(run_db)에서 실행된다.
+    저장 후에는 on_persisted(마지막 시퀀스) 로 대기 중인 poll/스트림을 깨운다.
+    """
+
+    def __init__(
+        self,
+        persist_batch: Callable[[Session, List[IngestItem]], int],
+        on_persisted: Optional[Callable[[int], Awaitable[None]]] = None,
+        maxsize: int = INGEST_QUEUE_SIZE,
+        batch_size: int = INGEST_BATCH_SIZE,
+    ) -> None:
+        self._persist_batch = persist_batch
+        self._on_persisted = on_persisted
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 통계
+        self.accepted = 0
+        self.rejected = 0
+        self.persisted = 0
+        self.failed = 0
+        self.batches = 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    @property
+    def depth(self) -> int:
+        """저장 대기 중인 이벤트 수"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def submit(self, item: IngestItem) -> bool:
+        """이벤트를 큐에 넣는다. 큐가 가득 차 있으면 False"""
+        queue = self._ensure_writer()
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            return False
+        self.accepted += 1
+        return True
+
+    async def drain(self) -> None:
+        """큐에 들어간 이벤트가 모두 저장될 때까지 대기"""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def stop(self) -> None:
+        """남은 이벤트를 저장한 뒤 writer 종료"""
+        await self.drain()
+        if self._writer is not None:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+            self._writer = None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queue_depth": self.depth,
+            "queue_capacity": self.maxsize,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "persisted": self.persisted,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+    def _ensure_writer(self) -> asyncio.Queue:
+        # 큐/태스크는 생성한 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만든다
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            self._loop = loop
+            self._writer = None
+        if self._writer is None or self._writer.done():
+            self._writer = loop.create_task(self._run_writer(self._queue))
+        return self._queue
+
+    async def _run_writer(self, queue: asyncio.Queue) -> None:
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                persisted, last_seq = await self._write(batch)
+                self.persisted += persisted
+                self.failed += len(batch) - persisted
+                self.batches += 1
+                if persisted and self._on_persisted is not None:
+                    await self._on_persisted(last_seq)
+            except Exception as e:
+                logger.error(f"webhook 이벤트 {len(batch)}건 저장 후 처리 실패: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _write(self, batch: List[IngestItem]) -> Tuple[int, int]:
+        """배치를 저장하고 (저장한 이벤트 수, 마지막 시퀀스) 반환"""
+        for attempt in range(INGEST_RETRIES + 1):
+            try:
+                return len(batch), await run_db(self._persist_batch, batch)
+            except Exception as e:
+                logger.warning(f"webhook 이벤트 {len(batch)}건 저장 실패 ({attempt + 1}회): {e}")
+            if attempt < INGEST_RETRIES:
+                await asyncio.sleep(INGEST_RETRY_DELAY * (attempt + 1))
+        if len(batch) == 1:
+            logger.error(f"webhook 이벤트를 저장하지 못해 버립니다: {_describe(batch[0])}")
+            return 0, 0
+
+        # 배치 안의 이벤트 하나가 원인일 수 있으므로 한 건씩 저장해 나머지는 살린다
+        persisted, last_seq = 0, 0
+        for item in batch:
+            try:
+                last_seq = await run_db(self._persist_batch, [item])
+                persisted += 1
+            except Exception as e:
+                logger.error(f"webhook 이벤트를 저장하지 못해 버립니다: {_describe(item)} ({e})")
+        return persisted, last_seq
+
+
+def _describe(item: IngestItem) -> str:
+    return f"{item.event_type} (delivery: {item.delivery_id})"
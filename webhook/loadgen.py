@@ -0,0 +1,412 @@
+"""Headless webhook 부하 생성기
+
+로컬에서 실행한 `webhook/app.py` 에 설정한 비율과 동시성으로 시뮬레이션 이벤트를
+보내면서, 관심사 필터를 가진 polling 클라이언트들이 동시에 메시지를 가져가도록 한다.
+실행이 끝나면 수신/poll 지연 백분위, 처리량, 수신부터 클라이언트 전달까지의
+지연(end-to-end lag)을 JSON 으로 출력한다.
+
+사용법:
+    python -m webhook.loadgen --spawn-server --duration 30 --rate 200 --clients 50
+    python -m webhook.loadgen --url http://localhost:8000 --mix pull_request=3,issues=1
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import requests
+
+from webhook.payloads import ACTIONS_MAP, generate_payload, send_webhook
+
+# payload 에 덧붙이는 측정용 필드 (전송 시각, 전송 번호)
+MARKER_FIELD = "loadgen"
+
+DEFAULT_MIX = {
+    "workflow_run": 3,
+    "workflow_job": 3,
+    "pull_request": 2,
+    "pull_request_review": 1,
+    "issues": 1,
+    "issue_comment": 1,
+}
+
+
+@dataclass
+class LoadConfig:
+    """부하 생성 설정"""
+
+    url: str = "http://localhost:8000"
+    duration: float = 10.0  # 이벤트 전송 시간 (초)
+    rate: float = 50.0  # 초당 목표 전송 수
+    concurrency: int = 8  # 동시 전송 수
+    clients: int = 10  # polling 클라이언트 수
+    repos: int = 10  # 이벤트를 나눠 보낼 저장소 수
+    repos_per_client: int = 2  # 클라이언트별 관심 저장소 수 (0 이면 모든 이벤트)
+    org: str = "loadgen"
+    mix: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    poll_interval: float = 0.5  # 클라이언트 poll 간격 (초)
+    poll_limit: int = 500
+    profile: str = "slim"
+    secret: str = ""
+    drain_timeout: float = 10.0  # 전송 종료 후 남은 메시지를 기다리는 최대 시간 (초)
+    seed: Optional[int] = None
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """`pull_request=3,issues=1` 형식의 이벤트 비율 파싱"""
+    mix: Dict[str, float] = {}
+    for part in value.split(","):
+        if not part.strip():
+            continue
+        event_type, _, weight = part.partition("=")
+        event_type = event_type.strip()
+        if event_type not in ACTIONS_MAP:
+            raise ValueError(f"지원하지 않는 이벤트 타입: {event_type}")
+        mix[event_type] = float(weight) if weight else 1.0
+        if mix[event_type] < 0:
+            raise ValueError(f"이벤트 비율은 0 이상이어야 합니다: {part}")
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("이벤트 비율이 비어 있습니다")
+    return mix
+
+
+def percentiles(values: List[float]) -> Dict[str, float]:
+    """밀리초 단위 지연 요약 (p50/p90/p99/max)"""
+    if not values:
+        return {"count": 0}
+    ms = sorted(v * 1000 for v in values)
+    if len(ms) > 1:
+        cuts = statistics.quantiles(ms, n=100, method="inclusive")
+        p50, p90, p99 = cuts[49], cuts[89], cuts[98]
+    else:
+        p50 = p90 = p99 = ms[0]
+    return {
+        "count": len(ms),
+        "mean": round(statistics.fmean(ms), 2),
+        "p50": round(p50, 2),
+        "p90": round(p90, 2),
+        "p99": round(p99, 2),
+        "max": round(ms[-1], 2),
+    }
+
+
+@dataclass
+class _PollClient:
+    client_id: int
+    repos: List[str]
+    received: int = 0
+
+
+class LoadGenerator:
+    """이벤트 전송기와 polling 클라이언트를 함께 실행하고 결과를 집계한다."""
+
+    def __init__(self, config: LoadConfig) -> None:
+        self.config = config
+        self.run_id = uuid.uuid4().hex[:8]
+        self._random = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+        self.ingest_latencies: List[float] = []
+        self.ingest_status: Dict[str, int] = {}
+        self.poll_latencies: List[float] = []
+        self.poll_errors = 0
+        self.lags: List[float] = []
+        self.sent_repos: List[str] = []
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def run(self) -> Dict[str, Any]:
+        """설정한 시간 동안 부하를 만들고 JSON 요약을 반환"""
+        config = self.config
+        clients = self._register_clients()
+
+        pollers = [threading.Thread(target=self._poll_loop, args=(c,)) for c in clients]
+        for poller in pollers:
+            poller.start()
+
+        started = time.perf_counter()
+        self._send_events()
+        send_seconds = time.perf_counter() - started
+
+        # 보낸 이벤트가 모두 전달되거나 drain_timeout 이 지날 때까지 polling 계속
+        expected = self._expected_deliveries(clients)
+        deadline = time.monotonic() + config.drain_timeout
+        while time.monotonic() < deadline and sum(c.received for c in clients) < expected:
+            time.sleep(0.05)
+        self._stop.set()
+        for poller in pollers:
+            poller.join()
+
+        return self._summary(clients, send_seconds, expected)
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+    def _repo_name(self, index: int) -> str:
+        return f"{self.run_id}-repo-{index}"
+
+    def _register_clients(self) -> List[_PollClient]:
+        config = self.config
+        clients = []
+        with requests.Session() as session:
+            for i in range(config.clients):
+                if config.repos_per_client > 0:
+                    count = min(config.repos_per_client, config.repos)
+                    indexes = self._random.sample(range(config.repos), count)
+                    repos = [f"{config.org}/{self._repo_name(index)}" for index in indexes]
+                else:
+                    # 이번 실행의 이벤트만 받도록 저장소 전체를 관심사로 지정
+                    repos = [f"{config.org}/{self._repo_name(n)}" for n in range(config.repos)]
+                response = session.post(
+                    f"{config.url}/clients",
+                    json={"name": f"loadgen-{self.run_id}-{i}", "interested_repos": repos},
+                    timeout=10,
+                )
+                response.raise_for_status()
+                clients.append(_PollClient(client_id=response.json()["id"], repos=repos))
+        return clients
+
+    def _event_schedule(self) -> Iterator[Tuple[float, str, str, int]]:
+        """(전송 시각, 이벤트 타입, 액션, 저장소 번호) 를 목표 비율로 생성"""
+        config = self.config
+        event_types = list(config.mix)
+        weights = [config.mix[event_type] for event_type in event_types]
+        total = max(1, int(config.duration * config.rate))
+        for n in range(total):
+            event_type = self._random.choices(event_types, weights)[0]
+            action = self._random.choice(ACTIONS_MAP[event_type])
+            yield n / config.rate, event_type, action, self._random.randrange(config.repos)
+
+    def _send_events(self) -> None:
+        config = self.config
+        local = threading.local()
+        start = time.perf_counter()
+
+        def send(n: int, event_type: str, action: str, repo_index: int) -> None:
+            if not hasattr(local, "session"):
+                local.session = requests.Session()
+            payload = generate_payload(event_type, action, config.org, self._repo_name(repo_index))
+            payload[MARKER_FIELD] = {"run_id": self.run_id, "n": n, "sent_at": time.time()}
+            sent = time.perf_counter()
+            try:
+                response = send_webhook(
+                    f"{config.url}/webhook",
+                    event_type,
+                    payload,
+                    config.secret,
+                    delivery_id=f"{self.run_id}-{n}",
+                    session=local.session,
+                )
+                status = str(response.status_code)
+            except requests.RequestException as e:
+                status = type(e).__name__
+            latency = time.perf_counter() - sent
+            with self._lock:
+                self.ingest_latencies.append(latency)
+                self.ingest_status[status] = self.ingest_status.get(status, 0) + 1
+                if status == "202":
+                    self.sent_repos.append(f"{config.org}/{self._repo_name(repo_index)}")
+
+        with ThreadPoolExecutor(max_workers=config.concurrency) as executor:
+            futures = []
+            for n, (offset, event_type, action, repo_index) in enumerate(self._event_schedule()):
+                # 목표 비율을 지키도록 예정 시각까지 대기 (open-loop)
+                delay = start + offset - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(executor.submit(send, n, event_type, action, repo_index))
+            for future in futures:
+                future.result()
+
+    def _poll_loop(self, client: _PollClient) -> None:
+        config = self.config
+        params: Dict[str, Any] = {"limit": config.poll_limit, "profile": config.profile}
+        if config.profile == "slim":
+            params["fields"] = MARKER_FIELD  # slim 프로필에도 측정용 필드는 포함
+        with requests.Session() as session:
+            while not self._stop.is_set():
+                started = time.perf_counter()
+                try:
+                    response = session.get(
+                        f"{config.url}/poll/{client.client_id}", params=params, timeout=30
+                    )
+                    response.raise_for_status()
+                    messages = response.json()["messages"]
+                except (requests.RequestException, ValueError, KeyError):
+                    with self._lock:
+                        self.poll_errors += 1
+                    time.sleep(config.poll_interval)
+                    continue
+                received_at = time.time()
+                latency = time.perf_counter() - started
+
+                lags = []
+                for message in messages:
+                    marker = (message.get("payload") or {}).get(MARKER_FIELD) or {}
+                    if marker.get("run_id") == self.run_id:
+                        lags.append(received_at - float(marker["sent_at"]))
+                with self._lock:
+                    self.poll_latencies.append(latency)
+                    self.lags.extend(lags)
+                    client.received += len(lags)
+
+                if len(messages) < config.poll_limit:
+                    self._stop.wait(config.poll_interval)
+
+    def _expected_deliveries(self, clients: List[_PollClient]) -> int:
+        with self._lock:
+            sent = list(self.sent_repos)
+        return sum(sum(1 for repo in sent if repo in c.repos) for c in clients)
+
+    def _summary(
+        self, clients: List[_PollClient], send_seconds: float, expected: int
+    ) -> Dict[str, Any]:
+        accepted = self.ingest_status.get("202", 0)
+        delivered = sum(c.received for c in clients)
+        return {
+            "run_id": self.run_id,
+            "config": asdict(self.config) | {"secret": bool(self.config.secret)},
+            "ingest": {
+                "sent": len(self.ingest_latencies),
+                "accepted": accepted,
+                "status": dict(sorted(self.ingest_status.items())),
+                "send_seconds": round(send_seconds, 3),
+                "throughput_per_sec": round(accepted / send_seconds, 2) if send_seconds else 0,
+                "latency_ms": percentiles(self.ingest_latencies),
+            },
+            "poll": {
+                "clients": len(clients),
+                "polls": len(self.poll_latencies),
+                "errors": self.poll_errors,
+                "latency_ms": percentiles(self.poll_latencies),
+            },
+            "delivery": {
+                "expected": expected,
+                "delivered": delivered,
+                "complete": delivered >= expected,
+                "lag_ms": percentiles(self.lags),
+            },
+        }
+
+
+def _free_port() -> int:
+    import socket
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def spawn_server(port: int, workdir: str) -> subprocess.Popen:
+    """임시 DB/데이터 폴더로 webhook/app.py 서버를 띄우고 응답할 때까지 대기"""
+    env = dict(os.environ)
+    env.setdefault("WEBHOOK_DATABASE_URL", f"sqlite:///{os.path.join(workdir, 'webhook.db')}")
+    env.setdefault("WEBHOOK_DATA_DIR", os.path.join(workdir, "data"))
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "webhook.app:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("webhook 서버 시작 실패")
+        try:
+            requests.get(f"http://127.0.0.1:{port}/health", timeout=1)
+            return process
+        except requests.RequestException:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("webhook 서버가 응답하지 않습니다")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    defaults = LoadConfig()
+    parser = argparse.ArgumentParser(description="webhook 서버 headless 부하 생성기")
+    parser.add_argument("--url", default=defaults.url, help="webhook 서버 주소")
+    parser.add_argument(
+        "--spawn-server", action="store_true", help="임시 DB 로 로컬 webhook/app.py 를 띄워 사용"
+    )
+    parser.add_argument("--duration", type=float, default=defaults.duration)
+    parser.add_argument("--rate", type=float, default=defaults.rate, help="초당 전송 수")
+    parser.add_argument("--concurrency", type=int, default=defaults.concurrency)
+    parser.add_argument("--clients", type=int, default=defaults.clients)
+    parser.add_argument("--repos", type=int, default=defaults.repos)
+    parser.add_argument("--repos-per-client", type=int, default=defaults.repos_per_client)
+    parser.add_argument("--org", default=defaults.org)
+    parser.add_argument("--mix", type=parse_mix, default=None, help="예: pull_request=3,issues=1")
+    parser.add_argument("--poll-interval", type=float, default=defaults.poll_interval)
+    parser.add_argument("--poll-limit", type=int, default=defaults.poll_limit)
+    parser.add_argument("--profile", choices=["full", "slim"], default=defaults.profile)
+    parser.add_argument("--drain-timeout", type=float, default=defaults.drain_timeout)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", help="JSON 요약을 저장할 파일 (기본: 표준 출력)")
+    args = parser.parse_args(argv)
+
+    config = LoadConfig(
+        url=args.url.rstrip("/"),
+        duration=args.duration,
+        rate=args.rate,
+        concurrency=args.concurrency,
+        clients=args.clients,
+        repos=args.repos,
+        repos_per_client=args.repos_per_client,
+        org=args.org,
+        mix=args.mix or dict(DEFAULT_MIX),
+        poll_interval=args.poll_interval,
+        poll_limit=args.poll_limit,
+        profile=args.profile,
+        secret=os.getenv("GITHUB_WEBHOOK_SECRET", ""),
+        drain_timeout=args.drain_timeout,
+        seed=args.seed,
+    )
+
+    server = None
+    with tempfile.TemporaryDirectory(prefix="webhook-loadgen-") as workdir:
+        try:
+            if args.spawn_server:
+                port = _free_port()
+                server = spawn_server(port, workdir)
+                config.url = f"http://127.0.0.1:{port}"
+            summary = LoadGenerator(config).run()
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait(timeout=10)
+
+    output = json.dumps(summary, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 0 if summary["delivery"]["complete"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,25 @@
+import asyncio
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Generator, List
-
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, create_engine
+from typing import Any, Callable, Generator, List, TypeVar
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    create_engine,
+    event,
+    inspect,
+    text,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 
@@ -22,6 +39,11 @@ class Client(Base):  # type: ignore
     created_at = Column(DateTime, default=datetime.now)
     last_poll_at = Column(DateTime, nullable=True)
 
+    # 전달 커서 (이벤트 시퀀스 번호 기준)
+    acked_seq = Column(Integer, nullable=False, default=0)  # 확인(ack)된 마지막 시퀀스
+    delivered_seq = Column(Integer, nullable=False, default=0)  # 전달된 마지막 시퀀스
+    lease_expires_at = Column(DateTime, nullable=True)  # 미확인 메시지 재전달 시각
+
     # 관계
     consumed_messages = relationship("MessageConsumption", back_populates="client")
 
@@ -47,7 +69,7 @@ class Client(Base):  # type: ignore
 
 
 class MessageConsumption(Base):  # type: ignore
-    """메시지 소비 이력"""
+    """메시지 소비 이력 (레거시, 현재는 Client 의 전달 커서를 사용)"""
 
     __tablename__ = "message_consumptions"
 
@@ -62,16 +84,132 @@ class MessageConsumption(Base):  # type: ignore
     # 관계
     client = relationship("Client", back_populates="consumed_messages")
 
+    __table_args__ = (Index("ix_message_consumptions_client_file", "client_id", "message_file"),)
+
+
+class WebhookEvent(Base):  # type: ignore
+    """수신된 webhook 이벤트 (이벤트 저장소)
+
+    id 는 단조 증가하는 시퀀스 번호로 사용된다. 삭제 후에도 번호가 재사용되지
+    않도록 SQLite AUTOINCREMENT 를 사용한다.
+    """
+
+    __tablename__ = "webhook_events"
+
+    id = Column(Integer, primary_key=True)
+    filename = Column(String(255), unique=True, nullable=False)  # 기존 파일명 호환용 식별자
+    event_type = Column(String(50), nullable=False, index=True)
+    org_name = Column(String(100), nullable=True, index=True)
+    repo_name = Column(String(200), nullable=True, index=True)
+    repo_short_name = Column(String(100), nullable=True, index=True)  # full_name 의 repo 부분
+    received_at = Column(DateTime, default=datetime.now, nullable=False)
+    payload = Column(LargeBinary, nullable=False)  # 포맷 버전 바이트 + 코덱 본문 (payload_codec)
+    payload_size = Column(Integer, nullable=False, default=0)  # 저장된(압축된) 바이트 수
+
+    __table_args__ = (
+        Index("ix_webhook_events_org_repo", "org_name", "repo_name"),
+        {"sqlite_autoincrement": True},
+    )
+
+
+class EventRoute(Base):  # type: ignore
+    """수신 시점에 계산한 이벤트별 전달 대상 클라이언트
+
+    (client_id, event_id) 기본키로 클라이언트별 미전달 이벤트를 범위 조회한다.
+    """
+
+    __tablename__ = "event_routes"
+
+    client_id = Column(Integer, ForeignKey("clients.id"), primary_key=True)
+    event_id = Column(Integer, ForeignKey("webhook_events.id"), primary_key=True)
+
 
 # 데이터베이스 설정
-DATABASE_URL = "sqlite:///./webhook_clients.db"
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+DATABASE_URL = os.getenv("WEBHOOK_DATABASE_URL", "sqlite:///./webhook_clients.db")
+
+# 동기 세션은 DB 전용 스레드 풀에서만 사용해 async 핸들러가 이벤트 루프를 막지 않게 한다
+DB_THREADS = int(os.getenv("WEBHOOK_DB_THREADS", "16"))
+# 쓰기 잠금을 기다리는 최대 시간 (밀리초, 초과 시 database is locked)
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("WEBHOOK_SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    # DB 스레드 + 수신 writer/보존 정리 스레드가 연결을 기다리지 않도록 여유를 둔다
+    pool_size=DB_THREADS,
+    max_overflow=DB_THREADS,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@event.listens_for(engine, "connect")
+def _configure_sqlite(dbapi_connection: Any, _: Any) -> None:
+    """WAL 로 poll(읽기)이 수신 저장(쓰기)을 기다리지 않게 하고, 잠금 충돌은 재시도"""
+    if engine.dialect.name != "sqlite":
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.close()
+
+
+# SQLite 는 쓰기 트랜잭션을 하나만 허용한다. 수신 writer 가 배치를 연달아 저장하면
+# poll/ack 의 짧은 커서 갱신이 busy 대기 중에 계속 밀리므로, 프로세스 안의 쓰기는
+# 이 잠금으로 차례를 정한다 (잠금을 잡은 뒤 쓰기를 시작하고 commit 후 놓는다)
+write_lock = threading.Lock()
+
+_db_executor = ThreadPoolExecutor(max_workers=DB_THREADS, thread_name_prefix="webhook-db")
+
+T = TypeVar("T")
+
+
+async def run_db(func: Callable[..., T], *args: Any) -> T:
+    """새 세션으로 func(db, *args) 를 DB 전용 스레드에서 실행하고 결과 반환
+
+    세션과 ORM 객체는 스레드 밖으로 내보내지 않도록 func 안에서 응답 데이터까지 만든다.
+    """
+
+    def call() -> T:
+        with SessionLocal() as db:
+            return func(db, *args)
+
+    return await asyncio.get_running_loop().run_in_executor(_db_executor, call)
+
+
+# 기존 DB 에 추가해야 하는 컬럼 (create_all 은 기존 테이블을 변경하지 않음)
+_ADDED_COLUMNS = {
+    "clients": {
+        "acked_seq": "INTEGER NOT NULL DEFAULT 0",
+        "delivered_seq": "INTEGER NOT NULL DEFAULT 0",
+        "lease_expires_at": "DATETIME",
+    },
+}
+
+
+def _add_missing_columns() -> None:
+    """이전 버전 스키마로 만들어진 테이블에 누락된 컬럼 추가"""
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table_name, columns in _ADDED_COLUMNS.items():
+            existing = {column["name"] for column in inspector.get_columns(table_name)}
+            for column_name, ddl in columns.items():
+                if column_name not in existing:
+                    conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {ddl}"))
+
+
+def _create_missing_indexes() -> None:
+    """기존 테이블에 나중에 추가된 인덱스 생성 (create_all 은 기존 테이블의 인덱스를 만들지 않음)"""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
 def create_tables() -> None:
     """테이블 생성"""
     Base.metadata.create_all(bind=engine)
+    _add_missing_columns()
+    _create_missing_indexes()
 
 
 def get_db() -> Generator[Any, None, None]:
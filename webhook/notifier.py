@@ -0,0 +1,55 @@
+"""새 이벤트 저장 알림
+
+receive_webhook 이 이벤트를 저장한 뒤 publish 하면, long-poll 과 SSE 스트림이
+고정 주기 polling 없이 즉시 깨어나 새 메시지를 조회한다.
+"""
+
+import asyncio
+from typing import Optional
+
+
+class EventNotifier:
+    """이벤트 저장을 asyncio.Condition 으로 알린다.
+
+    대기자는 시퀀스 대신 publish 횟수(generation)를 기준으로 깨어나므로,
+    DB 가 초기화되어 시퀀스가 다시 1 부터 시작해도 알림이 누락되지 않는다.
+    """
+
+    def __init__(self) -> None:
+        self.latest_seq = 0
+        self.generation = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Condition 은 처음 사용한 이벤트 루프에 묶이므로 루프가 바뀌면 새로 만든다
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+        return self._condition
+
+    async def publish(self, seq: int) -> None:
+        """seq 까지 저장되었음을 대기 중인 요청들에 알린다."""
+        condition = self._get_condition()
+        async with condition:
+            self.latest_seq = seq
+            self.generation += 1
+            condition.notify_all()
+
+    async def wait_for_newer(self, generation: int, timeout: float) -> bool:
+        """generation 이후 새 이벤트가 저장될 때까지 최대 timeout 초 대기"""
+        if self.generation != generation:
+            return True
+        condition = self._get_condition()
+        try:
+            async with condition:
+                await asyncio.wait_for(
+                    condition.wait_for(lambda: self.generation != generation), timeout=timeout
+                )
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
+event_notifier = EventNotifier()
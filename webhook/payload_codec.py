@@ -0,0 +1,103 @@
+"""이벤트 payload 저장 포맷
+
+저장 바이트의 첫 바이트는 포맷 버전(= 코덱 id)이며 나머지는 코덱이 인코딩한
+JSON 본문이다. 헤더가 없는 이전 버전 데이터(`{` 로 시작하는 UTF-8 JSON)도
+그대로 읽을 수 있다. 새 코덱은 `register_codec` 으로 추가한다.
+"""
+
+import json
+import os
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+# 헤더 없이 저장된 이전 버전 payload 의 첫 바이트
+_LEGACY_JSON_PREFIX = b"{"[0]
+
+
+class PayloadCodec(ABC):
+    """payload 바이트 인코딩 인터페이스"""
+
+    codec_id: int = -1
+    name: str = ""
+
+    @abstractmethod
+    def encode(self, data: bytes) -> bytes:
+        """JSON 본문 바이트를 저장 형식으로 인코딩"""
+
+    @abstractmethod
+    def decode(self, data: bytes) -> bytes:
+        """저장 형식을 JSON 본문 바이트로 디코딩"""
+
+
+class RawCodec(PayloadCodec):
+    """압축하지 않음"""
+
+    codec_id = 1
+    name = "raw"
+
+    def encode(self, data: bytes) -> bytes:
+        return data
+
+    def decode(self, data: bytes) -> bytes:
+        return data
+
+
+class ZlibCodec(PayloadCodec):
+    """표준 라이브러리 zlib 압축"""
+
+    codec_id = 2
+    name = "zlib"
+
+    def __init__(self, level: int = 6) -> None:
+        self.level = level
+
+    def encode(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decode(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+_CODECS: Dict[int, PayloadCodec] = {}
+_CODECS_BY_NAME: Dict[str, PayloadCodec] = {}
+
+
+def register_codec(codec: PayloadCodec) -> None:
+    """코덱 등록 (codec_id 는 1~255, `{` 와 겹치지 않아야 한다)"""
+    if not 0 < codec.codec_id < 256 or codec.codec_id == _LEGACY_JSON_PREFIX:
+        raise ValueError(f"사용할 수 없는 코덱 id: {codec.codec_id}")
+    _CODECS[codec.codec_id] = codec
+    _CODECS_BY_NAME[codec.name] = codec
+
+
+def get_codec(name: str) -> PayloadCodec:
+    try:
+        return _CODECS_BY_NAME[name]
+    except KeyError:
+        raise ValueError(f"알 수 없는 payload 코덱: {name}") from None
+
+
+register_codec(RawCodec())
+register_codec(ZlibCodec())
+
+# 새로 저장하는 payload 에 사용할 코덱
+DEFAULT_CODEC = get_codec(os.getenv("WEBHOOK_PAYLOAD_CODEC", "zlib"))
+
+
+def encode_payload(payload: Dict[str, Any], codec: PayloadCodec = DEFAULT_CODEC) -> bytes:
+    """payload 를 [포맷 버전 1바이트][코덱 본문] 형태로 직렬화"""
+    data = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return bytes([codec.codec_id]) + codec.encode(data)
+
+
+def decode_payload(data: bytes) -> Dict[str, Any]:
+    """저장된 바이트를 payload 로 역직렬화 (헤더 없는 이전 포맷 포함)"""
+    if not data or data[0] == _LEGACY_JSON_PREFIX:
+        body = data
+    else:
+        codec = _CODECS.get(data[0])
+        if codec is None:
+            raise ValueError(f"알 수 없는 payload 포맷 버전: {data[0]}")
+        body = codec.decode(data[1:])
+    return json.loads(body.decode("utf-8"))  # type: ignore[no-any-return]
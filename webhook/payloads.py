@@ -0,0 +1,293 @@
+"""GitHub webhook 시뮬레이션 payload 생성과 전송
+
+Tk 시뮬레이터(`webhook.simulator`)와 headless 부하 생성기(`webhook.loadgen`)가
+함께 사용하는 GUI 독립 모듈이다.
+"""
+
+import hashlib
+import hmac
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+# 이벤트 타입별로 시뮬레이션할 수 있는 액션
+ACTIONS_MAP: Dict[str, List[str]] = {
+    "workflow_run": ["requested", "completed", "in_progress"],
+    "workflow_job": ["queued", "in_progress", "completed"],
+    "check_run": ["created", "completed", "rerequested"],
+    "check_suite": ["requested", "completed"],
+    "status": ["pending", "success", "failure"],  # status 이벤트는 action 대신 state
+    "pull_request": ["opened", "closed", "synchronize", "reopened", "edited"],
+    "pull_request_review": ["submitted", "edited", "dismissed"],
+    "pull_request_review_comment": ["created", "edited", "deleted"],
+    "issues": ["opened", "closed", "edited", "deleted", "reopened"],
+    "issue_comment": ["created", "edited", "deleted"],
+}
+
+
+def generate_payload(
+    event_type: str, action: str, org_name: str, repo_name: str, pr_number: int = 1
+) -> Dict[str, Any]:
+    """이벤트 타입과 액션에 따른 페이로드 생성"""
+    full_repo_name = f"{org_name}/{repo_name}" if org_name else repo_name
+
+    base_repo = {
+        "id": 123456789,
+        "name": repo_name,
+        "full_name": full_repo_name,
+        "owner": {
+            "login": org_name or "user",
+            "type": "Organization" if org_name else "User"
+        },
+        "private": False,
+        "html_url": f"https://github.com/{full_repo_name}",
+        "default_branch": "main"
+    }
+
+    user = {
+        "login": "testuser",
+        "id": 12345,
+        "type": "User",
+        "html_url": "https://github.com/testuser"
+    }
+
+    head_sha = "abc123def456"
+    pull_requests = [{"number": pr_number, "head": {"sha": head_sha}, "base": {"ref": "main"}}]
+
+    if event_type == "workflow_run":
+        return {
+            "action": action,
+            "workflow_run": {
+                "id": 987654321,
+                "name": "CI",
+                "head_branch": "main",
+                "head_sha": head_sha,
+                "status": "completed" if action == "completed" else "in_progress",
+                "conclusion": "success" if action == "completed" else None,
+                "pull_requests": pull_requests,
+                "workflow_id": 12345,
+                "run_number": 42,
+                "created_at": datetime.now().isoformat() + "Z",
+                "updated_at": datetime.now().isoformat() + "Z",
+                "html_url": f"https://github.com/{full_repo_name}/actions/runs/987654321"
+            },
+            "repository": base_repo,
+            "organization": {"login": org_name} if org_name else None,
+            "sender": user
+        }
+
+    elif event_type == "workflow_job":
+        return {
+            "action": action,
+            "workflow_job": {
+                "id": 111222333,
+                "run_id": 987654321,
+                "head_sha": head_sha,
+                "name": "build",
+                "status": "completed" if action == "completed" else action,
+                "conclusion": "success" if action == "completed" else None,
+                "started_at": datetime.now().isoformat() + "Z",
+                "completed_at": datetime.now().isoformat() + "Z" if action == "completed" else None,
+                "html_url": f"https://github.com/{full_repo_name}/runs/111222333"
+            },
+            "repository": base_repo,
+            "organization": {"login": org_name} if org_name else None,
+            "sender": user
+        }
+
+    elif event_type in ("check_run", "check_suite"):
+        check_suite = {
+            "id": 444555666,
+            "head_branch": "main",
+            "head_sha": head_sha,
+            "status": "completed" if action == "completed" else "queued",
+            "conclusion": "success" if action == "completed" else None,
+            "app": {"id": 15368, "name": "GitHub Actions"},
+            "pull_requests": pull_requests
+        }
+        if event_type == "check_run":
+            run = {
+                "id": 222333444,
+                "name": "build",
+                "head_sha": head_sha,
+                "status": "completed" if action == "completed" else "in_progress",
+                "conclusion": "success" if action == "completed" else None,
+                "html_url": f"https://github.com/{full_repo_name}/runs/222333444",
+                "check_suite": check_suite,
+                "app": check_suite["app"],
+                "pull_requests": pull_requests
+            }
+        else:
+            run = check_suite
+        return {
+            "action": action,
+            event_type: run,
+            "repository": base_repo,
+            "organization": {"login": org_name} if org_name else None,
+            "sender": user
+        }
+
+    elif event_type == "status":
+        return {
+            "id": 555666777,
+            "sha": head_sha,
+            "name": full_repo_name,
+            "context": "ci/deploy",
+            "state": action,
+            "description": f"배포 {action}",
+            "target_url": f"https://ci.example.com/{full_repo_name}/{head_sha}",
+            "branches": [{"name": "main", "commit": {"sha": head_sha}}],
+            "repository": base_repo,
+            "organization": {"login": org_name} if org_name else None,
+            "sender": user
+        }
+
+    elif event_type == "pull_request":
+        return {
+            "action": action,
+            "number": pr_number,
+            "pull_request": {
+                "id": 555666777,
+                "number": pr_number,
+                "title": f"테스트 Pull Request #{pr_number}",
+                "body": "테스트용 PR입니다.",
+                "state": "closed" if action == "closed" else "open",
+                "merged": action == "closed",
+                "head": {
+                    "label": f"{org_name}:feature-branch",
+                    "ref": "feature-branch",
+                    "sha": "xyz789abc123"
+                },
+                "base": {
+                    "label": f"{org_name}:main",
+                    "ref": "main",
+                    "sha": "main123abc456"
+                },
+                "user": user,
+                "created_at": datetime.now().isoformat() + "Z",
+                "updated_at": datetime.now().isoformat() + "Z",
+                "html_url": f"https://github.com/{full_repo_name}/pull/{pr_number}"
+            },
+            "repository": base_repo,
+            "organization": {"login": org_name} if org_name else None,
+            "sender": user
+        }
+
+    elif event_type == "pull_request_review":
+        return {
+            "action": action,
+            "review": {
+                "id": 888999111,
+                "user": user,
+                "body": "테스트 리뷰 코멘트입니다.",
+                "state": "approved",
+                "html_url": f"https://github.com/{full_repo_name}/pull/{pr_number}#pullrequestreview-888999111",
+                "submitted_at": datetime.now().isoformat() + "Z"
+            },
+            "pull_request": {
+                "id": 555666777,
+                "number": pr_number,
+                "title": f"테스트 Pull Request #{pr_number}",
+                "html_url": f"https://github.com/{full_repo_name}/pull/{pr_number}"
+            },
+            "repository": base_repo,
+            "organization": {"login": org_name} if org_name else None,
+            "sender": user
+        }
+
+    elif event_type == "issues":
+        return {
+            "action": action,
+            "issue": {
+                "id": 333444555,
+                "number": pr_number,
+                "title": f"테스트 Issue #{pr_number}",
+                "body": "테스트용 이슈입니다.",
+                "state": "closed" if action == "closed" else "open",
+                "user": user,
+                "created_at": datetime.now().isoformat() + "Z",
+                "updated_at": datetime.now().isoformat() + "Z",
+                "html_url": f"https://github.com/{full_repo_name}/issues/{pr_number}"
+            },
+            "repository": base_repo,
+            "organization": {"login": org_name} if org_name else None,
+            "sender": user
+        }
+
+    elif event_type == "issue_comment":
+        return {
+            "action": action,
+            "issue": {
+                "id": 333444555,
+                "number": pr_number,
+                "title": f"테스트 Issue #{pr_number}",
+                "html_url": f"https://github.com/{full_repo_name}/issues/{pr_number}"
+            },
+            "comment": {
+                "id": 777888999,
+                "user": user,
+                "body": "테스트 코멘트입니다.",
+                "created_at": datetime.now().isoformat() + "Z",
+                "updated_at": datetime.now().isoformat() + "Z",
+                "html_url": f"https://github.com/{full_repo_name}/issues/{pr_number}#issuecomment-777888999"
+            },
+            "repository": base_repo,
+            "organization": {"login": org_name} if org_name else None,
+            "sender": user
+        }
+
+    # 기본값 (알 수 없는 이벤트)
+    return {
+        "action": action,
+        "repository": base_repo,
+        "organization": {"login": org_name} if org_name else None,
+        "sender": user
+    }
+
+
+def generate_signature(payload_body: bytes, secret: str) -> str:
+    """GitHub webhook 서명 생성 (secret 이 없으면 빈 문자열)"""
+    if not secret:
+        return ""
+
+    hash_object = hmac.new(secret.encode("utf-8"), msg=payload_body, digestmod=hashlib.sha256)
+    return "sha256=" + hash_object.hexdigest()
+
+
+def build_request(
+    event_type: str,
+    payload: Dict[str, Any],
+    secret: str = "",
+    delivery_id: Optional[str] = None,
+) -> Tuple[bytes, Dict[str, str]]:
+    """GitHub 와 같은 형식의 요청 본문과 헤더 생성"""
+    payload_bytes = json.dumps(payload, indent=2).encode("utf-8")
+    headers = {
+        "Content-Type": "application/json",
+        "X-GitHub-Event": event_type,
+        "X-GitHub-Delivery": delivery_id
+        or f"test-delivery-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
+        "User-Agent": "GitHub-Hookshot/test",
+    }
+    signature = generate_signature(payload_bytes, secret)
+    if signature:
+        headers["X-Hub-Signature-256"] = signature
+    return payload_bytes, headers
+
+
+def send_webhook(
+    webhook_url: str,
+    event_type: str,
+    payload: Dict[str, Any],
+    secret: str = "",
+    delivery_id: Optional[str] = None,
+    session: Optional[requests.Session] = None,
+    timeout: float = 10,
+) -> requests.Response:
+    """webhook 한 건 전송 (서버는 수신 큐에 넣은 뒤 202 Accepted 로 응답)"""
+    payload_bytes, headers = build_request(event_type, payload, secret, delivery_id)
+    return (session or requests).post(
+        webhook_url, data=payload_bytes, headers=headers, timeout=timeout
+    )
@@ -0,0 +1,250 @@
+"""payload 필드 선택 (projection)
+
+클라이언트는 알림 메시지를 만들 때 payload 의 일부 필드만 읽는다. poll 응답에서
+이벤트 타입별로 정의한 필드만 남겨 전송량을 줄이고, 전체 payload 는
+`GET /events/{id}/payload` 로 필요할 때만 가져가도록 한다.
+
+필드 경로 문법: `a.b.c` 는 중첩 객체, `a[].b` 는 목록 a 의 각 항목의 b 필드.
+경로가 가리키는 값은 하위 구조까지 통째로 유지한다.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 목록 항목을 나타내는 경로 토큰
+_LIST_ITEM = "[]"
+
+FieldTree = Optional[Dict[str, Any]]  # None 이면 해당 값을 통째로 유지
+
+_COMMON_FIELDS = [
+    "action",
+    "sender.login",
+    "repository.name",
+    "repository.full_name",
+    "repository.html_url",
+    "organization.login",
+]
+
+_USER = ["user.login", "user.avatar_url"]
+
+
+def _prefixed(prefix: str, fields: Iterable[str]) -> List[str]:
+    return [f"{prefix}.{field}" for field in fields]
+
+
+_PULL_REQUEST_FIELDS = _prefixed(
+    "pull_request",
+    [
+        "title",
+        "number",
+        "body",
+        "html_url",
+        "state",
+        "draft",
+        "merged",
+        "base.ref",
+        "head.ref",
+        "additions",
+        "deletions",
+        "changed_files",
+        "labels[].name",
+        "labels[].color",
+        *_USER,
+    ],
+)
+
+_ISSUE_FIELDS = _prefixed(
+    "issue",
+    [
+        "title",
+        "number",
+        "body",
+        "html_url",
+        "state",
+        "labels[].name",
+        "assignees[].login",
+        *_USER,
+    ],
+)
+
+_COMMENT_FIELDS = _prefixed(
+    "comment",
+    [
+        "id",
+        "body",
+        "html_url",
+        "path",
+        "line",
+        "original_line",
+        "position",
+        "original_position",
+        "commit_id",
+        *_USER,
+    ],
+)
+
+# CI 이벤트는 클라이언트가 같은 커밋의 이벤트를 묶을 수 있도록 head SHA 와 PR 번호를 남긴다
+# (application/util/event_coalescer.py 의 REF_PATHS)
+_RUN_FIELDS = [
+    "id",
+    "name",
+    "status",
+    "conclusion",
+    "html_url",
+    "head_branch",
+    "head_sha",
+    "pull_requests[].number",
+]
+
+# 프로필이 없는 이벤트 타입 (기본 메시지가 읽는 최상위 필드)
+DEFAULT_SLIM_FIELDS = ["id", "name", "title", "state", "description", "url", "html_url"]
+
+# 이벤트 타입별 slim 프로필 (클라이언트 메시지 빌더가 읽는 필드)
+SLIM_PROFILES: Dict[str, List[str]] = {
+    "push": [
+        "ref",
+        "before",
+        "after",
+        "compare",
+        "forced",
+        "pusher.name",
+        "head_commit.added",
+        "head_commit.removed",
+        "head_commit.modified",
+        "commits[].id",
+        "commits[].message",
+        "commits[].author.name",
+    ],
+    "pull_request": _PULL_REQUEST_FIELDS,
+    "pull_request_review": _PULL_REQUEST_FIELDS
+    + _prefixed("review", ["body", "state", "html_url", *_USER]),
+    "pull_request_review_comment": _PULL_REQUEST_FIELDS + _COMMENT_FIELDS,
+    "issues": _ISSUE_FIELDS
+    + ["label.name", "assignee.login", "milestone.title"],
+    "issue_comment": _ISSUE_FIELDS + _COMMENT_FIELDS,
+    "commit_comment": _COMMENT_FIELDS,
+    "release": _prefixed(
+        "release",
+        [
+            "tag_name",
+            "name",
+            "body",
+            "html_url",
+            "prerelease",
+            "draft",
+            "created_at",
+            "author.login",
+        ],
+    ),
+    "star": ["repository.stargazers_count"],
+    "watch": ["repository.watchers_count"],
+    "fork": ["forkee.full_name", "forkee.html_url", "repository.forks_count"],
+    "create": ["ref", "ref_type", "master_branch"],
+    "delete": ["ref", "ref_type"],
+    "gollum": ["pages[].title", "pages[].action", "pages[].html_url"],
+    "milestone": _prefixed(
+        "milestone",
+        ["title", "number", "state", "description", "due_on", "open_issues", "closed_issues"],
+    ),
+    "workflow_run": _prefixed("workflow_run", _RUN_FIELDS),
+    "workflow_job": _prefixed("workflow_job", [*_RUN_FIELDS, "run_id"]),
+    "check_run": _prefixed("check_run", [*_RUN_FIELDS, "check_suite.head_sha"]),
+    "check_suite": _prefixed("check_suite", [*_RUN_FIELDS, "app.name"]),
+    "status": [*DEFAULT_SLIM_FIELDS, "sha", "context", "target_url"],
+}
+
+PROFILES = ("full", "slim")
+
+
+def _split_path(path: str) -> List[str]:
+    tokens: List[str] = []
+    for part in path.split("."):
+        if part.endswith(_LIST_ITEM):
+            tokens.extend([part[: -len(_LIST_ITEM)], _LIST_ITEM])
+        else:
+            tokens.append(part)
+    return [token for token in tokens if token]
+
+
+def compile_fields(paths: Iterable[str]) -> Dict[str, Any]:
+    """필드 경로 목록을 projection 트리로 변환"""
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        tokens = _split_path(path.strip())
+        if not tokens:
+            continue
+        node = tree
+        for token in tokens[:-1]:
+            child: FieldTree = node.setdefault(token, {})
+            if child is None:
+                break  # 상위 값을 이미 통째로 유지
+            node = child
+        else:
+            node[tokens[-1]] = None
+    return tree
+
+
+def apply_projection(value: Any, tree: FieldTree) -> Any:
+    """projection 트리에 포함된 필드만 남긴 사본 반환"""
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        item_tree = tree.get(_LIST_ITEM, tree)
+        return [apply_projection(item, item_tree) for item in value]
+    if isinstance(value, dict):
+        return {
+            key: apply_projection(value[key], subtree)
+            for key, subtree in tree.items()
+            if key in value
+        }
+    return value
+
+
+@lru_cache(maxsize=None)
+def slim_tree(event_type: str) -> Dict[str, Any]:
+    fields = SLIM_PROFILES.get(event_type, DEFAULT_SLIM_FIELDS)
+    return compile_fields(_COMMON_FIELDS + fields)
+
+
+@lru_cache(maxsize=256)
+def _fields_tree(fields: Tuple[str, ...]) -> Dict[str, Any]:
+    return compile_fields(fields)
+
+
+def project_payload(
+    payload: Dict[str, Any],
+    event_type: str,
+    profile: Optional[str] = None,
+    fields: Optional[str] = None,
+) -> Dict[str, Any]:
+    """profile(slim) 과 fields(쉼표 구분 경로) 에 따라 payload 를 줄인다
+
+    둘 다 지정하면 합집합을 남기며, 둘 다 없거나 profile 이 full 이면 원본 반환.
+    """
+    use_slim = profile == "slim"
+    field_list = tuple(f for f in (fields or "").split(",") if f.strip())
+    if not use_slim and not field_list:
+        return payload
+
+    tree: Dict[str, Any] = {}
+    if use_slim:
+        tree = slim_tree(event_type)
+    if field_list:
+        extra = _fields_tree(field_list)
+        tree = compile_fields(_tree_paths(tree) + _tree_paths(extra)) if tree else extra
+    return apply_projection(payload, tree)  # type: ignore[no-any-return]
+
+
+def _tree_paths(tree: Dict[str, Any], prefix: str = "") -> List[str]:
+    """projection 트리를 다시 경로 목록으로 (프로필과 fields 합치기용)"""
+    paths: List[str] = []
+    for key, subtree in tree.items():
+        if key == _LIST_ITEM:
+            path = f"{prefix}[]"
+        else:
+            path = f"{prefix}.{key}" if prefix else key
+        if subtree is None:
+            paths.append(path)
+        else:
+            paths.extend(_tree_paths(subtree, path))
+    return paths
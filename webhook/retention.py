@@ -0,0 +1,277 @@
+"""이벤트 보존 정책과 저장소 정리
+
+- 최대 보존 기간: 수신 후 max_age 가 지난 이벤트 삭제
+- 최대 저장 용량: payload 총 크기가 max_total_bytes 를 넘으면 오래된 이벤트부터 삭제
+- 확인 전 보존: 관심 클라이언트가 아직 ack 하지 않은 이벤트는 위 두 정책으로 지우지 않는다
+  (max_age 동안 poll 하지 않은 클라이언트는 보존 대상에서 제외)
+
+정리는 batch_size 단위의 짧은 트랜잭션으로 나누어 수행하고, 각 트랜잭션은 수신 저장과
+같은 write_lock 을 잡으므로 정리 중에도 수신/poll 이 오래 막히지 않는다. 주기 실행은
+run_periodic, 즉시 실행은 관리자 API 에서 모두 DB 전용 스레드(run_db)로 호출한다.
+
+이벤트 저장소로 가져온 기존 data/*.json 파일은 운영자의 원본이므로 기본으로는 지우지 않는다
+(WEBHOOK_RETENTION_DELETE_LEGACY=true 일 때만 삭제).
+"""
+
+import asyncio
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from loguru import logger
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from webhook.models import (
+    Client,
+    EventRoute,
+    MessageConsumption,
+    WebhookEvent,
+    run_db,
+    write_lock,
+)
+from webhook.payload_codec import decode_payload, encode_payload
+
+
+@dataclass
+class RetentionPolicy:
+    """보존 정책 설정 (환경변수로 기본값 변경 가능)"""
+
+    max_age: timedelta = timedelta(days=float(os.getenv("WEBHOOK_RETENTION_DAYS", "30")))
+    max_total_bytes: int = int(os.getenv("WEBHOOK_RETENTION_MAX_BYTES", str(1024**3)))
+    keep_until_acked: bool = os.getenv("WEBHOOK_RETENTION_KEEP_UNACKED", "true").lower() == "true"
+    batch_size: int = 500
+    interval_seconds: float = float(os.getenv("WEBHOOK_RETENTION_INTERVAL", "3600"))
+    delete_legacy_files: bool = (
+        os.getenv("WEBHOOK_RETENTION_DELETE_LEGACY", "false").lower() == "true"
+    )
+
+
+class RetentionManager:
+    """보존 정책에 따라 이벤트, 전달 경로, 소비 이력, 가져온 기존 파일을 정리한다.
+
+    clock 을 주입할 수 있어 테스트에서 수 주 분량의 트래픽을 가짜 시계로 재현할 수 있다.
+    """
+
+    def __init__(
+        self,
+        policy: Optional[RetentionPolicy] = None,
+        clock: Callable[[], datetime] = datetime.now,
+        data_dir: Optional[Path] = None,
+    ) -> None:
+        self.policy = policy or RetentionPolicy()
+        self.clock = clock
+        self.data_dir = data_dir
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+    def stats(self, db: Session) -> Dict[str, Any]:
+        """저장소 사용량과 보존 정책 요약"""
+        row: Any = db.execute(
+            select(
+                func.count(WebhookEvent.id),
+                func.coalesce(func.sum(WebhookEvent.payload_size), 0),
+                func.min(WebhookEvent.received_at),
+                func.max(WebhookEvent.received_at),
+            )
+        ).one()
+        count, total_bytes, oldest, newest = row
+        legacy_files = self._imported_legacy_files(db)
+        return {
+            "event_count": count,
+            "total_bytes": int(total_bytes),
+            "oldest_event_at": oldest.isoformat() if oldest else None,
+            "newest_event_at": newest.isoformat() if newest else None,
+            "pinned_event_count": db.scalar(
+                select(func.count(WebhookEvent.id)).where(self._pinned(self.clock()))
+            ),
+            "route_count": db.scalar(select(func.count()).select_from(EventRoute)),
+            "consumption_count": db.scalar(select(func.count(MessageConsumption.id))),
+            "legacy_file_count": len(legacy_files),
+            "legacy_file_bytes": sum(path.stat().st_size for path in legacy_files),
+            "policy": {
+                "max_age_days": self.policy.max_age.total_seconds() / 86400,
+                "max_total_bytes": self.policy.max_total_bytes,
+                "keep_until_acked": self.policy.keep_until_acked,
+            },
+        }
+
+    # ------------------------------------------------------------------
+    # 정리
+    # ------------------------------------------------------------------
+    def compact(self, db: Session) -> Dict[str, int]:
+        """보존 정책을 적용하고 정리한 항목 수를 반환"""
+        now = self.clock()
+        cutoff = now - self.policy.max_age
+        result = {
+            "legacy_files": self._prune_legacy_files(db) if self.policy.delete_legacy_files else 0,
+            "expired_events": self._prune_expired(db, now, cutoff),
+            "oversize_events": self._prune_oversize(db, now),
+            "acked_routes": self._prune_acked_routes(db),
+            "consumptions": self._prune_consumptions(db, cutoff),
+            "recompressed": self._recompress_legacy_payloads(db),
+        }
+        if any(result.values()):
+            logger.info(f"webhook 저장소 정리 완료: {result}")
+        return result
+
+    async def run_periodic(self) -> None:
+        """interval_seconds 마다 정리 (수신/poll 과 같은 DB 전용 스레드에서 실행)"""
+        while True:
+            await asyncio.sleep(self.policy.interval_seconds)
+            try:
+                await run_db(self.compact)
+            except Exception as e:
+                logger.error(f"webhook 저장소 정리 실패: {e}")
+
+    # ------------------------------------------------------------------
+    # Internal
+    # ------------------------------------------------------------------
+    def _pinned(self, now: datetime) -> Any:
+        """아직 ack 하지 않은 활성 클라이언트가 있는 이벤트 조건"""
+        active_since = now - self.policy.max_age
+        return (
+            select(EventRoute.event_id)
+            .join(Client, Client.id == EventRoute.client_id)
+            .where(
+                EventRoute.event_id == WebhookEvent.id,
+                EventRoute.event_id > Client.acked_seq,
+                func.coalesce(Client.last_poll_at, Client.created_at) >= active_since,
+            )
+            .exists()
+        )
+
+    def _candidates(self, now: datetime) -> Any:
+        """정리 가능한 이벤트를 오래된 순으로 조회하는 쿼리"""
+        query: Any = select(WebhookEvent.id, WebhookEvent.payload_size).order_by(WebhookEvent.id)
+        if self.policy.keep_until_acked:
+            query = query.where(~self._pinned(now))
+        return query
+
+    @staticmethod
+    def _delete_events(db: Session, event_ids: List[int]) -> None:
+        with write_lock:
+            db.execute(delete(EventRoute).where(EventRoute.event_id.in_(event_ids)))
+            db.execute(delete(WebhookEvent).where(WebhookEvent.id.in_(event_ids)))
+            db.commit()
+
+    def _prune_expired(self, db: Session, now: datetime, cutoff: datetime) -> int:
+        query = self._candidates(now).where(WebhookEvent.received_at < cutoff)
+        pruned = 0
+        while True:
+            event_ids = list(db.scalars(query.limit(self.policy.batch_size)))
+            if not event_ids:
+                return pruned
+            self._delete_events(db, event_ids)
+            pruned += len(event_ids)
+
+    def _prune_oversize(self, db: Session, now: datetime) -> int:
+        pruned = 0
+        while True:
+            total_bytes = db.scalar(select(func.coalesce(func.sum(WebhookEvent.payload_size), 0)))
+            excess = int(total_bytes or 0) - self.policy.max_total_bytes
+            if excess <= 0:
+                return pruned
+
+            event_ids: List[int] = []
+            for event_id, size in db.execute(self._candidates(now).limit(self.policy.batch_size)):
+                event_ids.append(event_id)
+                excess -= size
+                if excess <= 0:
+                    break
+            if not event_ids:
+                logger.warning("저장 용량 한도를 넘었지만 확인되지 않은 이벤트만 남아 있습니다")
+                return pruned
+            self._delete_events(db, event_ids)
+            pruned += len(event_ids)
+
+    def _prune_acked_routes(self, db: Session) -> int:
+        """클라이언트가 이미 ack 한 전달 경로 삭제 (poll 에 다시 쓰이지 않음)"""
+        pruned = 0
+        clients: Any = db.execute(select(Client.id, Client.acked_seq)).all()
+        for client_id, acked_seq in clients:
+            query: Any = (
+                select(EventRoute.event_id)
+                .where(EventRoute.client_id == client_id, EventRoute.event_id <= acked_seq)
+                .limit(self.policy.batch_size)
+            )
+            while True:
+                event_ids = list(db.scalars(query))
+                if not event_ids:
+                    break
+                with write_lock:
+                    db.execute(
+                        delete(EventRoute).where(
+                            EventRoute.client_id == client_id, EventRoute.event_id.in_(event_ids)
+                        )
+                    )
+                    db.commit()
+                pruned += len(event_ids)
+        return pruned
+
+    def _prune_consumptions(self, db: Session, cutoff: datetime) -> int:
+        """보존 기간이 지난 기존 소비 이력 삭제 (커서로 변환된 이후에는 사용하지 않음)"""
+        query: Any = (
+            select(MessageConsumption.id)
+            .where(MessageConsumption.consumed_at < cutoff)  # type: ignore[arg-type]
+            .limit(self.policy.batch_size)
+        )
+        pruned = 0
+        while True:
+            ids = list(db.scalars(query))
+            if not ids:
+                return pruned
+            with write_lock:
+                db.execute(delete(MessageConsumption).where(MessageConsumption.id.in_(ids)))
+                db.commit()
+            pruned += len(ids)
+
+    def _recompress_legacy_payloads(self, db: Session) -> int:
+        """압축 도입 이전에 헤더 없이 저장된 payload 를 현재 포맷으로 다시 저장"""
+        query = (
+            select(WebhookEvent)
+            .where(func.substr(WebhookEvent.payload, 1, 1) == b"{")
+            .limit(self.policy.batch_size)
+        )
+        converted = 0
+        while True:
+            events = list(db.scalars(query))
+            if not events:
+                return converted
+            for event in events:
+                data = encode_payload(decode_payload(event.payload))  # type: ignore[arg-type]
+                event.payload = data  # type: ignore[assignment]
+                event.payload_size = len(data)  # type: ignore[assignment]
+            with write_lock:
+                db.commit()
+            converted += len(events)
+
+    def _imported_legacy_files(self, db: Session) -> List[Path]:
+        """이벤트 저장소로 이미 가져온 기존 data/*.json 파일"""
+        if self.data_dir is None or not self.data_dir.exists():
+            return []
+        files = list(self.data_dir.glob("*.json"))
+        if not files:
+            return []
+        known: Set[str] = set(
+            db.scalars(
+                select(WebhookEvent.filename).where(
+                    WebhookEvent.filename.in_([path.name for path in files])
+                )
+            )
+        )
+        return [path for path in files if path.name in known]
+
+    def _prune_legacy_files(self, db: Session) -> int:
+        """이벤트 저장소로 옮겨진 기존 파일 삭제 (policy.delete_legacy_files 일 때만 호출)"""
+        pruned = 0
+        for path in self._imported_legacy_files(db):
+            try:
+                path.unlink()
+                pruned += 1
+            except OSError as e:
+                logger.error(f"기존 webhook 파일 삭제 실패 ({path.name}): {e}")
+        return pruned
@@ -0,0 +1,74 @@
+"""클라이언트 관심사 라우팅 색인
+
+수신 시점에 이벤트를 받을 클라이언트를 한 번만 계산하기 위한 메모리 색인이다.
+클라이언트의 관심 조직/저장소 JSON 은 색인을 재구축할 때만 해석하며,
+이벤트마다 조직/저장소 키를 조회해 대상 클라이언트 집합을 구한다.
+"""
+
+from typing import Dict, Iterable, Optional, Set
+
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from webhook.models import Client
+
+
+class InterestIndex:
+    """org → 클라이언트, repo → 클라이언트, 전체 관심(wildcard) 클라이언트 색인
+
+    `message_matches_client_interest` 와 같은 규칙을 따른다.
+    - 관심 조직/저장소가 모두 비어 있으면 모든 이벤트 대상
+    - 조직 이름 일치
+    - 저장소 full_name 또는 repo 이름 일치
+    """
+
+    def __init__(self) -> None:
+        self._by_org: Dict[str, Set[int]] = {}
+        self._by_repo: Dict[str, Set[int]] = {}
+        self._wildcard: Set[int] = set()
+        self.version = 0  # 재구축할 때마다 증가
+
+    def rebuild(self, db: Session) -> None:
+        """DB 의 클라이언트 관심사로 색인을 다시 만든다 (/clients 변경 시 호출)"""
+        self.load(db.scalars(select(Client)))
+
+    def load(self, clients: Iterable[Client]) -> None:
+        by_org: Dict[str, Set[int]] = {}
+        by_repo: Dict[str, Set[int]] = {}
+        wildcard: Set[int] = set()
+
+        count = 0
+        for client in clients:
+            client_id = int(client.id)
+            orgs = client.get_interested_orgs()
+            repos = client.get_interested_repos()
+            count += 1
+
+            if not orgs and not repos:
+                wildcard.add(client_id)
+                continue
+            for org in orgs:
+                by_org.setdefault(org, set()).add(client_id)
+            for repo in repos:
+                by_repo.setdefault(repo, set()).add(client_id)
+
+        # 조회 중인 요청이 중간 상태를 보지 않도록 한 번에 교체
+        self._by_org, self._by_repo, self._wildcard = by_org, by_repo, wildcard
+        self.version += 1
+        logger.debug(f"관심사 라우팅 색인 재구축: 클라이언트 {count}개 (version {self.version})")
+
+    def match(self, org_name: Optional[str], repo_name: Optional[str]) -> Set[int]:
+        """이벤트를 받을 클라이언트 id 집합"""
+        matched = set(self._wildcard)
+        if org_name:
+            matched.update(self._by_org.get(org_name, ()))
+        if repo_name:
+            matched.update(self._by_repo.get(repo_name, ()))
+            if "/" in repo_name:
+                # full_name 에서 repository name 만 추출해서 비교
+                matched.update(self._by_repo.get(repo_name.split("/")[-1], ()))
+        return matched
+
+
+interest_index = InterestIndex()
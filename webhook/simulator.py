@@ -1,6 +1,9 @@
-import hashlib
-import hmac
-import json
+"""GitHub webhook 시뮬레이터 (Tk GUI)
+
+payload 생성과 전송은 `webhook.payloads` 를 사용한다. GUI 없이 대량의 이벤트로
+서버 부하를 재현하려면 `python -m webhook.loadgen` 을 사용한다.
+"""
+
 import os
 import threading
 import tkinter as tk
@@ -10,6 +13,8 @@ from typing import Any, Dict
 
 import requests
 
+from webhook.payloads import ACTIONS_MAP, generate_payload, generate_signature, send_webhook
+
 
 class GitHubWebhookSimulator:
     def __init__(self, root: tk.Tk) -> None:
@@ -149,201 +154,22 @@ class GitHubWebhookSimulator:
         """선택된 이벤트 타입에 따라 액션 업데이트"""
         event_type = self.event_type_var.get()
         
-        actions_map = {
-            "workflow_run": ["requested", "completed", "in_progress"],
-            "workflow_job": ["queued", "in_progress", "completed"],
-            "pull_request": ["opened", "closed", "synchronize", "reopened", "edited"],
-            "pull_request_review": ["submitted", "edited", "dismissed"],
-            "pull_request_review_comment": ["created", "edited", "deleted"],
-            "issues": ["opened", "closed", "edited", "deleted", "reopened"],
-            "issue_comment": ["created", "edited", "deleted"]
-        }
-        
-        actions = actions_map.get(event_type, [])
+        actions = ACTIONS_MAP.get(event_type, [])
         self.action_combo['values'] = actions
         if actions:
             self.action_var.set(actions[0])
             
     def generate_signature(self, payload_body: bytes) -> str:
         """GitHub webhook 서명 생성"""
-        if not self.webhook_secret:
-            return ""
-            
-        hash_object = hmac.new(
-            self.webhook_secret.encode('utf-8'),
-            msg=payload_body,
-            digestmod=hashlib.sha256
-        )
-        return "sha256=" + hash_object.hexdigest()
-        
+        return generate_signature(payload_body, self.webhook_secret)
+
     def generate_payload(self, event_type: str, action: str) -> Dict[str, Any]:
         """이벤트 타입과 액션에 따른 페이로드 생성"""
         org_name = self.org_entry.get().strip()
         repo_name = self.repo_entry.get().strip()
-        full_repo_name = f"{org_name}/{repo_name}" if org_name else repo_name
         pr_number = int(self.pr_number_var.get() or "1")
-        
-        base_repo = {
-            "id": 123456789,
-            "name": repo_name,
-            "full_name": full_repo_name,
-            "owner": {
-                "login": org_name or "user",
-                "type": "Organization" if org_name else "User"
-            },
-            "private": False,
-            "html_url": f"https://github.com/{full_repo_name}",
-            "default_branch": "main"
-        }
-        
-        user = {
-            "login": "testuser",
-            "id": 12345,
-            "type": "User",
-            "html_url": "https://github.com/testuser"
-        }
-        
-        if event_type == "workflow_run":
-            return {
-                "action": action,
-                "workflow_run": {
-                    "id": 987654321,
-                    "name": "CI",
-                    "head_branch": "main",
-                    "head_sha": "abc123def456",
-                    "status": "completed" if action == "completed" else "in_progress",
-                    "conclusion": "success" if action == "completed" else None,
-                    "workflow_id": 12345,
-                    "run_number": 42,
-                    "created_at": datetime.now().isoformat() + "Z",
-                    "updated_at": datetime.now().isoformat() + "Z",
-                    "html_url": f"https://github.com/{full_repo_name}/actions/runs/987654321"
-                },
-                "repository": base_repo,
-                "organization": {"login": org_name} if org_name else None,
-                "sender": user
-            }
-            
-        elif event_type == "workflow_job":
-            return {
-                "action": action,
-                "workflow_job": {
-                    "id": 111222333,
-                    "run_id": 987654321,
-                    "name": "build",
-                    "status": "completed" if action == "completed" else action,
-                    "conclusion": "success" if action == "completed" else None,
-                    "started_at": datetime.now().isoformat() + "Z",
-                    "completed_at": datetime.now().isoformat() + "Z" if action == "completed" else None,
-                    "html_url": f"https://github.com/{full_repo_name}/runs/111222333"
-                },
-                "repository": base_repo,
-                "organization": {"login": org_name} if org_name else None,
-                "sender": user
-            }
-            
-        elif event_type == "pull_request":
-            return {
-                "action": action,
-                "number": pr_number,
-                "pull_request": {
-                    "id": 555666777,
-                    "number": pr_number,
-                    "title": f"테스트 Pull Request #{pr_number}",
-                    "body": "테스트용 PR입니다.",
-                    "state": "closed" if action == "closed" else "open",
-                    "merged": action == "closed",
-                    "head": {
-                        "label": f"{org_name}:feature-branch",
-                        "ref": "feature-branch",
-                        "sha": "xyz789abc123"
-                    },
-                    "base": {
-                        "label": f"{org_name}:main",
-                        "ref": "main",
-                        "sha": "main123abc456"
-                    },
-                    "user": user,
-                    "created_at": datetime.now().isoformat() + "Z",
-                    "updated_at": datetime.now().isoformat() + "Z",
-                    "html_url": f"https://github.com/{full_repo_name}/pull/{pr_number}"
-                },
-                "repository": base_repo,
-                "organization": {"login": org_name} if org_name else None,
-                "sender": user
-            }
-            
-        elif event_type == "pull_request_review":
-            return {
-                "action": action,
-                "review": {
-                    "id": 888999111,
-                    "user": user,
-                    "body": "테스트 리뷰 코멘트입니다.",
-                    "state": "approved",
-                    "html_url": f"https://github.com/{full_repo_name}/pull/{pr_number}#pullrequestreview-888999111",
-                    "submitted_at": datetime.now().isoformat() + "Z"
-                },
-                "pull_request": {
-                    "id": 555666777,
-                    "number": pr_number,
-                    "title": f"테스트 Pull Request #{pr_number}",
-                    "html_url": f"https://github.com/{full_repo_name}/pull/{pr_number}"
-                },
-                "repository": base_repo,
-                "organization": {"login": org_name} if org_name else None,
-                "sender": user
-            }
-            
-        elif event_type == "issues":
-            return {
-                "action": action,
-                "issue": {
-                    "id": 333444555,
-                    "number": pr_number,
-                    "title": f"테스트 Issue #{pr_number}",
-                    "body": "테스트용 이슈입니다.",
-                    "state": "closed" if action == "closed" else "open",
-                    "user": user,
-                    "created_at": datetime.now().isoformat() + "Z",
-                    "updated_at": datetime.now().isoformat() + "Z",
-                    "html_url": f"https://github.com/{full_repo_name}/issues/{pr_number}"
-                },
-                "repository": base_repo,
-                "organization": {"login": org_name} if org_name else None,
-                "sender": user
-            }
-            
-        elif event_type == "issue_comment":
-            return {
-                "action": action,
-                "issue": {
-                    "id": 333444555,
-                    "number": pr_number,
-                    "title": f"테스트 Issue #{pr_number}",
-                    "html_url": f"https://github.com/{full_repo_name}/issues/{pr_number}"
-                },
-                "comment": {
-                    "id": 777888999,
-                    "user": user,
-                    "body": "테스트 코멘트입니다.",
-                    "created_at": datetime.now().isoformat() + "Z",
-                    "updated_at": datetime.now().isoformat() + "Z",
-                    "html_url": f"https://github.com/{full_repo_name}/issues/{pr_number}#issuecomment-777888999"
-                },
-                "repository": base_repo,
-                "organization": {"login": org_name} if org_name else None,
-                "sender": user
-            }
-            
-        # 기본값 (알 수 없는 이벤트)
-        return {
-            "action": action,
-            "repository": base_repo,
-            "organization": {"login": org_name} if org_name else None,
-            "sender": user
-        }
-        
+        return generate_payload(event_type, action, org_name, repo_name, pr_number)
+
     def send_webhook(self) -> None:
         """Webhook 전송"""
         def send_in_thread() -> None:
@@ -360,41 +186,19 @@ class GitHubWebhookSimulator:
                     self.log_message("❌ Webhook URL을 입력해주세요.")
                     return
                 
-                # 페이로드 생성
-                payload = self.generate_payload(event_type, action)
-                payload_json = json.dumps(payload, indent=2)
-                payload_bytes = payload_json.encode('utf-8')
-                
-                # 서명 생성
-                signature = self.generate_signature(payload_bytes)
-                
-                # 헤더 설정
-                headers = {
-                    "Content-Type": "application/json",
-                    "X-GitHub-Event": event_type,
-                    "X-GitHub-Delivery": f"test-delivery-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
-                    "User-Agent": "GitHub-Hookshot/test"
-                }
-                
-                if signature:
-                    headers["X-Hub-Signature-256"] = signature
-                
                 self.log_message(f"🚀 Webhook 전송 시작...")
                 self.log_message(f"   URL: {webhook_url}")
                 self.log_message(f"   Event: {event_type}")
                 self.log_message(f"   Action: {action}")
                 self.log_message(f"   Organization: {self.org_entry.get() or 'N/A'}")
                 self.log_message(f"   Repository: {self.repo_entry.get()}")
-                
-                # HTTP 요청 전송
-                response = requests.post(
-                    webhook_url,
-                    data=payload_bytes,
-                    headers=headers,
-                    timeout=10
-                )
-                
-                if response.status_code == 200:
+
+                # 페이로드 생성 및 HTTP 요청 전송
+                payload = self.generate_payload(event_type, action)
+                response = send_webhook(webhook_url, event_type, payload, self.webhook_secret)
+
+                # 서버는 수신 큐에 넣은 뒤 202 Accepted 로 응답한다
+                if 200 <= response.status_code < 300:
                     self.log_message(f"✅ Webhook 전송 성공! (Status: {response.status_code})")
                     try:
                         response_data = response.json()